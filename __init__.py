@@ -2,4 +2,5 @@ from product.productIO.Product import Product
 from product.productParse.Parse import Parse
 from product.productProcessing.subset.Subset import Subset
 from product.productProcessing.units.radiance2reflectance.Radiance2Reflectance import Radiance2Reflectance
-from product.productProcessing.collocate.Collocate import Collocate
\ No newline at end of file
+from product.productProcessing.collocate.Collocate import Collocate
+from matchup.Matchup import Matchup
@@ -0,0 +1,333 @@
+"""
+Functions to write synthetic Sentinel-3 SEN3 data products of configurable scene size, for benchmarking
+"""
+
+'''___Built-In Modules___'''
+from os import makedirs
+from os.path import join as pjoin
+from datetime import datetime, timedelta
+
+'''___Third-Party Modules___'''
+from netCDF4 import Dataset
+from numpy import arange, linspace, array, float32, uint16, uint32, int16, zeros, ones
+from numpy.random import RandomState
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+START_TIME = datetime(2018, 4, 5, 10, 0, 0)
+DURATION = timedelta(minutes=3)
+CENTRE = (10.0, 45.0)               # Scene centre (lon, lat)
+EXTENT = (4.0, 3.0)                 # Scene extent in degrees (lon, lat)
+OLCI_AC_SUBSAMPLING = 64            # OLCI tie point grid across track subsampling factor
+OLCI_BANDS = 21
+OLCI_DETECTORS = 740
+SLSTR_500M_BANDS = ["S1", "S2", "S3", "S4", "S5", "S6"]
+SLSTR_1KM_BANDS = ["S7", "S8", "S9", "F1", "F2"]
+
+MANIFEST_TEMPLATE = """<?xml version="1.0" encoding="UTF-8"?>
+<xfdu:XFDU xmlns:xfdu="urn:ccsds:schema:xfdu:1" xmlns:sentinel-safe="http://www.esa.int/safe/sentinel/1.1"
+           xmlns:sentinel3="http://www.esa.int/safe/sentinel/sentinel-3/1.0"
+           xmlns:olci="http://www.esa.int/safe/sentinel/sentinel-3/olci/1.0">
+  <metadataSection>
+    <metadataObject ID="generalProductInformation">
+      <metadataWrap><xmlData><sentinel3:generalProductInformation>
+        <sentinel3:productType>{product_type}</sentinel3:productType>
+      </sentinel3:generalProductInformation></xmlData></metadataWrap>
+    </metadataObject>
+    <metadataObject ID="acquisitionPeriod">
+      <metadataWrap><xmlData><sentinel-safe:acquisitionPeriod>
+        <sentinel-safe:startTime>{start_time}</sentinel-safe:startTime>
+        <sentinel-safe:stopTime>{stop_time}</sentinel-safe:stopTime>
+      </sentinel-safe:acquisitionPeriod></xmlData></metadataWrap>
+    </metadataObject>
+    <metadataObject ID="platform">
+      <metadataWrap><xmlData><sentinel-safe:platform>
+        <sentinel-safe:familyName>Sentinel-3</sentinel-safe:familyName>
+        <sentinel-safe:number>A</sentinel-safe:number>
+        <sentinel-safe:instrument>
+          <sentinel-safe:familyName abbreviation="{instrument}">{instrument}</sentinel-safe:familyName>
+        </sentinel-safe:instrument>
+      </sentinel-safe:platform></xmlData></metadataWrap>
+    </metadataObject>{product_information}
+  </metadataSection>
+</xfdu:XFDU>
+"""
+
+OLCI_PRODUCT_INFORMATION = """
+    <metadataObject ID="olciProductInformation">
+      <metadataWrap><xmlData><olci:olciProductInformation>
+        <olci:samplingParameters alSpatialSampling="300" acSpatialSampling="300"/>
+        <olci:earthSunDistance>149597870700</olci:earthSunDistance>
+        <olci:pixelQualitySummary>
+          <olci:invalidPixels percentage="0.0"/>
+        </olci:pixelQualitySummary>
+        <olci:classificationSummary>
+          <olci:landPixels percentage="50.0"/>
+        </olci:classificationSummary>
+      </olci:olciProductInformation></xmlData></metadataWrap>
+    </metadataObject>"""
+
+OLCI_FLAG_MEANINGS = "land coastline fresh_inland_water tidal_region bright straylight_risk invalid cosmetic " \
+                     "duplicated sun_glint_risk dubious saturated@Oa01"
+
+
+def return_product_name(product_type, start_time=START_TIME):
+    """
+    Return SEN3 product directory name for synthetic product
+
+    :type product_type: str
+    :param product_type: Product type string, e.g. *"OL_1_EFR"*
+
+    :type start_time: datetime.datetime
+    :param start_time: (optional) Product sensing start time
+
+    :return:
+        :product_name: *str*
+
+        SEN3 product directory name
+    """
+
+    stop_time = start_time + DURATION
+    return "S3A_%s____%s_%s_%s_0179_010_122_1979_SVL_O_NR_002.SEN3" % (product_type,
+                                                                       start_time.strftime("%Y%m%dT%H%M%S"),
+                                                                       stop_time.strftime("%Y%m%dT%H%M%S"),
+                                                                       stop_time.strftime("%Y%m%dT%H%M%S"))
+
+
+def write_manifest(product_directory, product_type, instrument, product_information="", start_time=START_TIME):
+    """
+    Write SEN3 xfdumanifest.xml for synthetic product
+
+    :type product_directory: str
+    :param product_directory: SEN3 product directory
+
+    :type product_type: str
+    :param product_type: Product type string
+
+    :type instrument: str
+    :param instrument: Instrument abbreviation, e.g. *"OLCI"*
+
+    :type product_information: str
+    :param product_information: (optional) Instrument specific metadata object xml
+
+    :type start_time: datetime.datetime
+    :param start_time: (optional) Product sensing start time
+    """
+
+    with open(pjoin(product_directory, "xfdumanifest.xml"), "w") as f:
+        f.write(MANIFEST_TEMPLATE.format(product_type=product_type, instrument=instrument,
+                                         start_time=start_time.strftime("%Y-%m-%dT%H:%M:%S.000000Z"),
+                                         stop_time=(start_time + DURATION).strftime("%Y-%m-%dT%H:%M:%S.000000Z"),
+                                         product_information=product_information))
+
+
+def write_variables(path, dims, variables, global_attrs=None):
+    """
+    Write netCDF file of variables
+
+    :type path: str
+    :param path: netCDF file path
+
+    :type dims: collections.OrderedDict/list
+    :param dims: Dimension (name, size) pairs
+
+    :type variables: list
+    :param variables: Variables to write, as *(name, dimensions, values, attributes)* tuples
+
+    :type global_attrs: dict
+    :param global_attrs: (optional) Global attributes
+    """
+
+    dataset = Dataset(path, "w")
+    for dim, size in dims:
+        dataset.createDimension(dim, size)
+    if global_attrs is not None:
+        dataset.setncatts(global_attrs)
+    for name, var_dims, values, attrs in variables:
+        variable = dataset.createVariable(name, values.dtype, var_dims, zlib=False)
+        # Values written as given, before any scale_factor attribute set
+        variable[:] = values
+        if attrs:
+            variable.setncatts(attrs)
+    dataset.close()
+
+
+def return_geolocation(rows, columns):
+    """
+    Return synthetic latitude and longitude grids, regularly spaced over scene extent
+
+    :type rows: int
+    :param rows: Number of image rows
+
+    :type columns: int
+    :param columns: Number of image columns
+
+    :return:
+        :latitude: *numpy.ndarray*
+
+        Pixel latitudes, decreasing with row
+
+        :longitude: *numpy.ndarray*
+
+        Pixel longitudes, increasing with column
+    """
+
+    latitude = linspace(CENTRE[1] + EXTENT[1]/2.0, CENTRE[1] - EXTENT[1]/2.0, rows)[:, None] * ones((1, columns))
+    longitude = linspace(CENTRE[0] - EXTENT[0]/2.0, CENTRE[0] + EXTENT[0]/2.0, columns)[None, :] * ones((rows, 1))
+    return latitude, longitude
+
+
+def writeOLCIL1Product(directory, rows, columns, bands=OLCI_BANDS, start_time=START_TIME, seed=0):
+    """
+    Write synthetic Sentinel-3 OLCI L1 EFR SEN3 product
+
+    :type directory: str
+    :param directory: Directory to write product to
+
+    :type rows: int
+    :param rows: Number of image rows
+
+    :type columns: int
+    :param columns: Number of image columns
+
+    :type bands: int
+    :param bands: (optional) Number of radiance bands, default all 21 OLCI bands
+
+    :type start_time: datetime.datetime
+    :param start_time: (optional) Product sensing start time
+
+    :type seed: int
+    :param seed: (optional) Random number generator seed for radiance values
+
+    :return:
+        :product_path: *str*
+
+        Path of product xfdumanifest.xml
+    """
+
+    product_directory = pjoin(directory, return_product_name("OL_1_EFR", start_time))
+    makedirs(product_directory)
+    write_manifest(product_directory, "OL_1_EFR", "OLCI", OLCI_PRODUCT_INFORMATION, start_time)
+
+    random = RandomState(seed)
+    image_dims = [("columns", columns), ("rows", rows)]
+
+    # Radiances, stored as scaled integers as in real products
+    for i in range(bands):
+        name = "Oa%02d_radiance" % (i+1)
+        values = (random.uniform(20.0, 120.0, (rows, columns)) / 0.01).astype(uint16)
+        write_variables(pjoin(product_directory, name + ".nc"), image_dims,
+                        [(name, ("rows", "columns"), values, {"units": "mW.m-2.sr-1.nm-1", "scale_factor": 0.01,
+                                                              "add_offset": 0.0})])
+
+    # Geolocation
+    latitude, longitude = return_geolocation(rows, columns)
+    write_variables(pjoin(product_directory, "geo_coordinates.nc"), image_dims,
+                    [("latitude", ("rows", "columns"), latitude.astype(float32), {"units": "degrees_north"}),
+                     ("longitude", ("rows", "columns"), longitude.astype(float32), {"units": "degrees_east"}),
+                     ("altitude", ("rows", "columns"), zeros((rows, columns), float32), {"units": "m"})])
+
+    # Quality flags - land west of scene centre, invalid first row
+    flag_masks = (2 ** arange(31, 31 - len(OLCI_FLAG_MEANINGS.split()), -1)).astype(uint32)
+    quality_flags = zeros((rows, columns), uint32)
+    quality_flags[:, :columns//2] |= flag_masks[0]
+    quality_flags[0, :] |= flag_masks[6]
+    write_variables(pjoin(product_directory, "qualityFlags.nc"), image_dims,
+                    [("quality_flags", ("rows", "columns"), quality_flags, {"flag_masks": flag_masks,
+                                                                            "flag_meanings": OLCI_FLAG_MEANINGS})])
+
+    # Tie point geometries
+    tie_columns = (columns - 1) // OLCI_AC_SUBSAMPLING + 2
+    tie_rows = rows
+    tie_sza = (30.0 + linspace(0.0, 10.0, tie_rows)[:, None] + linspace(0.0, 5.0, tie_columns)[None, :])
+    write_variables(pjoin(product_directory, "tie_geometries.nc"), [("tie_columns", tie_columns),
+                                                                    ("tie_rows", tie_rows)],
+                    [("SZA", ("tie_rows", "tie_columns"), tie_sza.astype(float32), {"units": "degrees"}),
+                     ("SAA", ("tie_rows", "tie_columns"), (tie_sza * 4.0).astype(float32), {"units": "degrees"}),
+                     ("OZA", ("tie_rows", "tie_columns"), (tie_sza / 3.0).astype(float32), {"units": "degrees"}),
+                     ("OAA", ("tie_rows", "tie_columns"), (tie_sza * 2.0).astype(float32), {"units": "degrees"})],
+                    {"ac_subsampling_factor": OLCI_AC_SUBSAMPLING, "al_subsampling_factor": 1})
+
+    # Instrument data
+    detector_index = (arange(columns)[None, :] * ones((rows, 1)) % OLCI_DETECTORS).astype(int16)
+    solar_flux = (1500.0 + random.uniform(-10.0, 10.0, (bands, OLCI_DETECTORS))).astype(float32)
+    write_variables(pjoin(product_directory, "instrument_data.nc"), image_dims + [("bands", bands),
+                                                                                  ("detectors", OLCI_DETECTORS)],
+                    [("detector_index", ("rows", "columns"), detector_index, {}),
+                     ("solar_flux", ("bands", "detectors"), solar_flux, {"units": "mW.m-2.nm-1"})])
+
+    return pjoin(product_directory, "xfdumanifest.xml")
+
+
+def writeSLSTRL1Product(directory, rows, columns, start_time=START_TIME, seed=0):
+    """
+    Write synthetic Sentinel-3 SLSTR L1 RBT SEN3 product, nadir view only
+
+    :type directory: str
+    :param directory: Directory to write product to
+
+    :type rows: int
+    :param rows: Number of 1 km image rows, 500 m grid has twice as many rows and columns
+
+    :type columns: int
+    :param columns: Number of 1 km image columns
+
+    :type start_time: datetime.datetime
+    :param start_time: (optional) Product sensing start time
+
+    :type seed: int
+    :param seed: (optional) Random number generator seed for radiance and brightness temperature values
+
+    :return:
+        :product_path: *str*
+
+        Path of product xfdumanifest.xml
+    """
+
+    product_directory = pjoin(directory, return_product_name("SL_1_RBT", start_time))
+    makedirs(product_directory)
+    write_manifest(product_directory, "SL_1_RBT", "SLSTR", "", start_time)
+
+    random = RandomState(seed)
+
+    for grid, grid_rows, grid_columns, bands, quantity, units in \
+            [("an", rows*2, columns*2, SLSTR_500M_BANDS, "radiance", "mW.m-2.sr-1.nm-1"),
+             ("in", rows, columns, SLSTR_1KM_BANDS, "BT", "K")]:
+        image_dims = [("columns", grid_columns), ("rows", grid_rows)]
+
+        for band in bands:
+            name = "%s_%s_%s" % (band, quantity, grid)
+            values = random.uniform(20.0, 120.0, (grid_rows, grid_columns)) if quantity == "radiance" else \
+                random.uniform(250.0, 310.0, (grid_rows, grid_columns))
+            write_variables(pjoin(product_directory, name + ".nc"), image_dims,
+                            [(name, ("rows", "columns"), values.astype(float32), {"units": units})])
+
+        latitude, longitude = return_geolocation(grid_rows, grid_columns)
+        write_variables(pjoin(product_directory, "geodetic_%s.nc" % grid), image_dims,
+                        [("latitude_%s" % grid, ("rows", "columns"), latitude.astype(float32),
+                          {"units": "degrees_north"}),
+                         ("longitude_%s" % grid, ("rows", "columns"), longitude.astype(float32),
+                          {"units": "degrees_east"})])
+
+        cloud = zeros((grid_rows, grid_columns), uint32)
+        cloud[:grid_rows//4, :] = 1
+        write_variables(pjoin(product_directory, "flags_%s.nc" % grid), image_dims,
+                        [("cloud_%s" % grid, ("rows", "columns"), cloud,
+                          {"flag_masks": array([1, 2], uint32), "flag_meanings": "visible threshold"})])
+
+    return pjoin(product_directory, "xfdumanifest.xml")
+
+
+if __name__ == "__main__":
+    pass
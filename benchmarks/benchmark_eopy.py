@@ -0,0 +1,636 @@
+"""
+Benchmark suite timing the main eopy data paths on synthetic Sentinel-3 products, or given products, of configurable
+scene size, with results written to json
+
+Each benchmark case is run in a fresh process, so timings and peak memory of cases are independent. For example:
+
+.. code-block:: bash
+
+    python benchmark_eopy.py --sizes 512x512,2048x2048 --output results.json
+    python benchmark_eopy.py --sizes 512x512,2048x2048 --output new.json --compare results.json
+
+Products may also be read with another engine, e.g. ``--engine netcdf``, in which case cases of processors that only
+support the default (snappy) engine are skipped, with status "unsupported" (see *UNSUPPORTED_CASES* and
+*UNSUPPORTED_PRODUCT_CASES*).
+"""
+
+'''___Built-In Modules___'''
+import sys
+import json
+import time
+import platform
+import traceback
+from argparse import ArgumentParser
+from multiprocessing import Process, Queue
+from collections import OrderedDict
+from datetime import datetime
+from os import makedirs
+from os.path import dirname, abspath, basename, exists
+from os.path import join as pjoin
+from tempfile import mkdtemp
+from shutil import rmtree
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(abspath(__file__))))
+sys.path.append(dirname(abspath(__file__)))
+from SyntheticProducts import writeOLCIL1Product, writeSLSTRL1Product, CENTRE, START_TIME, DURATION
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+RESULTS_VERSION = 1
+DEFAULT_SIZES = "256x256,1024x1024"
+DEFAULT_REPEAT = 3
+DEFAULT_THRESHOLD = 1.2             # Fractional slow down of case reported as a regression
+SUBSET_SIZE = 20000.0               # Side length of subset region of interest (m)
+CASE_TIMEOUT = 3600                 # Maximum run time of a case (s)
+
+# Cases not supported by engines other than the default, by engine - processing factories only process products read
+# with snappy
+UNSUPPORTED_CASES = {"netcdf": ["subset_pos", "subset_wkt", "collocate", "rad2refl"]}
+
+# Cases not supported by synthetic product types, by product type - Product.save_to_netcdf reads all variables on one
+# grid, so can not save products of more than one grid
+UNSUPPORTED_PRODUCT_CASES = {"SL_1_RBT": ["save_to_netcdf"]}
+
+# Synthetic product types - writer function and variables to read, bands all on the same grid
+SYNTHETIC_PRODUCTS = OrderedDict([("OL_1_EFR", {"write": writeOLCIL1Product,
+                                                "bands": ["Oa%02d_radiance" % i for i in range(1, 22)],
+                                                "geolocation": ["latitude", "longitude"]}),
+                                  ("SL_1_RBT", {"write": writeSLSTRL1Product,
+                                                "bands": ["S%d_radiance_an" % i for i in range(1, 7)],
+                                                "geolocation": ["latitude_an", "longitude_an"]})])
+
+
+def return_subset_wkt(centre=CENTRE, half_width=0.1):
+    """
+    Return WKT polygon region of interest around centre, for subset benchmark
+
+    :type centre: tuple
+    :param centre: (optional) Centre of region of interest *(lon, lat)*
+
+    :type half_width: float
+    :param half_width: (optional) Half width of region of interest (degrees)
+
+    :return:
+        :wkt: *str*
+
+        Region of interest as WKT polygon
+    """
+
+    lon, lat = centre
+    corners = [(lon - half_width, lat - half_width), (lon + half_width, lat - half_width),
+               (lon + half_width, lat + half_width), (lon - half_width, lat + half_width),
+               (lon - half_width, lat - half_width)]
+    return "POLYGON((%s))" % ", ".join("%f %f" % corner for corner in corners)
+
+
+# Benchmark cases - each function takes the case context, which includes the opened product unless the case is
+# "open", and runs the benchmarked path once
+def case_open(context):
+    from product.productIO.Product import Product
+    return Product(context["product_path"], engine=context["engine"])
+
+
+def case_getData_single(context):
+    return context["product"].getData(context["bands"][0]).values
+
+
+def case_getData_multi(context):
+    data = context["product"].getData(*(context["bands"] + context["geolocation"]))
+    return [data[v].values for v in data.variables]
+
+
+def case_subset_pos(context):
+    from product.productProcessing.subset.Subset import Subset
+    return Subset().run(context["product"], pos=(CENTRE[0], CENTRE[1], SUBSET_SIZE))
+
+
+def case_subset_wkt(context):
+    from product.productProcessing.subset.Subset import Subset
+    return Subset().run(context["product"], wkt=return_subset_wkt())
+
+
+def case_collocate(context):
+    from product.productProcessing.collocate.Collocate import Collocate
+    return Collocate().run(context["product"], master=context["master"])
+
+
+def case_rad2refl(context):
+    from product.productProcessing.units.radiance2reflectance.Radiance2Reflectance import Radiance2Reflectance
+    return Radiance2Reflectance().run(context["product"])
+
+
+def case_save_to_netcdf(context):
+    path = pjoin(context["directory"], "save_to_netcdf.nc")
+    context["product"].save_to_netcdf(path)
+    return path
+
+
+CASES = OrderedDict([("open", case_open),
+                     ("getData_single", case_getData_single),
+                     ("getData_multi", case_getData_multi),
+                     ("subset_pos", case_subset_pos),
+                     ("subset_wkt", case_subset_wkt),
+                     ("collocate", case_collocate),
+                     ("rad2refl", case_rad2refl),
+                     ("save_to_netcdf", case_save_to_netcdf)])
+
+
+def return_memory_usage():
+    """
+    Return current and peak resident memory of process, in MB
+
+    :return:
+        :current: *float*
+
+        Current resident memory, None if not available
+
+        :peak: *float*
+
+        Peak resident memory since process start or last *reset_peak_memory_usage*
+    """
+
+    # Linux - from /proc
+    if exists("/proc/self/status"):
+        memory = {}
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:") or line.startswith("VmHWM:"):
+                    memory[line.split(":")[0]] = float(line.split()[1]) / 1024.0
+        return memory.get("VmRSS", None), memory.get("VmHWM", None)
+
+    # Otherwise peak only
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return None, peak / (1024.0 * 1024.0 if sys.platform == "darwin" else 1024.0)
+
+
+def reset_peak_memory_usage():
+    """
+    Reset peak resident memory of process, where possible (Linux only), so peak memory of benchmarked path is
+    measured separately from set up
+
+    :return:
+        :reset: *bool*
+
+        True if peak memory reset
+    """
+
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+        return True
+    except (IOError, OSError):
+        return False
+
+
+def return_case_supported(case, engine=None, product_type=None):
+    """
+    Return True if benchmark case supported by engine products are read with, and by product type
+
+    :type case: str
+    :param case: Name of benchmark case
+
+    :type engine: str
+    :param engine: (optional) Engine products are read with, default engine if None
+
+    :type product_type: str
+    :param product_type: (optional) Synthetic product type, None for given products
+
+    :return:
+        :supported: *bool*
+
+        True if case supported
+    """
+
+    return (case not in UNSUPPORTED_CASES.get(engine, [])) and \
+        (case not in UNSUPPORTED_PRODUCT_CASES.get(product_type, []))
+
+
+def run_case(case, context, repeat, queue):
+    """
+    Run benchmark case, putting result dictionary on queue - intended to be run in a separate process
+
+    :type case: str
+    :param case: Name of benchmark case
+
+    :type context: dict
+    :param context: Case context, entries "product_path", "master_path", "engine", "bands", "geolocation" and
+    "directory"
+
+    :type repeat: int
+    :param repeat: Number of times to run case
+
+    :type queue: multiprocessing.Queue
+    :param queue: Queue to put result on
+    """
+
+    result = {"case": case, "status": "ok", "times": [], "error": None}
+
+    try:
+        # Set up - import eopy and open product, except for open case
+        from product.productIO.Product import Product
+        if case != "open":
+            context["product"] = case_open(context)
+            if case == "collocate":
+                context["master"] = Product(context["master_path"], engine=context["engine"])
+
+        setup_memory, _ = return_memory_usage()
+        peak_reset = reset_peak_memory_usage()
+
+        for i in range(repeat):
+            start = time.time()
+            output = CASES[case](context)
+            result["times"].append(time.time() - start)
+            del output
+
+        current_memory, peak_memory = return_memory_usage()
+        result.update({"setup_memory_mb": setup_memory,
+                       "peak_memory_mb": peak_memory,
+                       "peak_memory_since_setup": peak_reset})
+
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = "%s: %s" % (type(e).__name__, str(e))
+        result["traceback"] = traceback.format_exc()
+
+    queue.put(result)
+
+
+def benchmark_case(case, context, repeat):
+    """
+    Return result of benchmark case, run in a separate process
+
+    :type case: str
+    :param case: Name of benchmark case
+
+    :type context: dict
+    :param context: Case context
+
+    :type repeat: int
+    :param repeat: Number of times to run case
+
+    :return:
+        :result: *dict*
+
+        Benchmark result, entries:
+
+        * "case" - name of case
+        * "status" - "ok" or "error"
+        * "times" - run time of each repeat (s)
+        * "min", "mean" - minimum and mean run time (s)
+        * "setup_memory_mb" - resident memory after set up, e.g. opening product (MB)
+        * "peak_memory_mb" - peak resident memory while running case (MB)
+        * "error" - error message, if case failed
+    """
+
+    queue = Queue()
+    process = Process(target=run_case, args=(case, context, repeat, queue))
+    process.start()
+
+    try:
+        result = queue.get(timeout=CASE_TIMEOUT)
+    except Exception:
+        result = {"case": case, "status": "error", "times": [], "error": "Case timed out or process failed"}
+        process.terminate()
+    process.join()
+
+    if result["times"]:
+        result["min"] = min(result["times"])
+        result["mean"] = sum(result["times"]) / len(result["times"])
+
+    return result
+
+
+def return_cases(names=None):
+    """
+    Return names of benchmark cases to run
+
+    :type names: str
+    :param names: (optional) Comma separated case names, default all cases
+
+    :return:
+        :cases: *list*
+
+        Case names
+    """
+
+    if names is None:
+        return list(CASES.keys())
+
+    cases = [n.strip() for n in names.split(",")]
+    unknown = [c for c in cases if c not in CASES]
+    if unknown:
+        raise ValueError("Unknown benchmark cases %s, must be from %s" % (str(unknown), str(list(CASES.keys()))))
+    return cases
+
+
+def return_sizes(sizes):
+    """
+    Return scene sizes from string
+
+    :type sizes: str
+    :param sizes: Comma separated scene sizes, as *<rows>x<columns>*
+
+    :return:
+        :sizes: *list*
+
+        *(rows, columns)* per size
+    """
+
+    return [tuple(int(n) for n in size.lower().split("x")) for size in sizes.split(",")]
+
+
+def return_product_variables(product_path, engine=None, n_bands=4):
+    """
+    Return variables to benchmark reading from given product - the first spectral variables on the same grid, and
+    geolocation variables if present
+
+    :type product_path: str
+    :param product_path: Product path
+
+    :type engine: str
+    :param engine: (optional) Engine to read product with
+
+    :type n_bands: int
+    :param n_bands: (optional) Maximum number of spectral variables
+
+    :return:
+        :bands: *list*
+
+        Spectral variable names
+
+        :geolocation: *list*
+
+        Geolocation variable names
+    """
+
+    from product.productIO.Product import Product
+    product = Product(product_path, engine=engine)
+
+    spectral = [v for v in product.variables if hasattr(v, "wavelength") and (v.vtype == "data")]
+    bands = [v.name for v in spectral if v.shape == spectral[0].shape][:n_bands] if spectral else []
+    geolocation = [n for n in ["latitude", "longitude"] if n in product.getVariableNames()]
+
+    return bands, geolocation
+
+
+def run_benchmarks(sizes, cases, repeat=DEFAULT_REPEAT, engine=None, product_types=None, product_paths=None,
+                   directory=None, log=None):
+    """
+    Return results of benchmarks cases on synthetic products of given sizes, and given products
+
+    :type sizes: list
+    :param sizes: Scene sizes of synthetic products, as *(rows, columns)*
+
+    :type cases: list
+    :param cases: Names of benchmark cases to run
+
+    :type repeat: int
+    :param repeat: (optional) Number of times to run each case
+
+    :type engine: str
+    :param engine: (optional) Engine to read products with, e.g. *"netcdf"* for Sentinel-3 products
+
+    :type product_types: list
+    :param product_types: (optional) Synthetic product types to benchmark, default all
+
+    :type product_paths: list
+    :param product_paths: (optional) Paths of additional products to benchmark (e.g. Sentinel-2 products), synthetic
+    products not used if product types is an empty list
+
+    :type directory: str
+    :param directory: (optional) Directory to write synthetic products to, default temporary directory removed after
+
+    :type log: function
+    :param log: (optional) Function to log progress messages with
+
+    :return:
+        :results: *list*
+
+        Benchmark result dictionary per product and case, see *benchmark_case*. Cases not supported by the engine are
+        not run, with status "unsupported".
+    """
+
+    product_types = list(SYNTHETIC_PRODUCTS.keys()) if product_types is None else product_types
+    product_paths = [] if product_paths is None else product_paths
+
+    temporary = directory is None
+    directory = mkdtemp() if temporary else directory
+
+    results = []
+    try:
+        # Build benchmark subjects - (description, context)
+        subjects = []
+        for product_type in product_types:
+            for rows, columns in sizes:
+                product_directory = pjoin(directory, "%s_%dx%d" % (product_type, rows, columns))
+                write = SYNTHETIC_PRODUCTS[product_type]["write"]
+                if log is not None:
+                    log("Writing synthetic %s product, %dx%d" % (product_type, rows, columns))
+                makedirs(product_directory)
+                product_path = write(product_directory, rows, columns)
+                master_path = write(product_directory, rows, columns, start_time=START_TIME + DURATION, seed=1)
+                subjects.append(({"product": basename(dirname(product_path)), "product_type": product_type,
+                                  "synthetic": True, "rows": rows, "columns": columns},
+                                 {"product_path": product_path, "master_path": master_path,
+                                  "bands": SYNTHETIC_PRODUCTS[product_type]["bands"],
+                                  "geolocation": SYNTHETIC_PRODUCTS[product_type]["geolocation"],
+                                  "directory": product_directory}))
+
+        for product_path in product_paths:
+            bands, geolocation = return_product_variables(product_path, engine)
+            subjects.append(({"product": basename(dirname(abspath(product_path))), "product_type": None,
+                              "synthetic": False, "rows": None, "columns": None},
+                             {"product_path": product_path, "master_path": product_path, "bands": bands,
+                              "geolocation": geolocation, "directory": directory}))
+
+        # Run cases per subject
+        for description, context in subjects:
+            context["engine"] = engine
+            for case in cases:
+                if log is not None:
+                    log("Running %s on %s" % (case, description["product"]))
+                result = OrderedDict(description)
+                result["engine"] = engine
+                if return_case_supported(case, engine, description["product_type"]):
+                    result.update(benchmark_case(case, dict(context), repeat))
+                else:
+                    unsupported_by = "%s engine" % engine if not return_case_supported(case, engine) else \
+                        "%s products" % description["product_type"]
+                    result.update({"case": case, "status": "unsupported", "times": [],
+                                   "error": "Case not supported by %s" % unsupported_by})
+                results.append(result)
+                if (log is not None) and (result["status"] != "ok"):
+                    log("    %s" % result["error"])
+    finally:
+        if temporary:
+            rmtree(directory)
+
+    return results
+
+
+def return_result_key(result):
+    """
+    Return key identifying benchmark result, to compare with other benchmark runs
+
+    :type result: dict
+    :param result: Benchmark result
+
+    :return:
+        :key: *tuple*
+
+        Result key
+    """
+
+    return (result["product_type"] if result["synthetic"] else result["product"], result["rows"],
+            result["columns"], result["engine"], result["case"])
+
+
+def compare_results(results, baseline_results, threshold=DEFAULT_THRESHOLD):
+    """
+    Return benchmark cases that are slower than in baseline results by more than threshold
+
+    :type results: list
+    :param results: Benchmark results
+
+    :type baseline_results: list
+    :param baseline_results: Baseline benchmark results, e.g. from previous release
+
+    :type threshold: float
+    :param threshold: (optional) Ratio of minimum run time to baseline minimum run time above which case is regression
+
+    :return:
+        :regressions: *list*
+
+        Regression dictionary per regressed case, entries "key", "min", "baseline_min" and "ratio"
+    """
+
+    baseline = dict((return_result_key(r), r) for r in baseline_results if r["status"] == "ok")
+
+    regressions = []
+    for result in results:
+        key = return_result_key(result)
+        if (result["status"] != "ok") or (key not in baseline):
+            continue
+
+        ratio = result["min"] / baseline[key]["min"] if baseline[key]["min"] > 0 else float("inf")
+        if ratio > threshold:
+            regressions.append({"key": list(key), "min": result["min"], "baseline_min": baseline[key]["min"],
+                                "ratio": ratio})
+
+    return regressions
+
+
+def write_results(path, results, arguments=None):
+    """
+    Write benchmark results to json file
+
+    :type path: str
+    :param path: Output file path
+
+    :type results: list
+    :param results: Benchmark results
+
+    :type arguments: dict
+    :param arguments: (optional) Benchmark arguments, recorded in file
+    """
+
+    output = OrderedDict([("version", RESULTS_VERSION),
+                          ("created", datetime.utcnow().isoformat()),
+                          ("python", platform.python_version()),
+                          ("platform", platform.platform()),
+                          ("arguments", arguments),
+                          ("results", results)])
+
+    with open(path, "w") as f:
+        json.dump(output, f, indent=2)
+
+
+def read_results(path):
+    """
+    Return benchmark results from json file
+
+    :type path: str
+    :param path: Results file path
+
+    :return:
+        :results: *list*
+
+        Benchmark results
+    """
+
+    with open(path, "r") as f:
+        return json.load(f)["results"]
+
+
+def main(argv=None):
+    """
+    Run benchmark suite from command line
+
+    :type argv: list
+    :param argv: (optional) Command line arguments, default *sys.argv*
+
+    :return:
+        :exit_code: *int*
+
+        0, or 1 if regressions found compared to baseline
+    """
+
+    parser = ArgumentParser(description="Benchmark eopy data paths on synthetic Sentinel-3 products and given "
+                                        "products (e.g. Sentinel-2)")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help="comma separated synthetic scene sizes, <rows>x<columns> (default %s)" % DEFAULT_SIZES)
+    parser.add_argument("--cases", default=None,
+                        help="comma separated cases to run, from %s (default all)" % ", ".join(CASES.keys()))
+    parser.add_argument("--product-types", default=None,
+                        help="comma separated synthetic product types, from %s (default all)"
+                             % ", ".join(SYNTHETIC_PRODUCTS.keys()))
+    parser.add_argument("--product", action="append", default=[],
+                        help="path of additional product to benchmark, may be given more than once")
+    parser.add_argument("--engine", default=None, help="engine to read products with, e.g. netcdf")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="number of runs per case")
+    parser.add_argument("--directory", default=None, help="directory to write synthetic products to")
+    parser.add_argument("--output", default="benchmark_results.json", help="results json file path")
+    parser.add_argument("--compare", default=None, help="baseline results json file to compare to")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="run time ratio to baseline reported as a regression (default %.1f)" % DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    def log(message):
+        sys.stdout.write(message + "\n")
+        sys.stdout.flush()
+
+    product_types = None if args.product_types is None else \
+        [t.strip() for t in args.product_types.split(",") if t.strip() != ""]
+
+    results = run_benchmarks(return_sizes(args.sizes), return_cases(args.cases), repeat=args.repeat,
+                             engine=args.engine, product_types=product_types, product_paths=args.product,
+                             directory=args.directory, log=log)
+    write_results(args.output, results, vars(args))
+    log("Results written to %s" % args.output)
+
+    if args.compare is not None:
+        regressions = compare_results(results, read_results(args.compare), args.threshold)
+        for regression in regressions:
+            log("Regression: %s %.3fs (baseline %.3fs, x%.2f)" % (" ".join(str(k) for k in regression["key"]),
+                                                                   regression["min"], regression["baseline_min"],
+                                                                   regression["ratio"]))
+        return 1 if regressions else 0
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
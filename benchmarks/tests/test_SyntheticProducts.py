@@ -0,0 +1,65 @@
+"""
+Synthetic product functions test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname, abspath
+from os.path import join as pjoin
+from tempfile import mkdtemp
+from shutil import rmtree
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(abspath(__file__))))
+sys.path.append(pjoin(dirname(dirname(dirname(abspath(__file__)))), "product", "productIO", "sentinel3_reader"))
+sys.path.append(pjoin(dirname(dirname(dirname(abspath(__file__)))), "product", "productIO"))
+from SyntheticProducts import writeOLCIL1Product, writeSLSTRL1Product
+from SEN3NetCDFFactory import SEN3NetCDFFactory
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+class TestSyntheticProducts(unittest.TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.directory)
+
+    def test_writeOLCIL1Product(self):
+        product_path = writeOLCIL1Product(self.directory, 20, 30, bands=2)
+
+        factory = SEN3NetCDFFactory()
+        products, variables, attributes = factory.openProduct(product_path)
+        data = factory.getData(products, variables, attributes, "Oa02_radiance", "latitude", "longitude")
+
+        self.assertEqual("OL_1_EFR", attributes["product_string"])
+        self.assertEqual((20, 30), data["Oa02_radiance"].shape)
+        self.assertTrue(((data["Oa02_radiance"].values >= 20.0) & (data["Oa02_radiance"].values <= 120.0)).all())
+        self.assertTrue("quality_flags_land" in products[0]["variables"])
+        self.assertTrue("SZA" in products[0]["variables"])
+
+    def test_writeSLSTRL1Product(self):
+        product_path = writeSLSTRL1Product(self.directory, 10, 15)
+
+        factory = SEN3NetCDFFactory()
+        products, variables, attributes = factory.openProduct(product_path)
+
+        self.assertEqual("SL_1_RBT", attributes["product_string"])
+        self.assertItemsEqual([(20, 30), (10, 15)],
+                              [(p["product"]["height"], p["product"]["width"]) for p in products])
+        self.assertEqual((20, 30), factory.getData(products, variables, attributes, "S1_radiance_an").shape)
+
+
+if __name__ == "__main__":
+    unittest.main()
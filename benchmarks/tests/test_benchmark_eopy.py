@@ -0,0 +1,70 @@
+"""
+Benchmark suite functions test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname, abspath
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(abspath(__file__))))
+from benchmark_eopy import return_sizes, return_cases, return_case_supported, compare_results, run_benchmarks, CASES
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+def makeResult(case, minimum, status="ok"):
+    return {"product": "product", "product_type": "OL_1_EFR", "synthetic": True, "rows": 10, "columns": 10,
+            "engine": None, "case": case, "status": status, "min": minimum}
+
+
+class TestBenchmarkEOPy(unittest.TestCase):
+    def test_return_sizes(self):
+        self.assertEqual([(256, 512), (1024, 1024)], return_sizes("256x512,1024X1024"))
+
+    def test_return_cases(self):
+        self.assertEqual(list(CASES.keys()), return_cases())
+        self.assertEqual(["open", "rad2refl"], return_cases("open, rad2refl"))
+
+    def test_return_cases_unknown(self):
+        self.assertRaises(ValueError, return_cases, "open,resample")
+
+    def test_return_case_supported(self):
+        self.assertTrue(all(return_case_supported(case) for case in CASES))
+        self.assertTrue(return_case_supported("getData_single", "netcdf"))
+        self.assertTrue(return_case_supported("save_to_netcdf", "netcdf"))
+        self.assertFalse(return_case_supported("subset_pos", "netcdf"))
+        self.assertFalse(return_case_supported("rad2refl", "netcdf"))
+        self.assertTrue(return_case_supported("save_to_netcdf", product_type="OL_1_EFR"))
+        self.assertFalse(return_case_supported("save_to_netcdf", product_type="SL_1_RBT"))
+
+    def test_run_benchmarks_unsupported(self):
+        results = run_benchmarks([(16, 16)], ["subset_wkt", "collocate"], engine="netcdf", product_types=["OL_1_EFR"])
+
+        self.assertEqual(["subset_wkt", "collocate"], [r["case"] for r in results])
+        self.assertEqual(["unsupported", "unsupported"], [r["status"] for r in results])
+        self.assertEqual([[], []], [r["times"] for r in results])
+
+    def test_compare_results(self):
+        results = [makeResult("open", 1.0), makeResult("getData_single", 2.0), makeResult("rad2refl", 5.0, "error")]
+        baseline = [makeResult("open", 0.5), makeResult("getData_single", 1.9), makeResult("rad2refl", 1.0)]
+
+        regressions = compare_results(results, baseline, threshold=1.2)
+
+        self.assertEqual(1, len(regressions))
+        self.assertEqual("open", regressions[0]["key"][-1])
+        self.assertEqual(2.0, regressions[0]["ratio"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,594 @@
+"""
+Matchup of satellite products with RadCalNet site data
+"""
+
+'''___Built-In Modules___'''
+import sys
+from os.path import dirname, abspath
+from os.path import join as pjoin
+from datetime import datetime, timedelta
+from collections import OrderedDict
+
+'''___Third-Party Modules___'''
+from numpy import array, asarray, argsort, searchsorted, repeat, arange, cumsum, linspace, interp, isfinite, \
+    isnat, nonzero, full, nan, float64, int64
+
+'''___NPL Modules___'''
+# xarray and the processors (Subset, Radiance2Reflectance) imported only as required in Matchup methods, so they are
+# only imported when matchups are extracted
+eopy_directory = dirname(dirname(abspath(__file__)))
+sys.path.append(pjoin(eopy_directory, "product", "productIO"))
+from Product import Product
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+# RadCalNet site locations, (lon, lat)
+RADCALNET_SITES = {"BTCN": (109.6291, 40.8514),     # Baotou
+                   "GONA": (15.11956, -23.6002),    # Gobabeb
+                   "LCFR": (4.86444, 43.55885),     # La Crau
+                   "RVUS": (-115.6900, 38.4970)}    # Railroad Valley
+
+DEFAULT_ROI_SIZE = 1000.0                      # Side length of satellite region of interest (m)
+DEFAULT_TOLERANCE = timedelta(minutes=30)      # Maximum time from overpass to nearest RadCalNet time step
+BAND_SAMPLES = 11                              # Samples of RadCalNet spectra averaged over satellite band width
+
+# Matchup table columns
+MATCHUP_COLUMNS = ["product_path", "product_string", "site", "radcalnet_path", "overpass_time", "time_difference",
+                   "variable", "wavelength", "bandwidth", "satellite_units", "satellite_mean", "satellite_std",
+                   "satellite_count", "radcalnet_reflectance", "radcalnet_reflectance_uncertainty"]
+
+
+def return_seconds(times):
+    """
+    Return times as seconds since 1970-01-01
+
+    :type times: numpy.ndarray/list
+    :param times: Times, as *datetime64* or *datetime.datetime*
+
+    :return:
+        :seconds: *numpy.ndarray*
+
+        Times as seconds since 1970-01-01, NaN if undefined
+    """
+
+    times = asarray(times, dtype="datetime64[us]")
+    seconds = times.astype(int64) / 1e6
+    seconds[isnat(times)] = nan
+
+    return seconds
+
+
+def interval_join(starts, ends, times, tolerance=0.0):
+    """
+    Return index pairs of times within intervals, by a time-sorted join - intervals are sorted by start once, and the
+    candidate intervals of each time found by binary search, so joining *n* times with *m* intervals costs
+    *O((n + m) log m)* plus the number of candidates
+
+    :type starts: numpy.ndarray
+    :param starts: Interval start times (s)
+
+    :type ends: numpy.ndarray
+    :param ends: Interval end times (s)
+
+    :type times: numpy.ndarray
+    :param times: Times to join to intervals (s)
+
+    :type tolerance: float
+    :param tolerance: (optional) Time by which intervals are extended at either end (s)
+
+    :return:
+        :time_indices: *numpy.ndarray*
+
+        Indices of times in matched pairs
+
+        :interval_indices: *numpy.ndarray*
+
+        Indices of intervals in matched pairs
+    """
+
+    starts = asarray(starts, dtype=float64)
+    ends = asarray(ends, dtype=float64)
+    times = asarray(times, dtype=float64)
+
+    # Intervals with undefined start or end never matched
+    valid = nonzero(isfinite(starts) & isfinite(ends))[0]
+    if (valid.size == 0) or (times.size == 0):
+        return array([], dtype=int64), array([], dtype=int64)
+
+    order = valid[argsort(starts[valid], kind="mergesort")]
+    sorted_starts = starts[order]
+
+    # Candidate intervals start at most the longest interval duration before the time
+    max_duration = (ends[order] - sorted_starts).max()
+    lower = searchsorted(sorted_starts, times - max_duration - tolerance, "left")
+    upper = searchsorted(sorted_starts, times + tolerance, "right")
+    counts = upper - lower
+
+    time_indices = repeat(arange(times.size, dtype=int64), counts)
+    offsets = arange(counts.sum(), dtype=int64) - repeat(cumsum(counts) - counts, counts)
+    interval_indices = order[repeat(lower, counts) + offsets]
+
+    matched = ends[interval_indices] + tolerance >= times[time_indices]
+
+    return time_indices[matched], interval_indices[matched]
+
+
+def interpolate_time(times, values, time, tolerance=0.0):
+    """
+    Return values linearly interpolated to time, along last axis
+
+    :type times: numpy.ndarray
+    :param times: Times of values, in ascending order (s)
+
+    :type values: numpy.ndarray
+    :param values: Values, with last axis of time
+
+    :type time: float
+    :param time: Time to interpolate to (s)
+
+    :type tolerance: float
+    :param tolerance: (optional) Maximum time before first or after last time, within which values of the first or last
+    time are returned (s)
+
+    :return:
+        :interpolated_values: *numpy.ndarray*
+
+        Values at time, NaN if time outside times by more than tolerance
+    """
+
+    times = asarray(times, dtype=float64)
+    values = asarray(values, dtype=float64)
+
+    if (times.size == 0) or (time < times[0] - tolerance) or (time > times[-1] + tolerance):
+        return full(values.shape[:-1], nan)
+    if times.size == 1:
+        return values[..., 0]
+
+    time = min(max(time, times[0]), times[-1])
+    i = min(max(searchsorted(times, time, "right"), 1), times.size - 1)
+    weight = (time - times[i - 1]) / (times[i] - times[i - 1])
+
+    return values[..., i - 1] * (1.0 - weight) + values[..., i] * weight
+
+
+def band_average(wavelengths, spectrum, band_wavelength, bandwidth=None):
+    """
+    Return spectrum averaged over band, of rectangular spectral response
+
+    :type wavelengths: numpy.ndarray
+    :param wavelengths: Spectrum wavelengths, in ascending order (nm)
+
+    :type spectrum: numpy.ndarray
+    :param spectrum: Spectrum values
+
+    :type band_wavelength: float
+    :param band_wavelength: Band centre wavelength (nm)
+
+    :type bandwidth: float
+    :param bandwidth: (optional) Band width (nm), spectrum at band centre wavelength returned if not given
+
+    :return:
+        :band_value: *float*
+
+        Band averaged spectrum value, NaN if band outside spectrum or no band wavelength given
+    """
+
+    if (band_wavelength is None) or (band_wavelength < wavelengths[0]) or (band_wavelength > wavelengths[-1]):
+        return nan
+
+    if not bandwidth:
+        return float(interp(band_wavelength, wavelengths, spectrum))
+
+    band_wavelengths = linspace(band_wavelength - bandwidth / 2.0, band_wavelength + bandwidth / 2.0, BAND_SAMPLES)
+    return float(interp(band_wavelengths, wavelengths, spectrum).mean())
+
+
+class Matchup:
+    """
+    Matchup finds and extracts matchups of satellite products (e.g. OLCI, SLSTR, MSI) with RadCalNet site data, from
+    a catalogue of both (see *eopy.product.productParse.Catalogue.Catalogue*).
+
+    Matchups are found without opening any product:
+
+    1. Spatial prefilter - for each site, catalogued satellite products with footprints containing the site are found
+       from the catalogue footprint index. Satellite products must be catalogued with footprints (i.e. with
+       ``detail="max"``).
+    2. Interval join - product overpass times (acquisition mid times) are joined to the sorted acquisition intervals
+       (days) of catalogued RadCalNet *.output* files of the site (see *interval_join*).
+
+    Only matched products are then opened, to extract the satellite region of interest about the site with *Subset*
+    and the RadCalNet TOA reflectance interpolated to overpass time and averaged over each satellite band. Products in
+    units of radiance (e.g. OLCI and SLSTR L1) are converted to reflectance with *Radiance2Reflectance* before
+    subsetting, so satellite values are comparable with RadCalNet TOA reflectance.
+
+    Sample Code:
+
+    .. code-block:: python
+
+        catalogue = Catalogue("path/to/catalogue.db")
+        catalogue.addArchive("path/to/satellite/archive", detail="max")
+        catalogue.addArchive("path/to/radcalnet/archive")
+
+        matchup = Matchup(catalogue)
+        matchups = matchup.findMatchups(start=datetime(2017, 1, 1), product_strings=["OL_1_EFR"])
+        table = matchup.run(start=datetime(2017, 1, 1), product_strings=["OL_1_EFR"]).to_dataframe()
+
+    :Attributes:
+        .. py:attribute:: catalogue
+
+            *eopy.product.productParse.Catalogue.Catalogue*
+
+            Catalogue of satellite products and RadCalNet files
+
+        .. py:attribute:: sites
+
+            *dict*
+
+            Site locations, *(lon, lat)*, by RadCalNet site name
+
+        .. py:attribute:: roi_size
+
+            *float*
+
+            Side length of satellite region of interest about site (m)
+
+        .. py:attribute:: tolerance
+
+            *datetime.timedelta*
+
+            Maximum time from overpass to nearest RadCalNet time step
+
+    :Methods:
+        .. py:method:: findMatchups(...):
+
+            Returns matchups of catalogued satellite products and RadCalNet files, without opening products
+
+        .. py:method:: run(...):
+
+            Returns table of satellite and RadCalNet values of matchups
+
+        .. py:method:: extractMatchup(...):
+
+            Returns table rows of matchup, one per satellite variable
+
+        .. py:method:: extractSatellite(...):
+
+            Returns statistics of satellite product variables in region of interest about site
+
+        .. py:method:: returnSatelliteStatistics(...):
+
+            Returns statistics of satellite product variables in region of interest subset
+
+        .. py:method:: returnReflectanceProduct(...):
+
+            Returns product with units of radiance converted to reflectance
+
+        .. py:method:: extractRadCalNet(...):
+
+            Returns RadCalNet TOA reflectance and uncertainty at overpass time
+    """
+
+    def __init__(self, catalogue, sites=None, roi_size=DEFAULT_ROI_SIZE, tolerance=DEFAULT_TOLERANCE):
+        """
+        Initialise matchup engine
+
+        :type catalogue: eopy.product.productParse.Catalogue.Catalogue
+        :param catalogue: Catalogue of satellite products and RadCalNet files
+
+        :type sites: list
+        :param sites: (optional) Names of RadCalNet sites to match, default all sites
+
+        :type roi_size: float
+        :param roi_size: (optional) Side length of satellite region of interest about site (m), default 1 km
+
+        :type tolerance: datetime.timedelta
+        :param tolerance: (optional) Maximum time from overpass to nearest RadCalNet time step, default 30 minutes
+        """
+
+        self.catalogue = catalogue
+        self.sites = dict((site, RADCALNET_SITES[site]) for site in (sites if sites is not None else RADCALNET_SITES))
+        self.roi_size = roi_size
+        self.tolerance = tolerance
+
+    def findMatchups(self, start=None, end=None, product_strings=None):
+        """
+        Returns matchups of catalogued satellite products and RadCalNet files, without opening products
+
+        :type start: datetime.datetime
+        :param start: (optional) Start of time range of matchups
+
+        :type end: datetime.datetime
+        :param end: (optional) End of time range of matchups
+
+        :type product_strings: list
+        :param product_strings: (optional) Satellite product types to match (e.g. *["OL_1_EFR", "SL_1_RBT"]*), default
+        all catalogued products with footprints
+
+        :return:
+            :matchups: *list*
+
+            Matchups, as tuples of *(product_path, site, radcalnet_path, overpass_time)*, in order of overpass time
+        """
+
+        matchups = []
+
+        for site in sorted(self.sites.keys()):
+            point = self.sites[site]
+
+            # 1. Spatial prefilter - satellite products with footprints containing site
+            if product_strings is None:
+                product_paths = self.catalogue.query(start=start, end=end, point=point)
+            else:
+                product_paths = [product_path for product_string in product_strings
+                                 for product_path in self.catalogue.query(start=start, end=end, point=point,
+                                                                          product_string=product_string)]
+            if product_paths == []:
+                continue
+
+            # 2. Interval join of overpass times with RadCalNet file acquisition intervals of site
+            radcalnet_paths = self.catalogue.query(start=start, end=end, site=site, product_string=site)
+
+            # Where more than one file per day (e.g. reprocessed versions) use last, by path
+            radcalnet_paths = sorted(radcalnet_paths)
+            radcalnet_starts, radcalnet_ends = self.catalogue.getTimes(radcalnet_paths)
+            latest = sorted(dict(zip(radcalnet_starts.tolist(), range(len(radcalnet_paths)))).values())
+            radcalnet_paths = [radcalnet_paths[i] for i in latest]
+            radcalnet_starts = radcalnet_starts[latest]
+            radcalnet_ends = radcalnet_ends[latest]
+
+            # Overpass times, acquisition mid times of products
+            starts, ends = self.catalogue.getTimes(product_paths)
+            overpass_times = starts + (ends - starts) / 2
+
+            time_indices, interval_indices = interval_join(return_seconds(radcalnet_starts),
+                                                           return_seconds(radcalnet_ends),
+                                                           return_seconds(overpass_times))
+
+            for i, j in zip(time_indices, interval_indices):
+                matchups.append((product_paths[i], site, radcalnet_paths[j], overpass_times[i].astype(datetime)))
+
+        return sorted(matchups, key=lambda matchup: (matchup[3], matchup[1]))
+
+    def run(self, start=None, end=None, product_strings=None, variables=None):
+        """
+        Returns table of satellite and RadCalNet values of matchups, with a row per matchup satellite variable
+
+        :type start: datetime.datetime
+        :param start: (optional) Start of time range of matchups
+
+        :type end: datetime.datetime
+        :param end: (optional) End of time range of matchups
+
+        :type product_strings: list
+        :param product_strings: (optional) Satellite product types to match, default all catalogued products with
+        footprints
+
+        :type variables: list
+        :param variables: (optional) Satellite variables to extract, of product converted to reflectance (e.g.
+        *"Oa01_reflectance"*), default all product "data" variables
+
+        :return:
+            :table: *xarray.Dataset*
+
+            Matchup table, with variables of *MATCHUP_COLUMNS* along dimension *matchup* - see *extractMatchup*.
+            Convert to a *pandas.DataFrame* with ``table.to_dataframe()``.
+        """
+
+        import xarray as xr
+
+        rows = []
+        for product_path, site, radcalnet_path, overpass_time in self.findMatchups(start, end, product_strings):
+            rows.extend(self.extractMatchup(product_path, site, radcalnet_path, overpass_time, variables))
+
+        return xr.Dataset(dict((column, ("matchup", array([row[column] for row in rows])))
+                               for column in MATCHUP_COLUMNS))
+
+    def extractMatchup(self, product_path, site, radcalnet_path, overpass_time, variables=None):
+        """
+        Returns table rows of matchup, one per satellite variable
+
+        :type product_path: str
+        :param product_path: Satellite product path
+
+        :type site: str
+        :param site: RadCalNet site name
+
+        :type radcalnet_path: str
+        :param radcalnet_path: RadCalNet *.output* file path
+
+        :type overpass_time: datetime.datetime
+        :param overpass_time: Satellite overpass time
+
+        :type variables: list
+        :param variables: (optional) Satellite variables to extract, of product converted to reflectance (e.g.
+        *"Oa01_reflectance"*), default all product "data" variables
+
+        :return:
+            :rows: *list*
+
+            Table rows, dictionaries with entries:
+
+            * "product_path", "product_string", "site", "radcalnet_path", "overpass_time" - matchup definition
+            * "time_difference" - time from overpass to nearest RadCalNet time step (s)
+            * "variable", "wavelength", "bandwidth" - satellite variable, and its band centre wavelength and width (nm)
+            * "satellite_units" - units of satellite variable, empty for reflectance (e.g. "K" for SLSTR brightness
+              temperatures, which are not converted)
+            * "satellite_mean", "satellite_std", "satellite_count" - statistics of valid satellite variable values in
+              region of interest
+            * "radcalnet_reflectance", "radcalnet_reflectance_uncertainty" - RadCalNet TOA reflectance and uncertainty
+              at overpass time, averaged over satellite band
+        """
+
+        satellite = self.extractSatellite(product_path, site, variables)
+        radcalnet = self.extractRadCalNet(radcalnet_path, overpass_time)
+
+        rows = []
+        for variable in satellite["variables"]:
+            row = {"product_path": product_path,
+                   "product_string": satellite["product_string"],
+                   "site": site,
+                   "radcalnet_path": radcalnet_path,
+                   "overpass_time": overpass_time,
+                   "time_difference": radcalnet["time_difference"]}
+            row.update(variable)
+
+            for name in ["reflectance", "reflectance_uncertainty"]:
+                row["radcalnet_" + name] = band_average(radcalnet["wavelength"], radcalnet[name],
+                                                        variable["wavelength"], variable["bandwidth"])
+            rows.append(row)
+
+        return rows
+
+    def extractSatellite(self, product_path, site, variables=None):
+        """
+        Returns statistics of satellite product variables in region of interest about site
+
+        :type product_path: str
+        :param product_path: Satellite product path
+
+        :type site: str
+        :param site: RadCalNet site name
+
+        :type variables: list
+        :param variables: (optional) Satellite variables to extract, of product converted to reflectance (e.g.
+        *"Oa01_reflectance"*), default all product "data" variables
+
+        :return:
+            :satellite: *dict*
+
+            Satellite values, with entries *"product_string"* and *"variables"*, list of dictionaries per variable
+            with entries *"variable"*, *"wavelength"*, *"bandwidth"*, *"satellite_units"*, *"satellite_mean"*,
+            *"satellite_std"* and *"satellite_count"*
+        """
+
+        sys.path.append(pjoin(eopy_directory, "product", "productProcessing", "subset"))
+        from Subset import Subset
+
+        lon, lat = self.sites[site]
+
+        product = self.returnReflectanceProduct(Product(product_path))
+        product_subset = Subset().run(product, pos=(lon, lat, self.roi_size))
+
+        return {"product_string": product.attributes["product_string"],
+                "variables": self.returnSatelliteStatistics(product_subset, variables)}
+
+    def returnSatelliteStatistics(self, product_subset, variables=None):
+        """
+        Returns statistics of satellite product variables in region of interest subset
+
+        Variables are read together per sub-product, as variables of different sub-products (e.g. SLSTR L1 500 m and
+        1 km grids) cannot be read in one call.
+
+        :type product_subset: eopy.product.productIO.Product.Product
+        :param product_subset: Region of interest subset of satellite product
+
+        :type variables: list
+        :param variables: (optional) Satellite variables to extract, default all product "data" variables
+
+        :return:
+            :satellite_variables: *list*
+
+            Dictionaries per variable with entries *"variable"*, *"wavelength"*, *"bandwidth"*, *"satellite_units"*,
+            *"satellite_mean"*, *"satellite_std"* and *"satellite_count"*
+        """
+
+        names = variables if variables is not None else product_subset.getDataVariableNames()
+
+        # Group variable names by sub-product
+        index = product_subset.returnVariableIndex()
+        groups = OrderedDict()
+        for name in names:
+            groups.setdefault(index.getProductIndex([name]), []).append(name)
+
+        data = {}
+        for group in groups.values():
+            group_data = product_subset.getData(*group)
+            if len(group) == 1:
+                data[group[0]] = group_data
+            else:
+                data.update((name, group_data[name]) for name in group)
+
+        satellite_variables = []
+        for name in names:
+            values = asarray(data[name].values, dtype=float64).ravel()
+            values = values[isfinite(values)]
+            variable = product_subset.getVariable(name)
+
+            satellite_variables.append({"variable": name,
+                                        "wavelength": getattr(variable, "wavelength", None),
+                                        "bandwidth": getattr(variable, "bandwidth", None),
+                                        "satellite_units": getattr(variable, "units", None) or "",
+                                        "satellite_mean": values.mean() if values.size != 0 else nan,
+                                        "satellite_std": values.std() if values.size != 0 else nan,
+                                        "satellite_count": values.size})
+
+        return satellite_variables
+
+    def returnReflectanceProduct(self, product):
+        """
+        Returns product with units of radiance converted to reflectance with *Radiance2Reflectance*, converted lazily
+        so only the region of interest subset is converted
+
+        :type product: eopy.product.productIO.Product.Product
+        :param product: Satellite product
+
+        :return:
+            :product_reflectance: *eopy.product.productIO.Product.Product*
+
+            Satellite product in units of reflectance, product unchanged if no radiance to reflectance processing tool
+            for its product type (e.g. MSI L1C, already in units of reflectance)
+        """
+
+        sys.path.append(pjoin(eopy_directory, "product", "productProcessing", "units", "radiance2reflectance"))
+        from Radiance2Reflectance import Radiance2Reflectance
+        from ProductProcessingTool import ProductProcessingTool
+
+        if ProductProcessingTool().setProcessingTool(Radiance2Reflectance.processor_directory,
+                                                     product.attributes["product_string"]) is None:
+            return product
+
+        return Radiance2Reflectance().run(product)
+
+    def extractRadCalNet(self, radcalnet_path, overpass_time):
+        """
+        Returns RadCalNet TOA reflectance and uncertainty at overpass time, linearly interpolated between RadCalNet
+        time steps
+
+        :type radcalnet_path: str
+        :param radcalnet_path: RadCalNet *.output* file path
+
+        :type overpass_time: datetime.datetime
+        :param overpass_time: Satellite overpass time
+
+        :return:
+            :radcalnet: *dict*
+
+            RadCalNet values, with entries *"wavelength"* (nm), *"reflectance"*, *"reflectance_uncertainty"* and
+            *"time_difference"*, time from overpass to nearest RadCalNet time step (s). Values NaN if overpass time
+            outside RadCalNet time steps by more than tolerance.
+        """
+
+        data = Product(radcalnet_path).getData("toa_reflectance", "toa_reflectance_uncertainty")
+
+        times = data["time"].values.astype("datetime64[s]").astype(int64).astype(float64)
+        time = return_seconds([overpass_time])[0]
+        tolerance = self.tolerance.total_seconds()
+
+        return {"wavelength": data["wavelength"].values,
+                "reflectance": interpolate_time(times, data["toa_reflectance"].values, time, tolerance),
+                "reflectance_uncertainty": interpolate_time(times, data["toa_reflectance_uncertainty"].values, time,
+                                                            tolerance),
+                "time_difference": abs(times - time).min() if times.size != 0 else nan}
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,276 @@
+"""
+Matchup class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname, abspath
+from os.path import join as pjoin
+from datetime import datetime
+from tempfile import mkdtemp
+import shutil
+import subprocess
+
+'''___Third-Party Modules___'''
+from numpy import arange, array, full, isnan, random, testing, nan
+import xarray as xr
+
+'''___NPL Modules___'''
+eopy_directory = dirname(dirname(dirname(abspath(__file__))))
+sys.path.append(dirname(dirname(abspath(__file__))))
+from Matchup import Matchup, interval_join, interpolate_time, band_average, RADCALNET_SITES
+from Product import Product
+from SpectralVariable import SpectralVariable
+from VariableIndex import VariableIndex
+from AbstractDataReader import AbstractDataReader
+sys.path.append(pjoin(eopy_directory, "product", "productParse"))
+from Catalogue import Catalogue
+sys.path.append(pjoin(eopy_directory, "product", "productIO", "radcalnet_reader", "tests"))
+from test_RadCalNetFactory import write_test_file, test_reflectance, test_uncertainty
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+def return_footprint(lon, lat, half_width=1.0):
+    return "POLYGON((%f %f, %f %f, %f %f, %f %f, %f %f))" % (lon - half_width, lat - half_width,
+                                                             lon + half_width, lat - half_width,
+                                                             lon + half_width, lat + half_width,
+                                                             lon - half_width, lat + half_width,
+                                                             lon - half_width, lat - half_width)
+
+
+class GridDataFactory(object):
+    """
+    Data factory of product of sub-products on different grids, reading variables of one sub-product per call as the
+    eopy data factories do
+    """
+
+    def getData(self, products, variables, attributes, variable, *args, **kwargs):
+        names = [variable] + list(args)
+        product_dict = VariableIndex(variables, products).getProduct(names)
+        if product_dict is None:
+            raise NameError("Cannot open combination of variables")
+
+        if len(names) == 1:
+            return xr.DataArray(product_dict["product"][variable])
+        return xr.Dataset(dict((name, (("y", "x"), product_dict["product"][name])) for name in names))
+
+
+def setup_slstr():
+    """
+    Return SLSTR L1 reflectance product subset, with 500 m S1-S2 reflectance and 1 km S7 brightness temperature grids
+    """
+
+    s1 = full((4, 4), 0.2)
+    s2 = full((4, 4), 0.3)
+    s2[0, 0] = nan
+    s7 = full((2, 2), 290.0)
+
+    product_subset = Product()
+    product_subset.dataReader = AbstractDataReader()
+    product_subset.dataReader.dataFactory = GridDataFactory()
+    product_subset.product = [{"product_name": "S3A_SL_1_RBT_a_500m",
+                               "product": {"S1_reflectance_an": s1, "S2_reflectance_an": s2},
+                               "variables": ["S1_reflectance_an", "S2_reflectance_an"]},
+                              {"product_name": "S3A_SL_1_RBT_a_1km", "product": {"S7_BT_in": s7},
+                               "variables": ["S7_BT_in"]}]
+    product_subset.variables = [SpectralVariable({"name": name, "ndims": 2, "shape": shape, "dtype": "float32",
+                                                  "vtype": "data", "units": units, "wavelength": wavelength,
+                                                  "bandwidth": bandwidth, "srf": None})
+                                for name, shape, units, wavelength, bandwidth in
+                                [("S1_reflectance_an", (4, 4), "", 554.27, 19.26),
+                                 ("S7_BT_in", (2, 2), "K", 3742.0, 398.0),
+                                 ("S2_reflectance_an", (4, 4), "", 659.47, 19.25)]]
+    product_subset.attributes = {"product_string": "SL_1_RBT"}
+
+    return product_subset
+
+
+class TestMatchupFunctions(unittest.TestCase):
+    def test_interval_join(self):
+        random.seed(1)
+        starts = random.uniform(0.0, 1000.0, 200)
+        ends = starts + random.uniform(0.0, 20.0, 200)
+        times = random.uniform(0.0, 1000.0, 300)
+
+        time_indices, interval_indices = interval_join(starts, ends, times, tolerance=1.0)
+
+        expected = set((i, j) for i in range(times.size) for j in range(starts.size)
+                       if starts[j] - 1.0 <= times[i] <= ends[j] + 1.0)
+        self.assertEqual(expected, set(zip(time_indices.tolist(), interval_indices.tolist())))
+
+    def test_interval_join_empty(self):
+        self.assertEqual(0, interval_join([], [], [1.0])[0].size)
+        self.assertEqual(0, interval_join([0.0], [1.0], [])[0].size)
+
+    def test_interval_join_undefined(self):
+        time_indices, interval_indices = interval_join([0.0, float("nan"), 5.0], [10.0, 1.0, float("nan")],
+                                                       [2.0, float("nan")])
+        self.assertEqual([0], time_indices.tolist())
+        self.assertEqual([0], interval_indices.tolist())
+
+    def test_interpolate_time(self):
+        times = array([0.0, 10.0, 20.0])
+        values = array([[0.0, 1.0, 3.0], [1.0, 1.0, 1.0]])
+
+        testing.assert_allclose([0.5, 1.0], interpolate_time(times, values, 5.0))
+        testing.assert_allclose([2.0, 1.0], interpolate_time(times, values, 15.0))
+        testing.assert_allclose([3.0, 1.0], interpolate_time(times, values, 22.0, tolerance=5.0))
+        self.assertTrue(isnan(interpolate_time(times, values, 22.0)).all())
+        self.assertTrue(isnan(interpolate_time(times, values, -6.0, tolerance=5.0)).all())
+
+    def test_band_average(self):
+        wavelengths = arange(400.0, 510.0, 10.0)
+        spectrum = wavelengths / 100.0
+
+        self.assertAlmostEqual(4.45, band_average(wavelengths, spectrum, 445.0))
+        self.assertAlmostEqual(4.45, band_average(wavelengths, spectrum, 445.0, 20.0))
+        self.assertTrue(isnan(band_average(wavelengths, spectrum, 600.0, 20.0)))
+        self.assertTrue(isnan(band_average(wavelengths, spectrum, None)))
+
+
+class TestMatchup(unittest.TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.radcalnet_path = write_test_file(self.directory)
+
+        gona = RADCALNET_SITES["GONA"]
+
+        self.catalogue = Catalogue()
+        self.catalogue.addProducts([
+            # Over GONA on day of RadCalNet file
+            ("S3A_OL_1_EFR_a.SEN3/xfdumanifest.xml",
+             {"product_string": "OL_1_EFR", "start_time": datetime(2017, 1, 1, 9, 20),
+              "end_time": datetime(2017, 1, 1, 9, 24), "footprint": return_footprint(*gona)}),
+            # Over GONA, no RadCalNet file that day
+            ("S3A_OL_1_EFR_b.SEN3/xfdumanifest.xml",
+             {"product_string": "OL_1_EFR", "start_time": datetime(2017, 1, 3, 9, 20),
+              "end_time": datetime(2017, 1, 3, 9, 24), "footprint": return_footprint(*gona)}),
+            # Not over any site
+            ("S3A_OL_1_EFR_c.SEN3/xfdumanifest.xml",
+             {"product_string": "OL_1_EFR", "start_time": datetime(2017, 1, 1, 9, 20),
+              "end_time": datetime(2017, 1, 1, 9, 24), "footprint": return_footprint(0.0, 0.0)}),
+            # Over GONA, other product type
+            ("S3A_SL_1_RBT_a.SEN3/xfdumanifest.xml",
+             {"product_string": "SL_1_RBT", "start_time": datetime(2017, 1, 1, 9, 20),
+              "end_time": datetime(2017, 1, 1, 9, 24), "footprint": return_footprint(*gona)}),
+            # RadCalNet files, no products over RVUS
+            (self.radcalnet_path,
+             {"product_string": "GONA", "site": "GONA", "mission": "radcalnet", "date": datetime(2017, 1, 1)}),
+            (pjoin(self.directory, "RVUS00_2017_001_v03.01.output"),
+             {"product_string": "RVUS", "site": "RVUS", "mission": "radcalnet", "date": datetime(2017, 1, 1)})])
+
+    def tearDown(self):
+        self.catalogue.close()
+        shutil.rmtree(self.directory)
+
+    def test_findMatchups(self):
+        matchup = Matchup(self.catalogue)
+
+        self.assertEqual([("S3A_OL_1_EFR_a.SEN3/xfdumanifest.xml", "GONA", self.radcalnet_path,
+                           datetime(2017, 1, 1, 9, 22)),
+                          ("S3A_SL_1_RBT_a.SEN3/xfdumanifest.xml", "GONA", self.radcalnet_path,
+                           datetime(2017, 1, 1, 9, 22))],
+                         sorted(matchup.findMatchups()))
+
+        self.assertEqual(["S3A_OL_1_EFR_a.SEN3/xfdumanifest.xml"],
+                         [m[0] for m in matchup.findMatchups(product_strings=["OL_1_EFR"])])
+        self.assertEqual([], matchup.findMatchups(start=datetime(2017, 1, 2)))
+        self.assertEqual([], Matchup(self.catalogue, sites=["RVUS"]).findMatchups())
+
+    def test_extractRadCalNet(self):
+        matchup = Matchup(self.catalogue)
+
+        radcalnet = matchup.extractRadCalNet(self.radcalnet_path, datetime(2017, 1, 1, 9, 15))
+        testing.assert_allclose(radcalnet["reflectance"], (test_reflectance[:, 0] + test_reflectance[:, 1]) / 2.0)
+        testing.assert_allclose(radcalnet["reflectance_uncertainty"],
+                                (test_uncertainty[:, 0] + test_uncertainty[:, 1]) / 2.0)
+        self.assertEqual(900.0, radcalnet["time_difference"])
+
+        radcalnet = matchup.extractRadCalNet(self.radcalnet_path, datetime(2017, 1, 1, 8, 0))
+        self.assertTrue(isnan(radcalnet["reflectance"]).all())
+
+    def test_run(self):
+        class TestMatchup(Matchup):
+            def extractSatellite(self, product_path, site, variables=None):
+                return {"product_string": "OL_1_EFR",
+                        "variables": [{"variable": "Oa02_reflectance", "wavelength": 412.5, "bandwidth": 10.0,
+                                       "satellite_units": "", "satellite_mean": 0.1, "satellite_std": 0.01,
+                                       "satellite_count": 4}]}
+
+        table = TestMatchup(self.catalogue).run(product_strings=["OL_1_EFR"])
+
+        self.assertEqual(1, table.dims["matchup"])
+        self.assertEqual("GONA", table["site"].values[0])
+        self.assertEqual("Oa02_reflectance", table["variable"].values[0])
+        self.assertEqual("", table["satellite_units"].values[0])
+        self.assertAlmostEqual(0.1, table["satellite_mean"].values[0])
+        self.assertTrue(0.1 < table["radcalnet_reflectance"].values[0] < 0.3)
+
+    def test_returnReflectanceProduct_radiance(self):
+        import snappy
+
+        snap_product = snappy.Product("S3A_OL_1_EFR_a", "OL_1_EFR", 3, 2)
+        for name in ["Oa01_radiance", "solar_flux_band_1", "SZA"]:
+            snap_product.addBand(name, "float32")
+
+        product = Product()
+        product.product = [{"product_name": "S3A_OL_1_EFR_a", "product": snap_product,
+                            "variables": ["Oa01_radiance", "solar_flux_band_1", "SZA"]}]
+        product.variables = [SpectralVariable({"name": "Oa01_radiance", "ndims": 2, "shape": (2, 3),
+                                               "dtype": "float32", "vtype": "data", "units": "mW.m-2.sr-1.nm-1",
+                                               "wavelength": 400.0, "bandwidth": 15.0, "srf": None})]
+        product.attributes = {"product_string": "OL_1_EFR", "product_processing": []}
+
+        product_reflectance = Matchup(self.catalogue).returnReflectanceProduct(product)
+
+        self.assertEqual(["Oa01_reflectance"], product_reflectance.getDataVariableNames())
+        self.assertEqual("", product_reflectance.getVariable("Oa01_reflectance").units)
+        self.assertEqual(400.0, product_reflectance.getVariable("Oa01_reflectance").wavelength)
+
+    def test_returnSatelliteStatistics_slstr(self):
+        product_subset = setup_slstr()
+        self.assertRaises(NameError, product_subset.getData, *product_subset.getDataVariableNames())
+
+        satellite_variables = Matchup(self.catalogue).returnSatelliteStatistics(product_subset)
+
+        self.assertEqual(["S1_reflectance_an", "S7_BT_in", "S2_reflectance_an"],
+                         [v["variable"] for v in satellite_variables])
+        self.assertEqual(["", "K", ""], [v["satellite_units"] for v in satellite_variables])
+        self.assertEqual([16, 4, 15], [v["satellite_count"] for v in satellite_variables])
+        testing.assert_allclose([0.2, 290.0, 0.3], [v["satellite_mean"] for v in satellite_variables])
+        self.assertEqual(554.27, satellite_variables[0]["wavelength"])
+
+    def test_returnSatelliteStatistics_slstr_variables(self):
+        satellite_variables = Matchup(self.catalogue).returnSatelliteStatistics(setup_slstr(), ["S7_BT_in"])
+
+        self.assertEqual(["S7_BT_in"], [v["variable"] for v in satellite_variables])
+        self.assertAlmostEqual(290.0, satellite_variables[0]["satellite_mean"])
+
+    def test_returnReflectanceProduct_reflectance(self):
+        product = Product()
+        product.attributes = {"product_string": "MSIL1C"}
+
+        self.assertIs(product, Matchup(self.catalogue).returnReflectanceProduct(product))
+
+
+class TestMatchupImport(unittest.TestCase):
+    def test_import(self):
+        # Processors and xarray only imported when matchups extracted
+        code = "import sys; sys.path.append(%r); import Matchup; " \
+               "print(sorted(set(['xarray', 'Subset', 'Radiance2Reflectance']) & set(sys.modules)))" \
+               % dirname(dirname(abspath(__file__)))
+
+        self.assertEqual("[]", subprocess.check_output([sys.executable, "-c", code]).strip())
+
+
+if __name__ == "__main__":
+    unittest.main()
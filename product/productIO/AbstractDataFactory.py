@@ -3,12 +3,14 @@ Contains class to be used as parent class for data factory implementations
 """
 
 '''___Built-In Modules___'''
+from collections import OrderedDict
 
 '''___Third-Party Modules___'''
 
 '''___NPL Modules___'''
 from Variable import Variable
 from SpectralVariable import SpectralVariable
+from VariableIndex import VariableIndex
 
 '''___Authorship___'''
 __author__ = "Sam Hunt"
@@ -19,6 +21,10 @@ __maintainer__ = "Sam Hunt"
 __email__ = "sam.hunt@npl.co.uk"
 __status__ = "Development"
 
+# Number of variable indices kept per data factory, data factories may be shared by a product and products processed
+# from it
+INDEX_CACHE_SIZE = 8
+
 
 class AbstractDataFactory:
     """
@@ -120,8 +126,19 @@ class AbstractDataFactory:
         .. py:method:: getData(...):
 
             Returns variable[s] of in-memory product as an xarray data structure.
+
+        .. py:method:: getVariableInfo(...):
+
+            Returns variable information dictionary for specified variable
+
+        .. py:method:: returnVariableIndex(...):
+
+            Returns name index of product variables and sub-products
     """
 
+    # Attributes caching product metadata, not copied with data factory (e.g. as products are not copyable)
+    CACHE_ATTRIBUTES = ["variable_indices"]
+
     def __init__(self):
         """
         Initialise class
@@ -129,6 +146,18 @@ class AbstractDataFactory:
 
         pass
 
+    def __getstate__(self):
+        """
+        Returns state of data factory for copying, without cached product metadata
+
+        :return:
+            :state: *dict*
+
+            Data factory attributes
+        """
+
+        return dict((k, v) for k, v in self.__dict__.items() if k not in self.CACHE_ATTRIBUTES)
+
     def openProduct(self, product_path):
         """
         Opens an in-memory representation of data product at specified product_path
@@ -214,7 +243,40 @@ class AbstractDataFactory:
             Dictionary of variable metadata
         """
 
-        return [var.return_variable_dict() for var in variables if var.name == name][0]
+        return self.returnVariableIndex(variables).getVariableInfo(name)
+
+    def returnVariableIndex(self, variables, products=None):
+        """
+        Returns name index of product variables and sub-products, reused between calls while variables and products
+        are unchanged
+
+        :type variables: list
+        :param variables: list of variable objects
+
+        :type products: list
+        :param products: (optional) List of dictionaries of in-memory representations of opened data products
+
+        :return:
+            :index: *eopy.product.productIO.VariableIndex.VariableIndex*
+
+            Index of variables and sub-products by name
+        """
+
+        if getattr(self, "variable_indices", None) is None:
+            self.variable_indices = OrderedDict()
+
+        key = (id(variables), id(products))
+        index = self.variable_indices.get(key, None)
+
+        if (index is None) or (not index.isCurrent(variables, products)):
+            index = VariableIndex(variables, products)
+
+        self.variable_indices.pop(key, None)
+        self.variable_indices[key] = index
+        while len(self.variable_indices) > INDEX_CACHE_SIZE:
+            self.variable_indices.popitem(last=False)
+
+        return index
 
     def getDataVariables(self, product):
         """
@@ -628,7 +690,7 @@ class AbstractDataFactory:
         """
         return {"product_string": None}
 
-    def getData(self, product, variables, attributes, variable, *args):
+    def getData(self, product, variables, attributes, variable, *args, **kwargs):
         """
         Returns variable[s] of in-memory product as an xarray data structure.
 
@@ -648,6 +710,14 @@ class AbstractDataFactory:
         :param args: str
         :param args: Name of additional variables to return data for
 
+        :type kwargs: -
+        :param kwargs: Data reading parameters, for example:
+
+        * *window* - pixel window to read, defined as *(x, y, x_width, y_width)*, or list of such windows
+        * *lazy* - if True return dask-backed data structure, read chunk by chunk when computed
+        * *chunks* - chunk size for lazily read data
+        * *mask_format* - format of returned mask variables, *None* (default), *"bool"* or *"packed"*
+
         :return:
             :data: *xarray.DataArray [xarray.Dataset]*
             Specified variable[s] in memory in xarray data structure
@@ -29,6 +29,13 @@ class AbstractDataReader:
 
         Instance of sub-class of product factory for reading product data
 
+        .. py:attribute:: engine
+
+        *str*
+
+        Name of engine to read product data with, for data readers with more than one engine available (e.g.
+        *"netcdf"*). Default engine used if None.
+
     :Methods:
         .. py:method:: setDataFactory(...):
 
@@ -49,16 +56,20 @@ class AbstractDataReader:
             Inherits this functionality from *self.dataFactory*.
     """
 
-    def __init__(self, product_path=None):
+    def __init__(self, product_path=None, engine=None):
         """
         Initialise DataReader object
 
         :type product_path: str
         :param product_path: The data product file path
+
+        :type engine: str
+        :param engine: (optional) Name of engine to read product data with, if more than one available
         """
 
         # Initialise attributes
         self.dataFactory = None   # Data Factory for input data path
+        self.engine = engine      # Engine to read data with, default engine if None
 
         if product_path is not None:
             # See if dataFactory available in reader implementation suitable data product at specified product_path
@@ -110,7 +121,7 @@ class AbstractDataReader:
 
         return product, variables, attributes
 
-    def getData(self, product, variables, attributes, variable, *args):
+    def getData(self, product, variables, attributes, variable, *args, **kwargs):
         """
         Returns variable[s] of in-memory product as an xarray data structure.
 
@@ -129,6 +140,9 @@ class AbstractDataReader:
         :type args: str
         :param args: Name of additional variables to to return data for
 
+        :type kwargs: -
+        :param kwargs: Data reading parameters (e.g. *window*), passed to *self.dataFactory*
+
         :return:
             :data: *xarray.DataArray [xarray.Dataset]*
 
@@ -136,7 +150,7 @@ class AbstractDataReader:
         """
 
         # Use dataFactory method getData() to get variable as an xarray
-        data = self.dataFactory.getData(product, variables, attributes, variable, *args)
+        data = self.dataFactory.getData(product, variables, attributes, variable, *args, **kwargs)
 
         return data
 
@@ -0,0 +1,235 @@
+"""
+FlagCoding Class
+"""
+
+'''___Built-In Modules___'''
+from collections import OrderedDict
+
+'''___Third-Party Modules___'''
+from numpy import asarray, atleast_1d, int64, zeros, uint32, packbits, ndarray
+import numpy.ma as ma
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+# Number of pixels tested against all flags at once in FlagCoding.percentages, limits memory use to
+# BLOCK_SIZE x number of flags booleans
+BLOCK_SIZE = 65536
+
+# Value of raised flag in default mask format, as returned for snappy masks
+MASK_TRUE_VALUE = 255
+
+# Available formats of decoded masks
+MASK_FORMATS = [None, "bool", "packed"]
+
+
+def decode_flag(flag_values, flag_mask, mask_format=None):
+    """
+    Return mask of pixels with flag raised, decoded from raw flag values with NumPy bit operations
+
+    :type flag_values: numpy.ndarray/dask.array.Array
+    :param flag_values: Raw flag variable values
+
+    :type flag_mask: int
+    :param flag_mask: Bit mask of flag
+
+    :type mask_format: str
+    :param mask_format: (optional) Format of returned mask, either:
+
+    * None - *uint32* array, with raised flags set to 255 (default)
+    * *"bool"* - *bool* array
+    * *"packed"* - *uint8* array, with flags packed into bits along the x dimension (see *numpy.packbits*)
+
+    :return:
+        :mask: *numpy.ndarray/dask.array.Array*
+
+        Decoded flag mask
+    """
+
+    if mask_format not in MASK_FORMATS:
+        raise ValueError("Unknown mask format '%s', must be one of %s" % (mask_format, str(MASK_FORMATS)))
+
+    # Masked flag values (e.g. outside valid data) are not treated differently, mask data values only
+    if isinstance(flag_values, ma.MaskedArray):
+        flag_values = ma.getdata(flag_values)
+
+    raised = (flag_values & flag_mask) != 0
+
+    if mask_format == "bool":
+        return raised
+
+    elif mask_format == "packed":
+        if not isinstance(raised, ndarray):
+            raise ValueError("Packed masks only available for in-memory data")
+        return packbits(raised, axis=-1)
+
+    return raised.astype(uint32) * MASK_TRUE_VALUE
+
+
+class FlagCoding:
+    """
+    FlagCoding instances describe the bits of a flag variable (e.g. Sentinel-3 OLCI ``quality_flags``, ``WQSF``,
+    ``LQSF``), and compute flag statistics from the raw flag values with NumPy bit operations. Flag variables read
+    with *getData* have their flag coding in the CF ``flag_masks`` and ``flag_meanings`` attributes.
+
+    Sample Code:
+
+    .. code-block:: python
+
+        quality_flags = product.getData("quality_flags")
+        flag_coding = FlagCoding.fromAttributes(quality_flags.attrs)
+        percentages = flag_coding.percentages(quality_flags.values, ["invalid", "land"])
+
+    :Attributes:
+        .. py:attribute:: flag_meanings
+
+            *list:str*
+
+            Flag names
+
+        .. py:attribute:: flag_masks
+
+            *numpy.ndarray*
+
+            Bit mask of each flag
+
+    :Methods:
+        .. py:method:: fromAttributes(...):
+
+            Return FlagCoding from CF ``flag_masks`` and ``flag_meanings`` variable attributes
+
+        .. py:method:: getFlagMask(...):
+
+            Return bit mask of flag
+
+        .. py:method:: decode(...):
+
+            Return mask of pixels with flag raised
+
+        .. py:method:: percentages(...):
+
+            Return percentage of pixels with each flag raised
+    """
+
+    def __init__(self, flag_masks, flag_meanings):
+        """
+        Initialise flag coding
+
+        :type flag_masks: list
+        :param flag_masks: Bit mask of each flag
+
+        :type flag_meanings: list
+        :param flag_meanings: Name of each flag
+        """
+
+        self.flag_masks = atleast_1d(asarray(flag_masks, dtype=int64))
+        self.flag_meanings = list(flag_meanings)
+
+        if len(self.flag_masks) != len(self.flag_meanings):
+            raise ValueError("Number of flag masks (%d) and flag meanings (%d) differ"
+                             % (len(self.flag_masks), len(self.flag_meanings)))
+
+    @classmethod
+    def fromAttributes(cls, attrs):
+        """
+        Return FlagCoding from CF ``flag_masks`` and ``flag_meanings`` variable attributes
+
+        :type attrs: dict
+        :param attrs: Variable attributes, e.g. ``attrs`` of *xarray.DataArray* returned by *getData*
+
+        :return:
+            :flag_coding: *eopy.product.productIO.FlagCoding.FlagCoding*
+
+            Flag coding of variable. None if variable has no flag coding.
+        """
+
+        if ("flag_masks" not in attrs) or ("flag_meanings" not in attrs):
+            return None
+
+        flag_meanings = attrs["flag_meanings"]
+        if isinstance(flag_meanings, basestring):
+            flag_meanings = flag_meanings.split()
+
+        return cls(attrs["flag_masks"], flag_meanings)
+
+    def getFlagMask(self, flag):
+        """
+        Return bit mask of flag
+
+        :type flag: str
+        :param flag: Flag name
+
+        :return:
+            :flag_mask: *int*
+
+            Bit mask of flag
+        """
+
+        if flag not in self.flag_meanings:
+            raise KeyError("Flag '%s' not in flag coding" % flag)
+
+        return int(self.flag_masks[self.flag_meanings.index(flag)])
+
+    def decode(self, flag_values, flag, mask_format="bool"):
+        """
+        Return mask of pixels with flag raised
+
+        :type flag_values: numpy.ndarray
+        :param flag_values: Raw flag variable values
+
+        :type flag: str
+        :param flag: Flag name
+
+        :type mask_format: str
+        :param mask_format: (optional) Format of returned mask, see *decode_flag*. Default is *"bool"*.
+
+        :return:
+            :flag_mask: *numpy.ndarray*
+
+            Decoded flag mask
+        """
+
+        return decode_flag(flag_values, self.getFlagMask(flag), mask_format)
+
+    def percentages(self, flag_values, flags=None):
+        """
+        Return percentage of pixels with each flag raised, computed in one pass over the flag values
+
+        :type flag_values: numpy.ndarray
+        :param flag_values: Raw flag variable values
+
+        :type flags: list
+        :param flags: (optional) Names of flags to compute percentages for, default all flags
+
+        :return:
+            :percentages: *collections.OrderedDict*
+
+            Percentage of pixels with flag raised, per flag name
+        """
+
+        if flags is None:
+            flags = self.flag_meanings
+
+        masks = asarray([self.getFlagMask(flag) for flag in flags], dtype=int64)
+        values = asarray(ma.getdata(flag_values)).ravel()
+
+        # Count raised flags in blocks of pixels, testing each block against all flag masks at once
+        counts = zeros(len(masks), int64)
+        for start in range(0, values.size, BLOCK_SIZE):
+            block = values[start:start+BLOCK_SIZE]
+            counts += ((block[:, None] & masks[None, :]) != 0).sum(axis=0)
+
+        size = float(values.size) if values.size > 0 else float("nan")
+        return OrderedDict((flag, (float(count) / size) * 100.0) for flag, count in zip(flags, counts))
+
+
+if __name__ == "__main__":
+    pass
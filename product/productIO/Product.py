@@ -8,6 +8,7 @@ Main wrapper of NPL Data Reading and Writer packages
 
 '''___NPL Modules___'''
 from ProductDataReader import ProductDataReader
+from VariableIndex import VariableIndex
 
 '''___Authorship___'''
 __author__ = "Sam Hunt"
@@ -61,6 +62,13 @@ class Product:
 
             Data reader for data specified by product_path, instantiated in *self.readProduct*
 
+        .. py:attribute:: index
+
+            *eopy.product.productIO.VariableIndex.VariableIndex*
+
+            Index of product variables and sub-products by variable name, built on opening product and updated by
+            *self.updateIndex* (e.g. after processing)
+
     :Methods:
         .. py:method:: openProduct(...):
 
@@ -98,21 +106,38 @@ class Product:
 
             Returns variable names for info variables
 
+        .. py:method:: getVariable(...):
+
+            Returns variable object for specified variable
+
         .. py:method:: getVariableInfo(...):
 
             Returns variable information dictionary for specified variable
 
+        .. py:method:: updateIndex(...):
+
+            Rebuilds index of product variables and sub-products by variable name
+
+        .. py:method:: returnVariableIndex(...):
+
+            Returns index of product variables and sub-products by variable name, rebuilt if out of date
+
         .. py:method:: save_to_netcdf(...):
 
             Writes entire data product to netcdf file at specified path
     """
 
-    def __init__(self, product_path=None):
+    def __init__(self, product_path=None, engine=None):
         """
         Initialise data Product object
 
         :type product_path: str
         :param product_path: The data product file path
+
+        :type engine: str
+        :param engine: (optional) Name of engine to read product data with, for products with more than one engine
+        available. For example, Sentinel-3 products may be read with *"netcdf"*, which reads the product netCDF files
+        directly rather than with snappy. Default engine used if None.
         """
 
         # Initialise class attributes
@@ -120,16 +145,18 @@ class Product:
         self.product = None        # In memory product instantiation
         self.attributes = None     # Product attributes dictionary
         self.variables = None      # Product variables dictionary
+        self.index = None          # Index of variables and sub-products by variable name
 
         # If path to product provided try to open data
         if product_path is not None:
-            self.product, self.variables, self.attributes = self.openProduct(product_path)
+            self.product, self.variables, self.attributes = self.openProduct(product_path, engine=engine)
+            self.updateIndex()
             # try:
             #     self.product, self.variables, self.attributes = self.openProduct(product_path)
             # except:
             #     raise RuntimeError("Product Error: Unable to read data product")
 
-    def openProduct(self, product_path):
+    def openProduct(self, product_path, engine=None):
         """
         Reads the data product specified by the given file path.
 
@@ -138,6 +165,9 @@ class Product:
         :type product_path: str
         :param product_path: The data product file path
 
+        :type engine: str
+        :param engine: (optional) Name of engine to read product data with, if more than one available
+
         :return:
             :product: *-*
 
@@ -154,15 +184,15 @@ class Product:
 
         # Get appropriate the data reader for  the data product at specified file path
         productDataReader = ProductDataReader()
-        dataReader = productDataReader.setDataReader(product_path)
+        dataReader = productDataReader.setDataReader(product_path, engine=engine)
 
         # Read data
-        self.dataReader = dataReader(product_path)
+        self.dataReader = dataReader(product_path, engine=engine)
         product, variables, attributes = self.dataReader.openProduct(product_path)
 
         return product, variables, attributes
 
-    def getData(self, variable, *args):
+    def getData(self, variable, *args, **kwargs):
         """
         Returns variable[s] of in-memory product as an xarray data structure.
 
@@ -173,13 +203,30 @@ class Product:
 
         :param args: Name of additional product variables to get data for
 
+        :type window: tuple/list
+        :param window: (optional) Pixel window to read data from, defined as *(x, y, x_width, y_width)* - i.e. pixel
+        location of upper left corner and pixel size of window. If a list of windows is given a list of data structures
+        is returned, one per window.
+
+        :type lazy: bool
+        :param lazy: (optional) If True return dask-backed data structure, where data is only read from the product for
+        the chunks computed. Default is False.
+
+        :type chunks: int/tuple
+        :param chunks: (optional) Chunk size, *(y_width, x_width)*, for lazily read data. Default is the preferred tile
+        size of the product.
+
+        :type mask_format: str
+        :param mask_format: (optional) Format of returned mask variables, either *None* (*uint32*, raised flags set to
+        255, default), *"bool"* or *"packed"* (bits packed along x dimension, in-memory data only)
+
         :return:
             :data: *xarray.DataArray [xarray.Dataset]*
 
             Specified variable[s] in memory in xarray data structure
         """
 
-        return self.dataReader.getData(self.product, self.variables, self.attributes, variable, *args)
+        return self.dataReader.getData(self.product, self.variables, self.attributes, variable, *args, **kwargs)
 
     def _check_variables_compatible(self, variables):
         """
@@ -287,7 +334,45 @@ class Product:
             Dictionary of variable metadata
         """
 
-        return [var.return_variable_dict() for var in self.variables if var.name == name][0]
+        return self.returnVariableIndex().getVariableInfo(name)
+
+    def getVariable(self, name):
+        """
+        Returns variable object for specified variable
+
+        :type name: str
+        :param name: variable name
+
+        :return:
+            :variable: *eopy.product.productIO.Variable.Variable*
+
+            Variable object
+        """
+
+        return self.returnVariableIndex().getVariable(name)
+
+    def updateIndex(self):
+        """
+        Rebuilds index of product variables and sub-products by variable name, e.g. after variables or sub-products
+        are edited in place
+        """
+
+        self.index = VariableIndex(self.variables, self.product)
+
+    def returnVariableIndex(self):
+        """
+        Returns index of product variables and sub-products by variable name, rebuilt if variables or sub-products have
+        changed since built
+
+        :return:
+            :index: *eopy.product.productIO.VariableIndex.VariableIndex*
+
+            Index of product variables and sub-products
+        """
+
+        if (self.index is None) or (not self.index.isCurrent(self.variables, self.product)):
+            self.updateIndex()
+        return self.index
 
     def save_to_netcdf(self, path):
         """
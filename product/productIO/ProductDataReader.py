@@ -3,14 +3,16 @@ Gets product reader appropriate for a given data product
 """
 
 '''___Built-In Modules___'''
+import sys
 from glob import glob
-from os.path import basename, dirname, splitext, abspath
+from os.path import basename, dirname, abspath
 from os.path import join as pjoin
-import imp
 
 '''___Third-Party Modules___'''
 
 '''___NPL Modules___'''
+sys.path.append(pjoin(dirname(dirname(dirname(abspath(__file__)))), "utils"))
+from PluginRegistry import PluginRegistry
 
 '''___Authorship___'''
 __author__ = "Sam Hunt"
@@ -24,7 +26,10 @@ __status__ = "Development"
 
 class ProductDataReader:
     """
-    Provides functionality to return appropriate product reader for a data product at a specified file path
+    Provides functionality to return appropriate product reader for a data product at a specified file path.
+
+    Available data readers are held in a process-wide *PluginRegistry*, so reader modules are only loaded once. The
+    product directory name is matched against the combined ``PATTERNS`` of all readers to find the suitable reader.
 
     :Methods:
         .. py:method:: setDataReader(...):
@@ -36,39 +41,31 @@ class ProductDataReader:
             Return paths of all available data readers in *eopy.dataIO* package
     """
 
-    def setDataReader(self, product_path):
+    def setDataReader(self, product_path, engine=None):
         """
         Return the appropriate data reader for a data product at a specified file path
 
         :type product_path: str
         :param product_path: The data product file path
 
+        :type engine: str
+        :param engine: (optional) Name of engine to read product data with, if more than one available
+
         :return:
             :DataReader: *eopy.dataIO.AbstractDataReader.AbstractDataReader*
 
             Product Data reader
         """
 
-        # Get paths of available product readers in eopy.dataIO package
-        dataReaderPaths = self.getDataReaderPaths()
-
-        # Check if any found product readers suitable for data product specified by product_path
-        for dataReaderPath in dataReaderPaths:
-
-            # Open specified product reader
-            dataReaderName = splitext(basename(dataReaderPath))[0]
-            dataReaderModule = imp.load_source(dataReaderName, dataReaderPath)
-            dataReader = getattr(dataReaderModule, dataReaderName)
-
-            # Test to find if product reader can find appropriate product factory
-            testDataReader = dataReader()
-            testProductFactory = testDataReader.setDataFactory(product_path)
+        # Get process-wide registry of available product readers in eopy.dataIO package
+        registry = PluginRegistry.getRegistry("productIO", self.getDataReaderPaths)
 
-            # If test instantiation of product reader can find appropriate product factory return data reader
-            if testProductFactory is not None:
-                return dataReader
+        # Test to find if product reader can find appropriate product factory
+        def test(dataReader):
+            return dataReader(engine=engine).setDataFactory(product_path) is not None
 
-        return None
+        # Find reader with pattern matching product directory name, or else any suitable reader
+        return registry.resolve(basename(dirname(product_path)), test)
 
     def getDataReaderPaths(self):
         """
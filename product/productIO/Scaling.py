@@ -0,0 +1,191 @@
+"""
+Scaling of raw stored variable values to physical values
+"""
+
+'''___Built-In Modules___'''
+
+'''___Third-Party Modules___'''
+from numpy import dtype as np_dtype, iinfo, issubdtype, integer, rint, clip, float32, float64, nan, ndarray, isnan
+import numpy.ma as ma
+import dask.array as da
+import xarray as xr
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+# Available scalings of returned data variables
+SCALINGS = ["physical", "raw"]
+
+# CF attributes of raw variable values
+SCALING_ATTRIBUTES = ["scale_factor", "add_offset", "_FillValue"]
+
+
+def return_fill_value(raw_dtype, fill_value=None):
+    """
+    Return value to fill invalid pixels of raw values with
+
+    :type raw_dtype: str
+    :param raw_dtype: Data type of raw values
+
+    :type fill_value: int/float
+    :param fill_value: (optional) Fill value defined for variable, e.g. its no-data value
+
+    :return:
+        :fill_value: *int/float*
+
+        Fill value - given fill value, or if None, the maximum value of unsigned integer types, the minimum value of
+        signed integer types and nan for floating point types
+    """
+
+    raw_dtype = np_dtype(raw_dtype)
+
+    if fill_value is not None:
+        return raw_dtype.type(fill_value)
+
+    if issubdtype(raw_dtype, integer):
+        info = iinfo(raw_dtype)
+        return raw_dtype.type(info.max if info.min == 0 else info.min)
+
+    return raw_dtype.type(nan)
+
+
+def return_raw_values(values, raw_dtype, scale_factor=None, add_offset=None, fill_value=None):
+    """
+    Return raw values of physical values, by inverting their scaling. Integer raw values are recovered exactly, as
+    physical values are read with at least the precision of the raw values.
+
+    :type values: numpy.ndarray
+    :param values: Physical values, masked or nan where invalid
+
+    :type raw_dtype: str
+    :param raw_dtype: Data type of raw values
+
+    :type scale_factor: float
+    :param scale_factor: (optional) Scale factor of raw values, default 1
+
+    :type add_offset: float
+    :param add_offset: (optional) Offset of raw values, default 0
+
+    :type fill_value: int/float
+    :param fill_value: (optional) Value to fill invalid pixels with, default from *return_fill_value*
+
+    :return:
+        :raw_values: *numpy.ndarray*
+
+        Raw values, with invalid pixels set to fill value
+    """
+
+    raw_dtype = np_dtype(raw_dtype)
+    fill_value = return_fill_value(raw_dtype, fill_value)
+
+    invalid = ma.getmaskarray(values)
+    values = ma.getdata(values).astype(float64)
+    invalid = invalid | isnan(values)
+
+    if add_offset is not None:
+        values = values - add_offset
+    if scale_factor is not None:
+        values = values / scale_factor
+
+    if issubdtype(raw_dtype, integer):
+        info = iinfo(raw_dtype)
+        values = clip(rint(values), info.min, info.max)
+
+    raw_values = values.astype(raw_dtype)
+    raw_values[invalid] = fill_value
+
+    return raw_values
+
+
+def apply_scaling(values, scale_factor=None, add_offset=None, fill_value=None, dtype=float32):
+    """
+    Return physical values of raw values. Vectorised, so suitable for *numpy.ndarray* or *dask.array.Array* arguments,
+    for which scaling is applied lazily.
+
+    :type values: numpy.ndarray/dask.array.Array
+    :param values: Raw values
+
+    :type scale_factor: float
+    :param scale_factor: (optional) Scale factor of raw values, default 1
+
+    :type add_offset: float
+    :param add_offset: (optional) Offset of raw values, default 0
+
+    :type fill_value: int/float
+    :param fill_value: (optional) Fill value of invalid raw values
+
+    :type dtype: type
+    :param dtype: (optional) Data type of physical values, default *float32*
+
+    :return:
+        :physical_values: *numpy.ndarray/dask.array.Array*
+
+        Physical values - invalid pixels masked for *numpy.ndarray* values, or set to nan for *dask.array.Array*
+        values
+    """
+
+    physical_values = values.astype(dtype)
+    if scale_factor is not None:
+        physical_values = physical_values * dtype(scale_factor)
+    if add_offset is not None:
+        physical_values = physical_values + dtype(add_offset)
+
+    if fill_value is None:
+        return physical_values
+
+    # nan fill values never equal, so nan values are invalid
+    invalid = (values != values) if isnan(fill_value) else (values == fill_value)
+    if isinstance(physical_values, ndarray):
+        return ma.masked_array(physical_values, mask=invalid | ma.getmaskarray(physical_values))
+    return da.where(invalid, nan, physical_values)
+
+
+def decode_scaling(data, dtype=float32):
+    """
+    Return xarray data structure, with raw variables (with CF ``scale_factor``, ``add_offset`` or ``_FillValue``
+    attributes, as returned by *getData* with *scaling="raw"*) scaled to physical values. Scaling is applied lazily to
+    dask-backed data.
+
+    :type data: xarray.DataArray/xarray.Dataset
+    :param data: Data, with raw variables
+
+    :type dtype: type
+    :param dtype: (optional) Data type of physical values, default *float32*
+
+    :return:
+        :physical_data: *xarray.DataArray/xarray.Dataset*
+
+        Data, with raw variables scaled to physical values, invalid pixels set to nan
+    """
+
+    if isinstance(data, xr.Dataset):
+        physical_data = data.copy()
+        for name in data.data_vars:
+            physical_data[name] = decode_scaling(data[name], dtype=dtype)
+        return physical_data
+
+    if not any(attribute in data.attrs for attribute in SCALING_ATTRIBUTES):
+        return data
+
+    attrs = dict((k, v) for k, v in data.attrs.items() if k not in SCALING_ATTRIBUTES)
+    scale_factor = data.attrs.get("scale_factor", None)
+    add_offset = data.attrs.get("add_offset", None)
+    fill_value = data.attrs.get("_FillValue", None)
+
+    values = apply_scaling(data.data, scale_factor, add_offset, fill_value, dtype)
+    if isinstance(values, ma.MaskedArray):
+        values = values.filled(nan)
+
+    return xr.DataArray(values, dims=data.dims, coords=data.coords, name=data.name, attrs=attrs)
+
+
+if __name__ == "__main__":
+    pass
@@ -48,6 +48,30 @@ class SpectralVariable(Variable):
 
             Data type of variable data array (i.e. int16, float32)
 
+        .. py:attribute:: raw_dtype
+
+            *str*
+
+            (optional) Data type of raw variable values as stored in product, if defined
+
+        .. py:attribute:: raw_scale_factor
+
+            *float*
+
+            (optional) Scale factor of raw variable values, if scaled
+
+        .. py:attribute:: raw_add_offset
+
+            *float*
+
+            (optional) Offset of raw variable values, if scaled
+
+        .. py:attribute:: raw_fill_value
+
+            *int/float*
+
+            (optional) Value of invalid raw variable values, if defined
+
         .. py:attribute:: vtype
 
             *str*
@@ -91,6 +115,11 @@ class SpectralVariable(Variable):
             self.bandwidth = variable_dict["bandwidth"]
             self.srf = variable_dict["srf"]
 
+            # Storage of raw variable values, only defined by some products
+            for key in ["raw_dtype", "raw_scale_factor", "raw_add_offset", "raw_fill_value"]:
+                if key in variable_dict:
+                    setattr(self, key, variable_dict[key])
+
     def add_srf(self, srf_path):
         # todo - write method for opening SpectralVariable srf as xarray
         pass
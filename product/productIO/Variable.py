@@ -47,6 +47,30 @@ class Variable:
 
             Data type of variable data array (i.e. int16, float32)
 
+        .. py:attribute:: raw_dtype
+
+            *str*
+
+            (optional) Data type of raw variable values as stored in product, if defined
+
+        .. py:attribute:: raw_scale_factor
+
+            *float*
+
+            (optional) Scale factor of raw variable values, if scaled
+
+        .. py:attribute:: raw_add_offset
+
+            *float*
+
+            (optional) Offset of raw variable values, if scaled
+
+        .. py:attribute:: raw_fill_value
+
+            *int/float*
+
+            (optional) Value of invalid raw variable values, if defined
+
         .. py:attribute:: vtype
 
             *str*
@@ -84,6 +108,11 @@ class Variable:
             self.vtype = variable_dict["vtype"]
             self.units = variable_dict["units"]
 
+            # Storage of raw variable values, only defined by some products
+            for key in ["raw_dtype", "raw_scale_factor", "raw_add_offset", "raw_fill_value"]:
+                if key in variable_dict:
+                    setattr(self, key, variable_dict[key])
+
     def return_variable_dict(self):
         """
         Returns dictionary of variable information
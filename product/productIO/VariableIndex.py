@@ -0,0 +1,227 @@
+"""
+VariableIndex Class
+"""
+
+'''___Built-In Modules___'''
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+class VariableIndex:
+    """
+    VariableIndex instances index the variables of a data product by name, and the sub-products of the data product
+    (i.e. entries of a *eopy.product.productIO.Product.Product* ``product`` attribute list, e.g. per resolution for
+    Sentinel-2 products) by the names of the variables they contain, so variables and the sub-product to read them
+    from are found in constant time.
+
+    Sample Code:
+
+    .. code-block:: python
+
+        index = VariableIndex(product.variables, product.product)
+        variable_info = index.getVariableInfo("Oa01_radiance")
+        sub_product = index.getProduct(["Oa01_radiance", "latitude", "longitude"])
+
+    :Attributes:
+        .. py:attribute:: variables
+
+            *list*
+
+            Indexed product variables as ``Variable`` or ``SpectralVariable`` class objects
+
+        .. py:attribute:: products
+
+            *list*
+
+            Indexed list of dictionaries of in-memory representations of data products, with entries "product_name",
+            "product" and "variables" (list of variable names). None if not indexed.
+
+        .. py:attribute:: variables_by_name
+
+            *dict*
+
+            Variable objects by variable name
+
+        .. py:attribute:: products_by_variable
+
+            *dict*
+
+            Indices of sub-products by name of variable they contain
+
+    :Methods:
+        .. py:method:: isCurrent(...):
+
+            Return True if index is up to date for given variables and products
+
+        .. py:method:: getVariable(...):
+
+            Return variable object for given variable name
+
+        .. py:method:: getVariableInfo(...):
+
+            Return variable information dictionary for given variable name
+
+        .. py:method:: getProductIndex(...):
+
+            Return index of sub-product containing all given variables
+
+        .. py:method:: getProduct(...):
+
+            Return sub-product dictionary containing all given variables
+    """
+
+    def __init__(self, variables, products=None):
+        """
+        Initialise index
+
+        :type variables: list
+        :param variables: Product variables as ``Variable`` or ``SpectralVariable`` class objects
+
+        :type products: list
+        :param products: (optional) List of dictionaries of in-memory representations of data products
+        """
+
+        self.variables = variables
+        self.products = products if type(products) == list else None
+
+        self.variables_by_name = {}
+        if variables is not None:
+            for variable in variables:
+                self.variables_by_name.setdefault(variable.name, variable)
+
+        self.products_by_variable = {}
+        self.product_variables = []
+        if self.products is not None:
+            for i, product_dict in enumerate(self.products):
+                product_variables = set(product_dict.get("variables", None) or [])
+                self.product_variables.append(product_variables)
+                for name in product_variables:
+                    self.products_by_variable.setdefault(name, []).append(i)
+
+        self.state = self.returnState(variables, products)
+
+    def returnState(self, variables, products):
+        """
+        Return summary of state of variables and products, to check whether index is up to date
+
+        :type variables: list
+        :param variables: Product variables
+
+        :type products: list
+        :param products: List of dictionaries of in-memory representations of data products
+
+        :return:
+            :state: *tuple*
+
+            Identity and length of variables and products variable name lists
+        """
+
+        products_state = None
+        if type(products) == list:
+            products_state = tuple((id(p.get("variables", None)), len(p.get("variables", None) or []))
+                                   for p in products)
+
+        return id(variables), len(variables) if variables is not None else 0, id(products), products_state
+
+    def isCurrent(self, variables, products=None):
+        """
+        Return True if index is up to date for given variables and products
+
+        :type variables: list
+        :param variables: Product variables
+
+        :type products: list
+        :param products: (optional) List of dictionaries of in-memory representations of data products
+
+        :return:
+            :current: *bool*
+
+            True if index up to date
+        """
+
+        return (variables is self.variables) and (self.returnState(variables, products) == self.state)
+
+    def getVariable(self, name):
+        """
+        Return variable object for given variable name
+
+        :type name: str
+        :param name: Variable name
+
+        :return:
+            :variable: *eopy.product.productIO.Variable.Variable*
+
+            Variable object
+        """
+
+        if name not in self.variables_by_name:
+            raise KeyError("Variable '%s' not in product" % name)
+
+        return self.variables_by_name[name]
+
+    def getVariableInfo(self, name):
+        """
+        Return variable information dictionary for given variable name
+
+        :type name: str
+        :param name: Variable name
+
+        :return:
+            :variable_dict: *dict*
+
+            Dictionary of variable metadata
+        """
+
+        return self.getVariable(name).return_variable_dict()
+
+    def getProductIndex(self, selected_variables):
+        """
+        Return index of sub-product containing all given variables, the last if more than one
+
+        :type selected_variables: list
+        :param selected_variables: Variable names
+
+        :return:
+            :i: *int*
+
+            Index of sub-product in products list. None if no sub-product contains all variables.
+        """
+
+        if (self.products is None) or (selected_variables == []):
+            return None
+
+        for i in reversed(self.products_by_variable.get(selected_variables[0], [])):
+            if all(s in self.product_variables[i] for s in selected_variables[1:]):
+                return i
+        return None
+
+    def getProduct(self, selected_variables):
+        """
+        Return sub-product dictionary containing all given variables, the last if more than one
+
+        :type selected_variables: list
+        :param selected_variables: Variable names
+
+        :return:
+            :product_dict: *dict*
+
+            Sub-product dictionary. None if no sub-product contains all variables.
+        """
+
+        i = self.getProductIndex(selected_variables)
+        return self.products[i] if i is not None else None
+
+
+if __name__ == "__main__":
+    pass
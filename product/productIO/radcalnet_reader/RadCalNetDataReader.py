@@ -0,0 +1,97 @@
+"""
+Data reader for RadCalNet data products
+"""
+
+'''___Built-In Modules___'''
+import sys
+from os.path import dirname, basename
+import re
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+# Product factory imported only as required in RadCalNetDataReader.setDataFactory(), so xarray is only imported when a
+# RadCalNet product is read
+sys.path.append(dirname(__file__))
+
+sys.path.append(dirname(dirname(__file__)))
+from AbstractDataReader import AbstractDataReader
+
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+# Regular expression for RadCalNet file names, compiled once on import
+RADCALNET_PATTERN = re.compile(r"(BTCN|GONA|LCFR|RVUS)\d\d_\d{4}_\d{3}_v\d+\.\d+\.(output|input)$")
+
+
+class RadCalNetDataReader(AbstractDataReader):
+    """
+    RadCalNetDataReader is a sub-class of AbstractDataReader for reading RadCalNet data products, *.output* (TOA
+    reflectance) and *.input* (BOA reflectance) files.
+
+    RadCalNet products are single files, matched by file name, so the reader defines no ``PATTERNS`` of product
+    directory names and is found by *eopy.product.productIO.ProductDataReader.ProductDataReader* by testing
+    *setDataFactory*.
+
+    :Attributes:
+        .. py:attribute:: dataFactory
+
+            *eopy.dataIO.AbstractDataFactory.AbstractDataFactory*
+
+            Instance of sub-class of product factory for reading RadCalNet product data
+
+    :Methods:
+        .. py:method:: setDataFactory(...):
+
+            Return RadCalNet product factory suitable for data product at product_path
+
+            *If no suitable factory available returns None*
+
+        :Inherited from *eopy.dataIO.AbstractDataReader.AbstractDataReader*:
+
+            .. py:method:: __init__(...):
+
+                Initialises attributes and finds suitable product factory for product_path if provided and possible.
+
+            .. py:method:: openProduct(...):
+
+                Opens an in-memory representation of data product specified by product_path. Inherits this functionality
+                from *self.dataFactory*.
+
+            .. py:method:: getData(...):
+
+                Returns variable[s] of in-memory product as an xarray data structure. Inherits this functionality from
+                *self.dataFactory*.
+    """
+
+    def setDataFactory(self, product_path):
+        """
+        Return RadCalNet product factory suitable for data product at product_path
+
+        *If no suitable factory available returns None*
+
+        :type product_path: str
+        :param product_path: The data product file path
+
+        :return:
+            :DataFactory: *cls*
+
+            RadCalNet Product Data Factory
+        """
+
+        if RADCALNET_PATTERN.match(basename(product_path)):
+            from RadCalNetFactory import RadCalNetFactory
+            return RadCalNetFactory
+
+        return None
+
+
+if __name__ == "__main__":
+    pass
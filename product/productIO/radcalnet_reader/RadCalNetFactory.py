@@ -0,0 +1,685 @@
+"""
+Data factory for opening RadCalNet *.output* (TOA reflectance) and *.input* (BOA reflectance) text files
+
+RadCalNet files contain one day of site data, as tab separated text:
+
+* labelled header rows, *<label>:<tab><value>[<tab><value>...]* - site metadata rows (e.g. *Site*, *Lat*, *Year*,
+  *Day*, *Version*) are followed by the *UTC* row of time steps and rows of atmospheric parameters per time step (e.g.
+  *Pressure*, *Water vapour*, *AOD*). Labels may give units in brackets, e.g. *Pressure (hPa)*.
+* spectral rows, *<wavelength><tab><value per time step>*, for each wavelength - reflectance followed by the same rows
+  for reflectance uncertainty.
+
+Missing values are given as 9999.
+
+Files are parsed with all spectral rows converted to arrays in one pass and cached as *.npz* files, keyed by the
+modification time and size of the RadCalNet file, so repeated reads of the same files (e.g. in matchup processing)
+only load the cached arrays.
+"""
+
+'''___Built-In Modules___'''
+import sys
+import re
+import json
+from os import getenv, stat, rename, remove, fdopen
+from os.path import dirname, basename, splitext, abspath
+from os.path import join as pjoin
+from datetime import datetime, timedelta
+from tempfile import mkstemp
+from collections import OrderedDict
+from threading import Lock
+
+'''___Third-Party Modules___'''
+from numpy import array, asarray, concatenate, fromstring, load, savez, datetime64, nan, float64, int64, nonzero
+import xarray as xr
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from AbstractDataFactory import AbstractDataFactory
+from Variable import Variable
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+# Environment variable giving directory of RadCalNet file cache, if not set cache files written alongside RadCalNet
+# files
+CACHE_DIRECTORY_ENV = "EOPY_RADCALNET_CACHE"
+
+# Constants
+CACHE_VERSION = 1           # Version of cache file format, cache files of other versions are never read
+MEMORY_CACHE_SIZE = 1024    # Number of files kept in process-wide cache, about 50 kB per file
+FILL_VALUE = 9999.0         # Value of missing data in RadCalNet files
+SPECTRAL_VARIABLE_NAMES = {"output": ["toa_reflectance", "toa_reflectance_uncertainty"],
+                           "input": ["boa_reflectance", "boa_reflectance_uncertainty"]}
+TIME_NAMES = ["utc", "utc_time", "time"]
+
+# Regular expressions for RadCalNet file rows
+SPECTRAL_ROW_PATTERN = re.compile(r"^\s*[-+]?\.?\d")
+HEADER_ROW_PATTERN = re.compile(r"^\s*(.*?):\s+(.*)$")
+LABEL_UNITS_PATTERN = re.compile(r"[(\[](.*?)[)\]]")
+
+# Process-wide cache of most recently read files, by path
+MEMORY_CACHE = OrderedDict()
+MEMORY_CACHE_LOCK = Lock()
+
+
+def parse_label(label):
+    """
+    Return variable name and units of RadCalNet header row label
+
+    :type label: str
+    :param label: Header row label, e.g. *"Pressure (hPa):"*
+
+    :return:
+        :name: *str*
+
+        Variable name, e.g. *"pressure"*
+
+        :units: *str*
+
+        Variable units, e.g. *"hPa"*, None if not given
+    """
+
+    units = LABEL_UNITS_PATTERN.search(label)
+    units = units.group(1).strip() if units is not None else None
+
+    name = LABEL_UNITS_PATTERN.sub("", label).strip().rstrip(":").strip().lower()
+    name = re.sub(r"[^a-z0-9]+", "_", name).strip("_")
+
+    return name, units
+
+
+def parse_values(values):
+    """
+    Return array of RadCalNet header row values, with missing values as NaN
+
+    :type values: list
+    :param values: Header row values, as strings
+
+    :return:
+        :values: *numpy.ndarray*
+
+        Values, as *float64* if numeric or else as strings
+    """
+
+    try:
+        values = array(values, dtype=float64)
+    except ValueError:
+        return array(values)
+
+    values[values == FILL_VALUE] = nan
+    return values
+
+
+def return_times(date, time_strings):
+    """
+    Return times of RadCalNet time steps
+
+    :type date: datetime.datetime
+    :param date: Date of RadCalNet file
+
+    :type time_strings: list
+    :param time_strings: Time step times of day, *"HH:MM"* or *"HH:MM:SS"*
+
+    :return:
+        :times: *numpy.ndarray*
+
+        Time step times, as *datetime64[s]*
+    """
+
+    seconds = [sum(int(t) * s for t, s in zip(time_string.split(":"), [3600, 60, 1])) for time_string in time_strings]
+    return datetime64(date, "s") + asarray(seconds, dtype=int64).astype("timedelta64[s]")
+
+
+def read_radcalnet_file(product_path):
+    """
+    Return contents of RadCalNet file, parsed from text
+
+    :type product_path: str
+    :param product_path: RadCalNet *.output* or *.input* file path
+
+    :return:
+        :table: *dict*
+
+        RadCalNet file contents, with entries:
+
+        * "attributes" - dictionary of site metadata header values, as strings
+        * "time" - time step times, as *datetime64[s]* array
+        * "wavelength" - spectral row wavelengths (nm)
+        * "spectral" - list of *(name, values)* of spectral variables, values of shape *(wavelength, time)*
+        * "temporal" - list of *(name, units, values)* of per time step header variables
+    """
+
+    with open(product_path, "r") as f:
+        lines = f.read().splitlines()
+
+    # Header rows precede spectral rows, which begin with a numeric wavelength
+    n_header = 0
+    while (n_header < len(lines)) and (SPECTRAL_ROW_PATTERN.match(lines[n_header]) is None):
+        n_header += 1
+
+    # 1. Parse header rows
+    attributes = {}
+    temporal = []
+    time_strings = None
+    for line in lines[:n_header]:
+        if "\t" in line:
+            label, _, values = line.partition("\t")
+        else:
+            match = HEADER_ROW_PATTERN.match(line)
+            if match is None:
+                continue
+            label, values = match.groups()
+        name, units = parse_label(label)
+        values = values.split()
+
+        # Skip unlabelled rows and, after time steps, rows without values (e.g. spectral column headings)
+        if (name == "") or ((time_strings is not None) and (values == [])):
+            continue
+        elif (time_strings is None) and (name in TIME_NAMES):
+            time_strings = values
+        elif (time_strings is None) and (len(values) <= 1):
+            attributes[name] = values[0] if values != [] else ""
+        else:
+            temporal.append((name, units, parse_values(values)))
+
+    # 2. Parse spectral rows, converting all values at once
+    n_columns = len(lines[n_header].split()) if n_header < len(lines) else 0
+    if n_columns < 2:
+        raise ValueError("No spectral rows in RadCalNet file '%s'" % product_path)
+
+    values = fromstring("\n".join(lines[n_header:]), sep=" ")
+    if values.size % n_columns != 0:
+        raise ValueError("Spectral rows of RadCalNet file '%s' of unequal length" % product_path)
+    values = values.reshape((-1, n_columns))
+
+    # Spectral rows repeated per variable (e.g. reflectance, then its uncertainty)
+    wavelength = values[:, 0]
+    repeats = nonzero(wavelength[1:] <= wavelength[:-1])[0]
+    n_wavelengths = repeats[0] + 1 if repeats.size != 0 else wavelength.size
+    if wavelength.size % n_wavelengths != 0:
+        raise ValueError("Spectral rows of RadCalNet file '%s' of unequal length" % product_path)
+
+    spectral_values = values[:, 1:]
+    spectral_values[spectral_values == FILL_VALUE] = nan
+    spectral_values = spectral_values.reshape((-1, n_wavelengths, n_columns - 1))
+
+    file_type = splitext(product_path)[1][1:]
+    names = SPECTRAL_VARIABLE_NAMES.get(file_type, ["reflectance", "reflectance_uncertainty"])
+    names = names + [names[0] + "_%d" % i for i in range(len(names), spectral_values.shape[0])]
+    spectral = [(names[i], spectral_values[i]) for i in range(spectral_values.shape[0])]
+
+    # 3. Time step times, from file date and UTC header row
+    if ("year" in attributes) and ("day" in attributes):
+        year, day = int(attributes["year"]), int(attributes["day"])
+    else:
+        year, day = int(basename(product_path)[7:11]), int(basename(product_path)[12:15])
+    date = datetime(year, 1, 1) + timedelta(day - 1)
+
+    if time_strings is None:
+        time_strings = ["00:00"] * (n_columns - 1)
+    if len(time_strings) != n_columns - 1:
+        raise ValueError("Number of time steps in RadCalNet file '%s' inconsistent" % product_path)
+
+    return {"attributes": attributes,
+            "time": return_times(date, time_strings),
+            "wavelength": values[:n_wavelengths, 0],
+            "spectral": spectral,
+            "temporal": temporal}
+
+
+def return_cache_path(product_path, cache_directory=None):
+    """
+    Return path of cache file of RadCalNet file
+
+    :type product_path: str
+    :param product_path: RadCalNet file path
+
+    :type cache_directory: str
+    :param cache_directory: (optional) Cache directory, default from *EOPY_RADCALNET_CACHE* environment variable or else
+    the directory of the RadCalNet file
+
+    :return:
+        :cache_path: *str*
+
+        Cache file path, hidden if alongside RadCalNet file so not found as a product
+    """
+
+    if cache_directory is None:
+        cache_directory = getenv(CACHE_DIRECTORY_ENV)
+
+    if cache_directory is None:
+        return pjoin(dirname(product_path), "." + basename(product_path) + ".npz")
+    return pjoin(cache_directory, basename(product_path) + ".npz")
+
+
+def read_cache(cache_path, source):
+    """
+    Return cached contents of RadCalNet file, None if not cached or cache out of date
+
+    :type cache_path: str
+    :param cache_path: Cache file path
+
+    :type source: tuple
+    :param source: RadCalNet file *(modification time, size)*, cache only read if cached for same file state
+
+    :return:
+        :table: *dict*
+
+        RadCalNet file contents (see *read_radcalnet_file*)
+    """
+
+    try:
+        with load(cache_path) as cache:
+            header = json.loads(str(cache["header"]))
+            if (header["version"] != CACHE_VERSION) or ((header["source_mtime"], header["source_size"]) != source):
+                return None
+            values = cache["values"]
+
+    except (IOError, OSError, ValueError, KeyError):
+        return None
+
+    # Unpack spectral and numeric per time step variables from values array
+    n_wavelengths = header["n_wavelengths"]
+    n_time = len(header["time"])
+    spectral_size = n_wavelengths * n_time
+
+    wavelength = values[:n_wavelengths]
+    offset = n_wavelengths
+
+    spectral = []
+    for name in header["spectral"]:
+        spectral.append((str(name), values[offset:offset + spectral_size].reshape((n_wavelengths, n_time))))
+        offset += spectral_size
+
+    temporal = []
+    for name, units, strings in header["temporal"]:
+        units = str(units) if units is not None else None
+        if strings is None:
+            temporal.append((str(name), units, values[offset:offset + n_time]))
+            offset += n_time
+        else:
+            temporal.append((str(name), units, array([str(s) for s in strings])))
+
+    return {"attributes": dict((str(name), str(value)) for name, value in header["attributes"].items()),
+            "time": asarray(header["time"], dtype=int64).astype("datetime64[s]"),
+            "wavelength": wavelength,
+            "spectral": spectral,
+            "temporal": temporal}
+
+
+def write_cache(cache_path, source, table):
+    """
+    Write contents of RadCalNet file to cache file, if cache directory writeable
+
+    Cache files contain a JSON header of file metadata and one array of all numeric values, so are read with only two
+    array reads.
+
+    :type cache_path: str
+    :param cache_path: Cache file path
+
+    :type source: tuple
+    :param source: RadCalNet file *(modification time, size)*
+
+    :type table: dict
+    :param table: RadCalNet file contents (see *read_radcalnet_file*)
+    """
+
+    numeric = lambda values: values.dtype == float64
+
+    header = {"version": CACHE_VERSION,
+              "source_mtime": source[0],
+              "source_size": source[1],
+              "attributes": table["attributes"],
+              "time": table["time"].astype(int64).tolist(),
+              "n_wavelengths": table["wavelength"].size,
+              "spectral": [name for name, _ in table["spectral"]],
+              "temporal": [(name, units, None if numeric(values) else values.tolist())
+                           for name, units, values in table["temporal"]]}
+
+    values = concatenate([table["wavelength"]] +
+                         [values.ravel() for _, values in table["spectral"]] +
+                         [values for _, _, values in table["temporal"] if numeric(values)])
+
+    # Write cache to temporary file, then move into place, so partially written cache files never read
+    try:
+        fd, temp_path = mkstemp(prefix=".tmp", suffix=".npz", dir=dirname(cache_path) or ".")
+    except (IOError, OSError):
+        return
+
+    try:
+        with fdopen(fd, "wb") as f:
+            savez(f, header=array(json.dumps(header)), values=values)
+        rename(temp_path, cache_path)
+    except (IOError, OSError):
+        try:
+            remove(temp_path)
+        except OSError:
+            pass
+
+
+def read_radcalnet(product_path, cache=True, cache_directory=None):
+    """
+    Return contents of RadCalNet file, from cache if cached for the current file state or else parsed from text (and
+    then cached)
+
+    Files read are also kept in a process-wide cache of the most recently read files, so files read repeatedly (e.g.
+    in matchup processing) are only read once per process. Arrays of files kept in memory are read-only.
+
+    :type product_path: str
+    :param product_path: RadCalNet *.output* or *.input* file path
+
+    :type cache: bool
+    :param cache: (optional) If False file always parsed from text and not cached, default True
+
+    :type cache_directory: str
+    :param cache_directory: (optional) Cache directory (see *return_cache_path*)
+
+    :return:
+        :table: *dict*
+
+        RadCalNet file contents (see *read_radcalnet_file*)
+    """
+
+    if not cache:
+        return read_radcalnet_file(product_path)
+
+    file_stat = stat(product_path)
+    source = (float(file_stat.st_mtime), int(file_stat.st_size))
+    key = abspath(product_path)
+
+    # 1. Previously read in process
+    with MEMORY_CACHE_LOCK:
+        entry = MEMORY_CACHE.pop(key, None)
+        if (entry is not None) and (entry[0] == source):
+            MEMORY_CACHE[key] = entry
+            return dict(entry[1])
+
+    # 2. Read from cache file, or else parse and write cache file
+    cache_path = return_cache_path(product_path, cache_directory)
+    table = read_cache(cache_path, source)
+    if table is None:
+        table = read_radcalnet_file(product_path)
+        write_cache(cache_path, source, table)
+
+    for values in [table["time"], table["wavelength"]] + [v for _, v in table["spectral"]] + \
+            [v for _, _, v in table["temporal"]]:
+        values.flags.writeable = False
+
+    with MEMORY_CACHE_LOCK:
+        MEMORY_CACHE[key] = (source, table)
+        while len(MEMORY_CACHE) > MEMORY_CACHE_SIZE:
+            MEMORY_CACHE.popitem(last=False)
+
+    return dict(table)
+
+
+class RadCalNetFactory(AbstractDataFactory):
+    """
+    RadCalNetFactory is a sub-class of AbstractDataFactory for opening RadCalNet *.output* and *.input* files
+
+    Spectral variables, of dimensions *(wavelength, time)*, are returned as "data" variables, e.g. *toa_reflectance*
+    and *toa_reflectance_uncertainty* for *.output* files, and *boa_reflectance* and *boa_reflectance_uncertainty* for
+    *.input* files. Atmospheric parameters per time step, of dimension *(time)*, are returned as "meteorological"
+    variables, named from their header row labels (e.g. *pressure*).
+
+    :Attributes:
+        .. py:attribute:: cache
+
+            *bool*
+
+            If True, files are cached as *.npz* files when first read (see *read_radcalnet*)
+
+        .. py:attribute:: cache_directory
+
+            *str*
+
+            Cache directory, default from *EOPY_RADCALNET_CACHE* environment variable or else the directory of the
+            RadCalNet file
+
+    :Methods:
+        .. py:method:: openProduct(...):
+
+           Opens an in-memory representation of data product specified by product_path.
+
+        .. py:method:: getData(...):
+
+            Returns variable[s] of in-memory product as an xarray data structure.
+
+        :Inherited from eopy.product.productIO.AbstractDataFactory.AbstractDataFactory:
+            .. py:method:: readVariables(...):
+
+                Returns list of product variables as ``Variable`` class objects.
+
+            .. py:method:: getVariableInfo(...):
+
+                Returns variable information dictionary for specified variable
+    """
+
+    # Constants
+    FACTORY_STRING = "RadCalNetFactory"
+
+    def __init__(self, cache=True, cache_directory=None):
+        """
+        Initialise class
+
+        :type cache: bool
+        :param cache: (optional) If False files always parsed from text and not cached, default True
+
+        :type cache_directory: str
+        :param cache_directory: (optional) Cache directory
+        """
+
+        self.cache = cache
+        self.cache_directory = cache_directory
+
+    def openProduct(self, product_path):
+        """
+        Opens an in-memory representation of RadCalNet file at specified path with metadata
+
+        :type product_path: str
+        :param product_path: RadCalNet *.output* or *.input* file path
+
+        :return:
+            :product: *dict*
+
+            RadCalNet file contents (see *read_radcalnet_file*), with entry *"product_path"*
+
+            :variables: *list*
+
+            list of product variables as ``Variable`` class objects.
+
+            :attributes: *dict*
+
+            Dictionary of product attributes.
+        """
+
+        product = read_radcalnet(product_path, cache=self.cache, cache_directory=self.cache_directory)
+        product["product_path"] = product_path
+
+        variables = self.readVariables(product)
+        attributes = self.readAttributes(product)
+
+        return product, variables, attributes
+
+    def readAttributes(self, product):
+        """
+        Return dictionary of product attributes
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :return:
+            :attributes: *dict*
+
+            Dictionary of product attributes, including site metadata header values
+        """
+
+        product_name, file_type = splitext(basename(product["product_path"]))
+
+        attributes = {}
+        for name, value in product["attributes"].items():
+            try:
+                attributes[name] = float(value)
+            except ValueError:
+                attributes[name] = value
+
+        attributes.update({"product_name": product_name,
+                           "product_string": product_name[:4] + ("_IN" if file_type == ".input" else ""),
+                           "product_type": "ground",
+                           "site": product_name[:4],
+                           "site_config": product_name[4:6],
+                           "product_processing": []})
+
+        times = product["time"]
+        if times.size != 0:
+            attributes["start_time"] = times.min().astype(datetime)
+            attributes["end_time"] = times.max().astype(datetime)
+
+        return attributes
+
+    def createDataVariable(self, product, variable_name):
+        """
+        Returns "data" type ``Variable`` class object, for given spectral variable
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :type variable_name: str
+        :param variable_name: Specified product variable name
+
+        :return:
+            :data_variable: *eopy.product.productIO.Variable.Variable*
+
+            ``Variable`` object for given product 'data' variable
+        """
+
+        return Variable({'name': variable_name,
+                         'dtype': 'float',
+                         'vtype': 'data',
+                         'units': None,
+                         'ndims': 2,
+                         'shape': (product["wavelength"].size, product["time"].size)})
+
+    def getDataVariableNames(self, product):
+        """
+        Returns list of product "data" type variable names
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :return:
+            :data_variable_names: *list*
+
+            List of product spectral variable names
+        """
+
+        return [name for name, _ in product["spectral"]]
+
+    def createMeteorologicalVariable(self, product, variable_name):
+        """
+        Returns "meteorological" type ``Variable`` class object, for given per time step variable
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :type variable_name: str
+        :param variable_name: Specified product variable name
+
+        :return:
+            :meteorological_variable: *eopy.product.productIO.Variable.Variable*
+
+            ``Variable`` object for given product 'meteorological' variable
+        """
+
+        units, values = [(units, values) for name, units, values in product["temporal"] if name == variable_name][0]
+
+        return Variable({'name': variable_name,
+                         'dtype': 'float' if values.dtype == float64 else 'str',
+                         'vtype': 'meteorological',
+                         'units': units,
+                         'ndims': 1,
+                         'shape': (values.size,)})
+
+    def getMeteorologicalVariableNames(self, product):
+        """
+        Returns list of product "meteorological" type variable names
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :return:
+            :meteorological_variable_names: *list*
+
+            List of product per time step variable names
+        """
+
+        return [name for name, _, _ in product["temporal"]]
+
+    def getData(self, product, variables, attributes, variable, *args, **kwargs):
+        """
+        Returns variable[s] of in-memory product as an xarray data structure, with *wavelength* and *time* coordinates
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :type variables: list
+        :param variables: List of product variables as ``Variable`` class objects.
+
+        :type attributes: dict
+        :param attributes: Dictionary of product metadata
+
+        :type variable: str
+        :param variable: Name of variable to return data for
+
+        :type args: str
+        :param args: Name of additional variables to to return data for
+
+        :return:
+            :data: *xarray.DataArray [xarray.Dataset]*
+
+            Specified variable[s] in memory in xarray data structure
+        """
+
+        selected_variables = [variable] + list(args)
+
+        spectral = dict(product["spectral"])
+        temporal = dict((name, values) for name, _, values in product["temporal"])
+
+        def read(v):
+            if v in spectral:
+                return ["wavelength", "time"], spectral[v]
+            elif v in temporal:
+                return ["time"], temporal[v]
+            raise KeyError("No variable '%s' in product" % v)
+
+        def read_info(v):
+            variable_info = self.getVariableInfo(variables, v)
+            return dict((key, value) for key, value in variable_info.items() if value is not None)
+
+        coords = {"wavelength": ("wavelength", product["wavelength"], {"units": "nm"}),
+                  "time": ("time", product["time"])}
+
+        # Case A: Only one variable required so form an xarray.DataArray
+        if len(selected_variables) == 1:
+            dims, values = read(variable)
+            return xr.DataArray(values, dims=dims, coords=dict((dim, coords[dim]) for dim in dims), name=variable,
+                                attrs=read_info(variable))
+
+        # Case B: Multiple variables required so form an xarray.Dataset
+        data_vars = {}
+        for v in selected_variables:
+            dims, values = read(v)
+            data_vars[v] = (dims, values, read_info(v))
+
+        used_dims = set(dim for dims, _, _ in data_vars.values() for dim in dims)
+        return xr.Dataset(data_vars=data_vars, coords=dict((dim, coords[dim]) for dim in used_dims))
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,56 @@
+"""
+Tests for RadCalNetDataReader class
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+from tempfile import mkdtemp
+import shutil
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(__file__))
+from test_RadCalNetFactory import write_test_file
+sys.path.append(dirname(dirname(__file__)))
+sys.path.append(dirname(dirname(dirname(__file__))))
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+class TestRadCalNetDataReader(unittest.TestCase):
+    def test_setDataFactory(self):
+        from RadCalNetDataReader import RadCalNetDataReader
+        from RadCalNetFactory import RadCalNetFactory
+
+        dataReader = RadCalNetDataReader()
+        self.assertEqual(RadCalNetFactory, dataReader.setDataFactory("/data/RVUS00_2015_320_v00.00.output"))
+        self.assertEqual(RadCalNetFactory, dataReader.setDataFactory("/data/GONA01_2017_001_v03.01.input"))
+        self.assertIsNone(dataReader.setDataFactory("/data/GONA01_2017_001_v03.01.output.npz"))
+        self.assertIsNone(dataReader.setDataFactory("/data/S2A_MSIL1C_20170105T013442_N0204_R031_T53NMJ_"
+                                                    "20170105T013443.SAFE/manifest.safe"))
+
+    def test_Product_radcalnet_reader_openProduct(self):
+        from Product import Product
+
+        directory = mkdtemp()
+        path = write_test_file(directory)
+
+        product = Product(path)
+        self.assertEqual("GONA", product.attributes["site"])
+        self.assertEqual(("wavelength", "time"), product.getData("toa_reflectance").dims)
+
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+"""
+Tests for RadCalNetFactory class
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os import utime, stat
+from os.path import dirname, exists
+from os.path import join as pjoin
+from tempfile import mkdtemp
+from datetime import datetime
+import shutil
+
+'''___Third-Party Modules___'''
+from numpy import arange, array, isnan, datetime64, testing
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from RadCalNetFactory import RadCalNetFactory, parse_label, read_radcalnet_file, read_radcalnet, return_cache_path, \
+    read_cache, MEMORY_CACHE
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+test_name = "GONA01_2017_001_v03.01.output"
+test_wavelengths = arange(400.0, 450.0, 10.0)
+test_reflectance = array([[0.1, 0.2, 0.3]]) + test_wavelengths[:, None] / 10000.0
+test_uncertainty = test_reflectance / 100.0
+
+
+def write_test_file(directory, name=test_name, reflectance=test_reflectance):
+    rows = ["Site:\tGONA", "Lat:\t-23.6002", "Lon:\t15.11956", "Alt:\t510", "Year:\t2017", "Day:\t001",
+            "Version:\t03.01",
+            "UTC:\t09:00\t09:30\t10:00",
+            "Pressure (hPa):\t958.1\t958.2\t9999",
+            "Water vapour (g/cm2):\t1.1\t1.2\t1.3",
+            "Aerosol type:\tdesert\tdesert\tdesert"]
+    rows += ["\t".join("%g" % v for v in [w] + list(r)) for w, r in zip(test_wavelengths, reflectance)]
+    rows += ["\t".join("%g" % v for v in [w] + list(r)) for w, r in zip(test_wavelengths, test_uncertainty)]
+
+    path = pjoin(directory, name)
+    with open(path, "w") as f:
+        f.write("\n".join(rows) + "\n")
+    return path
+
+
+class TestRadCalNetFactory(unittest.TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+        self.path = write_test_file(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_parse_label(self):
+        self.assertEqual(("pressure", "hPa"), parse_label("Pressure (hPa):"))
+        self.assertEqual(("water_vapour", "g/cm2"), parse_label("Water vapour [g/cm2]:"))
+        self.assertEqual(("site", None), parse_label("Site:"))
+
+    def test_read_radcalnet_file(self):
+        table = read_radcalnet_file(self.path)
+
+        self.assertEqual("GONA", table["attributes"]["site"])
+        self.assertEqual("03.01", table["attributes"]["version"])
+        testing.assert_array_equal(test_wavelengths, table["wavelength"])
+        self.assertEqual(datetime64("2017-01-01T09:30:00"), table["time"][1])
+
+        spectral = dict(table["spectral"])
+        self.assertEqual(["toa_reflectance", "toa_reflectance_uncertainty"], [name for name, _ in table["spectral"]])
+        testing.assert_allclose(spectral["toa_reflectance"], test_reflectance)
+        testing.assert_allclose(spectral["toa_reflectance_uncertainty"], test_uncertainty)
+
+        temporal = dict((name, (units, values)) for name, units, values in table["temporal"])
+        self.assertEqual("hPa", temporal["pressure"][0])
+        self.assertTrue(isnan(temporal["pressure"][1][2]))
+        self.assertEqual("desert", temporal["aerosol_type"][1][0])
+
+    def test_read_radcalnet_missing_spectral_values(self):
+        reflectance = test_reflectance.copy()
+        reflectance[0, 0] = 9999
+        path = write_test_file(self.directory, name="GONA01_2017_002_v03.01.output", reflectance=reflectance)
+
+        self.assertTrue(isnan(dict(read_radcalnet_file(path)["spectral"])["toa_reflectance"][0, 0]))
+
+    def test_read_radcalnet_cache(self):
+        cache_path = return_cache_path(self.path)
+        self.assertEqual(pjoin(self.directory, "." + test_name + ".npz"), cache_path)
+
+        # First read writes cache
+        table = read_radcalnet(self.path)
+        self.assertTrue(exists(cache_path))
+
+        # Second read from process-wide cache, read-only
+        self.assertFalse(dict(read_radcalnet(self.path)["spectral"])["toa_reflectance"].flags.writeable)
+
+        # Read from cache file
+        source = (float(stat(self.path).st_mtime), int(stat(self.path).st_size))
+        self.assertIsNotNone(read_cache(cache_path, source))
+        self.assertIsNone(read_cache(cache_path, (source[0] + 1.0, source[1])))
+        MEMORY_CACHE.clear()
+        cached_table = read_radcalnet(self.path)
+        self.assertEqual(table["attributes"], cached_table["attributes"])
+        testing.assert_array_equal(table["time"], cached_table["time"])
+        testing.assert_allclose(dict(table["spectral"])["toa_reflectance"],
+                                dict(cached_table["spectral"])["toa_reflectance"])
+        self.assertEqual([(name, units) for name, units, _ in table["temporal"]],
+                         [(name, units) for name, units, _ in cached_table["temporal"]])
+        self.assertEqual("desert", dict((n, v) for n, _, v in cached_table["temporal"])["aerosol_type"][0])
+
+        # Cache not read once file modified
+        reflectance = test_reflectance * 2.0
+        write_test_file(self.directory, reflectance=reflectance)
+        utime(self.path, (stat(self.path).st_atime, stat(self.path).st_mtime + 10))
+        testing.assert_allclose(dict(read_radcalnet(self.path)["spectral"])["toa_reflectance"], reflectance)
+
+    def test_read_radcalnet_cache_directory(self):
+        cache_directory = mkdtemp()
+        read_radcalnet(self.path, cache_directory=cache_directory)
+
+        self.assertTrue(exists(pjoin(cache_directory, test_name + ".npz")))
+        self.assertFalse(exists(return_cache_path(self.path, None)))
+
+        shutil.rmtree(cache_directory)
+
+    def test_openProduct(self):
+        factory = RadCalNetFactory(cache=False)
+        product, variables, attributes = factory.openProduct(self.path)
+
+        self.assertFalse(exists(return_cache_path(self.path)))
+
+        self.assertItemsEqual(["toa_reflectance", "toa_reflectance_uncertainty"],
+                              [v.name for v in variables if v.vtype == "data"])
+        self.assertItemsEqual(["pressure", "water_vapour", "aerosol_type"],
+                              [v.name for v in variables if v.vtype == "meteorological"])
+
+        self.assertEqual("GONA", attributes["product_string"])
+        self.assertEqual("01", attributes["site_config"])
+        self.assertEqual(-23.6002, attributes["lat"])
+        self.assertEqual(datetime(2017, 1, 1, 9, 0), attributes["start_time"])
+        self.assertEqual(datetime(2017, 1, 1, 10, 0), attributes["end_time"])
+
+    def test_getData(self):
+        factory = RadCalNetFactory(cache=False)
+        product, variables, attributes = factory.openProduct(self.path)
+
+        data = factory.getData(product, variables, attributes, "toa_reflectance")
+        self.assertEqual(("wavelength", "time"), data.dims)
+        testing.assert_allclose(data.sel(wavelength=420.0).values, test_reflectance[2])
+
+        dataset = factory.getData(product, variables, attributes, "toa_reflectance", "pressure")
+        self.assertEqual(("time",), dataset["pressure"].dims)
+        self.assertEqual("hPa", dataset["pressure"].attrs["units"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -13,10 +13,13 @@ import re
 from datetime import datetime as dt
 from datetime import timedelta
 from copy import deepcopy
+from threading import Lock
 
 '''___Third-Party Modules___'''
+import snappy
 from snappy import GPF
 from snappy import HashMap
+import jpy
 
 '''___NPL Modules___'''
 sys.path.append(pjoin(dirname(dirname(__file__)), "snappy_shared"))
@@ -30,6 +33,146 @@ __maintainer__ = "Sam Hunt"
 __email__ = "sam.hunt@npl.co.uk"
 __status__ = "Development"
 
+# MSI spatial resolutions, in m
+RESOLUTIONS = [10, 20, 60]
+
+# Resolution of native product scene raster
+REFERENCE_RESOLUTION = 10
+
+# Lock so each resolution product only resampled once, if first required by multiple threads
+RESAMPLE_LOCK = Lock()
+
+
+class MSIResolutionProduct(object):
+    """
+    MSIResolutionProduct is an in-memory representation of a Sentinel-2 product at one of the MSI spatial resolutions.
+    It wraps the native multi-resolution *snappy.Product*, so bands and masks already at the resolution are read
+    directly from the native product. The product is only resampled to the resolution, with the snap *Resample*
+    operator, the first time a variable not at the resolution (e.g. the angles) is required.
+
+    All other *snappy.Product* methods are delegated to the native product.
+
+    :Attributes:
+        .. py:attribute:: product
+
+            *snappy.Product*
+
+            Native multi-resolution product
+
+        .. py:attribute:: resolution
+
+            *int*
+
+            Spatial resolution of product, in m
+
+    :Methods:
+        .. py:method:: getResampledProduct(...):
+
+            Return product resampled to resolution, resampling on first call
+
+        .. py:method:: isNative(...):
+
+            Return True if raster data node at resolution of product
+    """
+
+    def __init__(self, product, resolution, resample):
+        """
+        Initialise resolution product
+
+        :type product: *snappy.Product*
+        :param product: Native multi-resolution product
+
+        :type resolution: int
+        :param resolution: Spatial resolution of product, in m
+
+        :type resample: function
+        :param resample: Function to resample native product to given resolution
+        """
+
+        self.product = product
+        self.resolution = resolution
+        self.resample = resample
+        self.resampled_product = None
+
+        self.width = int(product.getSceneRasterWidth()) * REFERENCE_RESOLUTION // resolution
+        self.height = int(product.getSceneRasterHeight()) * REFERENCE_RESOLUTION // resolution
+
+    def getResampledProduct(self):
+        """
+        Return product resampled to resolution, resampling on first call
+
+        :return:
+            :resampled_product: *snappy.Product*
+
+            Resampled product
+        """
+
+        with RESAMPLE_LOCK:
+            if self.resampled_product is None:
+                self.resampled_product = self.resample(self.product, self.resolution)
+        return self.resampled_product
+
+    def isNative(self, node):
+        """
+        Return True if raster data node at resolution of product
+
+        :type node: *snappy.RasterDataNode*
+        :param node: band or mask of native product
+
+        :return:
+            :is_native: *bool*
+
+            True if node raster size same as product raster size
+        """
+
+        return (node is not None) and (int(node.getRasterWidth()) == self.width) and \
+            (int(node.getRasterHeight()) == self.height)
+
+    def getSceneRasterWidth(self):
+        return self.width
+
+    def getSceneRasterHeight(self):
+        return self.height
+
+    def getBand(self, name):
+        band = self.product.getBand(name)
+        if self.isNative(band):
+            return band
+        return self.getResampledProduct().getBand(name)
+
+    def getTiePointGrid(self, name):
+        return self.getResampledProduct().getTiePointGrid(name)
+
+    def getSceneGeoCoding(self):
+        if self.resolution == REFERENCE_RESOLUTION:
+            return self.product.getSceneGeoCoding()
+        return self.getResampledProduct().getSceneGeoCoding()
+
+    def getMaskGroup(self):
+        return MSIResolutionMaskGroup(self)
+
+    def __getattr__(self, name):
+        return getattr(self.product, name)
+
+
+class MSIResolutionMaskGroup(object):
+    """
+    MSIResolutionMaskGroup is the mask group of a *MSIResolutionProduct*, returning masks at the resolution of the
+    product from the native product where available, else from the resampled product.
+    """
+
+    def __init__(self, resolution_product):
+        self.resolution_product = resolution_product
+
+    def getNodeNames(self):
+        return self.resolution_product.product.getMaskGroup().getNodeNames()
+
+    def get(self, name):
+        mask = self.resolution_product.product.getMaskGroup().get(name)
+        if (mask is not None) and self.resolution_product.isNative(jpy.cast(mask, snappy.Mask)):
+            return mask
+        return self.resolution_product.getResampledProduct().getMaskGroup().get(name)
+
 
 class MSISharedFactory(SnappySharedFactory):
     """
@@ -71,8 +214,8 @@ class MSISharedFactory(SnappySharedFactory):
         :return:
             :products: *dict*
 
-            List of product dictionaries - which themselves contain in-memory representation of opened `snappy.Product`
-            data products, one resampled to each S2 band resolution
+            List of product dictionaries - which themselves contain in-memory representation of opened data product,
+            one per S2 band resolution (see *MSIResolutionProduct*)
 
             :variables: *list*
 
@@ -83,26 +226,20 @@ class MSISharedFactory(SnappySharedFactory):
             Dictionary of product attributes.
         """
 
-        # Open S2 product 3 times, once for each spatial resolution
-        products = self.openMultipleProducts([{"product_name": "10m_resolution",
-                                               "product_path": product_path},
-                                              {"product_name": "20m_resolution",
-                                               "product_path": product_path},
-                                              {"product_name": "60m_resolution",
-                                               "product_path": product_path}])
-
-        product_name = products[0]["product"].getName()
+        # Open S2 product once, represented at each spatial resolution - only resampled if a variable not at that
+        # resolution is required
+        product = snappy.ProductIO.readProduct(product_path)
+        products = [{"product_name": str(res) + "m_resolution",
+                     "product": MSIResolutionProduct(product, res, self._resample_product)} for res in RESOLUTIONS]
 
-        # Resample the products to each of the instrument spatial resolutions
-        for i, res in enumerate([10, 20, 60]):
-            products[i]['product'] = self._resample_product(products[i]['product'], res)
+        product_name = product.getName()
 
         products, variables = self.readVariables(products)
 
         products, attributes = self.readAttributes(products)
         attributes["product_name"] = product_name
         products, attributes = self.addAttributes(products, attributes)
-        for i, res in enumerate([10, 20, 60]):
+        for i, res in enumerate(RESOLUTIONS):
             attributes["product_processing_" + products[i]['product_name']].append({"processing_name": "resample",
                                                                                     "processing_parameters":
                                                                                         {"resolution": res}})
@@ -11,9 +11,9 @@ import re
 '''___Third-Party Modules___'''
 
 '''___NPL Modules___'''
+# Product factories imported only as required in Sentinel2DataReader.setDataFactory(), so snappy is only imported
+# when a Sentinel-2 product is read
 sys.path.append(dirname(__file__))
-from MSIL1Factory import MSIL1Factory
-from MSIL2Factory import MSIL2Factory
 
 sys.path.append(dirname(dirname(__file__)))
 from AbstractDataReader import AbstractDataReader
@@ -28,6 +28,11 @@ __maintainer__ = "Sam Hunt"
 __email__ = "sam.hunt@npl.co.uk"
 __status__ = "Development"
 
+# Regular expressions for Sentinel-2 product directory names, compiled once on import
+MSIL1_pattern = re.compile(r"S2.*._MSIL1C_.*.SAFE")     # MSI L1c
+MSIL2_pattern = re.compile(r"S2.*._MSIL2A_.*.SAFE")     # MSI L2a
+SENTINEL2_PATTERNS = [MSIL1_pattern, MSIL2_pattern]
+
 
 class Sentinel2DataReader(AbstractDataReader):
     """
@@ -40,6 +45,19 @@ class Sentinel2DataReader(AbstractDataReader):
 
             Instance of sub-class of product factory for reading Sentinel-2 product data
 
+        .. py:attribute:: PATTERNS
+
+            *list:str*
+
+            Regular expressions of Sentinel-2 product directory names, used by
+            *eopy.product.productIO.ProductDataReader.ProductDataReader* to find the data reader for a product
+
+        .. py:attribute:: engine
+
+            *str*
+
+            Engine to read Sentinel-2 product data with, only None (read with snappy) available
+
     :Methods:
         .. py:method:: setDataFactory(...):
 
@@ -64,6 +82,8 @@ class Sentinel2DataReader(AbstractDataReader):
                 *self.dataFactory*.
     """
 
+    PATTERNS = [pattern.pattern for pattern in SENTINEL2_PATTERNS]
+
     def setDataFactory(self, product_path):
         """
         Return Sentinel-2 product factory suitable for data product at product_path
@@ -83,16 +103,21 @@ class Sentinel2DataReader(AbstractDataReader):
 
         # > Get directory of product
         product_directory = basename(dirname(product_path))
+        if not any(pattern.match(product_directory) for pattern in SENTINEL2_PATTERNS):
+            return None
 
-        # > Possible regular expression for Sentinel-2 products
-        MSIL1_pattern = re.compile(r"S2.*._MSIL1C_.*.SAFE")     # MSI L1c
-        MSIL2_pattern = re.compile(r"S2.*._MSIL2A_.*.SAFE")  # MSI L1c
+        # > Only snappy engine available for Sentinel-2 products
+        engine = getattr(self, "engine", None)
+        if engine is not None:
+            raise ValueError("Unknown Sentinel-2 reader engine '%s'" % engine)
 
         # > Check if input product_path matches any Sentinel-2 product regular expressions
         #   return dataFactory as appropriate
         if MSIL1_pattern.match(product_directory):
+            from MSIL1Factory import MSIL1Factory
             return MSIL1Factory
         elif MSIL2_pattern.match(product_directory):
+            from MSIL2Factory import MSIL2Factory
             return MSIL2Factory
         else:
             return None
@@ -0,0 +1,41 @@
+"""
+Tests for Sentinel2DataReader class
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+from os.path import join as pjoin
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from Sentinel2DataReader import Sentinel2DataReader
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+# Example product path
+MSIL1C_test_path = pjoin("S2A_MSIL1C_20170105T013442_N0204_R031_T53NMJ_20170105T013443.SAFE", "MTD_MSIL1C.xml")
+
+
+class TestSentinel2DataReader(unittest.TestCase):
+    def test_setDataFactory_engine(self):
+        dataReader = Sentinel2DataReader(engine="netcdf")
+        self.assertRaises(ValueError, dataReader.setDataFactory, MSIL1C_test_path)
+
+    def test_setDataFactory_engine_other_product(self):
+        dataReader = Sentinel2DataReader(engine="netcdf")
+        self.assertIsNone(dataReader.setDataFactory("RVUS00_2017_001_v03.01.output"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,1593 @@
+"""
+Data factory for opening Sentinel-3 SEN3 products directly from their netCDF files, without snappy
+"""
+
+'''___Built-In Modules___'''
+import sys
+from os.path import dirname, basename, isdir, splitext, abspath
+from os.path import join as pjoin
+from glob import glob
+from copy import deepcopy
+from collections import OrderedDict
+from datetime import datetime
+from threading import RLock
+import re
+import xml.etree.ElementTree as ElementTree
+
+'''___Third-Party Modules___'''
+import netCDF4
+import xarray as xr
+import dask.array as da
+from dask import delayed
+from numpy import asarray, array, uint32, float32, float64, ndarray, nan
+import numpy.ma as ma
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from AbstractDataFactory import AbstractDataFactory
+from Variable import Variable
+from SpectralVariable import SpectralVariable
+from FlagCoding import decode_flag
+from Scaling import SCALINGS, return_fill_value
+sys.path.append(pjoin(dirname(dirname(dirname(dirname(abspath(__file__))))), "utils"))
+from TiePointInterpolator import TiePointInterpolator
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Lock to serialise opening, closing and reading of netCDF files, e.g. when lazily read data is computed in parallel
+NETCDF_LOCK = RLock()
+DEFAULT_CHUNK_SIZE = 1024
+
+# Process-wide cache of open netCDF files of most recently read products, by path - files closed when evicted, so the
+# number of open files is bounded however many products are opened
+DATASET_CACHE_SIZE = 64
+open_datasets = OrderedDict()
+
+# Variable types of variables by netCDF file, all other variables are "data" type
+VTYPE_FILE_PATTERNS = [("meteorological", re.compile(r"^(tie_meteo|met_t.)\.nc$")),
+                       ("sensor", re.compile(r"^(instrument_data|indices_..)\.nc$")),
+                       ("info", re.compile(r"^(geo_coordinates|tie_geo_coordinates|tie_geometries|geodetic_..|"
+                                           r"cartesian_..|geometry_t.|time_coordinates)\.nc$"))]
+INFO_VARIABLE_PATTERN = re.compile(r"^solar_flux_band_\d+$")
+
+# Tie point grid variables with a discontinuity at 180 degrees
+DISCONTINUITY_VARIABLE_PATTERN = re.compile(r"(longitude|SAA|OAA|azimuth)")
+
+# Names given to layers of 3D variables, by layer dimension name - e.g. horizontal_wind_vector_1
+LAYER_DIMENSION_NAMES = {"wind_vectors": "vector", "tie_pressure_levels": "pressure_level"}
+
+# Nominal band centre wavelengths and bandwidths (nm)
+OLCI_BAND_PATTERN = re.compile(r"^Oa(\d\d)_(radiance|reflectance)$")
+OLCI_WAVELENGTHS = [400.0, 412.5, 442.5, 490.0, 510.0, 560.0, 620.0, 665.0, 673.75, 681.25, 708.75, 753.75, 761.25,
+                    764.375, 767.5, 778.75, 865.0, 885.0, 900.0, 940.0, 1020.0]
+OLCI_BANDWIDTHS = [15.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 7.5, 7.5, 10.0, 7.5, 2.5, 3.75, 2.5, 15.0, 20.0,
+                   10.0, 10.0, 20.0, 40.0]
+SLSTR_BAND_PATTERN = re.compile(r"^(S[1-9]|F[12])_(radiance|BT)_..$")
+SLSTR_WAVELENGTHS = {"S1": 554.27, "S2": 659.47, "S3": 868.00, "S4": 1374.80, "S5": 1613.40, "S6": 2255.70,
+                     "S7": 3742.00, "S8": 10854.00, "S9": 12022.50, "F1": 3742.00, "F2": 10854.00}
+SLSTR_BANDWIDTHS = {"S1": 19.26, "S2": 19.25, "S3": 20.60, "S4": 20.80, "S5": 60.68, "S6": 50.15, "S7": 398.00,
+                    "S8": 776.00, "S9": 905.00, "F1": 398.00, "F2": 776.00}
+
+
+def convert_cc2sc(name):
+    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
+    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+
+
+def local_name(tag):
+    """
+    Return xml tag name without namespace
+
+    :type tag: str
+    :param tag: xml element tag, e.g. *{namespace}name*
+
+    :return:
+        :name: *str*
+
+        tag name
+    """
+    return tag.split('}')[-1]
+
+
+def find_element(element, name):
+    """
+    Return first descendant element of given name, irrespective of namespace
+
+    :type element: xml.etree.ElementTree.Element
+    :param element: xml element to search
+
+    :type name: str
+    :param name: element name
+
+    :return:
+        :found_element: *xml.etree.ElementTree.Element*
+
+        First matching element, None if not found
+    """
+
+    if element is None:
+        return None
+
+    for elem in element.iter():
+        if local_name(elem.tag) == name:
+            return elem
+    return None
+
+
+def find_value(element, name):
+    """
+    Return value of element metadata, given as either element attribute or child element text
+
+    :type element: xml.etree.ElementTree.Element
+    :param element: xml element to search
+
+    :type name: str
+    :param name: metadata name
+
+    :return:
+        :value: *str*
+
+        metadata value, None if not found
+    """
+
+    if element is None:
+        return None
+
+    for key in element.attrib.keys():
+        if local_name(key) == name:
+            return element.attrib[key]
+
+    child = find_element(element, name)
+    if child is not None:
+        return child.text
+    return None
+
+
+def open_dataset(path):
+    """
+    Return open netCDF file, from process-wide cache of most recently used files. Call with *NETCDF_LOCK* held, until
+    reading from the file is complete.
+
+    :type path: str
+    :param path: netCDF file path
+
+    :return:
+        :dataset: *netCDF4.Dataset*
+
+        Open netCDF file
+    """
+
+    with NETCDF_LOCK:
+        if path in open_datasets:
+            open_datasets[path] = open_datasets.pop(path)
+            return open_datasets[path]
+
+        dataset = netCDF4.Dataset(path)
+        open_datasets[path] = dataset
+        while len(open_datasets) > DATASET_CACHE_SIZE:
+            open_datasets.popitem(last=False)[1].close()
+
+        return dataset
+
+
+def close_datasets():
+    """
+    Close all netCDF files in process-wide cache of open files
+    """
+
+    with NETCDF_LOCK:
+        while len(open_datasets) > 0:
+            open_datasets.popitem(last=False)[1].close()
+
+
+class SEN3NetCDFFactory(AbstractDataFactory):
+    """
+    SEN3NetCDFFactory is a sub-class of AbstractDataFactory for opening Sentinel-3 products in the SEN3 format directly
+    from their constituent netCDF files and xfdumanifest.xml, without snappy
+
+    Variables are named as by snappy, for example:
+
+    * masks are derived from flag variables, named *<flag variable>_<flag meaning>*
+    * tie point grids are interpolated to the image grid, with tie point geolocation named *TP_latitude* and
+      *TP_longitude*
+    * 3D meteorological variables are split by layer, e.g. *horizontal_wind_vector_1*
+    * per detector instrument data is returned per pixel by band, e.g. *solar_flux_band_1*
+
+    Variables on different grids (e.g. SLSTR nadir and oblique views at different resolutions) are opened as separate
+    products.
+
+    Product netCDF files are closed once scanned for variables, and reopened when read from a process-wide cache of
+    open files (see *open_dataset*).
+
+    :Methods:
+        .. py:method:: openProduct(...):
+
+           Opens an in-memory representation of data product specified by product_path.
+
+        .. py:method:: scanProduct(...):
+
+            Return dictionary of product variable nodes, by grid, from product netCDF files
+
+        .. py:method:: scanDatasets(...):
+
+            Return dictionary of product variable nodes, by grid, from open product netCDF files
+
+        .. py:method:: createVariable(...):
+
+            Returns `Variable` or `SpectralVariable` class object of given type, for given product variable
+
+        .. py:method:: getData(...):
+
+            Returns variable[s] of in-memory product as an xarray data structure.
+
+        .. py:method:: getPixelValues(...):
+
+            Returns pixel values of variable of in-memory product
+
+        .. py:method:: getLazyPixelValues(...):
+
+            Returns dask array of pixel values of variable of in-memory product, read tile by tile when computed
+
+        .. py:method:: applyDataMask(...):
+
+            Returns pixel values with data mask applied
+
+        .. py:method:: getFlagAttributes(...):
+
+            Returns CF flag attributes of variable, if a flag variable
+
+        .. py:method:: isRawVariable(...):
+
+            Return True if variable node can be read as raw values
+
+        .. py:method:: getScalingAttributes(...):
+
+            Returns CF scaling attributes of variable read as raw values
+
+        .. py:method:: returnTiePointInterpolator(...):
+
+            Return interpolator of tie point grid variable node to image grid
+
+        .. py:method:: getTiePointAttributes(...):
+
+            Returns attributes locating values of tie point grid variable, returned at tie point resolution, in the
+            image grid
+
+        :Inherited from eopy.product.productIO.AbstractDataFactory.AbstractDataFactory:
+            .. py:method:: readVariables(...):
+
+                Returns list of product variables as ``Variable`` or ``SpectralVariable`` class objects.
+
+            .. py:method:: getVariableInfo(...):
+
+                Returns variable information dictionary for specified variable
+    """
+
+    # Constants
+    FACTORY_STRING = "SEN3NetCDFFactory"
+    TYPE_STRING = None
+
+    def __init__(self):
+        """
+        Initialise class
+        """
+
+        # Mask to apply to in memory data arrays obtained in self.getData() - may be populated during subsetting
+        self.data_mask = None
+
+    def openProduct(self, product_path):
+        """
+        Opens an in-memory representation of SEN3 data product at specified path with metadata
+
+        :type product_path: str
+        :param product_path: The data product file path, the xfdumanifest.xml file of the SEN3 directory - as readers
+        are found by the name of the directory containing the given path (see
+        *eopy.product.productIO.ProductDataReader.ProductDataReader*). The SEN3 directory is also accepted if this
+        factory is used directly.
+
+        :return:
+            :products: *list*
+
+            List of dictionaries of in-memory representations of opened data products, one per product grid, entries:
+
+            * 'product_name' - name of product
+            * 'product' - dictionary of product variable nodes and open netCDF files
+            * 'variable' - variables that can be opened from product
+
+            :variables: *list*
+
+            list of product variables as ``Variable`` or ``SpectralVariable`` class objects.
+
+            :attributes: *dict*
+
+            Dictionary of product attributes.
+        """
+
+        product_directory = product_path if isdir(product_path) else dirname(product_path)
+        product_name = splitext(basename(product_directory.rstrip("/\\")))[0]
+
+        # 1. Find product variables in netCDF files, per grid
+        manifest = ElementTree.parse(pjoin(product_directory, "xfdumanifest.xml")).getroot()
+        grids = self.scanProduct(product_directory)
+
+        products = []
+        for grid in grids.keys():
+            products.append({"product_name": product_name if len(grids) == 1 else "%s_%dx%d" % ((product_name,) + grid),
+                             "product": {"product_path": product_directory,
+                                         "product_name": product_name,
+                                         "manifest": manifest,
+                                         "height": grid[0],
+                                         "width": grid[1],
+                                         "nodes": grids[grid]}})
+
+        # 2. Populate variables and attributes dictionaries with product metadata
+        products, variables = self.readVariables(products)
+        products, attributes = self.readAttributes(products)
+        products, attributes = self.addAttributes(products, attributes)
+
+        return products, variables, attributes
+
+    def scanProduct(self, product_directory):
+        """
+        Return dictionary of product variable nodes, by grid, from product netCDF files
+
+        :type product_directory: str
+        :param product_directory: SEN3 product directory
+
+        :return:
+            :grids: *collections.OrderedDict*
+
+            Dictionary with entry per grid, key of grid shape *(rows, columns)*, value of dictionary of variable node
+            dictionaries, defining how to read each variable
+        """
+
+        # Tie point grid files last, so image grid variables take precedence for names
+        paths = sorted(glob(pjoin(product_directory, "*.nc")), key=lambda p: (basename(p).startswith("tie_"), p))
+
+        # Files only held open while scanned
+        datasets = OrderedDict()
+        try:
+            for path in paths:
+                datasets[basename(path)] = netCDF4.Dataset(path)
+            return self.scanDatasets(datasets, product_directory)
+        finally:
+            for dataset in datasets.values():
+                dataset.close()
+
+    def scanDatasets(self, datasets, product_directory):
+        """
+        Return dictionary of product variable nodes, by grid, from open product netCDF files
+
+        :type datasets: collections.OrderedDict
+        :param datasets: Open product netCDF files, by file name, tie point grid files last
+
+        :type product_directory: str
+        :param product_directory: SEN3 product directory
+
+        :return:
+            :grids: *collections.OrderedDict*
+
+            Dictionary with entry per grid, as returned by *scanProduct*
+        """
+
+        # Image grid dimensions, for tie point grids to be interpolated to
+        image_grid = None
+        for dataset in datasets.values():
+            if ("rows" in dataset.dimensions) and ("columns" in dataset.dimensions):
+                grid = (len(dataset.dimensions["rows"]), len(dataset.dimensions["columns"]))
+                if (image_grid is None) or (grid[0]*grid[1] > image_grid[0]*image_grid[1]):
+                    image_grid = grid
+
+        grids = OrderedDict()
+        flags = []
+        detector_tables = []
+        for filename, dataset in datasets.items():
+
+            vtype = "data"
+            for pattern_vtype, pattern in VTYPE_FILE_PATTERNS:
+                if pattern.match(filename):
+                    vtype = pattern_vtype
+
+            tie = ("ac_subsampling_factor" in dataset.ncattrs()) and ("al_subsampling_factor" in dataset.ncattrs()) \
+                and (image_grid is not None)
+
+            for nc_name, nc_variable in dataset.variables.items():
+                dims = nc_variable.dimensions
+                node = {"file": filename, "path": pjoin(product_directory, filename), "nc_name": nc_name,
+                        "vtype": vtype, "shape": nc_variable.shape,
+                        "units": getattr(nc_variable, "units", None), "kind": "band", "layer": None,
+                        "raw_dtype": str(nc_variable.dtype),
+                        "raw_scaling": dict((attribute, nc_variable.getncattr(attribute)) for attribute in
+                                            ["scale_factor", "add_offset", "_FillValue"]
+                                            if attribute in nc_variable.ncattrs())}
+
+                # Per detector instrument data - returned per pixel with detector index
+                if dims == ("bands", "detectors"):
+                    detector_tables.append(node)
+                    continue
+
+                if len(dims) not in [2, 3]:
+                    continue
+
+                grid_dims = [d for d in dims if d in ["rows", "columns", "tie_rows", "tie_columns"]]
+                if len(grid_dims) != 2:
+                    continue
+
+                if tie and (grid_dims == ["tie_rows", "tie_columns"]):
+                    grid = image_grid
+                    node["kind"] = "tie"
+                    node["ac"] = int(dataset.getncattr("ac_subsampling_factor"))
+                    node["al"] = int(dataset.getncattr("al_subsampling_factor"))
+                else:
+                    grid = (len(dataset.dimensions[grid_dims[0]]), len(dataset.dimensions[grid_dims[1]]))
+
+                if grid not in grids:
+                    grids[grid] = OrderedDict()
+                nodes = grids[grid]
+
+                name = nc_name
+                if name in nodes:
+                    name = "TP_" + name
+
+                # Split 3D variables into a variable per layer
+                if len(dims) == 3:
+                    layer_dim = [d for d in dims if d not in grid_dims][0]
+                    layer_name = LAYER_DIMENSION_NAMES.get(layer_dim, layer_dim.replace("tie_", "").rstrip("s"))
+                    for i in range(len(dataset.dimensions[layer_dim])):
+                        layer_node = dict(node)
+                        layer_node["layer"] = (dims.index(layer_dim), i)
+                        nodes["%s_%s_%d" % (name, layer_name, i+1)] = layer_node
+                    continue
+
+                nodes[name] = node
+
+                # Masks from flag variables
+                if hasattr(nc_variable, "flag_masks") and hasattr(nc_variable, "flag_meanings"):
+                    flags.append((nodes, name, nc_variable))
+
+        for nodes, name, nc_variable in flags:
+            for bit, meaning in zip(asarray(nc_variable.flag_masks).ravel(), nc_variable.flag_meanings.split()):
+                mask_node = dict(nodes[name])
+                mask_node.update({"kind": "flag", "vtype": "mask", "bit": int(bit), "units": None,
+                                  "flag_variable": name})
+                nodes["%s_%s" % (name, meaning)] = mask_node
+
+            # Flag variable values returned as unsigned integers, with flag coding attributes
+            nodes[name]["flag_masks"] = asarray(nc_variable.flag_masks).ravel().astype(uint32)
+            nodes[name]["flag_meanings"] = nc_variable.flag_meanings
+
+        for nodes in grids.values():
+            # Per detector data by band, e.g. solar_flux_band_1
+            if "detector_index" in nodes:
+                for table in detector_tables:
+                    for i in range(table["shape"][0]):
+                        band_node = dict(table)
+                        band_node.update({"kind": "detector", "layer": i,
+                                          "detector_index": nodes["detector_index"]})
+                        if INFO_VARIABLE_PATTERN.match("%s_band_%d" % (table["nc_name"], i+1)):
+                            band_node["vtype"] = "info"
+                        nodes["%s_band_%d" % (table["nc_name"], i+1)] = band_node
+
+            # Per row time stamps
+            time_node = {"kind": "time", "vtype": "info", "units": "UTC", "path": None}
+            for filename, dataset in datasets.items():
+                if ("time_stamp" in dataset.variables) and (dataset.variables["time_stamp"].ndim == 1):
+                    time_node.update({"file": filename, "path": pjoin(product_directory, filename),
+                                      "nc_name": "time_stamp", "shape": dataset.variables["time_stamp"].shape,
+                                      "time_units": getattr(dataset.variables["time_stamp"], "units", None)})
+            nodes["time_stamp"] = time_node
+
+        return grids
+
+    def readVariables(self, products):
+        """
+        Returns list of multiple product variables as ``Variable`` or ``SpectralVariable`` class objects and updates
+        products dictionary
+
+        :type products: list
+        :param products: List of dictionaries of in-memory representations of opened data products
+
+        :return:
+            :products: *list*
+
+            List of dictionaries of in-memory representations of opened data products, with updated variables
+
+            :variables: *list*
+
+            List of products variables as ``Variable`` or ``SpectralVariable`` class objects.
+        """
+
+        variables = []
+        for i in range(len(products)):
+            product_obj = products[i]["product"]
+            product_variables = self.getDataVariables(product_obj) + \
+                                self.getMaskVariables(product_obj) + \
+                                self.getMeteorologicalVariables(product_obj) + \
+                                self.getSensorVariables(product_obj) + \
+                                self.getInfoVariables(product_obj)
+            variables += product_variables
+            products[i]["variables"] = [v.name for v in product_variables]
+
+        return products, variables
+
+    def readAttributes(self, products):
+        """
+        Return dictionary of multiple products attributes, from product xfdumanifest.xml
+
+        :type products: list
+        :param products: List of dictionaries of in-memory representations of opened data products
+
+        :return:
+            :products: *list*
+
+            List of dictionaries of in-memory representations of opened data products
+
+            :attributes: *dict*
+
+            Dictionary of multiple products attributes
+        """
+
+        product = products[0]["product"]
+        manifest = product["manifest"]
+
+        product_string = find_value(manifest, "productType")
+        if product_string is None:
+            product_string = product["product_name"][4:12]
+
+        attributes = {"product_name": product["product_name"],
+                      "product_string": product_string,
+                      "product_type": "satellite",
+                      "start_time": self.parse_time(find_value(manifest, "startTime")),
+                      "end_time": self.parse_time(find_value(manifest, "stopTime"))}
+
+        if len(products) > 1:
+            for p in products:
+                attributes["product_processing_" + p["product_name"]] = []
+                attributes["product_columns_" + p["product_name"]] = p["product"]["width"]
+                attributes["product_rows_" + p["product_name"]] = p["product"]["height"]
+        else:
+            attributes["product_processing"] = []
+            attributes["product_columns"] = product["width"]
+            attributes["product_rows"] = product["height"]
+
+        return products, attributes
+
+    def addAttributes(self, products, attributes):
+        """
+        Return updated dictionary of multiple products attributes, with instrument specific entries from product
+        xfdumanifest.xml
+
+        :type products: list
+        :param products: List of dictionaries of in-memory representations of opened data products
+
+        :type attributes: dict
+        :param attributes: Dictionary of multiple products attributes
+
+        :return:
+            :products: *list*
+
+            List of dictionaries of in-memory representations of opened data products
+
+            :attributes: *dict*
+
+            Dictionary of multiple products attributes
+        """
+
+        manifest = products[0]["product"]["manifest"]
+
+        # > platform meta
+        platform_meta = find_element(manifest, "platform")
+        if platform_meta is not None:
+            attributes["platform"] = find_value(platform_meta, "familyName") + find_value(platform_meta, "number")
+            attributes["instrument"] = find_value(find_element(find_element(platform_meta, "instrument"),
+                                                               "familyName"), "abbreviation")
+
+        # > OLCI product attributes
+        info_meta = find_element(manifest, "olciProductInformation")
+        if info_meta is None:
+            return products, attributes
+
+        sampling_meta = find_element(info_meta, "samplingParameters")
+        if sampling_meta is not None:
+            attributes['spatial_sampling_al'] = float(find_value(sampling_meta, "alSpatialSampling"))
+            attributes['spatial_sampling_ac'] = float(find_value(sampling_meta, "acSpatialSampling"))
+
+        if find_value(info_meta, "earthSunDistance") is not None:
+            attributes['earth_sun_distance'] = int(float(find_value(info_meta, "earthSunDistance")))
+        if find_value(info_meta, "oclStatus") is not None:
+            attributes['ocl_status'] = bool(find_value(info_meta, "oclStatus"))
+
+        # > pixel quality and classification attributes:
+        for summary in ["pixelQualitySummary", "classificationSummary"]:
+            summary_meta = find_element(info_meta, summary)
+            if summary_meta is None:
+                continue
+            for elem in list(summary_meta):
+                attributes[convert_cc2sc(local_name(elem.tag))+"_percentage"] = float(elem.get("percentage"))
+
+        return products, attributes
+
+    def parse_time(self, time_string):
+        """
+        Return datetime for manifest time string
+
+        :type time_string: str
+        :param time_string: time string, e.g. *2018-04-05T10:15:30.123456Z*
+
+        :return:
+            :time: *datetime.datetime*
+
+            time
+        """
+
+        if time_string is None:
+            return None
+        return datetime.strptime(time_string.rstrip("Z")[:26], '%Y-%m-%dT%H:%M:%S.%f')
+
+    def createVariable(self, product, variable_name, vtype):
+        """
+        Returns `Variable` or `SpectralVariable` class object of given type, for given product variable
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :type variable_name: str
+        :param variable_name: Specified product variable name
+
+        :type vtype: str
+        :param vtype: Variable type
+
+        :return:
+            :variable: *eopy.product.productIO.Variable.Variable*
+
+            ``Variable`` or ``SpectralVariable`` object for given product variable
+        """
+
+        node = product["nodes"][variable_name]
+
+        if node["kind"] == "time":
+            return Variable({'name': variable_name,
+                             'dtype': 'float',
+                             'vtype': vtype,
+                             'units': "UTC",
+                             'ndims': 1,
+                             'shape': (int(product["height"]))})
+
+        variable_dict = {'name': variable_name,
+                         'dtype': 'float',
+                         'vtype': vtype,
+                         'units': node["units"],
+                         'ndims': 2,
+                         'shape': (int(product["width"]), int(product["height"]))}
+
+        # Storage of variables that can be read as raw values
+        if self.isRawVariable(node):
+            variable_dict['raw_dtype'] = node["raw_dtype"]
+            for attribute, key in [("scale_factor", "raw_scale_factor"), ("add_offset", "raw_add_offset"),
+                                   ("_FillValue", "raw_fill_value")]:
+                if attribute in node["raw_scaling"]:
+                    variable_dict[key] = node["raw_scaling"][attribute]
+
+        wavelength = None
+        bandwidth = None
+        if OLCI_BAND_PATTERN.match(variable_name):
+            band = int(OLCI_BAND_PATTERN.match(variable_name).group(1)) - 1
+            wavelength = OLCI_WAVELENGTHS[band]
+            bandwidth = OLCI_BANDWIDTHS[band]
+        elif SLSTR_BAND_PATTERN.match(variable_name):
+            band = SLSTR_BAND_PATTERN.match(variable_name).group(1)
+            wavelength = SLSTR_WAVELENGTHS[band]
+            bandwidth = SLSTR_BANDWIDTHS[band]
+
+        if wavelength is not None:
+            variable_dict['wavelength'] = wavelength
+            variable_dict['bandwidth'] = bandwidth
+            variable_dict['srf'] = None
+            return SpectralVariable(variable_dict)
+        return Variable(variable_dict)
+
+    def return_variable_names(self, product, vtype):
+        """
+        Returns list of product variable names of given variable type
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :type vtype: str
+        :param vtype: Variable type
+
+        :return:
+            :variable_names: *list*
+
+            List of product variable names
+        """
+
+        return [name for name, node in product["nodes"].items() if node["vtype"] == vtype]
+
+    def createDataVariable(self, product, variable_name):
+        """
+        Returns "data" type variable class object, for given product variable
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :type variable_name: str
+        :param variable_name: Specified product variable name
+
+        :return:
+            :data_variable: *eopy.product.productIO.Variable.Variable*
+
+            ``Variable`` or ``SpectralVariable`` object for given product 'data' variable
+        """
+
+        return self.createVariable(product, variable_name, "data")
+
+    def getDataVariableNames(self, product):
+        """
+        Returns list of product "data" type variable names
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :return:
+            :data_variable_names: *list*
+
+            List of product "data" type variable names
+        """
+
+        return self.return_variable_names(product, "data")
+
+    def createMaskVariable(self, product, variable_name):
+        """
+        Returns "mask" type variable class object, for given product variable
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :type variable_name: str
+        :param variable_name: Specified product variable name
+
+        :return:
+            :mask_variable: *eopy.product.productIO.Variable.Variable*
+
+            ``Variable`` or ``SpectralVariable`` object for given product 'mask' variable
+        """
+
+        return self.createVariable(product, variable_name, "mask")
+
+    def getMaskVariableNames(self, product):
+        """
+        Returns list of product "mask" type variable names
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :return:
+            :mask_variable_names: *list*
+
+            List of product "mask" type variable names
+        """
+
+        return self.return_variable_names(product, "mask")
+
+    def createMeteorologicalVariable(self, product, variable_name):
+        """
+        Returns "meteorological" type variable class object, for given product variable
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :type variable_name: str
+        :param variable_name: Specified product variable name
+
+        :return:
+            :meteorological_variable: *eopy.product.productIO.Variable.Variable*
+
+            ``Variable`` or ``SpectralVariable`` object for given product 'meteorological' variable
+        """
+
+        return self.createVariable(product, variable_name, "meteorological")
+
+    def getMeteorologicalVariableNames(self, product):
+        """
+        Returns list of product "meteorological" type variable names
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :return:
+            :meteorological_variable_names: *list*
+
+            List of product "meteorological" type variable names
+        """
+
+        return self.return_variable_names(product, "meteorological")
+
+    def createSensorVariable(self, product, variable_name):
+        """
+        Returns "sensor" type variable class object, for given product variable
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :type variable_name: str
+        :param variable_name: Specified product variable name
+
+        :return:
+            :sensor_variable: *eopy.product.productIO.Variable.Variable*
+
+            ``Variable`` or ``SpectralVariable`` object for given product 'sensor' variable
+        """
+
+        return self.createVariable(product, variable_name, "sensor")
+
+    def getSensorVariableNames(self, product):
+        """
+        Returns list of product "sensor" type variable names
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :return:
+            :sensor_variable_names: *list*
+
+            List of product "sensor" type variable names
+        """
+
+        return self.return_variable_names(product, "sensor")
+
+    def createInfoVariable(self, product, variable_name):
+        """
+        Returns "info" type variable class object, for given product variable
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :type variable_name: str
+        :param variable_name: Specified product variable name
+
+        :return:
+            :info_variable: *eopy.product.productIO.Variable.Variable*
+
+            ``Variable`` or ``SpectralVariable`` object for given product 'info' variable
+        """
+
+        return self.createVariable(product, variable_name, "info")
+
+    def getInfoVariableNames(self, product):
+        """
+        Returns list of product "info" type variable names
+
+        :type product: dict
+        :param product: In memory representation of data product
+
+        :return:
+            :info_variable_names: *list*
+
+            List of product "info" type variable names
+        """
+
+        return self.return_variable_names(product, "info")
+
+    def determine_getData_product(self, products, selected_variables):
+        """
+        Return product to get data from for given variables
+
+        :type products: list
+        :param products: List of dictionaries of in-memory representations of opened data products
+
+        :type selected_variables: list
+        :param selected_variables: List of selected variables to open
+
+        :return:
+            :product: *dict*
+
+            In-memory representation data product to get data from
+        """
+
+        product_dict = self.returnVariableIndex(None, products).getProduct(selected_variables)
+
+        if product_dict is None:
+            raise NameError("Cannot open combination of variables")
+
+        return product_dict['product']
+
+    def determine_getData_mask(self, products, selected_variables):
+        """
+        Return mask to apply to data when opened
+
+        :type products: list
+        :param products: List of dictionaries of in-memory representations of opened data products
+
+        :type selected_variables: list
+        :param selected_variables: List of selected variables to open
+
+        :return:
+            :mask: *numpy.ndarray*
+
+            Mask to apply to data when opened
+        """
+
+        if type(self.data_mask) == ndarray:
+            return self.data_mask
+
+        i = self.returnVariableIndex(None, products).getProductIndex(selected_variables)
+
+        if (i is None) or (self.data_mask is None):
+            return None
+        return self.data_mask[i]
+
+    def getData(self, products, variables, attributes, variable, *args, **kwargs):
+        """
+        Returns variable[s] of in-memory product[s] as an xarray data structure.
+
+        :type products: list
+        :param products: List of dictionaries of in-memory representations of opened data products
+
+        :type variables: list
+        :param variables: List of product variables as ``Variable`` or ``SpectralVariable`` class objects.
+
+        :type attributes: dict
+        :param attributes: Dictionary of product[s] metadata
+
+        :type variable: str
+        :param variable: Name of variable to return data for
+
+        :type args: str
+        :param args: Name of additional variables to to return data for
+
+        :type window: tuple/list
+        :param window: (optional) Pixel window to read data from, defined as *(x, y, x_width, y_width)*. If a list of
+        windows is given a list of data structures is returned, one per window. Default is the full product extent.
+
+        :type lazy: bool
+        :param lazy: (optional) If True return dask-backed data structure, where each chunk is read from the product
+        only when computed. Default is False.
+
+        :type chunks: int/tuple
+        :param chunks: (optional) Chunk size, *(y_width, x_width)*, for lazily read data.
+
+        :type mask_format: str
+        :param mask_format: (optional) Format of returned mask variables, either *None* (*uint32*, raised flags set to
+        255, default), *"bool"* or *"packed"* (bits packed along x dimension, in-memory data only). Masks are decoded
+        from one read of their flag variable.
+
+        :type tie_point_resolution: str
+        :param tie_point_resolution: (optional) Resolution of returned tie point grid variables, either *"image"*
+        (bilinearly interpolated to image grid pixels in window, default) or *"native"* (tie points surrounding window,
+        along *x_tie*, *y_tie* dimensions, with ``tie_point_window`` attribute locating them in the tie point grid).
+        Data masks are not applied to tie point resolution values.
+
+        :type scaling: str
+        :param scaling: (optional) Scaling of returned data variables stored as scaled values (e.g. OLCI radiances,
+        stored as *uint16*), either *"physical"* (scaled to physical values, *float32*, default) or *"raw"* (values as
+        stored, with CF ``scale_factor``, ``add_offset`` and ``_FillValue`` attributes, invalid pixels set to
+        ``_FillValue``). Raw values may be scaled lazily or on demand with
+        *eopy.product.productIO.Scaling.decode_scaling*. Coordinate variables are always scaled.
+
+        :return:
+            :data: *xarray.DataArray [xarray.Dataset]*
+
+            Specified variable[s] in memory in xarray data structure
+        """
+
+        window = kwargs.get("window", None)
+        lazy = kwargs.get("lazy", False)
+        chunks = kwargs.get("chunks", None)
+        mask_format = kwargs.get("mask_format", None)
+        tie_point_resolution = kwargs.get("tie_point_resolution", "image")
+        scaling = kwargs.get("scaling", "physical")
+
+        if scaling not in SCALINGS:
+            raise ValueError("Unknown scaling '%s', must be one of %s" % (scaling, str(SCALINGS)))
+
+        # Multiple windows required so return list of data structures, one per window
+        if (type(window) == list) and (window != []) and (type(window[0]) in [list, tuple]):
+            return [self.getData(products, variables, attributes, variable, *args, **dict(kwargs, window=w))
+                    for w in window]
+
+        selected_variables = [variable] + list(args)
+
+        product = self.determine_getData_product(products, selected_variables)
+        mask = self.determine_getData_mask(products, selected_variables)
+
+        # Tie point grid variables returned at tie point resolution
+        native_variables = [v for v in selected_variables if (tie_point_resolution == "native") and
+                            (product["nodes"][v]["kind"] == "tie")]
+        resolution = lambda v: "native" if v in native_variables else "image"
+
+        # Variables returned as raw values
+        raw_variables = [v for v in selected_variables if (scaling == "raw") and
+                         self.isRawVariable(product["nodes"][v])]
+        scaling_of = lambda v: "raw" if v in raw_variables else "physical"
+
+        if lazy:
+            read_pixels = lambda v, m: self.getLazyPixelValues(product, variables, attributes, v, mask=m,
+                                                               window=window, chunks=chunks,
+                                                               tie_point_resolution=resolution(v),
+                                                               scaling=scaling_of(v))
+        else:
+            read_pixels = lambda v, m: self.getPixelValues(product, variables, attributes, v, mask=m, window=window,
+                                                           tie_point_resolution=resolution(v),
+                                                           scaling=scaling_of(v))
+
+        def read_info(v):
+            variable_info = self.simplify_attr(self.getVariableInfo(variables, v))
+
+            # Time stamps returned as datetimes, units set by xarray when encoded (e.g. by Product.save_to_netcdf)
+            if product["nodes"][v]["kind"] == "time":
+                variable_info.pop("units", None)
+
+            variable_info.update(self.getFlagAttributes(product, v))
+            if v in native_variables:
+                variable_info.update(self.getTiePointAttributes(product, v, window=window))
+            if v in raw_variables:
+                variable_info.update(self.getScalingAttributes(product, v))
+            return variable_info
+
+        # Masks are decoded from their flag variable, so each flag variable is read at most once
+        flag_values = {}
+
+        def read(v, m):
+            node = product["nodes"][v]
+            if node["kind"] != "flag":
+                return read_pixels(v, m)
+
+            if node["flag_variable"] not in flag_values:
+                flag_values[node["flag_variable"]] = read_pixels(node["flag_variable"], None)
+            pixel_values = decode_flag(flag_values[node["flag_variable"]], node["bit"], mask_format)
+            return self.applyDataMask(product, pixel_values, m, window=window)
+
+        # Case A: Only one variable required so form an xarray.DataArray
+        if len(selected_variables) == 1:
+            return xr.DataArray(read(variable, mask), name=variable, attrs=read_info(variable))
+
+        # Case B: Multiple variables required so form an xarray.Dataset
+        var_coords = {"lon": {"shape": ["x", "y"], "poss_names": ["longitude", "lon"]},
+                      "lat": {"shape": ["x", "y"], "poss_names": ["latitude", "lat"]},
+                      "alt": {"shape": ["x", "y"], "poss_names": ["altitude", "alt", "elevation"]},
+                      "time_stamp": {"shape": ["x"], "poss_names": ["time_stamp"]}}
+
+        # Coordinates always at image resolution and scaled
+        coordinate_names = [name for common_name in var_coords for name in var_coords[common_name]["poss_names"]]
+        native_variables = [v for v in native_variables if v not in coordinate_names]
+        raw_variables = [v for v in raw_variables if v not in coordinate_names]
+
+        coords = {}
+        remaining_variables = deepcopy(selected_variables)
+        for common_name in var_coords.keys():
+            for poss_name in var_coords[common_name]["poss_names"]:
+                if poss_name in selected_variables:
+                    coords[common_name] = (var_coords[common_name]["shape"], read(poss_name, None),
+                                           read_info(poss_name))
+                    remaining_variables.remove(poss_name)
+
+        data_vars = {}
+        for v in remaining_variables:
+            if v in native_variables:
+                dims = ['x_tie', 'y_tie']
+            elif (mask_format == "packed") and (product["nodes"][v]["kind"] == "flag"):
+                dims = ['x', 'y_packed']
+            else:
+                dims = ['x', 'y']
+            data_vars[v] = (dims, read(v, mask), read_info(v))
+
+        return xr.Dataset(data_vars=data_vars, coords=coords if coords != {} else None,
+                          attrs=self.simplify_attr(attributes))
+
+    def return_window(self, product, window=None):
+        """
+        Return pixel window to read from product, clipped to the product extent
+
+        :type product: dict
+        :param product: In memory representation of data product.
+
+        :type window: tuple
+        :param window: Pixel window defined as *(x, y, x_width, y_width)*, if None full product extent returned
+
+        :return:
+            :window: *tuple*
+
+            Pixel window clipped to product extent, *(x, y, x_width, y_width)*
+        """
+
+        w = product["width"]
+        h = product["height"]
+
+        if window is None:
+            return 0, 0, w, h
+
+        x, y, x_width, y_width = [int(v) for v in window]
+
+        x_start = max(x, 0)
+        y_start = max(y, 0)
+        x_end = min(x + x_width, w)
+        y_end = min(y + y_width, h)
+
+        if (x_end <= x_start) or (y_end <= y_start):
+            raise ValueError("Window %s outside of product extent (%s, %s)" % (str(window), w, h))
+
+        return x_start, y_start, x_end - x_start, y_end - y_start
+
+    def read_node(self, node, rows, columns, scale=True):
+        """
+        Return values of variable node for given rows and columns of its grid
+
+        :type node: dict
+        :param node: variable node dictionary
+
+        :type rows: slice
+        :param rows: grid rows to read
+
+        :type columns: slice
+        :param columns: grid columns to read
+
+        :type scale: bool
+        :param scale: (optional) If False, values returned as stored, without scaling to physical values (default
+        True)
+
+        :return:
+            :values: *numpy.ma.MaskedArray*
+
+            variable node values, scaled (unless *scale* False) and masked
+        """
+
+        index = [rows, columns]
+        if node["layer"] is not None:
+            layer_axis, layer = node["layer"]
+            index.insert(layer_axis, layer)
+
+        with NETCDF_LOCK:
+            nc_variable = open_dataset(node["path"]).variables[node["nc_name"]]
+            if scale:
+                return ma.asarray(nc_variable[tuple(index)])
+
+            # Variables of cached files shared, so scaling restored after read
+            nc_variable.set_auto_scale(False)
+            try:
+                return ma.asarray(nc_variable[tuple(index)])
+            finally:
+                nc_variable.set_auto_scale(True)
+
+    def getPixelValues(self, product, variables, attributes, variable, mask=None, window=None,
+                       tie_point_resolution="image", scaling="physical"):
+        """
+        Returns pixel values of variable of in-memory products
+
+        :type product: dict
+        :param product: In memory representation of data product.
+
+        :type variables: list
+        :param variables: list of product variables as ``Variable`` or ``SpectralVariable`` class objects.
+
+        :type attributes: dict
+        :param attributes: Dictionary of product attributes
+
+        :type variable: str
+        :param variable: Name of variable to return data for.
+
+        :type mask: numpy.ndarray
+        :param mask: (optional) Mask to apply to full product extent data
+
+        :type window: tuple
+        :param window: (optional) Pixel window to read, defined as *(x, y, x_width, y_width)*
+
+        :type tie_point_resolution: str
+        :param tie_point_resolution: (optional) Resolution of returned tie point grid variables, either *"image"*
+        (interpolated to image grid pixels in window, default) or *"native"* (tie points surrounding window, unmasked)
+
+        :type scaling: str
+        :param scaling: (optional) Scaling of returned values of variables stored as scaled values, either
+        *"physical"* (default) or *"raw"* (values as stored, with invalid and masked pixels set to fill value)
+
+        :return:
+            :pixel_values: *numpy.ndarray*
+
+            specified variable pixels values
+        """
+
+        node = product["nodes"][variable]
+
+        if node["kind"] == "time":
+            return self.getTimeStampValues(product, variables, attributes, variable, window=window)
+
+        x, y, w, h = self.return_window(product, window)
+        rows = slice(y, y+h)
+        columns = slice(x, x+w)
+
+        # Raw values read as stored, without scaling, with invalid and masked pixels set to fill value
+        if (scaling == "raw") and self.isRawVariable(node):
+            raw_values = self.read_node(node, rows, columns, scale=False)
+            if mask is not None:
+                raw_values = ma.masked_array(raw_values, mask=mask[y:y+h, x:x+w] | ma.getmaskarray(raw_values))
+            return raw_values.filled(self.getScalingAttributes(product, variable)["_FillValue"])
+
+        if (node["kind"] == "band") and ("flag_masks" in node):
+            pixel_values = self.read_node(node, rows, columns).astype(uint32)
+
+        elif node["kind"] == "band":
+            pixel_values = self.read_node(node, rows, columns).astype(float32)
+
+        elif node["kind"] == "tie":
+            # Read only tie points surrounding window
+            interpolator = self.returnTiePointInterpolator(node)
+            tie_window = interpolator.returnTieWindow((x, y, w, h))
+            tie_x, tie_y, tie_w, tie_h = tie_window
+            tie_values = self.read_node(node, slice(tie_y, tie_y+tie_h), slice(tie_x, tie_x+tie_w))
+
+            # Tie point resolution values returned without data mask, as defined on image grid
+            if tie_point_resolution == "native":
+                return ma.masked_invalid(tie_values.astype(float32))
+
+            pixel_values = interpolator.interpolate(tie_values.astype(float64).filled(nan), (x, y, w, h),
+                                                    DISCONTINUITY_VARIABLE_PATTERN.search(variable) is not None,
+                                                    tie_window=tie_window)
+            pixel_values = ma.masked_invalid(pixel_values.astype(float32))
+
+        elif node["kind"] == "flag":
+            pixel_values = decode_flag(self.read_node(node, rows, columns).filled(0), node["bit"])
+
+        elif node["kind"] == "detector":
+            detector_index = self.read_node(node["detector_index"], rows, columns)
+            with NETCDF_LOCK:
+                table = ma.asarray(open_dataset(node["path"]).variables[node["nc_name"]][node["layer"], :])
+            table = table.astype(float32)
+            pixel_values = ma.masked_array(table.filled(nan)[detector_index.filled(0)],
+                                           mask=ma.getmaskarray(detector_index))
+            pixel_values = ma.masked_invalid(pixel_values)
+
+        if mask is not None:
+            mask = mask[y:y+h, x:x+w]
+            pixel_values = ma.masked_array(pixel_values, mask=mask | ma.getmaskarray(pixel_values))
+
+        return pixel_values
+
+    def getLazyPixelValues(self, product, variables, attributes, variable, mask=None, window=None, chunks=None,
+                           tie_point_resolution="image", scaling="physical"):
+        """
+        Returns dask array of pixel values of variable of in-memory products, each chunk of which is read from the
+        product netCDF files only when computed
+
+        :type product: dict
+        :param product: In memory representation of data product.
+
+        :type variables: list
+        :param variables: list of product variables as ``Variable`` or ``SpectralVariable`` class objects.
+
+        :type attributes: dict
+        :param attributes: Dictionary of product attributes
+
+        :type variable: str
+        :param variable: Name of variable to return data for.
+
+        :type mask: numpy.ndarray
+        :param mask: (optional) Mask to apply to full product extent data
+
+        :type window: tuple
+        :param window: (optional) Pixel window to read, defined as *(x, y, x_width, y_width)*
+
+        :type chunks: int/tuple
+        :param chunks: (optional) Chunk size, *(y_width, x_width)*. Default is 1024 x 1024.
+
+        :type tie_point_resolution: str
+        :param tie_point_resolution: (optional) Resolution of returned tie point grid variables, either *"image"*
+        (default) or *"native"*
+
+        :type scaling: str
+        :param scaling: (optional) Scaling of returned values of variables stored as scaled values, either
+        *"physical"* (default) or *"raw"*
+
+        :return:
+            :pixel_values: *dask.array.Array*
+
+            specified variable pixels values, masked values set to nan (or fill value for raw values)
+        """
+
+        if product["nodes"][variable]["kind"] == "time":
+            return self.getTimeStampValues(product, variables, attributes, variable, window=window)
+
+        # * tie point resolution values are small enough to read immediately
+        if (product["nodes"][variable]["kind"] == "tie") and (tie_point_resolution == "native"):
+            return self.getPixelValues(product, variables, attributes, variable, window=window,
+                                       tie_point_resolution=tie_point_resolution)
+
+        x, y, w, h = self.return_window(product, window)
+        if chunks is None:
+            chunks = DEFAULT_CHUNK_SIZE
+        chunk_h, chunk_w = (chunks, chunks) if type(chunks) == int else (int(chunks[0]), int(chunks[1]))
+
+        flag = (product["nodes"][variable]["kind"] == "flag") or ("flag_masks" in product["nodes"][variable])
+        dtype = float64 if flag and (mask is not None) else (uint32 if flag else float32)
+
+        raw = (scaling == "raw") and self.isRawVariable(product["nodes"][variable])
+        if raw:
+            dtype = product["nodes"][variable]["raw_dtype"]
+
+        rows = []
+        for y_tile in range(y, y+h, chunk_h):
+            row = []
+            for x_tile in range(x, x+w, chunk_w):
+                tile_window = (x_tile, y_tile, min(chunk_w, x+w-x_tile), min(chunk_h, y+h-y_tile))
+                tile = delayed(self.readPixelTile, pure=False)(product, variables, attributes, variable, mask,
+                                                               tile_window, dtype, scaling=scaling)
+                row.append(da.from_delayed(tile, shape=(tile_window[3], tile_window[2]), dtype=dtype))
+            rows.append(row)
+
+        return da.block(rows)
+
+    def readPixelTile(self, product, variables, attributes, variable, mask, window, dtype, scaling="physical"):
+        """
+        Returns pixel values of variable of in-memory product for given window, with masked values set to nan
+
+        :type product: dict
+        :param product: In memory representation of data product.
+
+        :type variables: list
+        :param variables: list of product variables as ``Variable`` or ``SpectralVariable`` class objects.
+
+        :type attributes: dict
+        :param attributes: Dictionary of product attributes
+
+        :type variable: str
+        :param variable: Name of variable to return data for.
+
+        :type mask: numpy.ndarray
+        :param mask: Mask to apply to full product extent data
+
+        :type window: tuple
+        :param window: Pixel window to read, defined as *(x, y, x_width, y_width)*
+
+        :type dtype: type
+        :param dtype: data type of returned array
+
+        :type scaling: str
+        :param scaling: (optional) Scaling of returned values, either *"physical"* (default) or *"raw"*
+
+        :return:
+            :pixel_values: *numpy.ndarray*
+
+            specified variable pixels values for window
+        """
+
+        with NETCDF_LOCK:
+            pixel_values = self.getPixelValues(product, variables, attributes, variable, mask=mask, window=window,
+                                               scaling=scaling)
+
+        # Masked pixels of integer flag data can't be nan, so set to 0 (no flags raised)
+        if isinstance(pixel_values, ma.MaskedArray):
+            return pixel_values.astype(dtype).filled(nan if dtype in [float32, float64] else 0)
+        return pixel_values.astype(dtype)
+
+    def applyDataMask(self, product, pixel_values, mask, window=None):
+        """
+        Returns pixel values with data mask applied
+
+        :type product: dict
+        :param product: In memory representation of data product.
+
+        :type pixel_values: numpy.ndarray/dask.array.Array
+        :param pixel_values: Pixel values of window
+
+        :type mask: numpy.ndarray
+        :param mask: Mask to apply to full product extent data
+
+        :type window: tuple
+        :param window: (optional) Pixel window of pixel values, defined as *(x, y, x_width, y_width)*
+
+        :return:
+            :pixel_values: *numpy.ma.MaskedArray/dask.array.Array*
+
+            pixel values, masked values set to nan if dask array
+        """
+
+        if mask is None:
+            return pixel_values
+
+        x, y, w, h = self.return_window(product, window)
+        mask = mask[y:y+h, x:x+w]
+
+        if mask.shape != pixel_values.shape:
+            raise ValueError("Data mask can't be applied to packed masks")
+
+        if isinstance(pixel_values, da.Array):
+            return da.where(mask, nan, pixel_values.astype(float64))
+        return ma.masked_array(pixel_values, mask=mask)
+
+    def getFlagAttributes(self, product, variable):
+        """
+        Returns CF flag attributes of variable, if a flag variable, to describe the flag coding of its values (see
+        *eopy.product.productIO.FlagCoding.FlagCoding*)
+
+        :type product: dict
+        :param product: In memory representation of data product.
+
+        :type variable: str
+        :param variable: Name of variable
+
+        :return:
+            :flag_attributes: *dict*
+
+            ``flag_masks`` and ``flag_meanings`` attributes of flag variable, empty if variable not a flag variable
+        """
+
+        node = product["nodes"][variable]
+        if "flag_masks" not in node:
+            return {}
+
+        return {"flag_masks": node["flag_masks"], "flag_meanings": node["flag_meanings"]}
+
+    def isRawVariable(self, node):
+        """
+        Return True if variable node can be read as raw values, i.e. non-flag image grid variables
+
+        :type node: dict
+        :param node: variable node dictionary
+
+        :return:
+            :raw_variable: *bool*
+
+            True if variable can be read as raw values
+        """
+
+        return (node["kind"] == "band") and ("flag_masks" not in node)
+
+    def getScalingAttributes(self, product, variable):
+        """
+        Returns CF scaling attributes of variable read as raw values, to scale them to physical values (see
+        *eopy.product.productIO.Scaling.decode_scaling*)
+
+        :type product: dict
+        :param product: In memory representation of data product.
+
+        :type variable: str
+        :param variable: Name of variable
+
+        :return:
+            :scaling_attributes: *dict*
+
+            ``scale_factor`` and ``add_offset`` attributes of scaled variable, and ``_FillValue`` of invalid pixels,
+            empty if variable can not be read as raw values
+        """
+
+        node = product["nodes"][variable]
+        if not self.isRawVariable(node):
+            return {}
+
+        scaling_attributes = dict(node["raw_scaling"])
+        scaling_attributes["_FillValue"] = return_fill_value(node["raw_dtype"], node["raw_scaling"].get("_FillValue"))
+        return scaling_attributes
+
+    def returnTiePointInterpolator(self, node):
+        """
+        Return interpolator of tie point grid variable node to image grid, sharing interpolation weights with all tie
+        point grids of the same geometry
+
+        :type node: dict
+        :param node: tie point grid variable node dictionary
+
+        :return:
+            :interpolator: *eopy.utils.TiePointInterpolator.TiePointInterpolator*
+
+            tie point grid interpolator, with tie point *[0, 0]* at image pixel *[0, 0]*
+        """
+
+        shape = list(node["shape"])
+        if node["layer"] is not None:
+            del shape[node["layer"][0]]
+
+        return TiePointInterpolator(shape, node["ac"], node["al"])
+
+    def getTiePointAttributes(self, product, variable, window=None):
+        """
+        Returns attributes locating values of tie point grid variable, returned at tie point resolution, in the image
+        grid
+
+        :type product: dict
+        :param product: In memory representation of data product.
+
+        :type variable: str
+        :param variable: Name of variable
+
+        :type window: tuple
+        :param window: (optional) Pixel window read, defined as *(x, y, x_width, y_width)*
+
+        :return:
+            :tie_point_attributes: *dict*
+
+            ``tie_point_window`` (window of tie points returned, as *(tie_x, tie_y, tie_x_width, tie_y_width)*),
+            ``sub_sampling_x`` and ``sub_sampling_y`` attributes of tie point grid variable, empty if variable not a
+            tie point grid variable
+        """
+
+        node = product["nodes"][variable]
+        if node["kind"] != "tie":
+            return {}
+
+        interpolator = self.returnTiePointInterpolator(node)
+        return {"tie_point_window": interpolator.returnTieWindow(self.return_window(product, window)),
+                "sub_sampling_x": node["ac"], "sub_sampling_y": node["al"]}
+
+    def getTimeStampValues(self, product, variables, attributes, variable, window=None):
+        """
+        Return values for per pixel time per row
+
+        :type product: dict
+        :param product: In memory representation of data product.
+
+        :type variables: list
+        :param variables: list of product variables as ``Variable`` or ``SpectralVariable`` class objects.
+
+        :type attributes: dict
+        :param attributes: Dictionary of product attributes
+
+        :type variable: str
+        :param variable: Name of variable to return data for.
+
+        :type window: tuple
+        :param window: (optional) Pixel window to return time stamps for, defined as *(x, y, x_width, y_width)*
+
+        :return:
+            :time_stamp_values: *numpy.ndarray*
+
+            time stamp per row
+        """
+
+        x, y, w, h = self.return_window(product, window)
+        node = product["nodes"][variable]
+
+        # Time stamps from file if available
+        if (node["path"] is not None) and (node["time_units"] is not None) and (node["shape"][0] == product["height"]):
+            with NETCDF_LOCK:
+                time_stamps = open_dataset(node["path"]).variables[node["nc_name"]][y:y+h]
+            return asarray(netCDF4.num2date(time_stamps, node["time_units"]), dtype=datetime)
+
+        # Otherwise interpolate between product start and end time
+        start_time = attributes["start_time"]
+        end_time = attributes["end_time"]
+        row_time = (end_time - start_time) / (product["height"]-1)
+        increments = range(y, y+h) * array([row_time] * h)
+
+        return asarray(start_time + increments, dtype=datetime)
+
+    def simplify_attr(self, attr):
+        """
+        Return a simplified form of input attributes dictionary suitable for netcdf file attributes
+
+        :type attr: dict
+        :param attr: attributes dictionary
+
+        :return:
+            :new_attr: *dict*
+
+            Simplified attributes dictionary
+        """
+
+        new_attr = deepcopy(attr)
+
+        for attribute in new_attr.keys():
+
+            if type(new_attr[attribute]) == bool:
+                new_attr[attribute] = str(new_attr[attribute])
+
+            elif type(new_attr[attribute]) == datetime:
+                new_attr[attribute] = new_attr[attribute].strftime("%Y-%m-%dT%H:%M:%S")
+
+            elif new_attr[attribute] is None:
+                new_attr[attribute] = "None"
+
+            elif attribute == "coordinates":
+                del new_attr[attribute]
+
+        return new_attr
+
+
+if __name__ == "__main__":
+    pass
@@ -805,7 +805,8 @@ class SLSTRL1Factory(SnappySharedFactory):
     #
     #     return attributes
 
-    def define_coords(self, product, variables, attributes, selected_variables):
+    def define_coords(self, product, variables, attributes, selected_variables, window=None, lazy=False,
+                      chunks=None):
         """
         Build `xarray.Dataset` coord dictionary from based on list of selected variables
 
@@ -821,6 +822,15 @@ class SLSTRL1Factory(SnappySharedFactory):
         :type selected_variables: list
         :param selected_variables: List of requested variables
 
+        :type window: tuple
+        :param window: (optional) Pixel window to read coordinates for, defined as *(x, y, x_width, y_width)*
+
+        :type lazy: bool
+        :param lazy: (optional) If True coordinates returned as dask arrays, read chunk by chunk when computed
+
+        :type chunks: int/tuple
+        :param chunks: (optional) Chunk size for lazily read coordinates
+
         :return:
             :coords: *dict*
 
@@ -849,8 +859,12 @@ class SLSTRL1Factory(SnappySharedFactory):
         for common_name in var_coords.keys():
             for poss_name in var_coords[common_name]["poss_names"]:
                 if poss_name in selected_variables:
-                    coords[common_name] = (var_coords[common_name]["shape"],
-                                           self.getPixelValues(product, variables, attributes, poss_name),
+                    if lazy:
+                        pixel_values = self.getLazyPixelValues(product, variables, attributes, poss_name,
+                                                               window=window, chunks=chunks)
+                    else:
+                        pixel_values = self.getPixelValues(product, variables, attributes, poss_name, window=window)
+                    coords[common_name] = (var_coords[common_name]["shape"], pixel_values,
                                            self.simplify_attr(self.getVariableInfo(variables, poss_name)))
                     remaining_variables.remove(poss_name)
 
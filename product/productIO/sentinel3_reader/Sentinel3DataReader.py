@@ -4,9 +4,8 @@ Data reader for Sentinel-3 data products
 
 '''___Built-In Modules___'''
 import sys
-from os.path import dirname, basename
+from os.path import dirname, basename, abspath
 from os.path import join as pjoin
-import re
 
 '''___Third-Party Modules___'''
 
@@ -14,14 +13,13 @@ import re
 sys.path.append(dirname(dirname(__file__)))
 from AbstractDataReader import AbstractDataReader
 
+# Product factories imported only as required in Sentinel3DataReader.setDataFactory(), so snappy is not imported if
+# the "netcdf" engine is used
 sys.path.append(dirname(__file__))
-from OLCIL1Factory import OLCIL1Factory
-from OLCIL2LFactory import OLCIL2LFactory
-from OLCIL2WFactory import OLCIL2WFactory
-from SLSTRL1Factory import SLSTRL1Factory
-
 sys.path.append(pjoin(dirname(dirname(__file__)), "snappy_shared"))
-from SnappySharedFactory import SnappySharedFactory
+
+sys.path.append(pjoin(dirname(dirname(dirname(dirname(abspath(__file__))))), "utils"))
+from Sentinel3Naming import SENTINEL3_PATTERN, return_product_type
 
 '''___Authorship___'''
 __author__ = "Sam Hunt"
@@ -32,6 +30,20 @@ __maintainer__ = "Sam Hunt"
 __email__ = "sam.hunt@npl.co.uk"
 __status__ = "Development"
 
+# Snappy product factory of each Sentinel-3 product type (see Sentinel3Naming.SENTINEL3_PRODUCT_TYPES), factory class
+# has the same name as its module
+# TODO - Write specific SLSTR L2 and SYN factories?
+SENTINEL3_DATA_FACTORIES = {"OLCIL1": "OLCIL1Factory",
+                            "OLCIL2L": "OLCIL2LFactory",
+                            "OLCIL2W": "OLCIL2WFactory",
+                            "SLSTRL1": "SLSTRL1Factory",
+                            "SLSTRL2LST": "SnappySharedFactory",
+                            "SLSTRL2WST": "SnappySharedFactory",
+                            "SLSTRL2WCT": "SnappySharedFactory",
+                            "SYNL1": "SnappySharedFactory",
+                            "SYNL2": "SnappySharedFactory",
+                            "SYNVGT": "SnappySharedFactory"}
+
 
 class Sentinel3DataReader(AbstractDataReader):
     """
@@ -44,6 +56,23 @@ class Sentinel3DataReader(AbstractDataReader):
 
             Instance of sub-class of product factory for reading Sentinel-3 product data
 
+        .. py:attribute:: PATTERNS
+
+            *list:str*
+
+            Regular expressions of Sentinel-3 product directory names, used by
+            *eopy.product.productIO.ProductDataReader.ProductDataReader* to find the data reader for a product
+
+        .. py:attribute:: engine
+
+            *str*
+
+            Engine to read Sentinel-3 product data with, either:
+
+            * None - read with snappy (default)
+            * *"netcdf"* - read directly from the product netCDF files, with
+              *eopy.product.productIO.sentinel3_reader.SEN3NetCDFFactory.SEN3NetCDFFactory*
+
     :Methods:
         .. py:method:: setDataFactory(...):
 
@@ -68,6 +97,8 @@ class Sentinel3DataReader(AbstractDataReader):
                 *self.dataFactory*.
     """
 
+    PATTERNS = [SENTINEL3_PATTERN.pattern]
+
     def setDataFactory(self, product_path):
         """
         Return Sentinel-3 product factory suitable for data product at product_path
@@ -85,51 +116,25 @@ class Sentinel3DataReader(AbstractDataReader):
 
         # Test if directory name matches any sentinel-3 product factory inputs
 
-        # > Get directory of product
-        product_directory = basename(dirname(product_path))
-
-        # > Possible regular expression for Sentinel-3 products
-        OLCIL1_pattern = re.compile(r"S3.?_OL_1_E[RF]R_.*.SEN3")     # OLCI L1b
-        OLCIL2L_pattern = re.compile(r"S3.?_OL_2_(L[FR]R)_.*.SEN3")  # OLCI L2 L
-        OLCIL2W_pattern = re.compile(r"S3.?_OL_2_(W[FR]R)_.*.SEN3")  # OLCI L2 W
-        SLSTRL1_pattern = re.compile(r"S3.?_SL_1_RBT.*")             # SLSTR L1
-        SLSTRL2LST_pattern = re.compile(r"S3.?_SL_2_LST_.*.SEN3")    # SLSTR L2 LST
-        SLSTRL2WST_pattern = re.compile(r"S3.?_SL_2_WST_.*.SEN3")    # SLSTR L2 WST
-        SLSTRL2WCT_pattern = re.compile(r"S3.?_SL_2_WCT_.*.SEN3")    # SLSTR L2 WCT
-        SYNL1_pattern = re.compile(r"S3.?_SY_1_SYN_.*")              # SYN L1
-        SYNL2_pattern = re.compile(r"S3.?_SY_2_SYN_.*.SEN3")         # SYN L2
-        SYNVGT_pattern = re.compile(r"S3.?_SY_2_SYN_.*.SEN3")        # SYN VGT
-
-        # > Check if input product_path matches any Sentinel-3 product regular expressions
-        #   return dataFactory as appropriate
-        if OLCIL1_pattern.match(product_directory):
-            return OLCIL1Factory
-        elif OLCIL2L_pattern.match(product_directory):
-            return OLCIL2LFactory
-        elif OLCIL2W_pattern.match(product_directory):
-            return OLCIL2WFactory
-        elif SLSTRL1_pattern.match(product_directory):
-            return SLSTRL1Factory
-        elif SLSTRL2LST_pattern.match(product_directory):
-            # TODO - Write specific SLSTR L2 LST factory?
-            return SnappySharedFactory
-        elif SLSTRL2WST_pattern.match(product_directory):
-            # TODO - Write specific SLSTR L2 WST factory?
-            return SnappySharedFactory
-        elif SLSTRL2WCT_pattern.match(product_directory):
-            # TODO - Write specific SLSTR L2 WCT factory?
-            return SnappySharedFactory
-        elif SYNL1_pattern.match(product_directory):
-            # TODO - Write specific SYN L1 factory?
-            return SnappySharedFactory
-        elif SYNL2_pattern.match(product_directory):
-            # TODO - Write specific SYN L2 factory?
-            return SnappySharedFactory
-        elif SYNVGT_pattern.match(product_directory):
-            # TODO - Write specific SYN VGT factory?
-            return SnappySharedFactory
-        else:
+        # > Get product type of directory name
+        product_type = return_product_type(basename(dirname(product_path)))
+        if product_type is None:
             return None
 
+        engine = getattr(self, "engine", None)
+
+        # >> netcdf engine reads all SEN3 products with the same factory
+        if engine == "netcdf":
+            from SEN3NetCDFFactory import SEN3NetCDFFactory
+            return SEN3NetCDFFactory
+
+        elif engine is not None:
+            raise ValueError("Unknown Sentinel-3 reader engine '%s'" % engine)
+
+        # >> snappy factories, imported only as required
+        factory_name = SENTINEL3_DATA_FACTORIES[product_type]
+        return getattr(__import__(factory_name), factory_name)
+
+
 if __name__ == "__main__":
     pass
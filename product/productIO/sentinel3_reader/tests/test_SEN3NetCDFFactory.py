@@ -0,0 +1,419 @@
+"""
+SEN3NetCDFFactory class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname, basename
+from os.path import join as pjoin
+from os import makedirs
+from tempfile import mkdtemp
+from shutil import rmtree
+from datetime import datetime
+from glob import glob
+
+'''___Third-Party Modules___'''
+from netCDF4 import Dataset
+from numpy import arange, zeros, ones, array, float32, allclose, isnan, uint32, uint16
+import xarray as xr
+
+'''___NPL Modules___'''
+sys.path.append(dirname(__file__))
+sys.path.append(dirname(dirname(__file__)))
+sys.path.append(dirname(dirname(dirname(__file__))))
+import SEN3NetCDFFactory as SEN3NetCDFFactory_module
+from SEN3NetCDFFactory import SEN3NetCDFFactory, open_datasets, close_datasets
+from Scaling import decode_scaling
+from Product import Product
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+h = 10
+w = 9
+ac = 4
+al = 1
+
+MANIFEST = """<?xml version="1.0" encoding="UTF-8"?>
+<xfdu:XFDU xmlns:xfdu="urn:ccsds:schema:xfdu:1" xmlns:sentinel-safe="http://www.esa.int/safe/sentinel/1.1"
+           xmlns:sentinel3="http://www.esa.int/safe/sentinel/sentinel-3/1.0"
+           xmlns:olci="http://www.esa.int/safe/sentinel/sentinel-3/olci/1.0">
+  <metadataSection>
+    <metadataObject ID="generalProductInformation">
+      <metadataWrap><xmlData><sentinel3:generalProductInformation>
+        <sentinel3:productType>OL_1_EFR</sentinel3:productType>
+      </sentinel3:generalProductInformation></xmlData></metadataWrap>
+    </metadataObject>
+    <metadataObject ID="acquisitionPeriod">
+      <metadataWrap><xmlData><sentinel-safe:acquisitionPeriod>
+        <sentinel-safe:startTime>2018-04-05T10:00:00.000000Z</sentinel-safe:startTime>
+        <sentinel-safe:stopTime>2018-04-05T10:03:00.000000Z</sentinel-safe:stopTime>
+      </sentinel-safe:acquisitionPeriod></xmlData></metadataWrap>
+    </metadataObject>
+    <metadataObject ID="platform">
+      <metadataWrap><xmlData><sentinel-safe:platform>
+        <sentinel-safe:familyName>Sentinel-3</sentinel-safe:familyName>
+        <sentinel-safe:number>A</sentinel-safe:number>
+        <sentinel-safe:instrument>
+          <sentinel-safe:familyName abbreviation="OLCI">Ocean Land Colour Instrument</sentinel-safe:familyName>
+        </sentinel-safe:instrument>
+      </sentinel-safe:platform></xmlData></metadataWrap>
+    </metadataObject>
+    <metadataObject ID="olciProductInformation">
+      <metadataWrap><xmlData><olci:olciProductInformation>
+        <olci:samplingParameters alSpatialSampling="300" acSpatialSampling="300"/>
+        <olci:earthSunDistance>149597870700</olci:earthSunDistance>
+        <olci:pixelQualitySummary>
+          <olci:invalidPixels percentage="1.5"/>
+        </olci:pixelQualitySummary>
+        <olci:classificationSummary>
+          <olci:landPixels percentage="40.0"/>
+        </olci:classificationSummary>
+      </olci:olciProductInformation></xmlData></metadataWrap>
+    </metadataObject>
+  </metadataSection>
+</xfdu:XFDU>
+"""
+
+radiance_raw_array = arange(w*h).reshape((h, w)).astype(uint16)
+radiance_array = (radiance_raw_array / 10.0).astype(float32)
+tie_sza_array = (arange(h)[:, None] * 2.0 + arange(3)[None, :] * 8.0).astype(float32)
+quality_flags_array = zeros((h, w), uint32)
+quality_flags_array[:5, :] = 1
+quality_flags_array[:, :3] += 2
+detector_index_array = (arange(w*h).reshape((h, w)) % 3).astype("int16")
+solar_flux_array = array([[1000.0, 1100.0, 1200.0], [1500.0, 1600.0, 1700.0]], float32)
+wind_array = ones((h, 3, 2), float32)
+wind_array[:, :, 1] = 2.0
+
+
+def write_variable(path, name, dims, values, attrs=None, global_attrs=None, dim_sizes=None):
+    dataset = Dataset(path, "w")
+    for dim, size in zip(dims, values.shape):
+        dataset.createDimension(dim, size)
+    if global_attrs is not None:
+        dataset.setncatts(global_attrs)
+    variable = dataset.createVariable(name, values.dtype, dims)
+    if attrs is not None:
+        variable.setncatts(attrs)
+
+    # Values written as stored
+    variable.set_auto_scale(False)
+    variable[:] = values
+    dataset.close()
+
+
+def setup():
+    directory = mkdtemp()
+    product_directory = pjoin(directory,
+                              "S3A_OL_1_EFR____20180405T100000_20180405T100300_20180405T120000_0179_010_122_1979_SVL_O_"
+                              "NR_002.SEN3")
+    makedirs(product_directory)
+
+    with open(pjoin(product_directory, "xfdumanifest.xml"), "w") as f:
+        f.write(MANIFEST)
+
+    write_variable(pjoin(product_directory, "Oa01_radiance.nc"), "Oa01_radiance", ("rows", "columns"),
+                   radiance_raw_array, {"units": "mW.m-2.sr-1.nm-1", "scale_factor": float32(0.1)})
+    write_variable(pjoin(product_directory, "qualityFlags.nc"), "quality_flags", ("rows", "columns"),
+                   quality_flags_array, {"flag_masks": array([1, 2], uint32), "flag_meanings": "land coastline"})
+    write_variable(pjoin(product_directory, "tie_geometries.nc"), "SZA", ("tie_rows", "tie_columns"),
+                   tie_sza_array, {"units": "degrees"}, {"ac_subsampling_factor": ac, "al_subsampling_factor": al})
+    write_variable(pjoin(product_directory, "tie_meteo.nc"), "horizontal_wind", ("tie_rows", "tie_columns",
+                                                                                  "wind_vectors"),
+                   wind_array, {"units": "m s-1"}, {"ac_subsampling_factor": ac, "al_subsampling_factor": al})
+
+    dataset = Dataset(pjoin(product_directory, "instrument_data.nc"), "w")
+    dataset.createDimension("rows", h)
+    dataset.createDimension("columns", w)
+    dataset.createDimension("bands", 2)
+    dataset.createDimension("detectors", 3)
+    detector_index = dataset.createVariable("detector_index", "int16", ("rows", "columns"), fill_value=-1)
+    detector_index[:] = detector_index_array
+    solar_flux = dataset.createVariable("solar_flux", "float32", ("bands", "detectors"))
+    solar_flux.units = "mW.m-2.nm-1"
+    solar_flux[:] = solar_flux_array
+    dataset.close()
+
+    factory = SEN3NetCDFFactory()
+    products, variables, attributes = factory.openProduct(pjoin(product_directory, "xfdumanifest.xml"))
+
+    return directory, factory, products, variables, attributes
+
+
+class TestSEN3NetCDFFactory(unittest.TestCase):
+    def setUp(self):
+        self.directory, self.factory, self.products, self.variables, self.attributes = setup()
+
+    def tearDown(self):
+        close_datasets()
+        rmtree(self.directory)
+
+    def test_openProduct_datasets_closed(self):
+        self.assertEqual(0, len(open_datasets))
+
+    def test_getData_datasets_cached(self):
+        self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance")
+        self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance")
+
+        self.assertEqual(["Oa01_radiance.nc"], [basename(path) for path in open_datasets.keys()])
+
+    def test_getData_datasets_cache_size(self):
+        cache_size = SEN3NetCDFFactory_module.DATASET_CACHE_SIZE
+        SEN3NetCDFFactory_module.DATASET_CACHE_SIZE = 1
+        try:
+            self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance")
+            radiance_dataset = list(open_datasets.values())[0]
+            data = self.factory.getData(self.products, self.variables, self.attributes, "quality_flags")
+        finally:
+            SEN3NetCDFFactory_module.DATASET_CACHE_SIZE = cache_size
+
+        self.assertEqual(["qualityFlags.nc"], [basename(path) for path in open_datasets.keys()])
+        self.assertFalse(radiance_dataset.isopen())
+        self.assertEqual(quality_flags_array.tolist(), data.values.tolist())
+
+    def test_close_datasets(self):
+        self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance")
+        dataset = list(open_datasets.values())[0]
+
+        close_datasets()
+
+        self.assertEqual(0, len(open_datasets))
+        self.assertFalse(dataset.isopen())
+
+    def test_openProduct_variables(self):
+        expected_variable_names = {"Oa01_radiance": "data", "quality_flags": "data", "quality_flags_land": "mask",
+                                   "quality_flags_coastline": "mask", "SZA": "info",
+                                   "horizontal_wind_vector_1": "meteorological",
+                                   "horizontal_wind_vector_2": "meteorological", "detector_index": "sensor",
+                                   "solar_flux_band_1": "info", "solar_flux_band_2": "info", "time_stamp": "info"}
+
+        self.assertEqual(1, len(self.products))
+        self.assertItemsEqual(expected_variable_names.keys(), [v.name for v in self.variables])
+        for v in self.variables:
+            self.assertEqual(expected_variable_names[v.name], v.vtype)
+            if v.name != "time_stamp":
+                self.assertEqual((w, h), v.shape)
+
+    def test_openProduct_spectral_variable(self):
+        variable = [v for v in self.variables if v.name == "Oa01_radiance"][0]
+
+        self.assertEqual(400.0, variable.wavelength)
+        self.assertEqual(15.0, variable.bandwidth)
+        self.assertEqual("mW.m-2.sr-1.nm-1", variable.units)
+
+    def test_openProduct_attributes(self):
+        self.assertEqual("OL_1_EFR", self.attributes["product_string"])
+        self.assertEqual(datetime(2018, 4, 5, 10, 0, 0), self.attributes["start_time"])
+        self.assertEqual(datetime(2018, 4, 5, 10, 3, 0), self.attributes["end_time"])
+        self.assertEqual(w, self.attributes["product_columns"])
+        self.assertEqual(h, self.attributes["product_rows"])
+        self.assertEqual("Sentinel-3A", self.attributes["platform"])
+        self.assertEqual("OLCI", self.attributes["instrument"])
+        self.assertEqual(300.0, self.attributes["spatial_sampling_al"])
+        self.assertEqual(149597870700, self.attributes["earth_sun_distance"])
+        self.assertEqual(1.5, self.attributes["invalid_pixels_percentage"])
+        self.assertEqual(40.0, self.attributes["land_pixels_percentage"])
+
+    def test_getData_radiance(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance")
+
+        self.assertTrue(allclose(radiance_array, data.values))
+        self.assertEqual("mW.m-2.sr-1.nm-1", data.attrs["units"])
+
+    def test_getData_radiance_window(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance",
+                                    window=(2, 3, 4, 5))
+
+        self.assertTrue(allclose(radiance_array[3:8, 2:6], data.values))
+
+    def test_getData_radiance_lazy(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance", lazy=True,
+                                    chunks=(4, 4))
+
+        self.assertEqual(((4, 4, 2), (4, 4, 1)), data.data.chunks)
+        self.assertTrue(allclose(radiance_array, data.values))
+
+    def test_openProduct_raw_variable(self):
+        variable = [v for v in self.variables if v.name == "Oa01_radiance"][0]
+
+        self.assertEqual("uint16", variable.raw_dtype)
+        self.assertAlmostEqual(0.1, variable.raw_scale_factor)
+
+    def test_getData_radiance_raw(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance",
+                                    window=(2, 3, 4, 5), scaling="raw")
+
+        self.assertEqual(uint16, data.dtype)
+        self.assertTrue((radiance_raw_array[3:8, 2:6] == data.values).all())
+        self.assertAlmostEqual(0.1, data.attrs["scale_factor"])
+        self.assertTrue(allclose(radiance_array[3:8, 2:6], decode_scaling(data).values))
+
+    def test_read_node_raw(self):
+        node = self.products[0]["product"]["nodes"]["Oa01_radiance"]
+
+        raw_values = self.factory.read_node(node, slice(3, 8), slice(2, 6), scale=False)
+        values = self.factory.read_node(node, slice(3, 8), slice(2, 6))
+
+        # Raw values read as stored, and scaling of shared cached file restored after
+        self.assertEqual(uint16, raw_values.dtype)
+        self.assertTrue((radiance_raw_array[3:8, 2:6] == raw_values).all())
+        self.assertTrue(allclose(radiance_array[3:8, 2:6], values))
+
+    def test_getData_radiance_raw_lazy(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance", lazy=True,
+                                    chunks=(4, 4), scaling="raw")
+
+        self.assertEqual(uint16, data.dtype)
+        self.assertTrue((radiance_raw_array == data.values).all())
+
+    def test_getData_radiance_raw_data_mask(self):
+        self.factory.data_mask = zeros((h, w), bool)
+        self.factory.data_mask[0, :] = True
+
+        data = self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance", scaling="raw")
+
+        # Masked pixels set to fill value, so invalid when scaled
+        self.assertTrue((data.values[0, :] == data.attrs["_FillValue"]).all())
+        self.assertTrue(isnan(decode_scaling(data).values[0, :]).all())
+
+    def test_getData_tie_point_grid(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "SZA")
+
+        # tie point grid linear, so interpolated values exactly linear
+        expected_sza = arange(h)[:, None] * 2.0 + arange(w)[None, :] * 8.0 / ac
+        self.assertTrue(allclose(expected_sza, data.values))
+
+    def test_getData_tie_point_grid_window(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "SZA", window=(5, 2, 3, 4))
+
+        expected_sza = arange(h)[:, None] * 2.0 + arange(w)[None, :] * 8.0 / ac
+        self.assertTrue(allclose(expected_sza[2:6, 5:8], data.values))
+
+    def test_getData_tie_point_grid_native(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "SZA", window=(5, 2, 3, 4),
+                                    tie_point_resolution="native")
+
+        # Only tie points surrounding window returned
+        self.assertTrue(allclose(tie_sza_array[2:7, 1:3], data.values))
+        self.assertEqual((1, 2, 2, 5), data.attrs["tie_point_window"])
+        self.assertEqual(ac, data.attrs["sub_sampling_x"])
+
+    def test_getData_tie_point_grid_native_dataset(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance", "SZA",
+                                    tie_point_resolution="native")
+
+        self.assertEqual(("x_tie", "y_tie"), data["SZA"].dims)
+        self.assertTrue(allclose(tie_sza_array, data["SZA"].values))
+        self.assertEqual((h, w), data["Oa01_radiance"].shape)
+
+    def test_getData_meteorological_layer(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "horizontal_wind_vector_2")
+
+        self.assertTrue(allclose(2.0, data.values))
+
+    def test_getData_mask(self):
+        land = self.factory.getData(self.products, self.variables, self.attributes, "quality_flags_land")
+        coastline = self.factory.getData(self.products, self.variables, self.attributes, "quality_flags_coastline")
+
+        self.assertTrue(((quality_flags_array & 1) != 0).tolist() == (land.values != 0).tolist())
+        self.assertTrue(((quality_flags_array & 2) != 0).tolist() == (coastline.values != 0).tolist())
+
+    def test_getData_flag_variable(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "quality_flags")
+
+        self.assertEqual(uint32, data.dtype)
+        self.assertTrue((quality_flags_array == data.values).all())
+        self.assertEqual([1, 2], list(data.attrs["flag_masks"]))
+        self.assertEqual("land coastline", data.attrs["flag_meanings"])
+
+    def test_getData_flag_variable_lazy(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "quality_flags", lazy=True,
+                                    chunks=(4, 4))
+
+        self.assertEqual(uint32, data.dtype)
+        self.assertTrue((quality_flags_array == data.values).all())
+
+    def test_getData_masks_bool(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "quality_flags_land",
+                                    "quality_flags_coastline", mask_format="bool")
+
+        self.assertEqual(bool, data["quality_flags_land"].dtype)
+        self.assertTrue((((quality_flags_array & 1) != 0) == data["quality_flags_land"].values).all())
+        self.assertTrue((((quality_flags_array & 2) != 0) == data["quality_flags_coastline"].values).all())
+
+    def test_getData_masks_packed(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "quality_flags_coastline",
+                                    mask_format="packed")
+
+        self.assertEqual([[224, 0]]*h, data.values.tolist())
+
+    def test_getData_masks_one_read(self):
+        reads = []
+        read_node = self.factory.read_node
+        self.factory.read_node = lambda *args: reads.append(args) or read_node(*args)
+
+        self.factory.getData(self.products, self.variables, self.attributes, "quality_flags_land",
+                             "quality_flags_coastline")
+
+        self.assertEqual(1, len(reads))
+
+    def test_getData_masks_lazy(self):
+        self.factory.data_mask = zeros((h, w), bool)
+        self.factory.data_mask[0, 0] = True
+
+        data = self.factory.getData(self.products, self.variables, self.attributes, "quality_flags_land",
+                                    "quality_flags_coastline", lazy=True, chunks=(4, 4))
+
+        self.assertTrue(isnan(data["quality_flags_land"].values[0, 0]))
+        self.assertTrue(allclose(((quality_flags_array & 2) != 0)[1:] * 255,
+                                 data["quality_flags_coastline"].values[1:]))
+
+    def test_getData_solar_flux(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "solar_flux_band_2")
+
+        self.assertTrue(allclose(solar_flux_array[1][detector_index_array], data.values))
+
+    def test_getData_data_mask(self):
+        self.factory.data_mask = zeros((h, w), bool)
+        self.factory.data_mask[0, 0] = True
+
+        data = self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance")
+
+        self.assertTrue(isnan(data.values[0, 0]))
+        self.assertTrue(allclose(radiance_array[1:, :], data.values[1:, :]))
+
+    def test_getData_dataset(self):
+        data = self.factory.getData(self.products, self.variables, self.attributes, "Oa01_radiance", "SZA",
+                                    "time_stamp")
+
+        self.assertItemsEqual(["Oa01_radiance", "SZA"], data.data_vars.keys())
+        self.assertEqual(h, len(data.coords["time_stamp"]))
+        self.assertNotIn("units", data.coords["time_stamp"].attrs)
+
+    def test_save_to_netcdf(self):
+        product = Product(glob(pjoin(self.directory, "*.SEN3", "xfdumanifest.xml"))[0], engine="netcdf")
+        path = pjoin(self.directory, "product.nc")
+
+        product.save_to_netcdf(path)
+
+        data = product.getData("Oa01_radiance", "time_stamp")
+        saved_data = xr.open_dataset(path)
+        try:
+            self.assertTrue(allclose(data["Oa01_radiance"].values[1:, :], saved_data["Oa01_radiance"].values[1:, :]))
+            self.assertEqual(data.coords["time_stamp"].values.tolist(), saved_data.coords["time_stamp"].values.tolist())
+            self.assertEqual("OL_1_EFR", saved_data.attrs["product_string"])
+        finally:
+            saved_data.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+"""
+Per pixel geolocation of snappy products, and process-wide cache of their geolocation indices
+"""
+
+'''___Built-In Modules___'''
+import sys
+from os.path import dirname, abspath
+from os.path import join as pjoin
+from collections import OrderedDict
+from threading import Lock
+
+'''___Third-Party Modules___'''
+import snappy
+from numpy import zeros, float32, float64, bool_, nan, linspace, arange, interp, apply_along_axis, unwrap, deg2rad, \
+    rad2deg, round as np_round
+
+'''___NPL Modules___'''
+sys.path.append(pjoin(dirname(dirname(dirname(dirname(abspath(__file__))))), "utils"))
+from GeolocationIndex import GeolocationIndex, wrap_longitude
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+GEOLOCATION_INDEX_CACHE_SIZE = 2                                 # Geolocation indices held full scene lat/lon arrays
+GEOLOCATION_NAMES = [("latitude", "longitude"), ("lat", "lon")]  # Possible names of per pixel geolocation variables
+GEOCODING_SAMPLES = 101                                          # Geocoding samples per axis, if no lat/lon variables
+
+geolocation_indices = OrderedDict()
+geolocation_indices_lock = Lock()
+
+
+def returnGeolocationIndex(product, geocoding=False, geolocation=None):
+    """
+    Return geolocation index of product, built from product per pixel latitude and longitude on first use. Indices
+    are cached process-wide for the most recently used products.
+
+    :type product: *snappy.Product*
+    :param product: data product
+
+    :type geocoding: bool
+    :param geocoding: (default False) if True, index products without per pixel latitude and longitude from their
+    geocoding
+
+    :type geolocation: tuple
+    :param geolocation: (optional) product latitude and longitude, as returned by *readGeolocation*, if already read
+
+    :return:
+        :index: *GeolocationIndex*
+
+        Geolocation index of product, None if product geolocation unavailable
+    """
+
+    # Cache entries hold product, so id not reused while cached
+    key = (id(product), geocoding)
+
+    with geolocation_indices_lock:
+        if (key in geolocation_indices) and (geolocation_indices[key][0] is product):
+            geolocation_indices[key] = geolocation_indices.pop(key)
+            return geolocation_indices[key][1]
+
+    if geolocation is None:
+        geolocation = readGeolocation(product, geocoding=geocoding)
+    index = None if geolocation is None else GeolocationIndex(*geolocation)
+
+    with geolocation_indices_lock:
+        geolocation_indices.pop(key, None)
+        geolocation_indices[key] = (product, index)
+        while len(geolocation_indices) > GEOLOCATION_INDEX_CACHE_SIZE:
+            geolocation_indices.popitem(last=False)
+
+    return index
+
+
+def readGeolocation(product, geocoding=True):
+    """
+    Return full scene per pixel latitude and longitude of product, from its geolocation bands or tie point grids, or
+    otherwise interpolated from its geocoding evaluated on a coarse grid of pixels
+
+    :type product: *snappy.Product*
+    :param product: data product
+
+    :type geocoding: bool
+    :param geocoding: (default True) if True, use product geocoding if product has no per pixel latitude and
+    longitude
+
+    :return:
+        :latitude: *numpy.ndarray*
+
+        Pixel latitudes, dimensions *(rows, columns)*, invalid pixels nan
+
+        :longitude: *numpy.ndarray*
+
+        Pixel longitudes, dimensions *(rows, columns)*, invalid pixels nan
+
+        None returned if product geolocation unavailable
+    """
+
+    node_names = set(product.getBandNames()) | set(product.getTiePointGridNames())
+    for lat_name, lon_name in GEOLOCATION_NAMES:
+        if (lat_name in node_names) and (lon_name in node_names):
+            return readGeolocationVariable(product, lat_name), readGeolocationVariable(product, lon_name)
+
+    if geocoding:
+        return readGeocodingGeolocation(product)
+
+    return None
+
+
+def readGeolocationVariable(product, name):
+    """
+    Return full scene values of product geolocation band or tie point grid, with invalid pixels nan
+
+    :type product: *snappy.Product*
+    :param product: data product
+
+    :type name: str
+    :param name: band or tie point grid name
+
+    :return:
+        :values: *numpy.ndarray*
+
+        Geolocation values, dimensions *(rows, columns)*
+    """
+
+    w = product.getSceneRasterWidth()
+    h = product.getSceneRasterHeight()
+    values = zeros(w * h, float32)
+
+    band = product.getBand(name)
+    if band is not None:
+        band.readPixels(0, 0, w, h, values)
+        valid_mask = zeros(w * h, bool_)
+        band.readValidMask(0, 0, w, h, valid_mask)
+        values[~valid_mask] = nan
+    else:
+        product.getTiePointGrid(name).readPixels(0, 0, w, h, values)
+
+    values.shape = h, w
+
+    return values
+
+
+def readGeocodingGeolocation(product):
+    """
+    Return full scene per pixel latitude and longitude of product, evaluating the product geocoding on a coarse grid of
+    pixels and interpolating bilinearly between them
+
+    :type product: *snappy.Product*
+    :param product: data product
+
+    :return:
+        :latitude: *numpy.ndarray*
+
+        Pixel latitudes, dimensions *(rows, columns)*
+
+        :longitude: *numpy.ndarray*
+
+        Pixel longitudes, dimensions *(rows, columns)*
+
+        None returned if product has no geocoding
+    """
+
+    geo_code = product.getSceneGeoCoding()
+    if geo_code is None:
+        return None
+
+    w = product.getSceneRasterWidth()
+    h = product.getSceneRasterHeight()
+
+    # 1. Evaluate geocoding at pixel centres of coarse grid
+    xs = np_round(linspace(0, w - 1, min(w, GEOCODING_SAMPLES)))
+    ys = np_round(linspace(0, h - 1, min(h, GEOCODING_SAMPLES)))
+
+    lat_samples = zeros((len(ys), len(xs)), float64)
+    lon_samples = zeros((len(ys), len(xs)), float64)
+    pix_pos = snappy.PixelPos()
+    geo_pos = snappy.GeoPos()
+    for i, y in enumerate(ys):
+        for j, x in enumerate(xs):
+            pix_pos.x = x + 0.5
+            pix_pos.y = y + 0.5
+            geo_code.getGeoPos(pix_pos, geo_pos)
+            lat_samples[i, j] = geo_pos.lat
+            lon_samples[i, j] = geo_pos.lon
+
+    # 2. Interpolate to all pixels, with longitudes unwrapped across the antimeridian
+    lon_samples = rad2deg(unwrap(unwrap(deg2rad(lon_samples), axis=1), axis=0))
+
+    def interpolate(samples):
+        samples = apply_along_axis(lambda s: interp(arange(w), xs, s), 1, samples)
+        return apply_along_axis(lambda s: interp(arange(h), ys, s), 0, samples).astype(float32)
+
+    return interpolate(lat_samples), wrap_longitude(interpolate(lon_samples)).astype(float32)
+
+
+if __name__ == "__main__":
+    pass
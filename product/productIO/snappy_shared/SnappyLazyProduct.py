@@ -0,0 +1,74 @@
+"""
+Unwrapping of lazily processed snappy product wrappers to the *snappy.Product* snap operators require
+"""
+
+'''___Built-In Modules___'''
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Methods of lazy product wrappers returning their processed *snappy.Product*, processing with snap on first call:
+#
+# * getResampledProduct - Sentinel-2 resolution products (*MSIResolutionProduct*)
+# * getSubsetProduct - region of interest subset products (*SnappyRegionProduct*)
+# * getCollocatedProduct - natively collocated products (*SnappyCollocatedProduct*)
+# * getReflectanceProduct - reflectance products (*SnappyReflectanceProduct*)
+LAZY_PRODUCT_METHODS = ["getResampledProduct", "getSubsetProduct", "getCollocatedProduct", "getReflectanceProduct"]
+
+
+def return_lazy_product_method(product):
+    """
+    Return name of method of lazy product wrapper returning its processed *snappy.Product*
+
+    Methods are looked up on the class of the product only, as wrappers delegate other attributes to the product they
+    wrap - e.g. a region subset of a Sentinel-2 resolution product must be subset, not resampled in full.
+
+    :type product: *snappy.Product*
+    :param product: In memory representation of data product, or lazy wrapper of one
+
+    :return:
+        :method: *str*
+
+        Name of method, None if product not a lazy product wrapper
+    """
+
+    for method in LAZY_PRODUCT_METHODS:
+        if getattr(type(product), method, None) is not None:
+            return method
+    return None
+
+
+def return_snap_product(product):
+    """
+    Return *snappy.Product* of product for snap operators, processing any lazy product wrappers with snap
+
+    :type product: *snappy.Product*
+    :param product: In memory representation of data product, or lazy wrapper of one
+
+    :return:
+        :snap_product: *snappy.Product*
+
+        In memory representation of data product, with all processing applied
+    """
+
+    method = return_lazy_product_method(product)
+    while method is not None:
+        product = getattr(product, method)()
+        method = return_lazy_product_method(product)
+
+    return product
+
+
+if __name__ == "__main__":
+    pass
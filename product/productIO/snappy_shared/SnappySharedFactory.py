@@ -4,17 +4,22 @@ Data factory for opening Sentinel-3/OLCI L1b data
 
 '''___Built-In Modules___'''
 import sys
-from os.path import dirname
+from os.path import dirname, abspath
+from os.path import join as pjoin
 from datetime import datetime as dt
 from datetime import timedelta
 from copy import deepcopy
+from threading import Lock
+from collections import OrderedDict
 
 '''___Third-Party Modules___'''
 import snappy
 import xarray as xr
 import jpy
-from numpy import zeros, asarray, uint32, float32, full, bool_, ndarray, array
+from numpy import zeros, asarray, uint32, int32, float32, float64, full, bool_, ndarray, array, nan
 import numpy.ma as ma
+import dask.array as da
+from dask import delayed
 from datetime import datetime
 from astropy.time import Time
 
@@ -24,6 +29,10 @@ sys.path.append(dirname(dirname(__file__)))
 from AbstractDataFactory import AbstractDataFactory
 from Variable import Variable
 from SpectralVariable import SpectralVariable
+from FlagCoding import decode_flag, MASK_TRUE_VALUE
+from Scaling import SCALINGS, return_raw_values, return_fill_value
+sys.path.append(pjoin(dirname(dirname(dirname(dirname(abspath(__file__))))), "utils"))
+from TiePointInterpolator import TiePointInterpolator
 
 '''___Authorship___'''
 __author__ = "Sam Hunt"
@@ -38,6 +47,17 @@ __status__ = "Development"
 # todo - finalise contents of self.attributes
 # todo - getData apply_mask kwarg
 
+# Lock to serialise tile reads from snappy products when lazily read data is computed in parallel
+SNAPPY_LOCK = Lock()
+DEFAULT_CHUNK_SIZE = 1024
+
+# Number of products per data factory to cache band, tie point grid and mask names for
+PRODUCT_NAMES_CACHE_SIZE = 8
+
+# Data types of pixel buffers to read band raw values into from source image rasters, by raw data type
+RAW_PIXEL_BUFFER_DTYPES = {"int8": int32, "uint8": int32, "int16": int32, "uint16": int32, "int32": int32,
+                           "uint32": int32, "float32": float32, "float64": float64}
+
 
 class SnappySharedFactory(AbstractDataFactory):
     """
@@ -108,6 +128,58 @@ class SnappySharedFactory(AbstractDataFactory):
 
             Returns pixel values of variable of in-memory product
 
+        .. py:method:: getLazyPixelValues(...):
+
+            Returns dask array of pixel values of variable of in-memory product, read tile by tile when computed
+
+        .. py:method:: readPixelTile(...):
+
+            Returns pixel values of variable of in-memory product for given window, with masked values set to nan
+
+        .. py:method:: return_chunk_size(...):
+
+            Return chunk size to lazily read product data with
+
+        .. py:method:: return_window(...):
+
+            Return pixel window to read from product, clipped to the product extent
+
+        .. py:method:: getFlagAttributes(...):
+
+            Returns CF flag attributes of variable, if a flag band
+
+        .. py:method:: getFlagMaskIndex(...):
+
+            Returns index of product masks that can be decoded from a flag band
+
+        .. py:method:: returnBandStorage(...):
+
+            Returns storage of raw values of band, if it can be read as raw values
+
+        .. py:method:: readRawPixels(...):
+
+            Returns raw values of band in window, read as stored
+
+        .. py:method:: getScalingAttributes(...):
+
+            Returns CF scaling attributes of variable read as raw values
+
+        .. py:method:: returnTiePointGrid(...):
+
+            Returns tie point grid of product at tie point resolution, with interpolator to the image grid
+
+        .. py:method:: getTiePointAttributes(...):
+
+            Returns attributes locating values of tie point grid, returned at tie point resolution, in the image grid
+
+        .. py:method:: returnProductNames(...):
+
+            Returns names of bands, tie point grids and masks of product, read from product once and cached
+
+        .. py:method:: applyDataMask(...):
+
+            Returns pixel values with data mask applied
+
         :Inherited from eopy.product.productIO.AbstractDataFactory.AbstractDataFactory:
             .. py:method:: readVariables(...):
 
@@ -160,6 +232,8 @@ class SnappySharedFactory(AbstractDataFactory):
                 Returns dictionary of product attributes
     """
 
+    CACHE_ATTRIBUTES = AbstractDataFactory.CACHE_ATTRIBUTES + ["product_names"]
+
     def __init__(self):
         """
         Initialise class
@@ -371,8 +445,11 @@ class SnappySharedFactory(AbstractDataFactory):
         spectral_variable = False
         tiepointgrid = False
 
-        if variable_name in list(product.getBandNames()):
-            if product.getBand(variable_name).getSpectralWavelength() > 0.0:
+        names = self.returnProductNames(product)
+
+        if variable_name in names["band_set"]:
+            band = product.getBand(variable_name)
+            if band.getSpectralWavelength() > 0.0:
                 spectral_variable = True
         else:
             tiepointgrid = True
@@ -381,22 +458,24 @@ class SnappySharedFactory(AbstractDataFactory):
             data_variable_dict = {'name': variable_name,
                                   'dtype': 'float',
                                   'vtype': 'data',
-                                  'units': product.getBand(variable_name).getUnit(),
+                                  'units': band.getUnit(),
                                   'ndims': 2,
-                                  'shape': (int(product.getBand(variable_name).getRasterWidth()),
-                                            int(product.getBand(variable_name).getRasterHeight())),
-                                  'wavelength': product.getBand(variable_name).getSpectralWavelength(),
-                                  'bandwidth': product.getBand(variable_name).getSpectralBandwidth(),
+                                  'shape': (int(band.getRasterWidth()),
+                                            int(band.getRasterHeight())),
+                                  'wavelength': band.getSpectralWavelength(),
+                                  'bandwidth': band.getSpectralBandwidth(),
                                   'srf': None}
+            data_variable_dict.update(self.returnBandStorage(product, variable_name))
             data_variable = SpectralVariable(data_variable_dict)
         elif not tiepointgrid:
             data_variable_dict = {'name': variable_name,
                                   'dtype': 'float',
                                   'vtype': 'data',
-                                  'units': product.getBand(variable_name).getUnit(),
+                                  'units': band.getUnit(),
                                   'ndims': 2,
-                                  'shape': (int(product.getBand(variable_name).getRasterWidth()),
-                                            int(product.getBand(variable_name).getRasterHeight()))}
+                                  'shape': (int(band.getRasterWidth()),
+                                            int(band.getRasterHeight()))}
+            data_variable_dict.update(self.returnBandStorage(product, variable_name))
             data_variable = Variable(data_variable_dict)
         else:
             data_variable_dict = {'name': variable_name,
@@ -423,10 +502,12 @@ class SnappySharedFactory(AbstractDataFactory):
             List of product "data" type variable names
         """
 
-        all_variables_names = list(product.getBandNames()) + list(product.getTiePointGridNames())
+        names = self.returnProductNames(product)
+        all_variables_names = names["bands"] + names["tie_point_grids"]
 
         # Remove info variables
-        data_variable_names = [v for v in all_variables_names if v not in self.getInfoVariableNames(product)]
+        info_variable_names = set(self.getInfoVariableNames(product))
+        data_variable_names = [v for v in all_variables_names if v not in info_variable_names]
 
         return data_variable_names
 
@@ -471,7 +552,7 @@ class SnappySharedFactory(AbstractDataFactory):
             List of product "mask" type variable names
         """
 
-        return list(product.getMaskGroup().getNodeNames())
+        return list(self.returnProductNames(product)["masks"])
 
     def createMeteorologicalVariable(self, product, variable_name):
         """
@@ -493,10 +574,13 @@ class SnappySharedFactory(AbstractDataFactory):
         tiepointgrid = False
         mask = False
 
-        if variable_name in list(product.getBandNames()):
-            if product.getBand(variable_name).getSpectralWavelength() > 0.0:
+        names = self.returnProductNames(product)
+
+        if variable_name in names["band_set"]:
+            band = product.getBand(variable_name)
+            if band.getSpectralWavelength() > 0.0:
                 spectral_variable = True
-        elif variable_name not in list(product.getMaskGroup().getNodeNames()):
+        elif variable_name not in names["mask_set"]:
             tiepointgrid = True
         else:
             mask = True
@@ -505,22 +589,22 @@ class SnappySharedFactory(AbstractDataFactory):
             meteorological_variable_dict = {'name': variable_name,
                                             'dtype': 'float',
                                             'vtype': 'meterological',
-                                            'units': product.getBand(variable_name).getUnit(),
+                                            'units': band.getUnit(),
                                             'ndims': 2,
-                                            'shape': (int(product.getBand(variable_name).getRasterWidth()),
-                                                      int(product.getBand(variable_name).getRasterHeight())),
-                                            'wavelength': product.getBand(variable_name).getSpectralWavelength(),
-                                            'bandwidth': product.getBand(variable_name).getSpectralBandwidth(),
+                                            'shape': (int(band.getRasterWidth()),
+                                                      int(band.getRasterHeight())),
+                                            'wavelength': band.getSpectralWavelength(),
+                                            'bandwidth': band.getSpectralBandwidth(),
                                             'srf': None}
             meteorological_variable = SpectralVariable(meteorological_variable_dict)
         elif not tiepointgrid:
             meteorological_variable_dict = {'name': variable_name,
                                             'dtype': 'float',
                                             'vtype': 'meteorological',
-                                            'units': product.getBand(variable_name).getUnit(),
+                                            'units': band.getUnit(),
                                             'ndims': 2,
-                                            'shape': (int(product.getBand(variable_name).getRasterWidth()),
-                                                      int(product.getBand(variable_name).getRasterHeight()))}
+                                            'shape': (int(band.getRasterWidth()),
+                                                      int(band.getRasterHeight()))}
             meteorological_variable = Variable(meteorological_variable_dict)
         else:
             meteorological_variable_dict = {'name': variable_name,
@@ -617,10 +701,13 @@ class SnappySharedFactory(AbstractDataFactory):
         if variable_name == "time_stamp":
             time_stamp = True
 
-        if variable_name in list(product.getBandNames()):
-            if product.getBand(variable_name).getSpectralWavelength() > 0.0:
+        names = self.returnProductNames(product)
+
+        if variable_name in names["band_set"]:
+            band = product.getBand(variable_name)
+            if band.getSpectralWavelength() > 0.0:
                 spectral_variable = True
-        elif variable_name not in list(product.getMaskGroup().getNodeNames()):
+        elif variable_name not in names["mask_set"]:
             tiepointgrid = True
         else:
             mask = True
@@ -637,22 +724,22 @@ class SnappySharedFactory(AbstractDataFactory):
             info_variable_dict = {'name': variable_name,
                                   'dtype': 'float',
                                   'vtype': 'info',
-                                  'units': product.getBand(variable_name).getUnit(),
+                                  'units': band.getUnit(),
                                   'ndims': 2,
-                                  'shape': (int(product.getBand(variable_name).getRasterWidth()),
-                                            int(product.getBand(variable_name).getRasterHeight())),
-                                  'wavelength': product.getBand(variable_name).getSpectralWavelength(),
-                                  'bandwidth': product.getBand(variable_name).getSpectralBandwidth(),
+                                  'shape': (int(band.getRasterWidth()),
+                                            int(band.getRasterHeight())),
+                                  'wavelength': band.getSpectralWavelength(),
+                                  'bandwidth': band.getSpectralBandwidth(),
                                   'srf': None}
             info_variable = SpectralVariable(info_variable_dict)
         elif not tiepointgrid:
             info_variable_dict = {'name': variable_name,
                                   'dtype': 'float',
                                   'vtype': 'info',
-                                  'units': product.getBand(variable_name).getUnit(),
+                                  'units': band.getUnit(),
                                   'ndims': 2,
-                                  'shape': (int(product.getBand(variable_name).getRasterWidth()),
-                                            int(product.getBand(variable_name).getRasterHeight()))}
+                                  'shape': (int(band.getRasterWidth()),
+                                            int(band.getRasterHeight()))}
             info_variable = Variable(info_variable_dict)
         else:
             info_variable_dict = {'name': variable_name,
@@ -680,7 +767,8 @@ class SnappySharedFactory(AbstractDataFactory):
             List of product "info" type variable names
         """
 
-        all_variables_names = list(product.getBandNames()) + list(product.getTiePointGridNames())
+        names = self.returnProductNames(product)
+        all_variables_names = names["band_set"] | names["tie_point_grid_set"]
 
         info_variable_names = []
         if "longitude" in all_variables_names:
@@ -715,8 +803,8 @@ class SnappySharedFactory(AbstractDataFactory):
             variables from expected_variables list contained in the data product
         """
 
-        available_variables = list(product.getBandNames()) + list(product.getTiePointGridNames()) + \
-                              list(product.getMaskGroup().getNodeNames())
+        names = self.returnProductNames(product)
+        available_variables = names["band_set"] | names["tie_point_grid_set"] | names["mask_set"]
 
         return [v for v in expected_variables if v in available_variables]
 
@@ -736,16 +824,12 @@ class SnappySharedFactory(AbstractDataFactory):
             In-memory representation data product to get data from
         """
 
-        product = None
-        for i, product_dict in enumerate(products):
-            product_variables = product_dict['variables']
-            if all(s in product_variables for s in selected_variables):
-                product = product_dict['product']
+        product_dict = self.returnVariableIndex(None, products).getProduct(selected_variables)
 
-        if product is None:
+        if product_dict is None:
             raise NameError("Cannot open combination of variables")
 
-        return product
+        return product_dict['product']
 
     def determine_getData_mask(self, products, selected_variables):
         """
@@ -763,19 +847,16 @@ class SnappySharedFactory(AbstractDataFactory):
             Mask to apply to data when opened
         """
 
-        mask = None
-
         if type(self.data_mask) == ndarray:
             return self.data_mask
 
-        for i, product_dict in enumerate(products):
-            product_variables = product_dict['variables']
-            if all(s in product_variables for s in selected_variables):
-                mask = self.data_mask[i] if self.data_mask is not None else None
+        i = self.returnVariableIndex(None, products).getProductIndex(selected_variables)
 
-        return mask
+        if (i is None) or (self.data_mask is None):
+            return None
+        return self.data_mask[i]
 
-    def getData(self, products, variables, attributes, variable, *args):
+    def getData(self, products, variables, attributes, variable, *args, **kwargs):
         """
         Returns variable[s] of in-memory product[s] as an xarray data structure.
 
@@ -794,47 +875,143 @@ class SnappySharedFactory(AbstractDataFactory):
         :type args: str
         :param args: Name of additional variables to to return data for
 
+        :type window: tuple/list
+        :param window: (optional) Pixel window to read data from, defined as *(x, y, x_width, y_width)*. If a list of
+        windows is given a list of data structures is returned, one per window. Default is the full product extent.
+
+        :type lazy: bool
+        :param lazy: (optional) If True return dask-backed data structure, where each chunk is read from the product
+        only when computed. Default is False.
+
+        :type chunks: int/tuple
+        :param chunks: (optional) Chunk size, *(y_width, x_width)*, for lazily read data. Default is the preferred tile
+        size of the product.
+
+        :type mask_format: str
+        :param mask_format: (optional) Format of returned mask variables, either *None* (*uint32*, raised flags set to
+        255, default), *"bool"* or *"packed"* (bits packed along x dimension, in-memory data only). Masks of flag bands
+        are decoded from one read of the flag band.
+
+        :type tie_point_resolution: str
+        :param tie_point_resolution: (optional) Resolution of returned tie point grid variables, either *"image"*
+        (bilinearly interpolated to image grid pixels in window, default) or *"native"* (tie points surrounding window,
+        along *x_tie*, *y_tie* dimensions, with ``tie_point_window`` attribute locating them in the tie point grid).
+        Data masks are not applied to tie point resolution values.
+
+        :type scaling: str
+        :param scaling: (optional) Scaling of returned bands stored as scaled values (e.g. OLCI radiances, stored as
+        *uint16*), either *"physical"* (scaled to physical values, *float32*, default) or *"raw"* (values as stored,
+        with CF ``scale_factor``, ``add_offset`` and ``_FillValue`` attributes, invalid pixels set to ``_FillValue``).
+        Raw values may be scaled lazily or on demand with *eopy.product.productIO.Scaling.decode_scaling*. Coordinate
+        variables are always scaled.
+
         :return:
             :data: *xarray.DataArray [xarray.Dataset]*
 
             Specified variable[s] in memory in xarray data structure
         """
 
+        window = kwargs.get("window", None)
+        lazy = kwargs.get("lazy", False)
+        chunks = kwargs.get("chunks", None)
+        mask_format = kwargs.get("mask_format", None)
+        tie_point_resolution = kwargs.get("tie_point_resolution", "image")
+        scaling = kwargs.get("scaling", "physical")
+
+        if scaling not in SCALINGS:
+            raise ValueError("Unknown scaling '%s', must be one of %s" % (scaling, str(SCALINGS)))
+
+        # Multiple windows required so return list of data structures, one per window
+        if (type(window) == list) and (window != []) and (type(window[0]) in [list, tuple]):
+            return [self.getData(products, variables, attributes, variable, *args, **dict(kwargs, window=w))
+                    for w in window]
+
         # Full list of variables to open
         selected_variables = [variable] + list(args)
 
         product = self.determine_getData_product(products, selected_variables)
         mask = self.determine_getData_mask(products, selected_variables)
 
+        # Tie point grid variables returned at tie point resolution
+        native_variables = [v for v in selected_variables if (tie_point_resolution == "native") and
+                            (v in self.returnProductNames(product)["tie_point_grid_set"])]
+        resolution = lambda v: "native" if v in native_variables else "image"
+
+        # Bands returned as raw values
+        raw_variables = [v for v in selected_variables if (scaling == "raw") and
+                         (self.returnBandStorage(product, v) != {})]
+        scaling_of = lambda v: "raw" if v in raw_variables else "physical"
+
+        if lazy:
+            read_pixels = lambda v, m: self.getLazyPixelValues(product, variables, attributes, v, mask=m,
+                                                               window=window, chunks=chunks,
+                                                               tie_point_resolution=resolution(v),
+                                                               scaling=scaling_of(v))
+        else:
+            read_pixels = lambda v, m: self.getPixelValues(product, variables, attributes, v, mask=m, window=window,
+                                                           tie_point_resolution=resolution(v),
+                                                           scaling=scaling_of(v))
+
+        def read_info(v):
+            variable_info = self.simplify_attr(self.getVariableInfo(variables, v))
+            variable_info.update(self.getFlagAttributes(product, v))
+            if v in native_variables:
+                variable_info.update(self.getTiePointAttributes(product, v, window=window))
+            if v in raw_variables:
+                variable_info.update(self.getScalingAttributes(product, v))
+            return variable_info
+
+        # Masks of flag bands are decoded from their flag band, so each flag band is read at most once
+        flag_mask_index = self.getFlagMaskIndex(product)
+        mask_names = self.returnProductNames(product)["mask_set"]
+        flag_values = {}
+
+        def read(v, m):
+            if v in flag_mask_index:
+                flag_band, flag_mask = flag_mask_index[v]
+                if flag_band not in flag_values:
+                    flag_values[flag_band] = read_pixels(flag_band, None)
+                pixel_values = decode_flag(flag_values[flag_band], flag_mask, mask_format)
+            elif (mask_format is not None) and (v in mask_names):
+                pixel_values = decode_flag(read_pixels(v, None), MASK_TRUE_VALUE, mask_format)
+            else:
+                return read_pixels(v, m)
+            return self.applyDataMask(product, pixel_values, m, window=window)
+
         # Case A: Only one variable required so form an xarray.DataArray
         if len(selected_variables) == 1:
 
             # i. Read variable pixel values
-            pixel_values = self.getPixelValues(product, variables, attributes, variable, mask=mask)
-
-            # ii. convert variables attributes to netcdf friendly format
-            variable_info = self.simplify_attr(self.getVariableInfo(variables, variable))
+            pixel_values = read(variable, mask)
 
-            # ii. Form xarray.DataArray
-            data = xr.DataArray(pixel_values, name=variable, attrs=variable_info)
+            # ii. Form xarray.DataArray, with variables attributes converted to netcdf friendly format
+            data = xr.DataArray(pixel_values, name=variable, attrs=read_info(variable))
 
         # Case B: Multiple variables required so form an xarray.Dataset
         else:
             # i. Set coords
-            coords, remaining_variables = self.define_coords(product, variables, attributes, selected_variables)
+            coords, remaining_variables = self.define_coords(product, variables, attributes, selected_variables,
+                                                             window=window, lazy=lazy, chunks=chunks)
 
             # ii. Build variable data dictionary
             data_vars = {}
             for v in remaining_variables:
-                data_vars[v] = (['x', 'y'], self.getPixelValues(product, variables, attributes, v, mask=mask),
-                                self.simplify_attr(self.getVariableInfo(variables, v)))
+                pixel_values = read(v, mask)
+                if v in native_variables:
+                    dims = ['x_tie', 'y_tie']
+                elif (mask_format == "packed") and (v in mask_names):
+                    dims = ['x', 'y_packed']
+                else:
+                    dims = ['x', 'y']
+                data_vars[v] = (dims, pixel_values, read_info(v))
 
             # iii. Form xarray.Dataset
             data = xr.Dataset(data_vars=data_vars, coords=coords, attrs=self.simplify_attr(attributes))
 
         return data
 
-    def define_coords(self, product, variables, attributes, selected_variables):
+    def define_coords(self, product, variables, attributes, selected_variables, window=None, lazy=False,
+                      chunks=None):
         """
         Build `xarray.Dataset` coord dictionary from based on list of selected variables
 
@@ -850,6 +1027,15 @@ class SnappySharedFactory(AbstractDataFactory):
         :type selected_variables: list
         :param selected_variables: List of requested variables
 
+        :type window: tuple
+        :param window: (optional) Pixel window to read coordinates for, defined as *(x, y, x_width, y_width)*
+
+        :type lazy: bool
+        :param lazy: (optional) If True coordinates returned as dask arrays, read chunk by chunk when computed
+
+        :type chunks: int/tuple
+        :param chunks: (optional) Chunk size for lazily read coordinates
+
         :return:
             :coords: *dict*
 
@@ -872,8 +1058,12 @@ class SnappySharedFactory(AbstractDataFactory):
         for common_name in var_coords.keys():
             for poss_name in var_coords[common_name]["poss_names"]:
                 if poss_name in selected_variables:
-                    coords[common_name] = (var_coords[common_name]["shape"],
-                                           self.getPixelValues(product, variables, attributes, poss_name),
+                    if lazy:
+                        pixel_values = self.getLazyPixelValues(product, variables, attributes, poss_name,
+                                                               window=window, chunks=chunks)
+                    else:
+                        pixel_values = self.getPixelValues(product, variables, attributes, poss_name, window=window)
+                    coords[common_name] = (var_coords[common_name]["shape"], pixel_values,
                                            self.simplify_attr(self.getVariableInfo(variables, poss_name)))
                     remaining_variables.remove(poss_name)
 
@@ -882,7 +1072,55 @@ class SnappySharedFactory(AbstractDataFactory):
             return None, remaining_variables
         return coords, remaining_variables
 
-    def getPixelValues(self, product, variables, attributes, variable, mask=None):
+    def return_window(self, product, window=None):
+        """
+        Return pixel window to read from product, clipped to the product extent
+
+        :type product: *snappy.Product*
+        :param product: In memory representation of data product.
+
+        :type window: tuple
+        :param window: Pixel window defined as *(x, y, x_width, y_width)*, if None full product extent returned
+
+        :return:
+            :x: *int*
+
+            Pixel location of the upper left corner of the window in the x dimension
+
+            :y: *int*
+
+            Pixel location of the upper left corner of the window in the y dimension
+
+            :x_width: *int*
+
+            Pixel width of the window in the x dimension
+
+            :y_width: *int*
+
+            Pixel width of the window in the y dimension
+        """
+
+        w = product.getSceneRasterWidth()
+        h = product.getSceneRasterHeight()
+
+        if window is None:
+            return 0, 0, w, h
+
+        x, y, x_width, y_width = [int(v) for v in window]
+
+        # Clip window to product extent
+        x_start = max(x, 0)
+        y_start = max(y, 0)
+        x_end = min(x + x_width, w)
+        y_end = min(y + y_width, h)
+
+        if (x_end <= x_start) or (y_end <= y_start):
+            raise ValueError("Window %s outside of product extent (%s, %s)" % (str(window), w, h))
+
+        return x_start, y_start, x_end - x_start, y_end - y_start
+
+    def getPixelValues(self, product, variables, attributes, variable, mask=None, window=None,
+                       tie_point_resolution="image", scaling="physical"):
         """
         Returns pixel values of variable of in-memory products
 
@@ -898,6 +1136,22 @@ class SnappySharedFactory(AbstractDataFactory):
         :type variable: str
         :param variable: Name of variable to return data for.
 
+        :type mask: numpy.ndarray
+        :param mask: (optional) Mask to apply to full product extent data
+
+        :type window: tuple
+        :param window: (optional) Pixel window to read, defined as *(x, y, x_width, y_width)*. Only pixels within the
+        window are read from the product.
+
+        :type tie_point_resolution: str
+        :param tie_point_resolution: (optional) Resolution of returned tie point grid values, either *"image"*
+        (bilinearly interpolated to image grid pixels in window, default) or *"native"* (tie points surrounding window,
+        unmasked)
+
+        :type scaling: str
+        :param scaling: (optional) Scaling of returned values of bands stored as scaled values, either *"physical"*
+        (default) or *"raw"* (values as stored, with invalid and masked pixels set to fill value)
+
         :return:
             :pixel_values: *numpy.ndarray*
 
@@ -912,42 +1166,86 @@ class SnappySharedFactory(AbstractDataFactory):
 
         # * special case for time_stamp as values in metadata
         if variable == "time_stamp":
-            return self.getTimeStampValues(product, variables, attributes, variable)
+            return self.getTimeStampValues(product, variables, attributes, variable, window=window)
 
         # 2. Open data
 
-        # a. Initialise data array
-        w = product.getSceneRasterWidth()
-        h = product.getSceneRasterHeight()
+        # a. Initialise data array for window to read
+        x, y, w, h = self.return_window(product, window)
         pixel_values = zeros(w * h, float32)
 
+        # Crop mask to window
+        if mask is not None:
+            mask = mask[y:y+h, x:x+w]
+
         # b. Get data object, depending on variable type
-        band_names = product.getBandNames()
-        tie_point_grid_names = product.getTiePointGridNames()
-        mask_names = product.getMaskGroup().getNodeNames()
+        names = self.returnProductNames(product)
+        band_names = names["band_set"]
         if variable in band_names:
             obj = product.getBand(variable)
             valid_mask = zeros(h * w, bool_)
-            product.getBand(variable).readValidMask(0, 0, w, h, valid_mask)
+            product.getBand(variable).readValidMask(x, y, w, h, valid_mask)
             valid_mask.shape = h, w
 
-        elif variable in tie_point_grid_names:
-            obj = product.getTiePointGrid(variable)
-        elif variable in mask_names:
-            mask = product.getMaskGroup().get(variable)
-            obj = jpy.cast(mask, snappy.Mask)
+            # Raw values read as stored, without reading physical values, with invalid and masked pixels set to fill
+            # value
+            storage = self.returnBandStorage(product, variable) if scaling == "raw" else {}
+            raw_values = self.readRawPixels(obj, storage["raw_dtype"], (x, y, w, h)) if storage != {} else None
+            if raw_values is not None:
+                invalid = (mask ^ valid_mask) if mask is not None else ~valid_mask
+                raw_values[invalid] = return_fill_value(storage["raw_dtype"], storage.get("raw_fill_value", None))
+                return raw_values
+
+            # Flag band values read as integers, so all flag bits preserved
+            if obj.isFlagBand():
+                pixel_values = zeros(w * h, int32)
+
+        elif variable in names["tie_point_grid_set"]:
+            # Tie point grids interpolated from their tie points with cached weights, rather than by snap on each read
+            tie_point_grid = self.returnTiePointGrid(product, variable, window=(x, y, w, h))
+            if tie_point_grid is None:
+                if tie_point_resolution == "native":
+                    raise ValueError("Tie point grid %s not available at tie point resolution" % variable)
+                obj = product.getTiePointGrid(variable)
+
+            else:
+                tie_values, interpolator, grid_window, discontinuity = tie_point_grid
+                if tie_point_resolution == "native":
+                    tie_x, tie_y, tie_w, tie_h = interpolator.returnTieWindow(grid_window)
+                    return tie_values[tie_y:tie_y+tie_h, tie_x:tie_x+tie_w].astype(float32)
+
+                obj = None
+                pixel_values[:] = interpolator.interpolate(tie_values, grid_window, discontinuity).ravel()
+        elif variable in names["mask_set"]:
+            mask_obj = product.getMaskGroup().get(variable)
+            # Masks of region of interest subset and natively collocated products are returned ready to read
+            if hasattr(mask_obj, "region_product") or hasattr(mask_obj, "collocated_product"):
+                obj = mask_obj
+            else:
+                obj = jpy.cast(mask_obj, snappy.Mask)
             pixel_values = zeros(w * h, uint32)
 
         # c. Populate pixel data array with data from data object
-        obj.readPixels(0, 0, w, h, pixel_values)
+        if obj is not None:
+            obj.readPixels(x, y, w, h, pixel_values)
         pixel_values.shape = h, w
+        if pixel_values.dtype == int32:
+            pixel_values = pixel_values.view(uint32)
 
         # d. apply valid data mask to band data
         if variable in band_names:
             if mask is not None:
-                pixel_values = ma.masked_array(pixel_values, mask=mask-valid_mask)
+                pixel_values = ma.masked_array(pixel_values, mask=mask ^ valid_mask)
             else:
-                pixel_values = ma.masked_array(pixel_values, mask=-valid_mask)
+                pixel_values = ma.masked_array(pixel_values, mask=~valid_mask)
+
+            # Raw values of bands of proxy products (e.g. region of interest subsets) recovered from geophysical
+            # values read, exactly for integer raw values
+            if storage != {}:
+                pixel_values = return_raw_values(pixel_values, storage["raw_dtype"],
+                                                 storage.get("raw_scale_factor", None),
+                                                 storage.get("raw_add_offset", None),
+                                                 storage.get("raw_fill_value", None))
             return pixel_values
 
         if mask is not None:
@@ -955,7 +1253,481 @@ class SnappySharedFactory(AbstractDataFactory):
 
         return pixel_values
 
-    def getTimeStampValues(self, product, variables, attributes, variable):
+    def getLazyPixelValues(self, product, variables, attributes, variable, mask=None, window=None, chunks=None,
+                           tie_point_resolution="image", scaling="physical"):
+        """
+        Returns dask array of pixel values of variable of in-memory products, each chunk of which is read from the
+        product with a windowed read only when computed
+
+        :type product: *snappy.Product*
+        :param product: In memory representation of data product.
+
+        :type variables: list
+        :param variables: list of product variables as ``Variable`` or ``SpectralVariable`` class objects.
+
+        :type attributes: dict
+        :param attributes: Dictionary of product attributes
+
+        :type variable: str
+        :param variable: Name of variable to return data for.
+
+        :type mask: numpy.ndarray
+        :param mask: (optional) Mask to apply to full product extent data
+
+        :type window: tuple
+        :param window: (optional) Pixel window to read, defined as *(x, y, x_width, y_width)*
+
+        :type chunks: int/tuple
+        :param chunks: (optional) Chunk size, *(y_width, x_width)*. Default is the preferred tile size of the product.
+
+        :type tie_point_resolution: str
+        :param tie_point_resolution: (optional) Resolution of returned tie point grid values, either *"image"*
+        (default) or *"native"*
+
+        :type scaling: str
+        :param scaling: (optional) Scaling of returned values of bands stored as scaled values, either *"physical"*
+        (default) or *"raw"*
+
+        :return:
+            :pixel_values: *dask.array.Array*
+
+            specified variable pixels values, masked values set to nan (or fill value for raw values)
+        """
+
+        # * special case for time_stamp as values in metadata, so small enough to evaluate immediately
+        if variable == "time_stamp":
+            return self.getTimeStampValues(product, variables, attributes, variable, window=window)
+
+        # * tie point resolution values are small enough to read immediately
+        if (tie_point_resolution == "native") and (variable in self.returnProductNames(product)["tie_point_grid_set"]):
+            return self.getPixelValues(product, variables, attributes, variable, window=window,
+                                       tie_point_resolution=tie_point_resolution)
+
+        # 1. Determine chunk layout over window
+        x, y, w, h = self.return_window(product, window)
+        chunk_h, chunk_w = self.return_chunk_size(product, chunks)
+
+        # 2. Determine dtype of returned chunks - masked pixels are set to nan, so promoted to float if masked
+        names = self.returnProductNames(product)
+        if ((variable in names["band_set"]) and (variable not in names["flag_band_set"])) or \
+                (variable in names["tie_point_grid_set"]):
+            dtype = float32
+        else:
+            dtype = uint32 if mask is None else float64
+
+        # Raw values returned as stored, masked values set to fill value
+        storage = self.returnBandStorage(product, variable) if scaling == "raw" else {}
+        if storage != {}:
+            dtype = storage["raw_dtype"]
+
+        # 3. Build dask array from delayed tile reads
+        rows = []
+        for y_tile in range(y, y+h, chunk_h):
+            row = []
+            for x_tile in range(x, x+w, chunk_w):
+                tile_window = (x_tile, y_tile, min(chunk_w, x+w-x_tile), min(chunk_h, y+h-y_tile))
+                tile = delayed(self.readPixelTile, pure=False)(product, variables, attributes, variable, mask,
+                                                               tile_window, dtype, scaling=scaling)
+                row.append(da.from_delayed(tile, shape=(tile_window[3], tile_window[2]), dtype=dtype))
+            rows.append(row)
+
+        return da.block(rows)
+
+    def readPixelTile(self, product, variables, attributes, variable, mask, window, dtype, scaling="physical"):
+        """
+        Returns pixel values of variable of in-memory product for given window, with masked values set to nan
+
+        :type product: *snappy.Product*
+        :param product: In memory representation of data product.
+
+        :type variables: list
+        :param variables: list of product variables as ``Variable`` or ``SpectralVariable`` class objects.
+
+        :type attributes: dict
+        :param attributes: Dictionary of product attributes
+
+        :type variable: str
+        :param variable: Name of variable to return data for.
+
+        :type mask: numpy.ndarray
+        :param mask: Mask to apply to full product extent data
+
+        :type window: tuple
+        :param window: Pixel window to read, defined as *(x, y, x_width, y_width)*
+
+        :type dtype: type
+        :param dtype: data type of returned array
+
+        :type scaling: str
+        :param scaling: (optional) Scaling of returned values, either *"physical"* (default) or *"raw"*
+
+        :return:
+            :pixel_values: *numpy.ndarray*
+
+            specified variable pixels values for window
+        """
+
+        with SNAPPY_LOCK:
+            pixel_values = self.getPixelValues(product, variables, attributes, variable, mask=mask, window=window,
+                                               scaling=scaling)
+
+        # Masked pixels of integer flag data can't be nan, so set to 0 (no flags raised)
+        if isinstance(pixel_values, ma.MaskedArray):
+            return pixel_values.astype(dtype).filled(nan if dtype in [float32, float64] else 0)
+        return pixel_values.astype(dtype)
+
+    def return_chunk_size(self, product, chunks=None):
+        """
+        Return chunk size to lazily read product data with
+
+        :type product: *snappy.Product*
+        :param product: In memory representation of data product.
+
+        :type chunks: int/tuple
+        :param chunks: (optional) Chunk size, either int for square chunks or *(y_width, x_width)*. Default is the
+        preferred tile size of the product.
+
+        :return:
+            :chunk_h: *int*
+
+            Chunk size in the y dimension
+
+            :chunk_w: *int*
+
+            Chunk size in the x dimension
+        """
+
+        if chunks is None:
+            tile_size = product.getPreferredTileSize()
+            if tile_size is None:
+                return DEFAULT_CHUNK_SIZE, DEFAULT_CHUNK_SIZE
+            return int(tile_size.getHeight()), int(tile_size.getWidth())
+
+        if type(chunks) == int:
+            return chunks, chunks
+
+        return int(chunks[0]), int(chunks[1])
+
+    def getFlagAttributes(self, product, variable):
+        """
+        Returns CF flag attributes of variable, if a flag band, to describe the flag coding of its values (see
+        *eopy.product.productIO.FlagCoding.FlagCoding*)
+
+        :type product: *snappy.Product*
+        :param product: In memory representation of data product.
+
+        :type variable: str
+        :param variable: Name of variable
+
+        :return:
+            :flag_attributes: *dict*
+
+            ``flag_masks`` and ``flag_meanings`` attributes of flag band, empty if variable not a flag band
+        """
+
+        if variable not in self.returnProductNames(product)["flag_band_set"]:
+            return {}
+
+        flag_coding = product.getBand(variable).getFlagCoding()
+        flag_names = list(flag_coding.getFlagNames())
+
+        # Java ints are signed, so bit 31 flag masks returned negative
+        return {"flag_masks": array([int(flag_coding.getFlagMask(name)) & 0xFFFFFFFF for name in flag_names], uint32),
+                "flag_meanings": " ".join(flag_names)}
+
+    def getFlagMaskIndex(self, product):
+        """
+        Returns index of product masks that can be decoded from a flag band, i.e. masks named
+        *<flag band>_<flag name>* of single bit flags
+
+        :type product: *snappy.Product*
+        :param product: In memory representation of data product.
+
+        :return:
+            :flag_mask_index: *dict*
+
+            *(flag band name, flag bit mask)* per mask name
+        """
+
+        names = self.returnProductNames(product)
+        if "flag_mask_index" in names:
+            return names["flag_mask_index"]
+
+        mask_names = names["mask_set"]
+
+        flag_mask_index = {}
+        for band_name in names["flag_bands"]:
+            flag_coding = product.getBand(band_name).getFlagCoding()
+            for flag_name in flag_coding.getFlagNames():
+                mask_name = band_name + "_" + flag_name
+                flag_mask = int(flag_coding.getFlagMask(flag_name)) & 0xFFFFFFFF
+
+                # Multi-bit flags defined by a flag value, so read with snappy
+                if (mask_name in mask_names) and (flag_mask != 0) and (flag_mask & (flag_mask - 1) == 0):
+                    flag_mask_index[mask_name] = (band_name, flag_mask)
+
+        names["flag_mask_index"] = flag_mask_index
+        return flag_mask_index
+
+    def returnBandStorage(self, product, variable):
+        """
+        Returns storage of raw values of band, if it can be read as raw values - i.e. non-flag bands of raw values
+        stored in the product, linearly scaled if scaled
+
+        :type product: *snappy.Product*
+        :param product: In memory representation of data product.
+
+        :type variable: str
+        :param variable: Name of variable
+
+        :return:
+            :storage: *dict*
+
+            ``raw_dtype``, and if defined ``raw_scale_factor``, ``raw_add_offset`` and ``raw_fill_value`` (no-data
+            value), of band raw values, empty if variable can not be read as raw values
+        """
+
+        names = self.returnProductNames(product)
+        if (variable not in names["band_set"]) or (variable in names["flag_band_set"]):
+            return {}
+
+        # Reflectance bands computed in memory and resampled collocated bands have no raw values
+        band = product.getBand(variable)
+        if hasattr(band, "reflectance_product") or hasattr(band, "collocated_product") or band.isLog10Scaled():
+            return {}
+
+        storage = {"raw_dtype": str(snappy.ProductData.getTypeString(band.getDataType()))}
+        if band.isScalingApplied():
+            storage["raw_scale_factor"] = float(band.getScalingFactor())
+            storage["raw_add_offset"] = float(band.getScalingOffset())
+        if band.isNoDataValueUsed():
+            storage["raw_fill_value"] = band.getNoDataValue()
+
+        return storage
+
+    def readRawPixels(self, band, raw_dtype, window):
+        """
+        Returns raw values of band in window, read as stored from the band source image, without scaling to physical
+        values
+
+        :type band: *snappy.Band*
+        :param band: Band
+
+        :type raw_dtype: str
+        :param raw_dtype: Data type of band raw values (see *returnBandStorage*)
+
+        :type window: tuple
+        :param window: Pixel window to read, defined as *(x, y, x_width, y_width)*
+
+        :return:
+            :raw_values: *numpy.ndarray*
+
+            Raw values of band in window. None if band can not be read as stored - i.e. bands of proxy products (e.g.
+            region of interest subsets), read as physical values only, or of raw data types not readable from the
+            source image.
+        """
+
+        if hasattr(band, "region_product") or (raw_dtype not in RAW_PIXEL_BUFFER_DTYPES):
+            return None
+
+        x, y, w, h = window
+        raw_values = zeros(w * h, RAW_PIXEL_BUFFER_DTYPES[raw_dtype])
+        band.getSourceImage().getData(snappy.Rectangle(x, y, w, h)).getPixels(x, y, w, h, raw_values)
+        raw_values.shape = h, w
+
+        return raw_values.astype(raw_dtype)
+
+    def getScalingAttributes(self, product, variable):
+        """
+        Returns CF scaling attributes of variable read as raw values, to scale them to physical values (see
+        *eopy.product.productIO.Scaling.decode_scaling*)
+
+        :type product: *snappy.Product*
+        :param product: In memory representation of data product.
+
+        :type variable: str
+        :param variable: Name of variable
+
+        :return:
+            :scaling_attributes: *dict*
+
+            ``scale_factor`` and ``add_offset`` attributes of scaled band, and ``_FillValue`` of invalid pixels, empty
+            if variable can not be read as raw values
+        """
+
+        storage = self.returnBandStorage(product, variable)
+        if storage == {}:
+            return {}
+
+        scaling_attributes = {"_FillValue": return_fill_value(storage["raw_dtype"], storage.get("raw_fill_value"))}
+        if "raw_scale_factor" in storage:
+            scaling_attributes["scale_factor"] = storage["raw_scale_factor"]
+            scaling_attributes["add_offset"] = storage["raw_add_offset"]
+
+        return scaling_attributes
+
+    def returnTiePointGrid(self, product, variable, window=None):
+        """
+        Returns tie point grid of product at tie point resolution, with interpolator to the image grid
+
+        :type product: *snappy.Product*
+        :param product: In memory representation of data product.
+
+        :type variable: str
+        :param variable: Name of tie point grid
+
+        :type window: tuple
+        :param window: (optional) Pixel window to read, defined as *(x, y, x_width, y_width)*
+
+        :return:
+            :tie_values: *numpy.ndarray*
+
+            Tie point grid values
+
+            :interpolator: *eopy.utils.TiePointInterpolator.TiePointInterpolator*
+
+            Tie point grid interpolator to image grid, sharing interpolation weights with all tie point grids of the
+            same geometry
+
+            :grid_window: *tuple*
+
+            Pixel window in the image grid of the tie point grid
+
+            :discontinuity: *int*
+
+            Angle of discontinuity of tie point grid values, 0 if none
+
+        None returned if tie points are not available (i.e. tie point grids of natively collocated products)
+        """
+
+        x, y, w, h = self.return_window(product, window)
+        tie_point_grid = product.getTiePointGrid(variable)
+
+        # Tie point grids of region subset products are those of the source product, offset to the region
+        while hasattr(tie_point_grid, "region_product"):
+            x += tie_point_grid.region_product.region[0]
+            y += tie_point_grid.region_product.region[1]
+            tie_point_grid = tie_point_grid.node
+
+        # Tie point grids of natively collocated products are resampled to the master grid
+        if hasattr(tie_point_grid, "collocated_product"):
+            return None
+
+        shape = (tie_point_grid.getGridHeight(), tie_point_grid.getGridWidth())
+        tie_values = asarray(tie_point_grid.getTiePoints(), float64).reshape(shape)
+        interpolator = TiePointInterpolator(shape, tie_point_grid.getSubSamplingX(), tie_point_grid.getSubSamplingY(),
+                                            tie_point_grid.getOffsetX(), tie_point_grid.getOffsetY())
+
+        return tie_values, interpolator, (x, y, w, h), int(tie_point_grid.getDiscontinuity())
+
+    def getTiePointAttributes(self, product, variable, window=None):
+        """
+        Returns attributes locating values of tie point grid, returned at tie point resolution, in the image grid
+
+        :type product: *snappy.Product*
+        :param product: In memory representation of data product.
+
+        :type variable: str
+        :param variable: Name of variable
+
+        :type window: tuple
+        :param window: (optional) Pixel window read, defined as *(x, y, x_width, y_width)*
+
+        :return:
+            :tie_point_attributes: *dict*
+
+            ``tie_point_window`` (window of tie points returned, as *(tie_x, tie_y, tie_x_width, tie_y_width)*),
+            ``sub_sampling_x``, ``sub_sampling_y``, ``offset_x`` and ``offset_y`` attributes of tie point grid, empty if
+            variable not a tie point grid
+        """
+
+        if variable not in self.returnProductNames(product)["tie_point_grid_set"]:
+            return {}
+
+        tie_point_grid = self.returnTiePointGrid(product, variable, window=window)
+        if tie_point_grid is None:
+            return {}
+
+        _, interpolator, grid_window, _ = tie_point_grid
+        return {"tie_point_window": interpolator.returnTieWindow(grid_window),
+                "sub_sampling_x": interpolator.sub_sampling_x, "sub_sampling_y": interpolator.sub_sampling_y,
+                "offset_x": interpolator.offset_x, "offset_y": interpolator.offset_y}
+
+    def returnProductNames(self, product):
+        """
+        Returns names of bands, tie point grids and masks of product. These are read from the product once, on first
+        call (i.e. when the product is opened), and cached, so variable discovery and reads avoid repeated snappy calls.
+
+        :type product: *snappy.Product*
+        :param product: In memory representation of data product.
+
+        :return:
+            :product_names: *dict*
+
+            Names of product nodes, entries:
+
+            * 'bands', 'tie_point_grids', 'masks', 'flag_bands' - lists of names, in product order
+            * 'band_set', 'tie_point_grid_set', 'mask_set', 'flag_band_set' - sets of the same names
+        """
+
+        if getattr(self, "product_names", None) is None:
+            self.product_names = OrderedDict()
+
+        # Cache entries hold product, so id not reused while cached
+        key = id(product)
+        if (key not in self.product_names) or (self.product_names[key][0] is not product):
+            band_names = list(product.getBandNames())
+            flag_band_names = [b for b in band_names if product.getBand(b).isFlagBand()]
+            names = {"bands": band_names,
+                     "tie_point_grids": list(product.getTiePointGridNames()),
+                     "masks": list(product.getMaskGroup().getNodeNames()),
+                     "flag_bands": flag_band_names}
+            for node_type in ["bands", "tie_point_grids", "masks", "flag_bands"]:
+                names[node_type[:-1] + "_set"] = set(names[node_type])
+
+            self.product_names.pop(key, None)
+            self.product_names[key] = (product, names)
+            while len(self.product_names) > PRODUCT_NAMES_CACHE_SIZE:
+                self.product_names.popitem(last=False)
+
+        return self.product_names[key][1]
+
+    def applyDataMask(self, product, pixel_values, mask, window=None):
+        """
+        Returns pixel values with data mask applied
+
+        :type product: *snappy.Product*
+        :param product: In memory representation of data product.
+
+        :type pixel_values: numpy.ndarray/dask.array.Array
+        :param pixel_values: Pixel values of window
+
+        :type mask: numpy.ndarray
+        :param mask: Mask to apply to full product extent data
+
+        :type window: tuple
+        :param window: (optional) Pixel window of pixel values, defined as *(x, y, x_width, y_width)*
+
+        :return:
+            :pixel_values: *numpy.ma.MaskedArray/dask.array.Array*
+
+            pixel values, masked values set to nan if dask array
+        """
+
+        if mask is None:
+            return pixel_values
+
+        x, y, w, h = self.return_window(product, window)
+        mask = mask[y:y+h, x:x+w]
+
+        if mask.shape != pixel_values.shape:
+            raise ValueError("Data mask can't be applied to packed masks")
+
+        if isinstance(pixel_values, da.Array):
+            return da.where(mask, nan, pixel_values.astype(float64))
+        return ma.masked_array(pixel_values, mask=mask)
+
+    def getTimeStampValues(self, product, variables, attributes, variable, window=None):
         """
         Return values for per pixel time per row
 
@@ -971,6 +1743,9 @@ class SnappySharedFactory(AbstractDataFactory):
         :type variable: str
         :param variable: Name of variable to return data for.
 
+        :type window: tuple
+        :param window: (optional) Pixel window to return time stamps for, defined as *(x, y, x_width, y_width)*
+
         :return:
             :time_stamp_values: *numpy.ndarray*
 
@@ -980,9 +1755,10 @@ class SnappySharedFactory(AbstractDataFactory):
         start_time = attributes["start_time"]
         end_time = attributes["end_time"]
         product_rows = product.getSceneRasterHeight()
+        x, y, w, h = self.return_window(product, window)
 
         row_time = (end_time - start_time) / (product_rows-1)
-        increments = range(0, product_rows) * array([row_time] * product_rows)
+        increments = range(y, y+h) * array([row_time] * h)
 
         return asarray(start_time + increments, dtype=datetime)
 
@@ -0,0 +1,111 @@
+"""
+SnappyLazyProduct module test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from SnappyLazyProduct import return_lazy_product_method, return_snap_product
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+class SnapProduct(object):
+    def __init__(self, name):
+        self.name = name
+
+
+class LazyProduct(object):
+    """
+    Lazy product wrapper, delegating other attributes to wrapped product as the eopy lazy products do
+    """
+
+    def __init__(self, product, name, calls):
+        self.product = product
+        self.name = name
+        self.calls = calls
+
+    def process(self):
+        self.calls.append(self.name)
+        return SnapProduct(self.name + "(" + return_snap_product(self.product).name + ")")
+
+    def __getattr__(self, name):
+        return getattr(self.product, name)
+
+
+class ResolutionProduct(LazyProduct):
+    def getResampledProduct(self):
+        return self.process()
+
+
+class RegionProduct(LazyProduct):
+    def getSubsetProduct(self):
+        return self.process()
+
+
+class CollocatedProduct(LazyProduct):
+    def getCollocatedProduct(self):
+        return self.process()
+
+
+class ReflectanceProduct(LazyProduct):
+    def getReflectanceProduct(self):
+        return self.process()
+
+
+class TestSnappyLazyProduct(unittest.TestCase):
+    def test_return_lazy_product_method(self):
+        calls = []
+        self.assertEqual("getResampledProduct", return_lazy_product_method(ResolutionProduct(None, "r", calls)))
+        self.assertEqual("getSubsetProduct", return_lazy_product_method(RegionProduct(None, "s", calls)))
+        self.assertEqual("getCollocatedProduct", return_lazy_product_method(CollocatedProduct(None, "c", calls)))
+        self.assertEqual("getReflectanceProduct", return_lazy_product_method(ReflectanceProduct(None, "f", calls)))
+
+    def test_return_lazy_product_method_snap_product(self):
+        self.assertIsNone(return_lazy_product_method(SnapProduct("product")))
+
+    def test_return_lazy_product_method_delegated(self):
+        calls = []
+        product = RegionProduct(ResolutionProduct(SnapProduct("product"), "resample", calls), "subset", calls)
+        self.assertEqual("getSubsetProduct", return_lazy_product_method(product))
+
+    def test_return_snap_product_snap_product(self):
+        product = SnapProduct("product")
+        self.assertIs(product, return_snap_product(product))
+
+    def test_return_snap_product_resolution(self):
+        calls = []
+        snap_product = return_snap_product(ResolutionProduct(SnapProduct("product"), "resample", calls))
+
+        self.assertEqual("resample(product)", snap_product.name)
+        self.assertEqual(["resample"], calls)
+
+    def test_return_snap_product_nested(self):
+        calls = []
+        product = ReflectanceProduct(CollocatedProduct(RegionProduct(ResolutionProduct(SnapProduct("product"),
+                                                                                       "resample", calls),
+                                                                     "subset", calls),
+                                                       "collocate", calls),
+                                     "convert", calls)
+
+        snap_product = return_snap_product(product)
+
+        self.assertEqual("convert(collocate(subset(resample(product))))", snap_product.name)
+        self.assertEqual(["convert", "collocate", "subset", "resample"], calls)
+
+
+if __name__ == "__main__":
+    unittest.main()
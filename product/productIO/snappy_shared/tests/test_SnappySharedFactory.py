@@ -46,6 +46,26 @@ latitude_array = zeros((w, h))
 for i in range(w):
     latitude_array[-i-1, :] = i
 
+
+class RawBand(object):
+    """
+    Band with source image of raw values, read as from snap image rasters - raster coordinates in image coordinates
+    """
+
+    def __init__(self, raw_values):
+        self.raw_values = raw_values
+        self.regions = []
+
+    def getSourceImage(self):
+        return self
+
+    def getData(self, rectangle):
+        self.regions.append(rectangle)
+        return self
+
+    def getPixels(self, x, y, width, height, buffer):
+        buffer[:] = self.raw_values[y:y+height, x:x+width].ravel()
+
 def setup():
     from SnappySharedFactory import SnappySharedFactory
     factory = SnappySharedFactory()
@@ -136,6 +156,15 @@ class TestSnappySharedFactory(unittest.TestCase):
 
         self.assertItemsEqual(expected_variable_names, variable_names)
 
+    def test_returnProductNames(self):
+        factory, product, _, _ = setup()
+
+        names = factory.returnProductNames(product)
+
+        self.assertEqual(["band1", "band2", "longitude", "latitude"], names["bands"])
+        self.assertEqual(set(["tiepointgrid1"]), names["tie_point_grid_set"])
+        self.assertIs(names, factory.returnProductNames(product))
+
     def test_getVariableInfo_band1(self):
         factory, product, variables, _ = setup()
 
@@ -323,6 +352,128 @@ class TestSnappySharedFactory(unittest.TestCase):
             for elem, test_elem in zip(row, test_row):
                 self.assertAlmostEquals(elem, test_elem, places=3)
 
+    def test_return_window(self):
+        factory, product, variables, attributes = setup()
+
+        self.assertEqual((0, 0, 15, 10), factory.return_window(product))
+        self.assertEqual((2, 3, 4, 5), factory.return_window(product, (2, 3, 4, 5)))
+
+    def test_return_window_clip(self):
+        factory, product, variables, attributes = setup()
+
+        self.assertEqual((10, 8, 5, 2), factory.return_window(product, (10, 8, 20, 20)))
+
+    def test_return_window_outside(self):
+        factory, product, variables, attributes = setup()
+
+        self.assertRaises(ValueError, factory.return_window, product, (20, 20, 5, 5))
+
+    def test_getPixelValues_band1_window(self):
+        factory, product, variables, attributes = setup()
+
+        full_band1_array = factory.getPixelValues(product, variables, attributes, "band1")
+        test_band1_array = factory.getPixelValues(product, variables, attributes, "band1", window=(2, 3, 4, 5))
+
+        self.assertEqual((5, 4), test_band1_array.shape)
+
+        for row, test_row in zip(full_band1_array[3:8, 2:6], test_band1_array):
+            for elem, test_elem in zip(row, test_row):
+                self.assertAlmostEquals(elem, test_elem, places=3)
+
+    def test_getPixelValues_tie_point_grid(self):
+        factory, product, variables, attributes = setup()
+
+        # tie points every 5 pixels, linear in image coordinates, so interpolated values exactly linear
+        tie_points = (arange(3)[:, None] * 50.0 + arange(4)[None, :] * 5.0).astype("float32")
+        product.addTiePointGrid(snappy.TiePointGrid("tiepointgrid2", 4, 3, 0.5, 0.5, 5, 5, tie_points.flatten()))
+
+        test_array = factory.getPixelValues(product, variables, attributes, "tiepointgrid2", window=(2, 3, 4, 5))
+        expected_array = arange(3, 8)[:, None] * 10.0 + arange(2, 6)[None, :]
+        self.assertTrue(abs(expected_array - test_array).max() < 1e-4)
+
+        test_tie_array = factory.getPixelValues(product, variables, attributes, "tiepointgrid2", window=(2, 3, 4, 5),
+                                                tie_point_resolution="native")
+        self.assertEqual(tie_points[0:3, 0:3].tolist(), test_tie_array.tolist())
+
+    def test_getPixelValues_raw(self):
+        factory, product, variables, attributes = setup()
+
+        raw_array = arange(w*h, dtype="uint16").reshape((h, w))
+        band3 = product.addBand("band3", "uint16")
+        band3.setScalingFactor(0.1)
+        band3.setNoDataValue(0)
+        band3.setNoDataValueUsed(True)
+        band3.ensureRasterData()
+        band3.setPixels(0, 0, w, h, (raw_array * 0.1).flatten())
+
+        self.assertEqual({"raw_dtype": "uint16", "raw_scale_factor": 0.1, "raw_add_offset": 0.0,
+                          "raw_fill_value": 0.0}, factory.returnBandStorage(product, "band3"))
+        self.assertEqual({}, factory.returnBandStorage(product, "tiepointgrid1"))
+
+        test_array = factory.getPixelValues(product, variables, attributes, "band3", window=(2, 3, 4, 5),
+                                            scaling="raw")
+        self.assertEqual("uint16", test_array.dtype.name)
+        self.assertEqual(raw_array[3:8, 2:6].tolist(), test_array.tolist())
+
+        variables.append(factory.createDataVariable(product, "band3"))
+        self.assertEqual("uint16", variables[-1].raw_dtype)
+
+        test_data = factory.getData(product, variables, attributes, "band3", scaling="raw", lazy=True)
+        self.assertEqual("uint16", test_data.dtype.name)
+        self.assertAlmostEqual(0.1, test_data.attrs["scale_factor"])
+        self.assertEqual(0, test_data.attrs["_FillValue"])
+        self.assertEqual(raw_array.tolist(), test_data.values.tolist())
+
+    def test_readRawPixels(self):
+        from SnappySharedFactory import SnappySharedFactory
+
+        raw_array = (arange(w*h).reshape((h, w)) + 65000).astype("uint16")
+        band = RawBand(raw_array)
+
+        raw_values = SnappySharedFactory().readRawPixels(band, "uint16", (2, 3, 4, 5))
+
+        self.assertEqual("uint16", raw_values.dtype.name)
+        self.assertEqual(raw_array[3:8, 2:6].tolist(), raw_values.tolist())
+        self.assertEqual(1, len(band.regions))
+
+    def test_readRawPixels_region_product(self):
+        from SnappySharedFactory import SnappySharedFactory
+
+        # Bands of region of interest subset proxy products only read as physical values
+        band = RawBand(zeros((h, w), "uint16"))
+        band.region_product = None
+
+        self.assertIsNone(SnappySharedFactory().readRawPixels(band, "uint16", (2, 3, 4, 5)))
+        self.assertEqual([], band.regions)
+
+    def test_readRawPixels_dtype(self):
+        from SnappySharedFactory import SnappySharedFactory
+
+        self.assertIsNone(SnappySharedFactory().readRawPixels(RawBand(zeros((h, w), "int64")), "int64",
+                                                              (2, 3, 4, 5)))
+
+    def test_getData_band1_windows(self):
+        factory, product, variables, attributes = setup()
+
+        windows = [(0, 0, 5, 5), (5, 5, 10, 5)]
+        test_data = factory.getData(product, variables, attributes, "band1", window=windows)
+
+        self.assertEqual(2, len(test_data))
+        self.assertEqual((5, 5), test_data[0].values.shape)
+        self.assertEqual((5, 10), test_data[1].values.shape)
+
+    def test_getData_band1_lazy(self):
+        factory, product, variables, attributes = setup()
+
+        expected_data = factory.getData(product, variables, attributes, "band1")
+        test_data = factory.getData(product, variables, attributes, "band1", lazy=True, chunks=(4, 6))
+
+        self.assertEqual(((4, 4, 2), (6, 6, 3)), test_data.data.chunks)
+
+        for row, test_row in zip(expected_data.values, test_data.values):
+            for elem, test_elem in zip(row, test_row):
+                self.assertAlmostEquals(elem, test_elem, places=3)
+
     def test_getData_band1(self):
 
         factory, product, variables, attributes = setup()
@@ -0,0 +1,106 @@
+"""
+FlagCoding class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+from numpy import array, uint32, arange
+import numpy.ma as ma
+import dask.array as da
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from FlagCoding import FlagCoding, decode_flag
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+flag_masks = array([2**31, 2**30, 1], uint32)
+flag_meanings = "land coastline invalid"
+flag_values = array([[2**31, 2**31 + 2**30, 0, 1],
+                     [2**31 + 1, 0, 0, 2**30]], uint32)
+
+
+class TestFlagCoding(unittest.TestCase):
+    def test_fromAttributes(self):
+        flag_coding = FlagCoding.fromAttributes({"flag_masks": flag_masks, "flag_meanings": flag_meanings})
+
+        self.assertEqual(["land", "coastline", "invalid"], flag_coding.flag_meanings)
+        self.assertEqual(2**31, flag_coding.getFlagMask("land"))
+
+    def test_fromAttributes_none(self):
+        self.assertEqual(None, FlagCoding.fromAttributes({"units": None}))
+
+    def test_init_mismatch(self):
+        self.assertRaises(ValueError, FlagCoding, flag_masks, ["land"])
+
+    def test_getFlagMask_missing(self):
+        flag_coding = FlagCoding(flag_masks, flag_meanings.split())
+
+        self.assertRaises(KeyError, flag_coding.getFlagMask, "cloud")
+
+    def test_decode(self):
+        flag_coding = FlagCoding(flag_masks, flag_meanings.split())
+
+        self.assertEqual([[True, True, False, False], [True, False, False, False]],
+                         flag_coding.decode(flag_values, "land").tolist())
+
+    def test_decode_flag(self):
+        self.assertEqual([[255, 255, 0, 0], [255, 0, 0, 0]], decode_flag(flag_values, 2**31).tolist())
+
+    def test_decode_flag_packed(self):
+        self.assertEqual([[192], [128]], decode_flag(flag_values, 2**31, "packed").tolist())
+
+    def test_decode_flag_lazy(self):
+        self.assertEqual([[False, True, False, False], [False, False, False, True]],
+                         decode_flag(da.from_array(flag_values, chunks=2), 2**30, "bool").compute().tolist())
+
+    def test_decode_flag_unknown_format(self):
+        self.assertRaises(ValueError, decode_flag, flag_values, 1, "int")
+
+    def test_percentages(self):
+        flag_coding = FlagCoding(flag_masks, flag_meanings.split())
+
+        percentages = flag_coding.percentages(flag_values)
+
+        self.assertEqual(["land", "coastline", "invalid"], list(percentages.keys()))
+        self.assertEqual(37.5, percentages["land"])
+        self.assertEqual(25.0, percentages["coastline"])
+        self.assertEqual(25.0, percentages["invalid"])
+
+    def test_percentages_flags(self):
+        flag_coding = FlagCoding(flag_masks, flag_meanings.split())
+
+        percentages = flag_coding.percentages(ma.masked_array(flag_values), ["invalid"])
+
+        self.assertEqual({"invalid": 25.0}, dict(percentages))
+
+    def test_percentages_blocks(self):
+        import FlagCoding as FlagCoding_module
+        block_size = FlagCoding_module.BLOCK_SIZE
+        FlagCoding_module.BLOCK_SIZE = 3
+
+        flag_coding = FlagCoding([1, 2], ["odd", "two"])
+        values = arange(100).astype(uint32)
+        try:
+            percentages = flag_coding.percentages(values)
+        finally:
+            FlagCoding_module.BLOCK_SIZE = block_size
+
+        self.assertEqual(50.0, percentages["odd"])
+        self.assertEqual(50.0, percentages["two"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""
+Scaling functions test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+from numpy import arange, array, uint16, int16, float32, nan, isnan
+import numpy.ma as ma
+import dask.array as da
+import xarray as xr
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from Scaling import return_fill_value, return_raw_values, apply_scaling, decode_scaling
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+raw_array = arange(1, 13, dtype=uint16).reshape((3, 4)) * 1000
+
+
+class TestScaling(unittest.TestCase):
+    def test_return_fill_value(self):
+        self.assertEqual(65535, return_fill_value("uint16"))
+        self.assertEqual(-32768, return_fill_value("int16"))
+        self.assertTrue(isnan(return_fill_value("float32")))
+        self.assertEqual(0, return_fill_value("uint16", 0.0))
+
+    def test_return_raw_values(self):
+        physical_values = ma.masked_array((raw_array * float32(0.01) + float32(5.0)).astype(float32))
+        physical_values[0, 1] = ma.masked
+
+        raw_values = return_raw_values(physical_values, "uint16", scale_factor=0.01, add_offset=5.0)
+
+        expected = raw_array.copy()
+        expected[0, 1] = 65535
+        self.assertEqual(uint16, raw_values.dtype)
+        self.assertEqual(expected.tolist(), raw_values.tolist())
+
+    def test_return_raw_values_nan(self):
+        raw_values = return_raw_values(array([1.0, nan, -3.0]), "int16", fill_value=-1)
+
+        self.assertEqual(int16, raw_values.dtype)
+        self.assertEqual([1, -1, -3], raw_values.tolist())
+
+    def test_apply_scaling(self):
+        physical_values = apply_scaling(raw_array, scale_factor=0.01, fill_value=2000)
+
+        self.assertEqual(float32, physical_values.dtype)
+        self.assertTrue(physical_values.mask[0, 1])
+        self.assertAlmostEqual(10.0, physical_values[0, 0], places=5)
+
+    def test_apply_scaling_dask(self):
+        physical_values = apply_scaling(da.from_array(raw_array, chunks=(2, 2)), scale_factor=0.01, fill_value=2000)
+
+        self.assertTrue(isinstance(physical_values, da.Array))
+        self.assertTrue(isnan(physical_values.compute()[0, 1]))
+        self.assertAlmostEqual(10.0, physical_values.compute()[0, 0], places=5)
+
+    def test_decode_scaling(self):
+        data = xr.Dataset({"raw": (["y", "x"], raw_array, {"scale_factor": 0.01, "_FillValue": 2000, "units": "u"}),
+                           "physical": (["y", "x"], raw_array.astype(float32))})
+
+        physical_data = decode_scaling(data)
+
+        self.assertEqual({"units": "u"}, physical_data["raw"].attrs)
+        self.assertTrue(isnan(physical_data["raw"].values[0, 1]))
+        self.assertAlmostEqual(10.0, physical_data["raw"].values[0, 0], places=5)
+        self.assertEqual(raw_array.tolist(), physical_data["physical"].values.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+VariableIndex class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from VariableIndex import VariableIndex
+from Variable import Variable
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+def makeVariable(name):
+    return Variable({"name": name, "ndims": 2, "shape": (10, 10), "dtype": "float32", "vtype": "data",
+                     "units": None})
+
+
+def makeIndex():
+    variables = [makeVariable(n) for n in ["B2", "B5", "latitude", "longitude"]]
+    products = [{"product_name": "10m", "product": "product_10m", "variables": ["B2", "latitude", "longitude"]},
+                {"product_name": "20m", "product": "product_20m", "variables": ["B5", "latitude", "longitude"]}]
+    return VariableIndex(variables, products), variables, products
+
+
+class TestVariableIndex(unittest.TestCase):
+    def test_getVariable(self):
+        index, variables, products = makeIndex()
+
+        self.assertIs(variables[1], index.getVariable("B5"))
+
+    def test_getVariable_missing(self):
+        index, variables, products = makeIndex()
+
+        self.assertRaises(KeyError, index.getVariable, "B8")
+
+    def test_getVariableInfo(self):
+        index, variables, products = makeIndex()
+
+        self.assertEqual("latitude", index.getVariableInfo("latitude")["name"])
+
+    def test_getProduct(self):
+        index, variables, products = makeIndex()
+
+        self.assertEqual("product_20m", index.getProduct(["B5", "latitude"])["product"])
+
+    def test_getProduct_last(self):
+        index, variables, products = makeIndex()
+
+        self.assertEqual(1, index.getProductIndex(["latitude", "longitude"]))
+
+    def test_getProduct_none(self):
+        index, variables, products = makeIndex()
+
+        self.assertEqual(None, index.getProduct(["B2", "B5"]))
+
+    def test_isCurrent(self):
+        index, variables, products = makeIndex()
+
+        self.assertTrue(index.isCurrent(variables, products))
+
+    def test_isCurrent_variables_appended(self):
+        index, variables, products = makeIndex()
+        variables.append(makeVariable("B8"))
+
+        self.assertFalse(index.isCurrent(variables, products))
+
+    def test_isCurrent_product_variables_replaced(self):
+        index, variables, products = makeIndex()
+        products[0]["variables"] = ["B2"]
+
+        self.assertFalse(index.isCurrent(variables, products))
+
+
+if __name__ == "__main__":
+    unittest.main()
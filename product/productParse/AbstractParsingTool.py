@@ -104,7 +104,7 @@ class AbstractParsingTool:
         """
 
         # Use parsingFactory method parseProduct() to process data product
-        attributes = self.parsingFactory.parseProduct(product_path, detail="min", **kwargs)
+        attributes = self.parsingFactory.parseProduct(product_path, detail=detail, **kwargs)
 
         return attributes
 
@@ -0,0 +1,749 @@
+"""
+Catalogue of parsed product metadata for whole product archives, in an indexed SQLite database
+"""
+
+'''___Built-In Modules___'''
+import sys
+from os import listdir, stat, sep
+from os.path import dirname, isdir, splitext, abspath
+from os.path import join as pjoin
+from datetime import datetime as dt
+from datetime import timedelta
+from multiprocessing import Pool
+from functools import partial
+import sqlite3
+try:
+    from os import scandir
+except ImportError:
+    try:
+        from scandir import scandir
+    except ImportError:
+        scandir = None
+
+'''___Third-Party Modules___'''
+from numpy import array
+
+'''___NPL Modules___'''
+sys.path.append(dirname(__file__))
+from ProductParsingTool import ProductParsingTool
+
+sys.path.append(pjoin(dirname(dirname(dirname(abspath(__file__)))), "utils"))
+from PolygonRasteriser import parse_wkt
+from FootprintIndex import FootprintIndex
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+# Product attributes catalogued, in addition to product path, acquisition start and end time and footprint
+CATALOGUE_ATTRIBUTES = ["product_string", "mission", "mission_type", "instrument", "site", "tile", "creation_time"]
+
+# Catalogue columns of product attributes
+CATALOGUE_COLUMNS = ["start_time", "end_time"] + CATALOGUE_ATTRIBUTES + ["footprint"]
+
+# Metadata file parsed for products that are directories, by directory extension
+PRODUCT_DIRECTORY_FILES = {".SEN3": "xfdumanifest.xml", ".SAFE": "manifest.safe"}
+
+# Catalogue time format, fixed width so times order as strings
+TIME_FMT = "%Y-%m-%dT%H:%M:%S.%f"
+
+# Number of product paths parsed per task sent to a worker process
+CHUNK_SIZE = 512
+
+# Parsing tool and factory instances of process, instantiated on first use - see return_parsing_tools
+parsing_tools = None
+parsing_factories = {}
+
+
+def list_directory(directory):
+    """
+    Return entries of directory, with their type from the directory listing (with *scandir*) so without a stat call
+    per entry where the file system supports it
+
+    :type directory: str
+    :param directory: Directory path
+
+    :return:
+        :entries: *list:tuple*
+
+        *(name, path, is_dir)* of each directory entry
+    """
+
+    if scandir is not None:
+        return [(entry.name, entry.path, entry.is_dir()) for entry in scandir(directory)]
+
+    return [(name, pjoin(directory, name), isdir(pjoin(directory, name))) for name in listdir(directory)]
+
+
+def split_directory(directory):
+    """
+    Return paths of candidate products in directory, and its sub-directories that are not products. Products that are
+    directories (e.g. *.SEN3* directories) are given by the path of their metadata file (e.g. *xfdumanifest.xml*).
+
+    :type directory: str
+    :param directory: Directory path
+
+    :return:
+        :product_paths: *list:str*
+
+        Candidate product paths
+
+        :directories: *list:str*
+
+        Sub-directory paths
+    """
+
+    product_paths = []
+    directories = []
+    for name, path, is_dir in list_directory(directory):
+        if not is_dir:
+            product_paths.append(path)
+        elif splitext(name)[1] in PRODUCT_DIRECTORY_FILES:
+            product_paths.append(pjoin(path, PRODUCT_DIRECTORY_FILES[splitext(name)[1]]))
+        else:
+            directories.append(path)
+
+    return product_paths, directories
+
+
+def return_product_paths(directory):
+    """
+    Return paths of candidate products in directory tree. Products that are directories (e.g. *.SEN3* directories) are
+    given by the path of their metadata file (e.g. *xfdumanifest.xml*) and are not descended into.
+
+    :type directory: str
+    :param directory: Archive root directory path
+
+    :return:
+        :product_paths: *generator*
+
+        Candidate product paths
+    """
+
+    directories = [directory]
+    while directories:
+        product_paths, sub_directories = split_directory(directories.pop())
+        for product_path in product_paths:
+            yield product_path
+        directories.extend(sub_directories)
+
+
+def stat_product_paths(product_paths):
+    """
+    Return file status of products, as recorded in catalogue to find changed products
+
+    :type product_paths: list
+    :param product_paths: Data product paths
+
+    :return:
+        :stats: *list:tuple*
+
+        *(product_path, size, mtime, inode)* of each product, products removed while listed omitted
+    """
+
+    stats = []
+    for product_path in product_paths:
+        try:
+            status = stat(product_path)
+        except OSError:
+            continue
+        stats.append((product_path, status.st_size, status.st_mtime, status.st_ino))
+    return stats
+
+
+def stat_directory(directory):
+    """
+    Return file status of all products in directory tree, task of catalogue worker processes
+
+    :type directory: str
+    :param directory: Directory path
+
+    :return:
+        :stats: *list:tuple*
+
+        *(product_path, size, mtime, inode)* of each product
+    """
+
+    return stat_product_paths(return_product_paths(directory))
+
+
+def return_parsing_tools():
+    """
+    Return instances of all available parsing tools, instantiated once per process
+
+    :return:
+        :parsing_tools: *list:eopy.product.productParse.AbstractParsingTool.AbstractParsingTool*
+
+        Parsing tool instances
+    """
+
+    global parsing_tools
+
+    if parsing_tools is None:
+        productParsingTool = ProductParsingTool()
+        registry = productParsingTool.getRegistry()
+        parsing_tools = [registry.getPlugin(path)() for path in registry.plugin_paths]
+
+    return parsing_tools
+
+
+def parse_product_path(product_path, detail="min"):
+    """
+    Return parsed metadata of product, with parsing factories resolved from parsing tools instantiated once per
+    process
+
+    :type product_path: str
+    :param product_path: Data product path
+
+    :type detail: str
+    :param detail: (optional) Parsing detail, "min" (default) or "max"
+
+    :return:
+        :attributes: *dict*
+
+        Dictionary of parsed product metadata. None if no suitable parsing factory found, or product path malformed.
+    """
+
+    for parsing_tool in return_parsing_tools():
+        ParsingFactory = parsing_tool.setParsingFactory(product_path)
+        if ParsingFactory is None:
+            continue
+
+        if ParsingFactory not in parsing_factories:
+            parsing_factories[ParsingFactory] = ParsingFactory()
+
+        try:
+            return parsing_factories[ParsingFactory].parseProduct(product_path, detail=detail)
+        except (ValueError, IndexError):
+            return None
+
+    return None
+
+
+def parse_product_paths(product_paths, detail="min"):
+    """
+    Return parsed metadata of products, task of catalogue worker processes
+
+    :type product_paths: list
+    :param product_paths: Data product paths
+
+    :type detail: str
+    :param detail: (optional) Parsing detail, "min" (default) or "max"
+
+    :return:
+        :parsed: *list:tuple*
+
+        *(product_path, attributes)* of each product successfully parsed
+    """
+
+    parsed = []
+    for product_path in product_paths:
+        attributes = parse_product_path(product_path, detail=detail)
+        if attributes:
+            parsed.append((product_path, attributes))
+    return parsed
+
+
+def return_chunks(iterable, chunk_size):
+    """
+    Return items of iterable in lists of up to chunk_size items
+
+    :type iterable: iterable
+    :param iterable: Items
+
+    :type chunk_size: int
+    :param chunk_size: Number of items per chunk
+
+    :return:
+        :chunks: *generator*
+
+        Lists of items
+    """
+
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class Catalogue:
+    """
+    Catalogue provides an indexed SQLite catalogue of parsed product metadata (see *eopy.product.productParse.Parse*)
+    for whole product archives, so products may be found by type, mission, site and acquisition time without
+    re-parsing the archive.
+
+    Archives are walked with *scandir* and product paths parsed in parallel worker processes, each resolving parsing
+    tools once rather than once per product.
+
+    The size, modification time and inode of each product path are recorded, so archives may be refreshed
+    incrementally - only new or changed products are parsed and deleted products are removed. Refresh cost is then
+    dominated by listing and stat calls, which are parallelised per top-level archive directory.
+
+    Sample Code:
+
+    .. code-block:: python
+
+        catalogue = Catalogue("path/to/catalogue.db")
+        catalogue.addArchive("path/to/archive")
+
+        # Later, parse only new or changed products
+        catalogue.addArchive("path/to/archive", incremental=True)
+
+        product_paths = catalogue.query(product_string="OL_1_EFR", start=datetime(2018, 1, 1),
+                                        end=datetime(2018, 2, 1))
+
+        # Products with footprints (parsed with detail="max") containing point, within 2 hours of time
+        catalogue.addArchive("path/to/archive", detail="max")
+        product_paths = catalogue.query(point=(lon, lat), start=time - timedelta(hours=2),
+                                        end=time + timedelta(hours=2))
+
+    :Attributes:
+
+        .. py:attribute:: catalogue_path
+
+            *str*
+
+            Path of SQLite catalogue database, ":memory:" for an in-memory catalogue
+
+        .. py:attribute:: connection
+
+            *sqlite3.Connection*
+
+            Connection to catalogue database
+
+        .. py:attribute:: footprint_index
+
+            *tuple*
+
+            *(product_paths, eopy.utils.FootprintIndex.FootprintIndex)* spatio-temporal index of catalogued product
+            footprints, built on first spatial query and rebuilt when products change
+
+    :Methods:
+        .. py:method:: addArchive(...):
+
+            Parses all products in archive directory tree into catalogue
+
+        .. py:method:: statArchive(...):
+
+            Returns file status of all products in archive directory tree
+
+        .. py:method:: getEntries(...):
+
+            Returns recorded file status of product paths in archive directory tree
+
+        .. py:method:: addEntries(...):
+
+            Records file status of product paths
+
+        .. py:method:: addProducts(...):
+
+            Adds parsed products to catalogue
+
+        .. py:method:: removeProducts(...):
+
+            Removes products and their recorded file status from catalogue
+
+        .. py:method:: query(...):
+
+            Returns paths of catalogued products matching given attributes and acquired within given time range
+
+        .. py:method:: getFootprintIndex(...):
+
+            Returns spatio-temporal index of catalogued product footprints
+
+        .. py:method:: getAttributes(...):
+
+            Returns catalogued attributes of product
+
+        .. py:method:: getTimes(...):
+
+            Returns catalogued acquisition start and end times of products, as arrays
+
+        .. py:method:: formatTime(...):
+
+            Returns time in catalogue format
+
+        .. py:method:: close(...):
+
+            Closes connection to catalogue database
+    """
+
+    def __init__(self, catalogue_path=":memory:"):
+        """
+        Initialise catalogue, creating catalogue database if it does not exist
+
+        :type catalogue_path: str
+        :param catalogue_path: (optional) Path of SQLite catalogue database, default in-memory catalogue
+        """
+
+        self.catalogue_path = catalogue_path
+        self.connection = sqlite3.connect(catalogue_path)
+        self.footprint_index = None
+
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS products (product_path TEXT PRIMARY KEY, %s)" %
+                                    ", ".join("%s TEXT" % c for c in CATALOGUE_COLUMNS))
+
+            # Add columns missing from catalogues created by earlier versions
+            columns = [row[1] for row in self.connection.execute("PRAGMA table_info(products)")]
+            for column in CATALOGUE_COLUMNS:
+                if column not in columns:
+                    self.connection.execute("ALTER TABLE products ADD COLUMN %s TEXT" % column)
+
+            for attribute in ["product_string", "mission", "site"]:
+                self.connection.execute("CREATE INDEX IF NOT EXISTS products_%s ON products (%s, start_time)" %
+                                        (attribute, attribute))
+            self.connection.execute("CREATE INDEX IF NOT EXISTS products_start_time ON products (start_time)")
+
+            # File status of all product paths parsed, including those not parsable, to find changed paths
+            self.connection.execute("CREATE TABLE IF NOT EXISTS entries (product_path TEXT PRIMARY KEY, "
+                                    "size INTEGER, mtime REAL, inode INTEGER)")
+
+    def addArchive(self, directory, processes=None, incremental=False, detail="min"):
+        """
+        Parses all products in archive directory tree into catalogue. Paths that are not parsable products are ignored.
+
+        :type directory: str
+        :param directory: Archive root directory path
+
+        :type processes: int
+        :param processes: (optional) Number of worker processes to stat and parse products with, default number of
+        CPUs. If 1, products are parsed in this process.
+
+        :type incremental: bool
+        :param incremental: (optional) If True, only products new or changed (in size, modification time or inode)
+        since previously added are parsed, and products deleted from the archive are removed from the catalogue.
+        Default False, all products parsed.
+
+        :type detail: str
+        :param detail: (optional) Parsing detail, "min" (default, product attributes from filename) or "max" (also
+        product footprints from product metadata files, for spatial queries)
+
+        :return:
+            :n_products: *int*
+
+            Number of products added to catalogue
+        """
+
+        directory = abspath(directory)
+
+        pool = Pool(processes) if processes != 1 else None
+        imap = pool.imap_unordered if pool is not None else (lambda function, tasks: (function(t) for t in tasks))
+
+        try:
+            stats = self.statArchive(directory, imap)
+            entries = self.getEntries(directory) if incremental else {}
+
+            deleted = [product_path for product_path in entries if product_path not in stats]
+            changed = sorted(product_path for product_path, status in stats.items()
+                             if entries.get(product_path, None) != status)
+            self.removeProducts(deleted + changed)
+
+            n_products = 0
+            for parsed in imap(partial(parse_product_paths, detail=detail), return_chunks(changed, CHUNK_SIZE)):
+                n_products += self.addProducts(parsed)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        self.addEntries([(product_path,) + stats[product_path] for product_path in changed])
+
+        return n_products
+
+    def statArchive(self, directory, imap=None):
+        """
+        Returns file status of all products in archive directory tree, listed and stat-ed per top-level directory
+
+        :type directory: str
+        :param directory: Archive root directory path
+
+        :type imap: function
+        :param imap: (optional) Function to map top-level directory task over directories with, e.g.
+        *multiprocessing.Pool.imap_unordered*, default in this process
+
+        :return:
+            :stats: *dict*
+
+            *(size, mtime, inode)* of each product, by product path
+        """
+
+        if imap is None:
+            imap = lambda function, tasks: (function(t) for t in tasks)
+
+        product_paths, directories = split_directory(directory)
+
+        stats = {}
+        for directory_stats in [stat_product_paths(product_paths)] + list(imap(stat_directory, directories)):
+            for product_path, size, mtime, inode in directory_stats:
+                stats[product_path] = (size, mtime, inode)
+
+        return stats
+
+    def getEntries(self, directory):
+        """
+        Returns recorded file status of product paths in archive directory tree
+
+        :type directory: str
+        :param directory: Archive root directory path
+
+        :return:
+            :entries: *dict*
+
+            *(size, mtime, inode)* of each product path, by product path
+        """
+
+        prefix = abspath(directory).rstrip(sep) + sep
+
+        entries = {}
+        for product_path, size, mtime, inode in self.connection.execute("SELECT * FROM entries"):
+            if product_path.startswith(prefix):
+                entries[product_path] = (size, mtime, inode)
+
+        return entries
+
+    def addEntries(self, entries):
+        """
+        Records file status of product paths, replacing existing records of same product path
+
+        :type entries: list
+        :param entries: *(product_path, size, mtime, inode)* of each product path
+        """
+
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", entries)
+
+    def addProducts(self, parsed):
+        """
+        Adds parsed products to catalogue, replacing existing entries of same product path
+
+        Products with only an acquisition date (e.g. RadCalNet products) are catalogued as acquired over the whole
+        day, and products with only an acquisition start time (e.g. Sentinel-2 products) as acquired at that time.
+
+        :type parsed: list
+        :param parsed: *(product_path, attributes)* of each product
+
+        :return:
+            :n_products: *int*
+
+            Number of products added to catalogue
+        """
+
+        rows = []
+        for product_path, attributes in parsed:
+            attributes = dict(attributes)
+            if "start_time" not in attributes:
+                attributes["start_time"] = attributes.get("date", None)
+                if attributes["start_time"] is not None:
+                    attributes.setdefault("end_time", attributes["start_time"] + timedelta(days=1))
+            attributes.setdefault("end_time", attributes["start_time"])
+
+            row = [product_path]
+            for column in CATALOGUE_COLUMNS:
+                value = attributes.get(column, None)
+                row.append(self.formatTime(value) if isinstance(value, dt) else value)
+            rows.append(row)
+
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO products (product_path, %s) VALUES (%s)" %
+                                        (", ".join(CATALOGUE_COLUMNS), ", ".join(["?"] * (len(CATALOGUE_COLUMNS) + 1))),
+                                        rows)
+
+        self.footprint_index = None
+
+        return len(rows)
+
+    def removeProducts(self, product_paths):
+        """
+        Removes products and their recorded file status from catalogue
+
+        :type product_paths: list
+        :param product_paths: Data product paths
+        """
+
+        rows = [(product_path,) for product_path in product_paths]
+        with self.connection:
+            self.connection.executemany("DELETE FROM products WHERE product_path = ?", rows)
+            self.connection.executemany("DELETE FROM entries WHERE product_path = ?", rows)
+
+        self.footprint_index = None
+
+    def query(self, start=None, end=None, point=None, **attributes):
+        """
+        Returns paths of catalogued products matching given attributes and acquired within given time range, and if
+        given, with footprint containing point
+
+        :type start: datetime.datetime
+        :param start: (optional) Start of time range, products acquired (in part) after start returned
+
+        :type end: datetime.datetime
+        :param end: (optional) End of time range, products acquired (in part) before end returned
+
+        :type point: tuple
+        :param point: (optional) Point, *(lon, lat)*, products with footprints containing point returned, found from
+        spatio-temporal index of footprints - only products parsed with footprints (see *addArchive*) are returned
+
+        :type attributes: -
+        :param attributes: Catalogued attribute values to match (e.g. *product_string="OL_1_EFR"*), see
+        *CATALOGUE_ATTRIBUTES*
+
+        :return:
+            :product_paths: *list:str*
+
+            Paths of matching products, in order of acquisition start time
+        """
+
+        conditions = []
+        values = []
+        for attribute, value in attributes.items():
+            if attribute not in CATALOGUE_ATTRIBUTES:
+                raise ValueError("Unknown catalogue attribute '%s', must be one of %s" %
+                                 (attribute, str(CATALOGUE_ATTRIBUTES)))
+            conditions.append("%s = ?" % attribute)
+            values.append(value)
+
+        if start is not None:
+            conditions.append("end_time >= ?")
+            values.append(self.formatTime(start))
+        if end is not None:
+            conditions.append("start_time <= ?")
+            values.append(self.formatTime(end))
+
+        if point is not None:
+            product_paths, footprint_index = self.getFootprintIndex()
+            product_paths = [product_paths[i] for i in footprint_index.query(point[0], point[1], start, end)]
+            if product_paths == []:
+                return []
+            conditions.append("product_path IN (%s)" % ", ".join(["?"] * len(product_paths)))
+            values.extend(product_paths)
+
+        where = (" WHERE " + " AND ".join(conditions)) if conditions else ""
+        cursor = self.connection.execute("SELECT product_path FROM products%s ORDER BY start_time" % where, values)
+
+        return [row[0] for row in cursor]
+
+    def getFootprintIndex(self):
+        """
+        Returns spatio-temporal index of catalogued product footprints, built on first call and rebuilt when products
+        change
+
+        :return:
+            :product_paths: *list:str*
+
+            Paths of products with footprints, by index of product in footprint index
+
+            :footprint_index: *eopy.utils.FootprintIndex.FootprintIndex*
+
+            Spatio-temporal index of product footprints
+        """
+
+        if self.footprint_index is None:
+            product_paths = []
+            footprints = []
+            start_times = []
+            end_times = []
+            for product_path, start_time, end_time, footprint in self.connection.execute(
+                    "SELECT product_path, start_time, end_time, footprint FROM products WHERE footprint IS NOT NULL"):
+                product_paths.append(product_path)
+                footprints.append(parse_wkt(footprint))
+                start_times.append(dt.strptime(start_time, TIME_FMT) if start_time is not None else None)
+                end_times.append(dt.strptime(end_time, TIME_FMT) if end_time is not None else None)
+
+            self.footprint_index = (product_paths, FootprintIndex(footprints, start_times, end_times))
+
+        return self.footprint_index
+
+    def getAttributes(self, product_path):
+        """
+        Returns catalogued attributes of product
+
+        :type product_path: str
+        :param product_path: Data product path
+
+        :return:
+            :attributes: *dict*
+
+            Dictionary of catalogued product attributes, undefined attributes omitted. None if product not catalogued.
+        """
+
+        names = CATALOGUE_COLUMNS
+        row = self.connection.execute("SELECT %s FROM products WHERE product_path = ?" % ", ".join(names),
+                                      (product_path,)).fetchone()
+        if row is None:
+            return None
+
+        attributes = {}
+        for name, value in zip(names, row):
+            if value is None:
+                continue
+            attributes[name] = dt.strptime(value, TIME_FMT) if name.endswith("_time") else value
+
+        return attributes
+
+    def getTimes(self, product_paths):
+        """
+        Returns catalogued acquisition start and end times of products, as arrays, read in one query per chunk of
+        products
+
+        :type product_paths: list
+        :param product_paths: Data product paths, must be catalogued
+
+        :return:
+            :start_times: *numpy.ndarray*
+
+            Acquisition start times of products, as *datetime64[us]*, NaT if undefined
+
+            :end_times: *numpy.ndarray*
+
+            Acquisition end times of products, as *datetime64[us]*, NaT if undefined
+        """
+
+        times = {}
+        for chunk in return_chunks(product_paths, CHUNK_SIZE):
+            cursor = self.connection.execute("SELECT product_path, start_time, end_time FROM products WHERE "
+                                             "product_path IN (%s)" % ", ".join(["?"] * len(chunk)), chunk)
+            for product_path, start_time, end_time in cursor:
+                times[product_path] = (start_time, end_time)
+
+        # Catalogue times in ISO 8601 format, so parsed by numpy
+        start_times = array([times[p][0] or "NaT" for p in product_paths], dtype="datetime64[us]")
+        end_times = array([times[p][1] or "NaT" for p in product_paths], dtype="datetime64[us]")
+
+        return start_times, end_times
+
+    def formatTime(self, time):
+        """
+        Returns time in catalogue format
+
+        :type time: datetime.datetime
+        :param time: Time
+
+        :return:
+            :time_string: *str*
+
+            Time string, None if time is None
+        """
+
+        return time.strftime(TIME_FMT) if time is not None else None
+
+    def close(self):
+        """
+        Closes connection to catalogue database
+        """
+
+        self.connection.close()
+
+
+if __name__ == "__main__":
+    pass
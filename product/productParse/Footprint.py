@@ -0,0 +1,104 @@
+"""
+Functions for reading product footprints from product metadata files, without opening the product
+"""
+
+'''___Built-In Modules___'''
+from os.path import exists
+try:
+    from xml.etree.cElementTree import iterparse, ParseError
+except ImportError:
+    from xml.etree.ElementTree import iterparse, ParseError
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+def read_element_text(xml_path, tag):
+    """
+    Return text of first element of xml file with given tag, by streaming parse - parsing stops at the element, and
+    parsed elements are cleared, so large metadata files are neither read in full nor held in memory
+
+    :type xml_path: str
+    :param xml_path: Path of xml file
+
+    :type tag: str
+    :param tag: Element tag, without namespace (e.g. "posList" for "gml:posList")
+
+    :return:
+        :text: *str*
+
+        Element text, None if no element with tag
+    """
+
+    for event, element in iterparse(xml_path, events=("end",)):
+        if element.tag.split("}")[-1] == tag:
+            return element.text
+        element.clear()
+
+    return None
+
+
+def pos_list2wkt(pos_list):
+    """
+    Return *Well Known Text* POLYGON of GML-style position list of *latitude longitude* pairs (as in Sentinel-3
+    ``gml:posList`` and Sentinel-2 ``EXT_POS_LIST`` footprints)
+
+    :type pos_list: str
+    :param pos_list: Whitespace separated *latitude longitude* pairs of polygon vertices
+
+    :return:
+        :wkt: *str*
+
+        Polygon, with *(longitude latitude)* vertices, closed
+    """
+
+    values = pos_list.split()
+    vertices = [(values[i+1], values[i]) for i in range(0, len(values) - 1, 2)]
+    if vertices[0] != vertices[-1]:
+        vertices.append(vertices[0])
+
+    return "POLYGON((%s))" % ", ".join("%s %s" % vertex for vertex in vertices)
+
+
+def read_footprint(xml_path, tag="posList"):
+    """
+    Return footprint of product from metadata file
+
+    :type xml_path: str
+    :param xml_path: Path of product metadata xml file (e.g. Sentinel-3 *xfdumanifest.xml*)
+
+    :type tag: str
+    :param tag: (optional) Tag of footprint position list element, default "posList"
+
+    :return:
+        :footprint: *str*
+
+        Footprint *Well Known Text* POLYGON, None if metadata file or footprint not found, or metadata file malformed
+    """
+
+    if not exists(xml_path):
+        return None
+
+    try:
+        pos_list = read_element_text(xml_path, tag)
+    except ParseError:
+        return None
+
+    if (pos_list is None) or (len(pos_list.split()) < 6):
+        return None
+
+    return pos_list2wkt(pos_list)
+
+
+if __name__ == "__main__":
+    pass
@@ -3,13 +3,16 @@ Gets data processing tool appropriate for a given eopy.dataIO.Product.Product ob
 """
 
 '''___Built-In Modules___'''
+import sys
 from glob import glob
-from os.path import basename, splitext, abspath, dirname
-import imp
+from os.path import basename, abspath, dirname, isdir
+from os.path import join as pjoin
 
 '''___Third-Party Modules___'''
 
 '''___NPL Modules___'''
+sys.path.append(pjoin(dirname(dirname(dirname(abspath(__file__)))), "utils"))
+from PluginRegistry import PluginRegistry
 
 '''___Authorship___'''
 __author__ = "Sam Hunt"
@@ -31,6 +34,10 @@ class ProductParsingTool:
 
             Return the appropriate parsing tool for a product data with a specified ``product_path``
 
+        ..py:method:: getRegistry(...):
+
+            Return process-wide registry of available parsing tools
+
         ..py:method:: getProcessingToolPaths(...):
 
             Return paths of all available in parsing tools in *eopy.dataParsing* package
@@ -51,26 +58,27 @@ class ProductParsingTool:
             *If no suitable tool found returns None*
         """
 
-        # Get paths of available parsing tools in eopy.dataParse package
-        parsingToolPaths = self.getParsingToolPaths()
+        # Get process-wide registry of available parsing tools in eopy.dataParse package
+        registry = self.getRegistry()
+
+        # Test to find if parsing tool can find appropriate parsing factory
+        def test(ParsingTool):
+            return ParsingTool().setParsingFactory(product_path) is not None
 
-        # Check if any found tools suitable for data product specified by product_path
-        for parsingToolPath in parsingToolPaths:
+        # Find parsing tool with pattern matching product path, or else any suitable parsing tool
+        return registry.resolve(product_path, test)
 
-            # Open specified parsing tool
-            parsingToolName = splitext(basename(parsingToolPath))[0]
-            parsingToolModule = imp.load_source(parsingToolName, parsingToolPath)
-            ParsingTool = getattr(parsingToolModule, parsingToolName)
+    def getRegistry(self):
+        """
+        Return process-wide registry of available parsing tools in *eopy.dataParse* package
 
-            # Test to find if parsing tool can find appropriate parsing factory
-            testParsingTool = ParsingTool()
-            testParsingFactory = testParsingTool.setParsingFactory(product_path)
+        :return:
+            :registry: *PluginRegistry*
 
-            # If test instantiation of parsing tool can find appropriate parsing factory return parsing tool
-            if testParsingFactory is not None:
-                return ParsingTool
+            Parsing tool registry
+        """
 
-        return None
+        return PluginRegistry.getRegistry("productParse", self.getParsingToolPaths)
 
     def getParsingToolPaths(self):
         """
@@ -90,7 +98,7 @@ class ProductParsingTool:
 
         # Search eopy.dataProcessing.* processor package for processing tools
         for tool_directory in glob(abspath(dataParsing_path + "/tools/*/")):
-            if (basename(tool_directory) != "__init__") and (basename(tool_directory) != "__pycache__"):
+            if isdir(tool_directory) and (basename(tool_directory) != "__pycache__"):
                 parsingToolPaths.append(abspath(glob(tool_directory + "/*Tool.py")[0]))
 
         return parsingToolPaths
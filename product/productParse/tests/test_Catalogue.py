@@ -0,0 +1,210 @@
+"""
+Catalogue class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os import makedirs, remove, utime
+from os.path import dirname
+from os.path import join as pjoin
+from datetime import datetime as dt
+from datetime import timedelta
+from tempfile import mkdtemp
+import shutil
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from Catalogue import Catalogue, return_product_paths, parse_product_path, stat_directory
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+OLCIL1_directories = ["S3A_OL_1_EFR____20161023T100950_20161023T101250_20161023T120602_0179_010_122_1979_SVL_O_NR_002.SEN3",
+                      "S3A_OL_1_EFR____20161125T100950_20161125T101250_20161125T120602_0179_011_122_1979_SVL_O_NR_002.SEN3",
+                      "S3A_OL_1_ERR____20161023T100950_20161023T101250_20161023T120602_0179_010_122_1979_SVL_O_NR_002.SEN3"]
+RadCalNet_files = ["RVUS00_2016_297_v00.00.output", "GONA01_2016_297_v00.00.output"]
+manifest = """<?xml version="1.0" encoding="UTF-8"?>
+<xfdu:XFDU xmlns:xfdu="urn:ccsds:schema:xfdu:1" xmlns:gml="http://www.opengis.net/gml">
+  <gml:posList>%s</gml:posList>
+</xfdu:XFDU>
+"""
+footprints = ["38.0 -116.0 38.0 -115.0 39.0 -115.0 39.0 -116.0", "38.0 -117.0 38.0 -115.0 40.0 -115.0 40.0 -117.0",
+              "38.0 -116.0 38.0 -115.0 39.0 -115.0 39.0 -116.0"]
+
+
+def setup():
+    archive = mkdtemp()
+
+    for i, directory in enumerate(OLCIL1_directories):
+        product_directory = pjoin(archive, "OLCI", str(i), directory)
+        makedirs(product_directory)
+        with open(pjoin(product_directory, "xfdumanifest.xml"), "w") as f:
+            f.write(manifest % footprints[i])
+
+    makedirs(pjoin(archive, "radcalnet"))
+    for name in RadCalNet_files + ["README.txt"]:
+        open(pjoin(archive, "radcalnet", name), "w").close()
+
+    return archive
+
+
+class TestCatalogue(unittest.TestCase):
+    def test_return_product_paths(self):
+        archive = setup()
+
+        product_paths = sorted(return_product_paths(archive))
+
+        self.assertEqual(6, len(product_paths))
+        self.assertEqual(pjoin(archive, "OLCI", "0", OLCIL1_directories[0], "xfdumanifest.xml"), product_paths[0])
+
+        shutil.rmtree(archive)
+
+    def test_parse_product_path(self):
+        attributes = parse_product_path(pjoin("archive", OLCIL1_directories[0], "xfdumanifest.xml"))
+
+        self.assertEqual("OL_1_EFR", attributes["product_string"])
+        self.assertEqual(dt(2016, 10, 23, 10, 9, 50), attributes["start_time"])
+        self.assertIsNone(parse_product_path(pjoin("archive", "README.txt")))
+
+    def test_addArchive(self):
+        archive = setup()
+        catalogue = Catalogue()
+
+        self.assertEqual(5, catalogue.addArchive(archive, processes=1))
+
+        product_path = pjoin(archive, "OLCI", "0", OLCIL1_directories[0], "xfdumanifest.xml")
+        self.assertEqual({"product_string": "OL_1_EFR",
+                          "start_time": dt(2016, 10, 23, 10, 9, 50),
+                          "end_time": dt(2016, 10, 23, 10, 12, 50),
+                          "creation_time": dt(2016, 10, 23, 12, 6, 2),
+                          "mission": "Sentinel-3A",
+                          "mission_type": "satellite",
+                          "instrument": "OLCI"}, catalogue.getAttributes(product_path))
+
+        catalogue.close()
+        shutil.rmtree(archive)
+
+    def test_addArchive_processes(self):
+        archive = setup()
+        catalogue = Catalogue()
+
+        self.assertEqual(5, catalogue.addArchive(archive, processes=2))
+        self.assertEqual(3, len(catalogue.query(mission="Sentinel-3A")))
+
+        catalogue.close()
+        shutil.rmtree(archive)
+
+    def test_query(self):
+        archive = setup()
+        catalogue = Catalogue()
+        catalogue.addArchive(archive, processes=1)
+
+        self.assertEqual([pjoin(archive, "OLCI", "0", OLCIL1_directories[0], "xfdumanifest.xml")],
+                         catalogue.query(product_string="OL_1_EFR", start=dt(2016, 10, 1), end=dt(2016, 11, 1)))
+        self.assertEqual(2, len(catalogue.query(product_string="OL_1_EFR")))
+
+        # RadCalNet products catalogued over whole day of acquisition
+        self.assertEqual([pjoin(archive, "radcalnet", "RVUS00_2016_297_v00.00.output")],
+                         catalogue.query(site="RVUS", start=dt(2016, 10, 23, 12), end=dt(2016, 10, 23, 13)))
+
+        self.assertRaises(ValueError, catalogue.query, product="OL_1_EFR")
+
+        catalogue.close()
+        shutil.rmtree(archive)
+
+    def test_getTimes(self):
+        archive = setup()
+        catalogue = Catalogue()
+        catalogue.addArchive(archive, processes=1)
+
+        product_paths = catalogue.query()
+        start_times, end_times = catalogue.getTimes(product_paths)
+
+        for product_path, start_time, end_time in zip(product_paths, start_times, end_times):
+            attributes = catalogue.getAttributes(product_path)
+            self.assertEqual(attributes["start_time"], start_time.astype(dt))
+            self.assertEqual(attributes["end_time"], end_time.astype(dt))
+
+        self.assertEqual(0, catalogue.getTimes([])[0].size)
+
+        catalogue.close()
+        shutil.rmtree(archive)
+
+    def test_stat_directory(self):
+        archive = setup()
+
+        stats = stat_directory(pjoin(archive, "radcalnet"))
+
+        self.assertEqual(3, len(stats))
+        self.assertEqual(0, stats[0][1])
+
+        shutil.rmtree(archive)
+
+    def test_addArchive_incremental(self):
+        archive = setup()
+        catalogue = Catalogue()
+        catalogue.addArchive(archive, processes=1)
+
+        # Unchanged archive not re-parsed
+        self.assertEqual(0, catalogue.addArchive(archive, processes=1, incremental=True))
+
+        # One product changed, one deleted, one added
+        utime(pjoin(archive, "radcalnet", RadCalNet_files[0]), (0, 0))
+        remove(pjoin(archive, "radcalnet", RadCalNet_files[1]))
+        open(pjoin(archive, "radcalnet", "LCFR01_2016_297_v00.00.output"), "w").close()
+
+        self.assertEqual(2, catalogue.addArchive(archive, processes=2, incremental=True))
+        self.assertEqual([], catalogue.query(site="GONA"))
+        self.assertEqual(1, len(catalogue.query(site="LCFR")))
+        self.assertEqual(5, len(catalogue.query()))
+        self.assertEqual(6, len(catalogue.getEntries(archive)))
+
+        catalogue.close()
+        shutil.rmtree(archive)
+
+    def test_query_point(self):
+        archive = setup()
+        catalogue = Catalogue()
+        catalogue.addArchive(archive, processes=1, detail="max")
+
+        product_paths = [pjoin(archive, "OLCI", str(i), directory, "xfdumanifest.xml")
+                         for i, directory in enumerate(OLCIL1_directories)]
+        time = dt(2016, 10, 23, 12)
+
+        self.assertEqual([product_paths[0], product_paths[2], product_paths[1]], catalogue.query(point=(-115.5, 38.5)))
+        self.assertEqual([product_paths[1]], catalogue.query(point=(-116.5, 39.5)))
+        self.assertEqual([product_paths[0]], catalogue.query(point=(-115.5, 38.5), product_string="OL_1_EFR",
+                                                             start=time - timedelta(hours=2),
+                                                             end=time + timedelta(hours=2)))
+        self.assertEqual([], catalogue.query(point=(-115.5, 38.5), start=time + timedelta(hours=2),
+                                             end=time + timedelta(hours=4)))
+
+        catalogue.close()
+        shutil.rmtree(archive)
+
+    def test_Catalogue_persisted(self):
+        archive = setup()
+        catalogue_path = pjoin(archive, "catalogue.db")
+        catalogue = Catalogue(catalogue_path)
+        catalogue.addArchive(archive, processes=1)
+        catalogue.close()
+
+        catalogue = Catalogue(catalogue_path)
+        self.assertEqual(5, len(catalogue.query()))
+
+        catalogue.close()
+        shutil.rmtree(archive)
+
+
+if __name__ == "__main__":
+    unittest.main()
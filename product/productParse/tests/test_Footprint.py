@@ -0,0 +1,73 @@
+"""
+Footprint functions test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+from os.path import join as pjoin
+from tempfile import mkdtemp
+import shutil
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from Footprint import read_element_text, pos_list2wkt, read_footprint
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+manifest = """<?xml version="1.0" encoding="UTF-8"?>
+<xfdu:XFDU xmlns:xfdu="urn:ccsds:schema:xfdu:1" xmlns:gml="http://www.opengis.net/gml"
+           xmlns:sentinel-safe="http://www.esa.int/safe/sentinel/1.1">
+  <metadataSection>
+    <metadataObject ID="measurementFrameSet">
+      <sentinel-safe:frameSet>
+        <sentinel-safe:footPrint srsName="http://www.opengis.net/gml/srs/epsg.xml#4326">
+          <gml:posList>10.0 20.0 10.0 21.0 11.0 21.0 11.0 20.0</gml:posList>
+        </sentinel-safe:footPrint>
+      </sentinel-safe:frameSet>
+    </metadataObject>
+  </metadataSection>
+</xfdu:XFDU>
+"""
+
+
+class TestFootprint(unittest.TestCase):
+    def test_pos_list2wkt(self):
+        self.assertEqual("POLYGON((20.0 10.0, 21.0 10.0, 21.0 11.0, 20.0 10.0))",
+                         pos_list2wkt("10.0 20.0 10.0 21.0 11.0 21.0"))
+
+    def test_read_footprint(self):
+        directory = mkdtemp()
+        xml_path = pjoin(directory, "xfdumanifest.xml")
+        with open(xml_path, "w") as f:
+            f.write(manifest)
+
+        self.assertEqual("10.0 20.0 10.0 21.0 11.0 21.0 11.0 20.0", read_element_text(xml_path, "posList"))
+        self.assertIsNone(read_element_text(xml_path, "EXT_POS_LIST"))
+        self.assertEqual("POLYGON((20.0 10.0, 21.0 10.0, 21.0 11.0, 20.0 11.0, 20.0 10.0))", read_footprint(xml_path))
+
+        shutil.rmtree(directory)
+
+    def test_read_footprint_missing(self):
+        directory = mkdtemp()
+        open(pjoin(directory, "empty.xml"), "w").close()
+
+        self.assertIsNone(read_footprint(pjoin(directory, "xfdumanifest.xml")))
+        self.assertIsNone(read_footprint(pjoin(directory, "empty.xml")))
+
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+"""
+Parsing factory for Sentinel-2 MSI L1C products with a given path
+"""
+
+'''___Built-In Modules___'''
+import sys
+from os.path import dirname, basename
+from os.path import join as pjoin
+from datetime import datetime as dt
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+dataParsing_directory = dirname(dirname(dirname(__file__)))
+sys.path.append(dataParsing_directory)
+from AbstractParsingFactory import AbstractParsingFactory
+from Footprint import read_footprint
+
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+class MSIL1ParsingFactory(AbstractParsingFactory):
+    """
+    MSIL1ParsingFactory is a sub-class of *AbstractParsingFactory* for parsing metadata for Sentinel-2 MSI L1C
+    products, named by the compact naming convention, from their product path
+
+    :Methods:
+
+        .. py:method:: parseProduct(...):
+
+            Returns dictionary of parsed product metadata for MSI L1C products.
+
+            :inherited from eopy.dataProcessing.AbstractProcessingFactory.AbstractProcessingFactory:
+
+                .. py:method:: __init__():
+
+                    Initialises the class
+    """
+
+    def parseProduct(self, product_path, detail="min", **kwargs):
+        """
+        Returns dictionary of parsed product metadata.
+
+        :type product_path: str
+        :param product_path: Data product path
+
+        :type detail: str
+        :param detail: Can take values:
+
+        * "min" (default) - only information available with filename parsed.
+        * "max" - information available in metadata files also parsed, but with opening the product - i.e. tile
+          footprint (WKT POLYGON) from product metadata file (e.g. *MTD_MSIL1C.xml*).
+
+        :type kwargs: -
+        :param kwargs: Parsing parameters
+
+        :return:
+            :attributes: *dict*
+
+            Dictionary of parsed product metadata.
+        """
+
+        attributes = {}
+
+        path = basename(dirname(product_path))
+
+        # > product attributes
+        # -- product type string
+        attributes["product_string"] = path[4:10]
+        # -- acquisition data
+        time_fmt = "%Y%m%d"
+        attributes["date"] = dt.strptime(path[11:19], time_fmt)
+        # -- acquisition time (datatake sensing start)
+        time_fmt = "%Y%m%dT%H%M%S"
+        attributes["start_time"] = dt.strptime(path[11:26], time_fmt)
+        # -- processing baseline
+        attributes["processing_baseline"] = path[28:30] + "." + path[30:32]
+        # -- relative orbit
+        attributes["relative_orbit"] = int(path[34:37])
+        # -- tile
+        attributes["tile"] = path[39:44]
+
+        # > mission attributes
+        #  -- mission
+        attributes["mission"] = "Sentinel-2"+path[2]
+        # -- mission type
+        attributes["mission_type"] = "satellite"
+        # -- instrument
+        attributes["instrument"] = "MSI"
+
+        # > footprint
+        if detail == "max":
+            attributes["footprint"] = read_footprint(pjoin(dirname(product_path),
+                                                           "MTD_" + attributes["product_string"] + ".xml"),
+                                                     tag="EXT_POS_LIST")
+
+        return attributes
+
+
+if __name__ == "__main__":
+    pass
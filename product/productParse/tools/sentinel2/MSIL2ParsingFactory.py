@@ -0,0 +1,45 @@
+"""
+Parsing factory for Sentinel-2 MSI L2A products with a given path
+"""
+
+'''___Built-In Modules___'''
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(__file__))
+from MSIL1ParsingFactory import MSIL1ParsingFactory
+
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+class MSIL2ParsingFactory(MSIL1ParsingFactory):
+    """
+    MSIL2ParsingFactory is a sub-class of *MSIL1ParsingFactory* for parsing metadata for Sentinel-2 MSI L2A products,
+    named by the compact naming convention, from their product path. L2A product names and metadata follow those of
+    L1C products, so are parsed the same.
+
+    :Methods:
+
+        :inherited from eopy.dataParse.tools.sentinel2.MSIL1ParsingFactory.MSIL1ParsingFactory:
+
+            .. py:method:: parseProduct(...):
+
+                Returns dictionary of parsed product metadata for MSI products.
+    """
+
+    pass
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,100 @@
+"""
+Parsing tool for extracting information from a given Sentinel-2 product_path
+"""
+
+'''___Built-In Modules___'''
+import sys
+from os.path import dirname, basename
+import re
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+dataParsing_directory = dirname(dirname(dirname(__file__)))
+sys.path.append(dataParsing_directory)
+from AbstractParsingTool import AbstractParsingTool
+
+sys.path.append(dirname(__file__))
+from MSIL1ParsingFactory import MSIL1ParsingFactory
+from MSIL2ParsingFactory import MSIL2ParsingFactory
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+class Sentinel2ParsingTool(AbstractParsingTool):
+    """
+    Sentinel2ParsingTool is a sub-class of AbstractParsingTool for extracting information from a given Sentinel-2
+    product path
+
+    :Attributes:
+
+        .. py:attribute:: parsingFactory
+
+            *obj*
+
+            Instance of sub-class of *eopy.dataParse.AbstractParsingFactory.AbstractParsingFactory* for
+            extracting information from a given Sentinel-2 of a particular type
+
+    :Methods:
+        .. py:method:: setParsingFactory(...):
+
+            Returns parsingFactory for data product with given ``product_path``.
+
+            *If no suitable factory in parsing tool implementation available returns None*
+
+        :Inherited from eopy.dataProcessing.AbstractProcessingTool.AbstractProcessingTool:
+
+            .. py:method:: __init__(...):
+
+                Initialises parsing tool
+
+            .. py:method:: parseProduct(...):
+
+                Returns dictionary of parsed product metadata.
+    """
+
+    def setParsingFactory(self, product_path):
+        """
+        Returns parsingFactory for data product with given ``product_path``.
+
+        *If no suitable factory in parsing tool implementation available returns None*
+
+        :type product_path: str
+        :param product_path: Data product path, path of file in product *.SAFE* directory (e.g. *manifest.safe*)
+
+        :return:
+            :ParsingFactory: *eopy.dataParse.AbstractParsingFactory.AbstractParsingFactory*
+
+            Parsing factory suitable for Sentinel-2 input ``product_path``
+
+            *If no suitable parsing factory implementations available returns None*
+        """
+
+        # Test if directory name matches any sentinel-2 parsing factory inputs
+
+        # > Get directory of product
+        product_directory = basename(dirname(product_path))
+
+        # > Possible regular expression for Sentinel-2 products, compact naming convention
+        MSIL1_pattern = re.compile(r"S2._MSIL1C_\d{8}T\d{6}_N\d{4}_R\d{3}_T\w{5}_\d{8}T\d{6}.SAFE")     # MSI L1C
+        MSIL2_pattern = re.compile(r"S2._MSIL2A_\d{8}T\d{6}_N\d{4}_R\d{3}_T\w{5}_\d{8}T\d{6}.SAFE")     # MSI L2A
+
+        # > Check if input product_path matches any Sentinel-2 product regular expressions
+        #   return parsingFactory as appropriate
+        if MSIL1_pattern.match(product_directory):
+            return MSIL1ParsingFactory
+        elif MSIL2_pattern.match(product_directory):
+            return MSIL2ParsingFactory
+
+        return None
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,34 @@
+"""
+Test MSI L1C product path and parsed attributes, for testing sentinel2 parsing tool
+"""
+
+'''___Built-In Modules___'''
+from datetime import datetime as dt
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+MSIL1_test_path = "S2A_MSIL1C_20170105T013442_N0204_R031_T53NMJ_20170105T013443.SAFE/manifest.safe"
+
+MSIL1_test_attributes = {"product_string": "MSIL1C",
+                         "date": dt(2017, 1, 5),
+                         "start_time": dt(2017, 1, 5, 1, 34, 42),
+                         "processing_baseline": "02.04",
+                         "relative_orbit": 31,
+                         "tile": "53NMJ",
+                         "mission": "Sentinel-2A",
+                         "mission_type": "satellite",
+                         "instrument": "MSI"}
+
+if __name__ == "__main__":
+    pass
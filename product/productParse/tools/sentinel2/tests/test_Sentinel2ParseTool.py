@@ -0,0 +1,84 @@
+"""
+Test class for Sentinel2ParseTool
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os import makedirs
+from os.path import dirname
+from os.path import join as pjoin
+from tempfile import mkdtemp
+import shutil
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(__file__))
+dataParse_directory = dirname(dirname(dirname(dirname(__file__))))
+sys.path.append(dataParse_directory)
+
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+metadata = """<?xml version="1.0" encoding="UTF-8"?>
+<n1:Level-1C_User_Product xmlns:n1="https://psd-14.sentinel2.eo.esa.int/PSD/User_Product_Level-1C.xsd">
+  <n1:Geometric_Info>
+    <Product_Footprint>
+      <Product_Footprint>
+        <Global_Footprint>
+          <EXT_POS_LIST>1.8 135.0 1.8 136.0 0.8 136.0 0.8 135.0 1.8 135.0 </EXT_POS_LIST>
+        </Global_Footprint>
+      </Product_Footprint>
+    </Product_Footprint>
+  </n1:Geometric_Info>
+</n1:Level-1C_User_Product>
+"""
+
+
+class TestSentinel2ParsingTool(unittest.TestCase):
+    def test_parse_MSIL1(self):
+        from test_MSIL1_parse_data import MSIL1_test_path, MSIL1_test_attributes
+        from Parse import Parse
+
+        s2parse = Parse(MSIL1_test_path)
+
+        # Assert parsed attributes are the same as the true attributes
+        self.assertEqual(MSIL1_test_attributes, s2parse.attributes)
+
+    def test_parse_MSIL1_footprint(self):
+        from test_MSIL1_parse_data import MSIL1_test_path
+        from Parse import Parse
+
+        directory = mkdtemp()
+        makedirs(pjoin(directory, dirname(MSIL1_test_path)))
+        with open(pjoin(directory, dirname(MSIL1_test_path), "MTD_MSIL1C.xml"), "w") as f:
+            f.write(metadata)
+
+        s2parse = Parse(pjoin(directory, MSIL1_test_path), detail="max")
+
+        self.assertEqual("POLYGON((135.0 1.8, 136.0 1.8, 136.0 0.8, 135.0 0.8, 135.0 1.8))",
+                         s2parse.attributes["footprint"])
+
+        shutil.rmtree(directory)
+
+    def test_parse_MSIL2(self):
+        from test_MSIL1_parse_data import MSIL1_test_path
+        from Parse import Parse
+
+        s2parse = Parse(MSIL1_test_path.replace("MSIL1C", "MSIL2A"))
+
+        self.assertEqual("MSIL2A", s2parse.attributes["product_string"])
+        self.assertEqual("Sentinel-2A", s2parse.attributes["mission"])
+
+
+if __name__ == "__main__":
+    unittest.main()
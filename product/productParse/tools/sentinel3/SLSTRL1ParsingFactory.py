@@ -0,0 +1,44 @@
+"""
+Parsing factory for Sentinel-3 SLSTR L1 products with a given path
+"""
+
+'''___Built-In Modules___'''
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(__file__))
+from Sentinel3ParsingFactory import Sentinel3ParsingFactory
+
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+class SLSTRL1ParsingFactory(Sentinel3ParsingFactory):
+    """
+    SLSTRL1ParsingFactory is a sub-class of *Sentinel3ParsingFactory* for parsing metadata for SLSTR L1 (SL_1_RBT)
+    products, from their product path
+
+    :Methods:
+
+        :inherited from eopy.dataParse.tools.sentinel3.Sentinel3ParsingFactory.Sentinel3ParsingFactory:
+
+            .. py:method:: parseProduct(...):
+
+                Returns dictionary of parsed product metadata for Sentinel-3 products.
+    """
+
+    INSTRUMENT = "SLSTR"
+
+
+if __name__ == "__main__":
+    pass
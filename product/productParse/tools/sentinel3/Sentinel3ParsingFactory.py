@@ -0,0 +1,115 @@
+"""
+Parsing factory for Sentinel-3 products with a given path, by the Sentinel-3 product naming convention
+"""
+
+'''___Built-In Modules___'''
+import sys
+from os.path import dirname, basename
+from os.path import join as pjoin
+from datetime import datetime as dt
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+dataParsing_directory = dirname(dirname(dirname(__file__)))
+sys.path.append(dataParsing_directory)
+from AbstractParsingFactory import AbstractParsingFactory
+from Footprint import read_footprint
+
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+class Sentinel3ParsingFactory(AbstractParsingFactory):
+    """
+    Sentinel3ParsingFactory is a sub-class of *AbstractParsingFactory* for parsing metadata for Sentinel-3 products, from
+    their product path. All Sentinel-3 product directory names follow the same naming convention, so products of all
+    types are parsed to the same attribute schema - sub-classes define only the product instrument.
+
+    :Attributes:
+
+        .. py:attribute:: INSTRUMENT
+
+            *str*
+
+            Instrument of products parsed
+
+    :Methods:
+
+        .. py:method:: parseProduct(...):
+
+            Returns dictionary of parsed product metadata for Sentinel-3 products.
+
+            :inherited from eopy.dataProcessing.AbstractProcessingFactory.AbstractProcessingFactory:
+
+                .. py:method:: __init__():
+
+                    Initialises the class
+    """
+
+    INSTRUMENT = None
+
+    def parseProduct(self, product_path, detail="min", **kwargs):
+        """
+        Returns dictionary of parsed product metadata.
+
+        :type product_path: str
+        :param product_path: Data product path
+
+        :type detail: str
+        :param detail: Can take values:
+
+        * "min" (default) - only information available with filename parsed.
+        * "max" - information available in metadata files also parsed, but with opening the product - i.e. product
+          footprint (WKT POLYGON) from *xfdumanifest.xml*.
+
+        :type kwargs: -
+        :param kwargs: Parsing parameters
+
+        :return:
+            :attributes: *dict*
+
+            Dictionary of parsed product metadata.
+        """
+
+        attributes = {}
+
+        path = basename(dirname(product_path))
+
+        # > product attributes
+        # -- product type string
+        attributes["product_string"] = path[4:12]
+        # -- acquisition data
+        time_fmt = "%Y%m%d"
+        attributes["date"] = dt.strptime(path[16:24], time_fmt)
+        # -- acquisition time
+        time_fmt = "%Y%m%dT%H%M%S"
+        attributes["start_time"] = dt.strptime(path[16:31], time_fmt)
+        attributes["end_time"] = dt.strptime(path[32:47], time_fmt)
+        # -- creation time
+        attributes["creation_time"] = dt.strptime(path[48:63], time_fmt)
+
+        # > mission attributes
+        #  -- mission
+        attributes["mission"] = "Sentinel-3"+path[2]
+        # -- mission type
+        attributes["mission_type"] = "satellite"
+        # -- instrument
+        attributes["instrument"] = self.INSTRUMENT
+
+        # > footprint
+        if detail == "max":
+            attributes["footprint"] = read_footprint(pjoin(dirname(product_path), "xfdumanifest.xml"))
+
+        return attributes
+
+
+if __name__ == "__main__":
+    pass
@@ -4,8 +4,8 @@ Parsing tool for extracting information from a given Sentinel-3 product_path
 
 '''___Built-In Modules___'''
 import sys
-from os.path import dirname, basename
-import re
+from os.path import dirname, basename, abspath
+from os.path import join as pjoin
 
 '''___Third-Party Modules___'''
 
@@ -16,6 +16,13 @@ from AbstractParsingTool import AbstractParsingTool
 
 sys.path.append(dirname(__file__))
 from OLCIL1ParsingFactory import OLCIL1ParsingFactory
+from OLCIL2ParsingFactory import OLCIL2ParsingFactory
+from SLSTRL1ParsingFactory import SLSTRL1ParsingFactory
+from SLSTRL2ParsingFactory import SLSTRL2ParsingFactory
+from SYNParsingFactory import SYNParsingFactory
+
+sys.path.append(pjoin(dirname(dirname(dirname(dirname(dirname(abspath(__file__)))))), "utils"))
+from Sentinel3Naming import return_product_type
 
 '''___Authorship___'''
 __author__ = "Sam Hunt"
@@ -27,6 +34,19 @@ __email__ = "sam.hunt@npl.co.uk"
 __status__ = "Development"
 
 
+# Parsing factory of each Sentinel-3 product type (see Sentinel3Naming.SENTINEL3_PRODUCT_TYPES)
+SENTINEL3_PARSING_FACTORIES = {"OLCIL1": OLCIL1ParsingFactory,
+                               "OLCIL2L": OLCIL2ParsingFactory,
+                               "OLCIL2W": OLCIL2ParsingFactory,
+                               "SLSTRL1": SLSTRL1ParsingFactory,
+                               "SLSTRL2LST": SLSTRL2ParsingFactory,
+                               "SLSTRL2WST": SLSTRL2ParsingFactory,
+                               "SLSTRL2WCT": SLSTRL2ParsingFactory,
+                               "SYNL1": SYNParsingFactory,
+                               "SYNL2": SYNParsingFactory,
+                               "SYNVGT": SYNParsingFactory}
+
+
 class Sentinel3ParsingTool(AbstractParsingTool):
     """
     Sentinel3ParsingTool is a sub-class of AbstractParsingTool for extracting information from a given Sentinel-3
@@ -76,58 +96,8 @@ class Sentinel3ParsingTool(AbstractParsingTool):
             *If no suitable parsing factory implementations available returns None*
         """
 
-        # Test if directory name matches any sentinel-3 parsing factory inputs
-
-        # > Get directory of product
-        product_directory = basename(dirname(product_path))
-
-        # > Possible regular expression for Sentinel-3 products
-        OLCIL1_pattern = re.compile(r"S3.?_OL_1_E[RF]R_.*.SEN3")     # OLCI L1b
-        OLCIL2L_pattern = re.compile(r"S3.?_OL_2_(L[FR]R)_.*.SEN3")  # OLCI L2 L
-        OLCIL2W_pattern = re.compile(r"S3.?_OL_2_(W[FR]R)_.*.SEN3")  # OLCI L2 W
-        SLSTRL1_pattern = re.compile(r"S3.?_SL_1_RBT.*")             # SLSTR L1
-        SLSTRL2LST_pattern = re.compile(r"S3.?_SL_2_LST_.*.SEN3")    # SLSTR L2 LST
-        SLSTRL2WST_pattern = re.compile(r"S3.?_SL_2_WST_.*.SEN3")    # SLSTR L2 WST
-        SLSTRL2WCT_pattern = re.compile(r"S3.?_SL_2_WCT_.*.SEN3")    # SLSTR L2 WCT
-        SYNL1_pattern = re.compile(r"S3.?_SY_1_SYN_.*")              # SYN L1
-        SYNL2_pattern = re.compile(r"S3.?_SY_2_SYN_.*.SEN3")         # SYN L2
-        SYNVGT_pattern = re.compile(r"S3.?_SY_2_SYN_.*.SEN3")        # SYN VGT
-
-        # > Check if input product_path matches any Sentinel-3 product regular expressions
-        #   return parsingFactory as appropriate
-        if OLCIL1_pattern.match(product_directory):
-            return OLCIL1ParsingFactory
-        elif OLCIL2L_pattern.match(product_directory):
-            # TODO - Write OLCI L1b parsing factory
-            return None
-        elif OLCIL2W_pattern.match(product_directory):
-            # TODO - Write OLCI L2 L parsing factory
-            return None
-        elif SLSTRL1_pattern.match(product_directory):
-            # TODO - Write OLCI L2 W parsing factory
-            return None
-        elif SLSTRL2LST_pattern.match(product_directory):
-            # TODO - Write SLSTR L1 parsing factory
-            return None
-        elif SLSTRL2WST_pattern.match(product_directory):
-            # TODO - Write SLSTR L2 LST parsing factory
-            return None
-        elif SLSTRL2WCT_pattern.match(product_directory):
-            # TODO - Write SLSTR L2 WCT parsing factory
-            return None
-        elif SYNL1_pattern.match(product_directory):
-            # TODO - Write SYN L1 parsing factory
-            return None
-        elif SYNL2_pattern.match(product_directory):
-            # TODO - Write SYN L2 parsing factory
-            return None
-        elif SYNVGT_pattern.match(product_directory):
-            # TODO - Write SYN VGT parsing factory
-            return None
-        else:
-            return None
-
-        return None
+        # Test if directory name matches any sentinel-3 parsing factory inputs, by one lookup of product type
+        return SENTINEL3_PARSING_FACTORIES.get(return_product_type(basename(dirname(product_path))), None)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,75 @@
+"""
+Test class for Sentinel3ParsingFactory sub-classes, through Sentinel3ParsingTool
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+from datetime import datetime as dt
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from Sentinel3ParsingTool import Sentinel3ParsingTool
+from OLCIL1ParsingFactory import OLCIL1ParsingFactory
+from OLCIL2ParsingFactory import OLCIL2ParsingFactory
+from SLSTRL1ParsingFactory import SLSTRL1ParsingFactory
+from SLSTRL2ParsingFactory import SLSTRL2ParsingFactory
+from SYNParsingFactory import SYNParsingFactory
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+name_suffix = "____20161023T100950_20161023T101250_20161023T120602_0179_010_122_1979_SVL_O_NR_002.SEN3/xfdumanifest.xml"
+
+test_factories = {"OL_1_EFR": (OLCIL1ParsingFactory, "OLCI"),
+                  "OL_2_WFR": (OLCIL2ParsingFactory, "OLCI"),
+                  "OL_2_LFR": (OLCIL2ParsingFactory, "OLCI"),
+                  "SL_1_RBT": (SLSTRL1ParsingFactory, "SLSTR"),
+                  "SL_2_LST": (SLSTRL2ParsingFactory, "SLSTR"),
+                  "SL_2_WST": (SLSTRL2ParsingFactory, "SLSTR"),
+                  "SY_2_SYN": (SYNParsingFactory, "SYN"),
+                  "SY_2_VGP": (SYNParsingFactory, "SYN")}
+
+
+class TestSentinel3ParsingFactory(unittest.TestCase):
+    def test_setParsingFactory(self):
+        tool = Sentinel3ParsingTool()
+        for product_string, (factory, instrument) in test_factories.items():
+            self.assertEqual(factory, tool.setParsingFactory("S3A_" + product_string + name_suffix), product_string)
+
+        self.assertIsNone(tool.setParsingFactory("S3A_OL_1_XXX" + name_suffix))
+        self.assertIsNone(tool.setParsingFactory("S2A_MSIL1C_20170105T013442_N0204_R031_T53NMJ_20170105T013443.SAFE/"
+                                                 "manifest.safe"))
+
+    def test_parseProduct(self):
+        keys = None
+        for product_string, (factory, instrument) in test_factories.items():
+            attributes = factory().parseProduct("S3B_" + product_string + name_suffix)
+
+            # All product types parsed to the same attribute schema
+            if keys is None:
+                keys = sorted(attributes.keys())
+            self.assertEqual(keys, sorted(attributes.keys()), product_string)
+
+            self.assertEqual(product_string, attributes["product_string"])
+            self.assertEqual(instrument, attributes["instrument"])
+            self.assertEqual("Sentinel-3B", attributes["mission"])
+            self.assertEqual("satellite", attributes["mission_type"])
+            self.assertEqual(dt(2016, 10, 23), attributes["date"])
+            self.assertEqual(dt(2016, 10, 23, 10, 9, 50), attributes["start_time"])
+            self.assertEqual(dt(2016, 10, 23, 10, 12, 50), attributes["end_time"])
+            self.assertEqual(dt(2016, 10, 23, 12, 6, 2), attributes["creation_time"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -106,6 +106,11 @@ class AbstractProcessingTool:
         # Use processingFactory method processProduct() to process data product
         product_processed = self.processingFactory.processProduct(product, **kwargs)
 
+        # Index variables and sub-products of processed product[s] by name
+        for p in (product_processed if type(product_processed) == list else [product_processed]):
+            if hasattr(p, "updateIndex"):
+                p.updateIndex()
+
         return product_processed
 
 
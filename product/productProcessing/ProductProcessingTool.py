@@ -3,14 +3,16 @@ Gets data processing tool appropriate for a given eopy.product.productIO.Product
 """
 
 '''___Built-In Modules___'''
+import sys
 from glob import glob
-from os.path import basename, splitext, abspath, basename
+from os.path import basename, abspath, dirname
 from os.path import join as pjoin
-import imp
 
 '''___Third-Party Modules___'''
 
 '''___NPL Modules___'''
+sys.path.append(pjoin(dirname(dirname(dirname(abspath(__file__)))), "utils"))
+from PluginRegistry import PluginRegistry
 
 '''___Authorship___'''
 __author__ = "Sam Hunt"
@@ -57,26 +59,17 @@ class ProductProcessingTool:
             *If no suitable tool found returns None*
         """
 
-        # Get paths of available tools in eopy.dataProcessing.* processor package
-        processingToolPaths = self.getProcessingToolPaths(processor_directory)
+        # Get process-wide registry of available tools in eopy.dataProcessing.* processor package
+        processor_directory = abspath(processor_directory)
+        registry = PluginRegistry.getRegistry(processor_directory,
+                                              lambda: self.getProcessingToolPaths(processor_directory))
 
-        # Check if any found tools suitable for data product specified by product_string
-        for processingToolPath in processingToolPaths:
+        # Test to find if process tool can find appropriate processing factory
+        def test(ProcessingTool):
+            return ProcessingTool().setProcessingFactory(product_string) is not None
 
-            # Open specified processing tool
-            processingToolName = splitext(basename(processingToolPath))[0]
-            processingToolModule = imp.load_source(processingToolName, processingToolPath)
-            ProcessingTool = getattr(processingToolModule, processingToolName)
-
-            # Test to find if process tool can find appropriate processing factory
-            testProcessingTool = ProcessingTool()
-            testProcessingFactory = testProcessingTool.setProcessingFactory(product_string)
-
-            # If test instantiation of processing tool can find appropriate processing factory return processing tool
-            if testProcessingFactory is not None:
-                return ProcessingTool
-
-        return None
+        # Processing tool suitability only depends on product_string, so memoise resolved tool by product_string
+        return registry.resolve(product_string, test, key=product_string)
 
     def getProcessingToolPaths(self, processor_directory):
         """
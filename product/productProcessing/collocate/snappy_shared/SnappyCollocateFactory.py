@@ -4,7 +4,8 @@ Collocate factory for *eopy.product.productIO.Product.Product* objects which con
 
 '''___Built-In Modules___'''
 import sys
-from os.path import dirname
+from os.path import dirname, abspath
+from os.path import join as pjoin
 from copy import deepcopy
 import re
 
@@ -15,6 +16,14 @@ import jpy
 '''___NPL Modules___'''
 sys.path.append(dirname(dirname(__file__)))
 from AbstractProcessingFactory import AbstractProcessingFactory
+sys.path.append(dirname(__file__))
+from SnappyCollocatedProduct import SnappyCollocatedProduct
+sys.path.append(pjoin(dirname(dirname(dirname(dirname(abspath(__file__))))), "productIO", "snappy_shared"))
+import SnappyGeolocation
+from SnappyLazyProduct import return_snap_product
+sys.path.append(pjoin(dirname(dirname(dirname(dirname(dirname(abspath(__file__)))))), "utils"))
+from CollocationIndex import CollocationIndex, RESAMPLING_METHODS
+from CollocationIndexCache import CollocationIndexCache
 
 from eopy import Product
 
@@ -47,6 +56,14 @@ class SnappyCollocateFactory(AbstractProcessingFactory):
 
             Returns *snappy.Product* product collocated with master product
 
+        .. py:method:: returnCollocationIndex(...):
+
+            Returns collocation index of product pixels on master product grid
+
+        .. py:method:: snapCollocateProducts(...):
+
+            Returns *snappy.Product* product collocated with master product by snap *Collocate* operator
+
         .. py:method:: updateProductVariablesAttributes(...):
 
             Return updates variables attribute of processed *eopy.product.productIO.Product.Product* product attribute.
@@ -100,6 +117,11 @@ class SnappyCollocateFactory(AbstractProcessingFactory):
         * "bisinc_interpolation"
         * "bicubic_interpolation"
 
+        :type collocation_cache: str
+        :param collocation_cache: (optional) directory of on-disk cache of collocation indices, to reuse in later runs
+        collocating products with the same geolocation (default from *EOPY_COLLOCATION_CACHE* environment variable,
+        if undefined no cache). Cache size limited by *EOPY_COLLOCATION_CACHE_SIZE* environment variable (bytes).
+
         :return:
             :product_processed: *eopy.product.productIO.Product.Product*
 
@@ -119,13 +141,15 @@ class SnappyCollocateFactory(AbstractProcessingFactory):
 
         master_product = kwargs["master"]
         resampling = kwargs["resampling"] if "resampling" in kwargs.keys() else "nearest_neighbour"
+        collocation_cache = kwargs["collocation_cache"] if "collocation_cache" in kwargs.keys() else None
 
         for i, (p, m_p) in enumerate(zip(product.product, master_product.product)):
 
             # Collocate products
             product_processed.product[i]["product_name"] = self.updateProductName(p["product_name"])
             product_processed.product[i]["product"] = self.collocateProducts(p["product"], m_p["product"],
-                                                                             resampling=resampling)
+                                                                             resampling=resampling,
+                                                                             collocation_cache=collocation_cache)
             product_processed.product[i]["variables"] = self.updateProductVariablesAttributes(p["variables"])
 
         ################################################################################################################
@@ -167,10 +191,14 @@ class SnappyCollocateFactory(AbstractProcessingFactory):
 
         return original_product_name
 
-    def collocateProducts(self, product, master, resampling="nearest_neighbour"):
+    def collocateProducts(self, product, master, resampling="nearest_neighbour", collocation_cache=None):
         """
         Returns *snappy.Product* product collocated with master product
 
+        Nearest neighbour and bilinear interpolation collocation is performed in memory - a lookup of product pixels
+        for each master pixel is built once from the geolocation of both products, and applied to the pixels of each
+        variable read (see *SnappyCollocatedProduct*). Other resampling methods use the snap *Collocate* operator.
+
         :type product: *snappy.Product*
         :param product: In-memory data product
 
@@ -186,12 +214,94 @@ class SnappyCollocateFactory(AbstractProcessingFactory):
         * "bisinc_interpolation"
         * "bicubic_interpolation"
 
+        :type collocation_cache: str
+        :param collocation_cache: (optional) directory of on-disk cache of collocation indices
+
         :return:
             :product_processed: *snappy.Product*
 
             Collocated data product
         """
 
+        if resampling in RESAMPLING_METHODS:
+            index = self.returnCollocationIndex(product, master, resampling, collocation_cache=collocation_cache)
+            if index is not None:
+                return SnappyCollocatedProduct(product, master, index, resampling, self.snapCollocateProducts)
+
+        return self.snapCollocateProducts(product, master, resampling=resampling)
+
+    def returnCollocationIndex(self, product, master, resampling, collocation_cache=None):
+        """
+        Returns collocation index of product pixels on master product grid, read from the on-disk collocation index
+        cache if available, otherwise built from the product geolocation index (and written to the cache)
+
+        :type product: *snappy.Product*
+        :param product: In-memory data product
+
+        :type master: *snappy.Product*
+        :param master: Data product to collocate product to
+
+        :param resampling: str
+        :param resampling: resampling method, *"nearest_neighbour"* or *"bilinear_interpolation"*
+
+        :type collocation_cache: str
+        :param collocation_cache: (optional) directory of on-disk cache of collocation indices, default from
+        *EOPY_COLLOCATION_CACHE* environment variable, if undefined no cache
+
+        :return:
+            :index: *CollocationIndex*
+
+            Collocation index, None if product or master geolocation unavailable
+        """
+
+        master_geolocation = SnappyGeolocation.readGeolocation(master)
+        if master_geolocation is None:
+            return None
+
+        cache = CollocationIndexCache.getCache(collocation_cache)
+        if cache is None:
+            slave_index = SnappyGeolocation.returnGeolocationIndex(product, geocoding=True)
+            return None if slave_index is None else CollocationIndex(slave_index, *master_geolocation)
+
+        slave_geolocation = SnappyGeolocation.readGeolocation(product)
+        if slave_geolocation is None:
+            return None
+
+        key = cache.returnKey(master_geolocation[0], master_geolocation[1], slave_geolocation[0],
+                              slave_geolocation[1], resampling)
+        index = cache.read(key)
+        if index is None:
+            slave_index = SnappyGeolocation.returnGeolocationIndex(product, geocoding=True,
+                                                                   geolocation=slave_geolocation)
+            index = CollocationIndex(slave_index, *master_geolocation)
+            cache.write(key, index, resampling)
+
+        return index
+
+    def snapCollocateProducts(self, product, master, resampling="nearest_neighbour"):
+        """
+        Returns *snappy.Product* product collocated with master product by snap *Collocate* operator
+
+        :type product: *snappy.Product*
+        :param product: In-memory data product
+
+        :type master: *snappy.Product*
+        :param master: Data product to collocate product to (pixel values conserved)
+
+        :param resampling: str
+        :param resampling: resampling method to use on product in collocation process
+
+        :return:
+            :product_processed: *snappy.Product*
+
+            Collocated data product
+        """
+
+        # Lazily processed products (e.g. Sentinel-2 resolution, region and reflectance products) only processed with
+        # snap when required
+        product = return_snap_product(product)
+        master = return_snap_product(master)
+
         HashMap = jpy.get_type('java.util.HashMap')
 
         source_products = HashMap()
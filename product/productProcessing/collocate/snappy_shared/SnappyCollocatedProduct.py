@@ -0,0 +1,223 @@
+"""
+Slave snappy products collocated onto the grid of a master product, resampled in memory with a collocation index
+"""
+
+'''___Built-In Modules___'''
+from threading import Lock
+
+'''___Third-Party Modules___'''
+import snappy
+from snappy import jpy
+from numpy import zeros, bool_
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+MASTER_SUFFIX = "_M"    # Suffix of master product band names, as for snap Collocate operator "${ORIGINAL_NAME}_M"
+
+
+class SnappyCollocatedProduct(object):
+    """
+    SnappyCollocatedProduct is an in-memory representation of a *snappy.Product* collocated onto the grid of a master
+    *snappy.Product*. Pixel values are read from the window of the slave product required and resampled onto the master
+    grid with a *CollocationIndex*, rather than through the snap *Collocate* operator.
+
+    As for the snap *Collocate* operator, slave bands keep their names and master bands are available renamed with
+    suffix "_M". The collocated *snappy.Product* is only created, with the snap *Collocate* operator, the first time it
+    is required (e.g. to pass to a snap operator). Other *snappy.Product* methods are delegated to the slave product.
+
+    :Attributes:
+        .. py:attribute:: product
+
+            *snappy.Product*
+
+            Slave product
+
+        .. py:attribute:: master
+
+            *snappy.Product*
+
+            Master product
+
+        .. py:attribute:: index
+
+            *CollocationIndex*
+
+            Collocation index of slave product pixels on master product grid
+
+        .. py:attribute:: resampling
+
+            *str*
+
+            Resampling method, *"nearest_neighbour"* or *"bilinear_interpolation"*
+
+    :Methods:
+        .. py:method:: getCollocatedProduct(...):
+
+            Return collocated product, collocating with snap on first call
+    """
+
+    def __init__(self, product, master, index, resampling, collocate):
+        """
+        Initialise collocated product
+
+        :type product: *snappy.Product*
+        :param product: Slave product
+
+        :type master: *snappy.Product*
+        :param master: Master product
+
+        :type index: CollocationIndex
+        :param index: Collocation index of slave product pixels on master product grid
+
+        :type resampling: str
+        :param resampling: Resampling method, *"nearest_neighbour"* or *"bilinear_interpolation"*
+
+        :type collocate: function
+        :param collocate: Function to collocate slave product with snap, with arguments *(product, master, resampling)*
+        """
+
+        self.product = product
+        self.master = master
+        self.index = index
+        self.resampling = resampling
+        self.collocate = collocate
+        self.collocated_product = None
+        self.lock = Lock()
+
+    def getCollocatedProduct(self):
+        """
+        Return collocated product, collocating with snap on first call
+
+        :return:
+            :collocated_product: *snappy.Product*
+
+            Collocated product
+        """
+
+        with self.lock:
+            if self.collocated_product is None:
+                self.collocated_product = self.collocate(self.product, self.master, self.resampling)
+        return self.collocated_product
+
+    def getSceneRasterWidth(self):
+        return self.master.getSceneRasterWidth()
+
+    def getSceneRasterHeight(self):
+        return self.master.getSceneRasterHeight()
+
+    def getBandNames(self):
+        return list(self.product.getBandNames()) + [name + MASTER_SUFFIX for name in self.master.getBandNames()]
+
+    def getBand(self, name):
+        band = self.product.getBand(name)
+        if band is not None:
+            return SnappyCollocatedNode(band, self)
+        if name.endswith(MASTER_SUFFIX):
+            return self.master.getBand(name[:-len(MASTER_SUFFIX)])
+        return None
+
+    def getTiePointGrid(self, name):
+        tie_point_grid = self.product.getTiePointGrid(name)
+        return None if tie_point_grid is None else SnappyCollocatedNode(tie_point_grid, self)
+
+    def getMaskGroup(self):
+        return SnappyCollocatedMaskGroup(self)
+
+    def getSceneGeoCoding(self):
+        return self.master.getSceneGeoCoding()
+
+    def getPreferredTileSize(self):
+        return self.master.getPreferredTileSize()
+
+    def __getattr__(self, name):
+        return getattr(self.product, name)
+
+
+class SnappyCollocatedNode(object):
+    """
+    SnappyCollocatedNode is a raster data node (band, tie point grid or mask) of a *SnappyCollocatedProduct*, reading
+    the pixels of the slave product node required for a window of the master grid and resampling them onto it. Valid
+    masks are always resampled by nearest neighbour. Other raster data node methods are delegated to the slave product
+    node.
+    """
+
+    def __init__(self, node, collocated_product):
+        self.node = node
+        self.collocated_product = collocated_product
+
+    def getRasterWidth(self):
+        return self.collocated_product.getSceneRasterWidth()
+
+    def getRasterHeight(self):
+        return self.collocated_product.getSceneRasterHeight()
+
+    def getGeoCoding(self):
+        return self.collocated_product.getSceneGeoCoding()
+
+    def readPixels(self, x, y, w, h, pixel_values):
+        resampling = self.collocated_product.resampling
+        pixel_values[:] = self._read(x, y, w, h, pixel_values.dtype, "pixels", resampling).ravel()
+        return pixel_values
+
+    def readValidMask(self, x, y, w, h, valid_mask):
+        valid_mask[:] = self._read(x, y, w, h, bool_, "valid_mask", "nearest_neighbour").ravel()
+        return valid_mask
+
+    def _read(self, x, y, w, h, dtype, kind, resampling):
+        index = self.collocated_product.index
+        window = (x, y, w, h)
+
+        # Master window outside slave product
+        slave_window = index.returnSlaveWindow(window)
+        if slave_window is None:
+            return index.apply(zeros((1, 1), dtype), window=window, fill_value=(False if kind == "valid_mask" else None))
+
+        s_x, s_y, s_w, s_h = slave_window
+        values = zeros(s_w * s_h, dtype)
+        if kind == "valid_mask":
+            self.node.readValidMask(s_x, s_y, s_w, s_h, values)
+        else:
+            self.node.readPixels(s_x, s_y, s_w, s_h, values)
+        values.shape = s_h, s_w
+
+        return index.apply(values, resampling=resampling, window=window, slave_window=slave_window,
+                           fill_value=(False if kind == "valid_mask" else None))
+
+    def __getattr__(self, name):
+        return getattr(self.node, name)
+
+
+class SnappyCollocatedMaskGroup(object):
+    """
+    SnappyCollocatedMaskGroup is the mask group of a *SnappyCollocatedProduct*, returning masks of the slave product
+    that read pixels resampled onto the master grid.
+    """
+
+    def __init__(self, collocated_product):
+        self.collocated_product = collocated_product
+
+    def getNodeNames(self):
+        return self.collocated_product.product.getMaskGroup().getNodeNames()
+
+    def get(self, name):
+        mask = self.collocated_product.product.getMaskGroup().get(name)
+        if mask is None:
+            return None
+        if not (hasattr(mask, "region_product") or hasattr(mask, "collocated_product")):
+            mask = jpy.cast(mask, snappy.Mask)
+        return SnappyCollocatedNode(mask, self.collocated_product)
+
+
+if __name__ == "__main__":
+    pass
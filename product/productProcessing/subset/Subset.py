@@ -27,6 +27,9 @@ class Subset(AbstractProcessor):
     """
     Subset class operates on instances of eopy.dataIO.Product in-memory data products, returning a subset of the
     product, e.g. regions of interest.
+
+    Multiple regions of interest may be subset in one pass by giving a list of regions, e.g.
+    ``Subset().run(product, pos=[pos_1, pos_2])``, returning a list of products, one per region.
     
     :Variables:
         .. py:attribute:: processor_directory
@@ -0,0 +1,301 @@
+"""
+Region of interest subsets of snappy products, read from the pixels of a shared window read once
+"""
+
+'''___Built-In Modules___'''
+from threading import Lock
+
+'''___Third-Party Modules___'''
+import snappy
+from snappy import jpy
+from numpy import zeros, dtype as np_dtype
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+class RegionPixelCache(object):
+    """
+    RegionPixelCache holds the pixel values of the raster data nodes of a *snappy.Product* within a window, each read
+    from the product the first time it is required. The window is the union of a set of regions of interest, so
+    region products (see *SnappyRegionProduct*) in the window share one read of the product and slice it in memory.
+
+    :Attributes:
+        .. py:attribute:: product
+
+            *snappy.Product*
+
+            Product read from
+
+        .. py:attribute:: window
+
+            *tuple*
+
+            Window of product read, defined as *(x, y, x_width, y_width)*
+
+    :Methods:
+        .. py:method:: readPixels(...):
+
+            Return pixel values of raster data node within window, reading on first call
+
+        .. py:method:: readValidMask(...):
+
+            Return valid mask of raster data node within window, reading on first call
+    """
+
+    def __init__(self, product, window):
+        """
+        Initialise cache
+
+        :type product: *snappy.Product*
+        :param product: Product read from
+
+        :type window: tuple
+        :param window: Window of product read, defined as *(x, y, x_width, y_width)*
+        """
+
+        self.product = product
+        self.window = tuple(int(v) for v in window)
+        self.values = {}
+        self.lock = Lock()
+
+    def readPixels(self, node, dtype):
+        """
+        Return pixel values of raster data node within window, reading on first call
+
+        :type node: *snappy.RasterDataNode*
+        :param node: band, tie point grid or mask of product
+
+        :type dtype: numpy.dtype
+        :param dtype: data type to read pixel values as
+
+        :return:
+            :pixel_values: *numpy.ndarray*
+
+            Pixel values within window, dimensions *(y_width, x_width)*
+        """
+
+        return self._read(node, np_dtype(dtype), "pixels")
+
+    def readValidMask(self, node):
+        """
+        Return valid mask of raster data node within window, reading on first call
+
+        :type node: *snappy.RasterDataNode*
+        :param node: band of product
+
+        :return:
+            :valid_mask: *numpy.ndarray*
+
+            Valid mask within window, dimensions *(y_width, x_width)*
+        """
+
+        return self._read(node, np_dtype(bool), "valid_mask")
+
+    def _read(self, node, dtype, kind):
+        """
+        Return pixel values or valid mask of raster data node within window, reading on first call
+
+        :type node: *snappy.RasterDataNode*
+        :param node: band, tie point grid or mask of product
+
+        :type dtype: numpy.dtype
+        :param dtype: data type to read as
+
+        :type kind: str
+        :param kind: *"pixels"* or *"valid_mask"*
+
+        :return:
+            :values: *numpy.ndarray*
+
+            Values within window, dimensions *(y_width, x_width)*
+        """
+
+        key = (node.getName(), dtype.str, kind)
+
+        with self.lock:
+            if key not in self.values:
+                x, y, w, h = self.window
+                values = zeros(w * h, dtype)
+                if kind == "valid_mask":
+                    node.readValidMask(x, y, w, h, values)
+                else:
+                    node.readPixels(x, y, w, h, values)
+                values.shape = h, w
+                self.values[key] = values
+
+        return self.values[key]
+
+
+class SnappyRegionProduct(object):
+    """
+    SnappyRegionProduct is an in-memory representation of a region of interest subset of a *snappy.Product*. Pixel
+    values are sliced in memory from a *RegionPixelCache* window shared with other regions of the product, rather than
+    read through a separate snap *Subset* operator per region.
+
+    The subset *snappy.Product* is only created, with the snap *Subset* operator, the first time it is required (e.g.
+    for its geocoding, or to pass to a snap operator). Other *snappy.Product* methods are delegated to the source
+    product.
+
+    :Attributes:
+        .. py:attribute:: product
+
+            *snappy.Product*
+
+            Source product
+
+        .. py:attribute:: region
+
+            *tuple*
+
+            Region of source product, defined as *(x, y, x_width, y_width)*
+
+        .. py:attribute:: cache
+
+            *RegionPixelCache*
+
+            Pixel cache of window of source product containing region
+
+    :Methods:
+        .. py:method:: getSubsetProduct(...):
+
+            Return subset product of region, subsetting on first call
+    """
+
+    def __init__(self, product, region, cache, subset):
+        """
+        Initialise region product
+
+        :type product: *snappy.Product*
+        :param product: Source product
+
+        :type region: tuple
+        :param region: Region of source product, defined as *(x, y, x_width, y_width)*, within cache window
+
+        :type cache: RegionPixelCache
+        :param cache: Pixel cache of window of source product containing region
+
+        :type subset: function
+        :param subset: Function to subset source product to region, with arguments *(product, x, y, x_width, y_width)*
+        """
+
+        self.product = product
+        self.region = tuple(int(v) for v in region)
+        self.cache = cache
+        self.subset = subset
+        self.subset_product = None
+        self.lock = Lock()
+
+        # Offset of region within cache window
+        self.offset = (self.region[0] - cache.window[0], self.region[1] - cache.window[1])
+
+    def getSubsetProduct(self):
+        """
+        Return subset product of region, subsetting on first call
+
+        :return:
+            :subset_product: *snappy.Product*
+
+            Subset product
+        """
+
+        with self.lock:
+            if self.subset_product is None:
+                self.subset_product = self.subset(self.product, *self.region)
+        return self.subset_product
+
+    def getSceneRasterWidth(self):
+        return self.region[2]
+
+    def getSceneRasterHeight(self):
+        return self.region[3]
+
+    def getBand(self, name):
+        band = self.product.getBand(name)
+        return None if band is None else SnappyRegionNode(band, self)
+
+    def getTiePointGrid(self, name):
+        tie_point_grid = self.product.getTiePointGrid(name)
+        return None if tie_point_grid is None else SnappyRegionNode(tie_point_grid, self)
+
+    def getMaskGroup(self):
+        return SnappyRegionMaskGroup(self)
+
+    def getSceneGeoCoding(self):
+        return self.getSubsetProduct().getSceneGeoCoding()
+
+    def getMetadataRoot(self):
+        return self.getSubsetProduct().getMetadataRoot()
+
+    def __getattr__(self, name):
+        return getattr(self.product, name)
+
+
+class SnappyRegionNode(object):
+    """
+    SnappyRegionNode is a raster data node (band, tie point grid or mask) of a *SnappyRegionProduct*, reading pixels
+    from the region product pixel cache. Other raster data node methods are delegated to the source product node.
+    """
+
+    def __init__(self, node, region_product):
+        self.node = node
+        self.region_product = region_product
+
+    def getRasterWidth(self):
+        return self.region_product.getSceneRasterWidth()
+
+    def getRasterHeight(self):
+        return self.region_product.getSceneRasterHeight()
+
+    def getGeoCoding(self):
+        return self.region_product.getSceneGeoCoding()
+
+    def readPixels(self, x, y, w, h, pixel_values):
+        values = self.region_product.cache.readPixels(self.node, pixel_values.dtype)
+        pixel_values[:] = self._slice(values, x, y, w, h).ravel()
+        return pixel_values
+
+    def readValidMask(self, x, y, w, h, valid_mask):
+        values = self.region_product.cache.readValidMask(self.node)
+        valid_mask[:] = self._slice(values, x, y, w, h).ravel()
+        return valid_mask
+
+    def _slice(self, values, x, y, w, h):
+        x_offset, y_offset = self.region_product.offset
+        return values[y_offset+y:y_offset+y+h, x_offset+x:x_offset+x+w]
+
+    def __getattr__(self, name):
+        return getattr(self.node, name)
+
+
+class SnappyRegionMaskGroup(object):
+    """
+    SnappyRegionMaskGroup is the mask group of a *SnappyRegionProduct*, returning masks of the source product that read
+    pixels from the region product pixel cache.
+    """
+
+    def __init__(self, region_product):
+        self.region_product = region_product
+
+    def getNodeNames(self):
+        return self.region_product.product.getMaskGroup().getNodeNames()
+
+    def get(self, name):
+        mask = self.region_product.product.getMaskGroup().get(name)
+        if mask is None:
+            return None
+        if not (hasattr(mask, "region_product") or hasattr(mask, "collocated_product")):
+            mask = jpy.cast(mask, snappy.Mask)
+        return SnappyRegionNode(mask, self.region_product)
+
+
+if __name__ == "__main__":
+    pass
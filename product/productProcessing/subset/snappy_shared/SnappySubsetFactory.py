@@ -4,22 +4,28 @@ Subset factory for *eopy.product.productIO.Product.Product* objects which contai
 
 '''___Built-In Modules___'''
 import sys
-from os.path import dirname
-from copy import deepcopy
-import re
+from os.path import dirname, abspath
+from os.path import join as pjoin
+from copy import deepcopy, copy
 from datetime import datetime as dt
 
 '''___Third-Party Modules___'''
 import snappy
-from PIL import Image, ImageDraw
 import shapely.geometry
-from numpy import linspace, bool_, array
+from numpy import linspace, bool_, zeros, concatenate, cumsum, column_stack, split, floor, isfinite
 import geog
 from geopy.distance import geodesic
 
 '''___NPL Modules___'''
 sys.path.append(dirname(dirname(__file__)))
 from AbstractProcessingFactory import AbstractProcessingFactory
+sys.path.append(dirname(__file__))
+from SnappyRegionProduct import SnappyRegionProduct, RegionPixelCache
+sys.path.append(pjoin(dirname(dirname(dirname(dirname(dirname(abspath(__file__)))))), "utils"))
+from PolygonRasteriser import parse_wkt, rasterise_polygons, points_in_polygons, unwrap_longitudes
+sys.path.append(pjoin(dirname(dirname(dirname(dirname(abspath(__file__))))), "productIO", "snappy_shared"))
+import SnappyGeolocation
+from SnappyLazyProduct import return_snap_product
 
 from eopy import Product
 
@@ -44,6 +50,14 @@ class SnappySubsetFactory(AbstractProcessingFactory):
 
             Returns subset of input *eopy.product.productIO.Product.Product* object, type of subset defined by kwargs.
 
+        .. py:method:: processProductRegions(...):
+
+            Returns subsets of input *eopy.product.productIO.Product.Product* object, one per region of interest
+
+        .. py:method:: updateSubsetProduct(...):
+
+            Returns subset product with updated ``variables`` and ``attributes`` attributes
+
         .. py:method:: wktProduct(...):
 
             Returns region of interest subset of `snappy.Product` object, defined by *Well Known Text* polygon.
@@ -74,6 +88,14 @@ class SnappySubsetFactory(AbstractProcessingFactory):
 
             Return Well Known Text representation of region defined by 'pos' tuple
 
+        .. py:method:: clip_window(...):
+
+            Return pixel window of region of interest clipped to product extent, with its mask cropped to match
+
+        .. py:method:: return_union_window(...):
+
+            Return smallest pixel window containing all given windows
+
         .. py:method:: wkt2latlons(...):
 
             Return lats and lons from Well Known Text representation of region
@@ -82,6 +104,18 @@ class SnappySubsetFactory(AbstractProcessingFactory):
 
             Return pixel indices of point in product given lat, lon
 
+        .. py:method:: latlons2pixs(...):
+
+            Return pixel indices of points in product given lats, lons
+
+        .. py:method:: returnGeolocationIndex(...):
+
+            Return geolocation index of product, built from product per pixel latitude and longitude on first use
+
+        .. py:method:: geocoding_latlon2pix(...):
+
+            Return pixel indices of point given lat, lon, with snappy geocoding
+
         .. py:method:: pix2latlon(...):
 
             Return lat lon of point in product given by pixel indices
@@ -104,15 +138,16 @@ class SnappySubsetFactory(AbstractProcessingFactory):
         :type product: eopy.product.productIO.Product.Product
         :param product: Data product to process
 
-        Keyword arguments define subset:
+        Keyword arguments define subset, if a list of regions of interest is given a list of subset products is returned,
+        one per region (see ``processProductRegions``):
 
-        :type pos: tuple
+        :type pos: tuple/list
         :param pos: Definition of square, size L m, region of interest centre on lon lat - define as (lon, lat, L)
 
-        :type wkt: str
+        :type wkt: str/list
         :param wkt: Definition of region of interest in Well Known Text
 
-        :type shape: `shapely.geometry.Polygon`
+        :type shape: `shapely.geometry.Polygon`/list
         :param shape: Definition of region of interest of `shapely.geometry.Polygon`
 
         :return:
@@ -121,6 +156,10 @@ class SnappySubsetFactory(AbstractProcessingFactory):
             Processed data product
         """
 
+        # Multiple regions of interest required so return list of subset products, one per region
+        if any((k in kwargs) and (type(kwargs[k]) == list) for k in ["pos", "wkt", "shape"]):
+            return self.processProductRegions(product, **kwargs)
+
         # Initialise subset empty subset product
         product_subset = Product()
         product_subset.dataReader = deepcopy(product.dataReader)
@@ -144,8 +183,9 @@ class SnappySubsetFactory(AbstractProcessingFactory):
             # in different spatial resolutions (e.g. for Sentinel-2 products)
             for i, p in enumerate(product.product):
 
-                # Determine the location of the upper left corner, height and width of the box
-                upper_left_x, upper_left_y, x_width, y_width, centre_x, centre_y = self.pos2pixs(p["product"], pos)
+                # Determine the location of the upper left corner, height and width of the box, within product
+                window, _ = self.clip_window(p["product"], self.pos2pixs(p["product"], pos)[:4])
+                upper_left_x, upper_left_y, x_width, y_width = window
 
                 # Subset based on pixel geometries found
                 product_subset.product[i]["product"] = self.pixProduct(p["product"],
@@ -169,8 +209,11 @@ class SnappySubsetFactory(AbstractProcessingFactory):
 
                 # self.wkt2pix() finds the location of the upper left corner, height and width of the box containing
                 # the region defined by WKT with a mask cutting out the region within
-                upper_left_x, upper_left_y, x_width, y_width, centre_x, \
-                        centre_y, subset_mask = self.wkt2pixs(p["product"], wkt)
+                pixs = self.wkt2pixs(p["product"], wkt)
+
+                # Box clipped to product, for regions extending past the product edge
+                window, subset_mask = self.clip_window(p["product"], pixs[:4], pixs[6])
+                upper_left_x, upper_left_y, x_width, y_width = window
 
                 # Subset containing box of product and apply region of interest mask
                 product_subset.product[i]["product"] = self.pixProduct(p["product"],
@@ -187,6 +230,126 @@ class SnappySubsetFactory(AbstractProcessingFactory):
         # 2. Update attributes attributes and variables
         ################################################################################################################
 
+        return self.updateSubsetProduct(product_subset, product, processing_parameter)
+
+    def processProductRegions(self, product, **kwargs):
+        """
+        Returns subsets of input *eopy.product.productIO.Product.Product* object, one per region of interest.
+
+        Regions share the geolocation index of the product, and for each product in the product attribute the smallest
+        window containing all the regions is read once, with each region sliced from it in memory (see
+        *SnappyRegionProduct*).
+
+        :type product: eopy.product.productIO.Product.Product
+        :param product: Data product to process
+
+        Keyword arguments define regions of interest:
+
+        :type pos: list
+        :param pos: Definitions of square, size L m, regions of interest centred on lon lat - define each as
+        (lon, lat, L)
+
+        :type wkt: list
+        :param wkt: Definitions of regions of interest in Well Known Text
+
+        :type shape: list
+        :param shape: Definitions of regions of interest as `shapely.geometry.Polygon`
+
+        :return:
+            :product_subsets: *list*
+
+            Subset data products, one per region of interest
+        """
+
+        ################################################################################################################
+        # 1. Define regions
+        ################################################################################################################
+
+        if "pos" in kwargs:
+            regions = [{"pos": pos} for pos in kwargs["pos"]]
+        elif ("wkt" in kwargs) or ("shape" in kwargs):
+            wkts = [shape.wkt for shape in kwargs["shape"]] if "shape" in kwargs else kwargs["wkt"]
+            regions = [{"wkt": wkt} for wkt in wkts]
+        else:
+            raise ValueError("No valid Subset specification keyword in kwargs")
+
+        ################################################################################################################
+        # 2. Determine region windows, per product in product.product
+        ################################################################################################################
+
+        region_products = [[] for region in regions]
+        subset_masks = [[] for region in regions]
+
+        for p in product.product:
+
+            # a. Find window of each region - geolocation index built on first region and reused for others
+            windows = []
+            for j, region in enumerate(regions):
+                if "pos" in region:
+                    window = self.pos2pixs(p["product"], region["pos"])[:4]
+                    subset_mask = None
+                else:
+                    pixs = self.wkt2pixs(p["product"], region["wkt"])
+                    window = pixs[:4]
+                    subset_mask = pixs[6]
+
+                window, subset_mask = self.clip_window(p["product"], window, subset_mask)
+                windows.append(window)
+                subset_masks[j].append(subset_mask)
+
+            # b. Regions read from one shared window of product
+            cache = RegionPixelCache(p["product"], self.return_union_window(windows))
+            for j, window in enumerate(windows):
+                region_products[j].append(SnappyRegionProduct(p["product"], window, cache, self.pixProduct))
+
+        ################################################################################################################
+        # 3. Build subset products
+        ################################################################################################################
+
+        # Data reader copied once, region products take shallow copies to hold their own data mask
+        data_reader = deepcopy(product.dataReader)
+
+        product_subsets = []
+        for j, region in enumerate(regions):
+            product_subset = Product()
+            product_subset.dataReader = copy(data_reader)
+            product_subset.dataReader.dataFactory = copy(data_reader.dataFactory)
+
+            product_subset.product = []
+            for i, p in enumerate(product.product):
+                product_subset.product.append({"product_name": p["product_name"],
+                                               "product": region_products[j][i],
+                                               "variables": p["variables"]})
+
+            if "wkt" in region:
+                product_subset.dataReader.dataFactory.data_mask = subset_masks[j]
+                processing_parameter = {"wkt": region["wkt"]}
+            else:
+                processing_parameter = {"pos": str(region["pos"])}
+
+            product_subsets.append(self.updateSubsetProduct(product_subset, product, processing_parameter))
+
+        return product_subsets
+
+    def updateSubsetProduct(self, product_subset, product, processing_parameter):
+        """
+        Returns subset product with updated ``variables`` and ``attributes`` attributes
+
+        :type product_subset: `eopy.product.productIO.Product.Product`
+        :param product_subset: subsetted data product
+
+        :type product: `eopy.product.productIO.Product.Product`
+        :param product: original data product
+
+        :type processing_parameter: dict
+        :param processing_parameter: subset parameter, to describe processing in processing log
+
+        :return:
+            :product_subset: *eopy.product.productIO.Product.Product*
+
+            Updated subsetted data product
+        """
+
         product_subset.variables = self.updateVariables(product_subset, product)
 
         # Update common snappy product attributes
@@ -216,6 +379,10 @@ class SnappySubsetFactory(AbstractProcessingFactory):
             In memory representation of data product subsetted
         """
 
+        # Lazily processed products (e.g. Sentinel-2 resolution, region and reflectance products) only processed with
+        # snap when required
+        product = return_snap_product(product)
+
         # Get require SNAP tools
         SubsetOp = snappy.jpy.get_type('org.esa.snap.core.gpf.common.SubsetOp')
         WKTReader = snappy.jpy.get_type('com.vividsolutions.jts.io.WKTReader')
@@ -263,6 +430,10 @@ class SnappySubsetFactory(AbstractProcessingFactory):
             In memory representation of data product subsetted
         """
 
+        # Lazily processed products (e.g. Sentinel-2 resolution, region and reflectance products) only processed with
+        # snap when required
+        product = return_snap_product(product)
+
         # Get require SNAP tools
         SubsetOp = snappy.jpy.get_type('org.esa.snap.core.gpf.common.SubsetOp')
 
@@ -321,8 +492,14 @@ class SnappySubsetFactory(AbstractProcessingFactory):
 
             row_time = (original_end_time - original_start_time) / (original_product_rows - 1)
 
-            i_start = product_subset.product[0]["product"].getMetadataRoot().getElement("history") \
-                                                          .getElement("SubsetInfo").getAttributeInt("SubRegion.y") - 1
+            # Region products know their region, so need not be subset with snap to find it
+            subset = product_subset.product[0]["product"]
+            if hasattr(subset, "region"):
+                subset_y = subset.region[1]
+            else:
+                subset_y = subset.getMetadataRoot().getElement("history").getElement("SubsetInfo") \
+                                                                         .getAttributeInt("SubRegion.y")
+            i_start = subset_y - 1
             i_end = i_start + subset_product_rows
 
             new_attrs["start_time"] = original_start_time + i_start * row_time
@@ -409,10 +586,16 @@ class SnappySubsetFactory(AbstractProcessingFactory):
         Returns the location of the upper left corner, height and width of the box containing the region defined by
         WKT with a mask cutting out the region within
 
+        Regions may be polygons or multipolygons, with holes. Pixels are in the mask if their centre is within the
+        region. For products with per pixel latitude and longitude (e.g. curvilinear swath grids) pixels are tested in
+        geographic space, otherwise the region is rasterised in pixel space.
+
+        Regions may extend past the product edge, the box then extends past the product extent (see *clip_window*).
+
         :type product: *snappy.Product*
         :param product: data product
 
-        :type wkt: float
+        :type wkt: str
         :param wkt: Well Known Text definition of region of interest
 
         :return:
@@ -437,23 +620,55 @@ class SnappySubsetFactory(AbstractProcessingFactory):
             Mask of region of interest inside bounding box
         """
 
-        lats, lons = self.wkt2latlons(wkt)
-        xys = [self.latlon2pix(product, lat, lon) for lat, lon in zip(lats, lons)]
-        xs = [xy[0] for xy in xys]
-        ys = [xy[1] for xy in xys]
-
-        upper_left_x = int(min(xs))
-        upper_left_y = int(min(ys))
-        x_width = int(max(xs) - min(xs))+1
-        y_width = int(max(ys) - min(ys))+1
+        polygons = parse_wkt(wkt)
+        rings = [ring for polygon in polygons for ring in polygon]
+        vertices = concatenate(rings)
+        xs, ys = self.latlons2pixs(product, vertices[:, 1], vertices[:, 0])
+
+        # Vertices outside product extrapolated, so only vertices that cannot be located (e.g. outside the extent of
+        # the product geocoding) undefined - box of remaining vertices would miss part of region
+        located = isfinite(xs) & isfinite(ys)
+        if not located.any():
+            raise ValueError("Region of interest %s outside of product extent" % wkt)
+        if not located.all():
+            raise ValueError("Region of interest %s vertices %s could not be located in product"
+                             % (wkt, str(vertices[~located].tolist())))
+
+        upper_left_x = int(floor(min(xs)))
+        upper_left_y = int(floor(min(ys)))
+        x_width = int(floor(max(xs)) - upper_left_x)+1
+        y_width = int(floor(max(ys)) - upper_left_y)+1
         centre_x = int(upper_left_x+(float(x_width)/2.0))
         centre_y = int(upper_left_y+(float(y_width)/2.0))
 
         # Determine mask
-        polygon = [(x-upper_left_x, y-upper_left_y) for x, y in zip(xs, ys)]
-        img = Image.new('L', (x_width, y_width), 0)
-        ImageDraw.Draw(img).polygon(polygon, outline=1, fill=1)
-        subset_mask = array(img, bool_)
+        index = self.returnGeolocationIndex(product)
+
+        # a. Per pixel geolocation - test pixel latitude and longitude within region
+        if index is not None:
+            subset_mask = zeros((y_width, x_width), dtype=bool_)
+
+            rows, columns = index.latitude.shape
+            x_0, y_0 = max(upper_left_x, 0), max(upper_left_y, 0)
+            x_1, y_1 = min(upper_left_x + x_width, columns), min(upper_left_y + y_width, rows)
+
+            if (x_1 > x_0) and (y_1 > y_0):
+                lat = index.latitude[y_0:y_1, x_0:x_1]
+                lon = unwrap_longitudes(index.longitude[y_0:y_1, x_0:x_1], polygons)
+                subset_mask[y_0-upper_left_y:y_1-upper_left_y, x_0-upper_left_x:x_1-upper_left_x] = \
+                    points_in_polygons(lon, lat, polygons)
+
+        # b. Geocoding only - rasterise region in pixel space of bounding box
+        else:
+            ring_ends = cumsum([len(ring) for ring in rings])[:-1]
+            pixel_rings = split(column_stack([xs, ys]) - [upper_left_x, upper_left_y], ring_ends)
+
+            pixel_polygons = []
+            for polygon in polygons:
+                pixel_polygons.append(pixel_rings[:len(polygon)])
+                pixel_rings = pixel_rings[len(polygon):]
+
+            subset_mask = rasterise_polygons(pixel_polygons, x_width, y_width)
 
         return upper_left_x, upper_left_y, x_width, y_width, centre_x, centre_y, subset_mask
 
@@ -499,8 +714,10 @@ class SnappySubsetFactory(AbstractProcessingFactory):
         lat = pos[1]
         size = pos[2]
 
-        # 1. Find pixel position of lon, lat
+        # 1. Find pixel position of lon, lat - extrapolated if outside product, so region may extend past product edge
         x_centre, y_centre = self.latlon2pix(product, lat, lon)
+        if not (isfinite(x_centre) and isfinite(y_centre)):
+            raise ValueError("Region of interest centre %s could not be located in product" % str(pos[:2]))
 
         # 2. Find pixel position of the corners of the roi
         # determine spatial sample in x and y direction around the centre based on lat lon of pixels in that region
@@ -515,19 +732,19 @@ class SnappySubsetFactory(AbstractProcessingFactory):
         y_corners = [y_centre-n_ypixels, y_centre-n_ypixels, y_centre+n_ypixels, y_centre+n_ypixels]
 
         # Return parameters
-        upper_left_x = int(x_corners[0])
-        upper_left_y = int(y_corners[0])
+        upper_left_x = int(floor(x_corners[0]))
+        upper_left_y = int(floor(y_corners[0]))
         x_width = int(x_corners[1] - x_corners[0]) + 1
         y_width = int(y_corners[2] - y_corners[1]) + 1
 
-        return upper_left_x, upper_left_y, x_width, y_width, int(x_centre), int(y_centre)
+        return upper_left_x, upper_left_y, x_width, y_width, int(floor(x_centre)), int(floor(y_centre))
 
     def wkt2latlons(self, wkt):
         """
-        Return lats and lons from Well Known Text representation of region
+        Return lats and lons from Well Known Text representation of region, the vertices of all rings of all polygons
 
         :type wkt: str
-        :param wkt:
+        :param wkt: Well Known Text definition of region of interest, polygon or multipolygon
 
         :return:
             :lats: *list*
@@ -539,12 +756,10 @@ class SnappySubsetFactory(AbstractProcessingFactory):
             List of longitudes
         """
 
-        nums = re.findall(r'-?\d+(?:\.\d*)?', wkt.rpartition(',')[0])
-
-        lonlats = zip(*[iter(nums)] * 2)
+        vertices = concatenate([ring for polygon in parse_wkt(wkt) for ring in polygon])
 
-        lons = [float(p[0]) for p in lonlats]
-        lats = [float(p[1]) for p in lonlats]
+        lons = list(vertices[:, 0])
+        lats = list(vertices[:, 1])
 
         return lats, lons
 
@@ -572,6 +787,66 @@ class SnappySubsetFactory(AbstractProcessingFactory):
 
         return shapely.geometry.Polygon(polygon).wkt
 
+    def clip_window(self, product, window, subset_mask=None):
+        """
+        Return pixel window of region of interest clipped to product extent, with its mask cropped to match
+
+        :type product: *snappy.Product*
+        :param product: data product
+
+        :type window: tuple
+        :param window: Pixel window of region of interest, defined as *(x, y, x_width, y_width)*
+
+        :type subset_mask: numpy.ndarray
+        :param subset_mask: (optional) Mask of region of interest inside window
+
+        :return:
+            :window: *tuple*
+
+            Pixel window clipped to product extent
+
+            :subset_mask: *numpy.ndarray*
+
+            Mask of region of interest inside clipped window
+        """
+
+        x, y, x_width, y_width = [int(v) for v in window]
+        width = int(product.getSceneRasterWidth())
+        height = int(product.getSceneRasterHeight())
+
+        x_0 = max(x, 0)
+        y_0 = max(y, 0)
+        x_1 = min(x + x_width, width)
+        y_1 = min(y + y_width, height)
+
+        if (x_1 <= x_0) or (y_1 <= y_0):
+            raise ValueError("Region of interest %s outside of product extent (%s, %s)" % (str(window), width, height))
+
+        if subset_mask is not None:
+            subset_mask = subset_mask[y_0-y:y_1-y, x_0-x:x_1-x]
+
+        return (x_0, y_0, x_1 - x_0, y_1 - y_0), subset_mask
+
+    def return_union_window(self, windows):
+        """
+        Return smallest pixel window containing all given windows
+
+        :type windows: list
+        :param windows: Pixel windows, each defined as *(x, y, x_width, y_width)*
+
+        :return:
+            :window: *tuple*
+
+            Union pixel window, defined as *(x, y, x_width, y_width)*
+        """
+
+        x_0 = min(w[0] for w in windows)
+        y_0 = min(w[1] for w in windows)
+        x_1 = max(w[0] + w[2] for w in windows)
+        y_1 = max(w[1] + w[3] for w in windows)
+
+        return x_0, y_0, x_1 - x_0, y_1 - y_0
+
     def latlon2pix(self, product, lat, lon):
         """
         Return pixel indices of point in product given lat, lon
@@ -595,11 +870,80 @@ class SnappySubsetFactory(AbstractProcessingFactory):
             y index of point
         """
 
+        xs, ys = self.latlons2pixs(product, [lat], [lon])
+
+        return xs[0], ys[0]
+
+    def latlons2pixs(self, product, lats, lons):
+        """
+        Return pixel indices of points in product given lats, lons
+
+        Points are found in one vectorised query of the product geolocation index if the product has per pixel
+        latitude and longitude, otherwise point by point with the product geocoding. Indices of points outside the
+        product are extrapolated.
+
+        :type product: *snappy.Product*
+        :param product: data product
+
+        :type lats: list
+        :param lats: latitudes of points
+
+        :type lons: list
+        :param lons: longitudes of points
+
+        :return:
+            :xs: *list*
+
+            x indices of points
+
+            :ys: *list*
+
+            y indices of points
+        """
+
+        index = self.returnGeolocationIndex(product)
+
+        if index is not None:
+            xs, ys = index.latlon2pix(lats, lons, extrapolate=True)
+            return list(xs), list(ys)
+
+        geo_code = product.getBand(list(product.getBandNames())[0]).getGeoCoding()
+        xs = []
+        ys = []
+        for lat, lon in zip(lats, lons):
+            x, y = self.geocoding_latlon2pix(geo_code, lat, lon)
+            xs.append(x)
+            ys.append(y)
+
+        return xs, ys
+
+    def geocoding_latlon2pix(self, geo_code, lat, lon):
+        """
+        Return pixel indices of point given lat, lon, with snappy geocoding
+
+        :type geo_code: *snappy.GeoCoding*
+        :param geo_code: product geocoding
+
+        :type lat: float
+        :param lat: latitude of point
+
+        :type lon: float
+        :param lon: longitude of point
+
+        :return:
+            :x: *float*
+
+            x index of point
+
+            :y: *float*
+
+            y index of point
+        """
+
         geo_pos = snappy.GeoPos()
         geo_pos.lon = lon
         geo_pos.lat = lat
         pix_pos = snappy.PixelPos()
-        geo_code = product.getBand(list(product.getBandNames())[0]).getGeoCoding()
         geo_code.getPixelPos(geo_pos, pix_pos)
 
         x = pix_pos.getX()
@@ -630,6 +974,12 @@ class SnappySubsetFactory(AbstractProcessingFactory):
             longitude of point
         """
 
+        index = self.returnGeolocationIndex(product)
+
+        if index is not None:
+            lat, lon = index.pix2latlon(x, y)
+            return float(lat), float(lon)
+
         pix_pos = snappy.PixelPos()
         pix_pos.x = x
         pix_pos.y = y
@@ -647,6 +997,9 @@ class SnappySubsetFactory(AbstractProcessingFactory):
         """
         Return pixel sampling around pixel at given index
 
+        Sampling of pixels outside product (e.g. extrapolated region of interest centres) is that of the nearest pixel
+        within product.
+
         :type product: *snappy.Product*
         :param product: data product
 
@@ -666,6 +1019,10 @@ class SnappySubsetFactory(AbstractProcessingFactory):
             spatial sampling in y direction in metres
         """
 
+        # Pixel and its neighbours within product
+        x_i = min(max(x_i, 0), max(int(product.getSceneRasterWidth()) - 2, 0))
+        y_i = min(max(y_i, 0), max(int(product.getSceneRasterHeight()) - 2, 0))
+
         point = self.pix2latlon(product, x_i, y_i)
         point_xoffset = self.pix2latlon(product, x_i + 1, y_i)
         point_yoffset = self.pix2latlon(product, x_i, y_i + 1)
@@ -675,6 +1032,22 @@ class SnappySubsetFactory(AbstractProcessingFactory):
 
         return x_sampling, y_sampling
 
+    def returnGeolocationIndex(self, product):
+        """
+        Return geolocation index of product, built from product per pixel latitude and longitude on first use. Indices
+        are cached process-wide for the most recently used products.
+
+        :type product: *snappy.Product*
+        :param product: data product
+
+        :return:
+            :index: *GeolocationIndex*
+
+            Geolocation index of product, None if product has no per pixel latitude and longitude
+        """
+
+        return SnappyGeolocation.returnGeolocationIndex(product)
+
 
 if __name__ == "__main__":
     pass
@@ -0,0 +1,91 @@
+"""
+SnappyRegionProduct class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+from numpy import arange, zeros, float32
+import snappy
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from SnappyRegionProduct import SnappyRegionProduct, RegionPixelCache
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+w = 15
+h = 10
+band1_array = arange(w*h, dtype=float32).reshape((h, w))
+
+
+def setup():
+    product = snappy.Product("product", "type", w, h)
+    band1 = product.addBand("band1", "float32")
+    band1.ensureRasterData()
+    band1.setPixels(0, 0, w, h, band1_array.flatten())
+
+    subsets = []
+
+    def subset(*args):
+        subsets.append(args)
+        return args
+
+    cache = RegionPixelCache(product, (2, 3, 8, 5))
+    region_products = [SnappyRegionProduct(product, (2, 3, 3, 2), cache, subset),
+                       SnappyRegionProduct(product, (6, 5, 4, 3), cache, subset)]
+
+    return product, cache, region_products, subsets
+
+
+class TestSnappyRegionProduct(unittest.TestCase):
+    def test_getSceneRasterWidth(self):
+        product, cache, region_products, subsets = setup()
+        self.assertEqual(3, region_products[0].getSceneRasterWidth())
+        self.assertEqual(2, region_products[0].getSceneRasterHeight())
+
+    def test_readPixels(self):
+        product, cache, region_products, subsets = setup()
+
+        pixel_values = zeros(2 * 2, float32)
+        region_products[1].getBand("band1").readPixels(1, 1, 2, 2, pixel_values)
+
+        self.assertEqual(band1_array[6:8, 7:9].flatten().tolist(), pixel_values.tolist())
+
+    def test_readPixels_shared_read(self):
+        product, cache, region_products, subsets = setup()
+
+        for region_product in region_products:
+            pixel_values = zeros(region_product.getSceneRasterWidth() * region_product.getSceneRasterHeight(), float32)
+            region_product.getBand("band1").readPixels(0, 0, region_product.getSceneRasterWidth(),
+                                                       region_product.getSceneRasterHeight(), pixel_values)
+
+        self.assertEqual(1, len(cache.values))
+        self.assertEqual([], subsets)
+
+    def test_getSubsetProduct(self):
+        product, cache, region_products, subsets = setup()
+
+        region_products[1].getSubsetProduct()
+        region_products[1].getSubsetProduct()
+
+        self.assertEqual([(product, 6, 5, 4, 3)], subsets)
+
+    def test_getBandNames(self):
+        product, cache, region_products, subsets = setup()
+        self.assertEqual(["band1"], list(region_products[0].getBandNames()))
+
+
+if __name__ == "__main__":
+    unittest.main()
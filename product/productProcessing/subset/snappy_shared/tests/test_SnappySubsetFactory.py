@@ -0,0 +1,167 @@
+"""
+SnappySubsetFactory class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname, abspath
+from os.path import join as pjoin
+
+'''___Third-Party Modules___'''
+from numpy import arange, zeros, meshgrid, float32
+import snappy
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(dirname(dirname(abspath(__file__))))))
+sys.path.append(dirname(dirname(abspath(__file__))))
+from SnappySubsetFactory import SnappySubsetFactory
+from SnappyRegionProduct import SnappyRegionProduct, RegionPixelCache
+sys.path.append(pjoin(dirname(dirname(dirname(dirname(dirname(abspath(__file__)))))), "productIO", "sentinel2_reader"))
+from MSISharedFactory import MSIResolutionProduct
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+w = 15
+h = 10
+band1_array = arange(w*h, dtype=float32).reshape((h, w))
+
+# Regular 0.01 degree grid, pixel centre (c, r) at lon = 10.0 + 0.01 * (c + 0.5), lat = 45.0 - 0.01 * (r + 0.5)
+columns, rows = meshgrid(arange(w) + 0.5, arange(h) + 0.5)
+longitude_array = (10.0 + 0.01 * columns).astype(float32)
+latitude_array = (45.0 - 0.01 * rows).astype(float32)
+
+
+def pixel_centre_lonlat(c, r):
+    return 10.0 + 0.01 * (c + 0.5), 45.0 - 0.01 * (r + 0.5)
+
+
+def setup_geolocation():
+    """
+    Return product with per pixel latitude and longitude
+    """
+
+    product = snappy.Product("product", "type", w, h)
+    for name, values in [("band1", band1_array), ("latitude", latitude_array), ("longitude", longitude_array)]:
+        band = product.addBand(name, "float32")
+        band.ensureRasterData()
+        band.setPixels(0, 0, w, h, values.flatten())
+
+    return SnappySubsetFactory(), product
+
+
+def return_wkt(vertices):
+    vertices = vertices + [vertices[0]]
+    return "POLYGON ((" + ", ".join("%.6f %.6f" % pixel_centre_lonlat(c, r) for c, r in vertices) + "))"
+
+
+def setup():
+    """
+    Return Sentinel-2 resolution product of native 10 m product, resampled on demand
+    """
+
+    product = snappy.Product("product", "type", w, h)
+    band1 = product.addBand("band1", "float32")
+    band1.ensureRasterData()
+    band1.setPixels(0, 0, w, h, band1_array.flatten())
+
+    resampled = []
+
+    def resample(native_product, resolution):
+        resampled.append(resolution)
+        return native_product
+
+    return SnappySubsetFactory(), product, MSIResolutionProduct(product, 10, resample), resampled
+
+
+def read_band1(product):
+    width = int(product.getSceneRasterWidth())
+    height = int(product.getSceneRasterHeight())
+    pixel_values = zeros(width * height, float32)
+    product.getBand("band1").readPixels(0, 0, width, height, pixel_values)
+    return pixel_values.reshape((height, width))
+
+
+class TestSnappySubsetFactory(unittest.TestCase):
+    def test_pixProduct_sentinel2(self):
+        factory, product, resolution_product, resampled = setup()
+
+        product_subset = factory.pixProduct(resolution_product, 2, 3, 4, 5)
+
+        self.assertEqual([10], resampled)
+        self.assertEqual(4, product_subset.getSceneRasterWidth())
+        self.assertEqual(5, product_subset.getSceneRasterHeight())
+        self.assertEqual(band1_array[3:8, 2:6].tolist(), read_band1(product_subset).tolist())
+
+    def test_pixProduct_sentinel2_region(self):
+        factory, product, resolution_product, resampled = setup()
+
+        cache = RegionPixelCache(resolution_product, (1, 1, 10, 8))
+        region_product = SnappyRegionProduct(resolution_product, (2, 3, 4, 5), cache, factory.pixProduct)
+
+        product_subset = factory.pixProduct(region_product, 1, 1, 2, 2)
+
+        self.assertEqual([10], resampled)
+        self.assertEqual(2, product_subset.getSceneRasterWidth())
+        self.assertEqual(2, product_subset.getSceneRasterHeight())
+        self.assertEqual(band1_array[4:6, 3:5].tolist(), read_band1(product_subset).tolist())
+
+    def test_wkt2pixs_past_edge(self):
+        factory, product = setup_geolocation()
+
+        # Polygon of pixel centres columns -3 to 5, rows 2 to 6, extending past left edge of product
+        wkt = return_wkt([(-3, 2), (5, 2), (5, 6), (-3, 6)])
+
+        upper_left_x, upper_left_y, x_width, y_width, centre_x, centre_y, subset_mask = factory.wkt2pixs(product, wkt)
+
+        self.assertEqual((-3, 2, 9, 5), (upper_left_x, upper_left_y, x_width, y_width))
+        self.assertEqual((5, 9), subset_mask.shape)
+        self.assertFalse(subset_mask[:, :3].any())
+
+        window, subset_mask = factory.clip_window(product, (upper_left_x, upper_left_y, x_width, y_width),
+                                                  subset_mask)
+
+        self.assertEqual((0, 2, 6, 5), window)
+        self.assertEqual((5, 6), subset_mask.shape)
+        self.assertTrue(subset_mask[1:4, :5].all())
+
+    def test_wkt2pixs_past_edge_vertex_order(self):
+        factory, product = setup_geolocation()
+
+        vertices = [(-3, 2), (5, 2), (5, 6), (-3, 6)]
+        pixs_outside_first = factory.wkt2pixs(product, return_wkt(vertices))
+        pixs_inside_first = factory.wkt2pixs(product, return_wkt(vertices[1:] + vertices[:1]))
+
+        self.assertEqual(pixs_outside_first[:6], pixs_inside_first[:6])
+        self.assertEqual(pixs_outside_first[6].tolist(), pixs_inside_first[6].tolist())
+
+    def test_wkt2pixs_outside(self):
+        factory, product = setup_geolocation()
+
+        wkt = return_wkt([(-30, 2), (-20, 2), (-20, 6), (-30, 6)])
+        window = factory.wkt2pixs(product, wkt)[:4]
+
+        self.assertRaises(ValueError, factory.clip_window, product, window)
+
+    def test_pos2pixs_past_edge(self):
+        factory, product = setup_geolocation()
+
+        # Region centred on pixel centre (-1, 4), about 2.3 x 2.2 pixels in size
+        lon, lat = pixel_centre_lonlat(-1, 4)
+        upper_left_x, upper_left_y, x_width, y_width, centre_x, centre_y = factory.pos2pixs(product, (lon, lat, 2500.0))
+
+        self.assertEqual((-1, 4), (centre_x, centre_y))
+        self.assertEqual((-2, 3, 3, 3), (upper_left_x, upper_left_y, x_width, y_width))
+        self.assertEqual((0, 3, 1, 3), factory.clip_window(product, (upper_left_x, upper_left_y, x_width, y_width))[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
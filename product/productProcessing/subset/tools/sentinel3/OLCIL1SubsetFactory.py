@@ -12,12 +12,16 @@ from datetime import timedelta
 
 '''___Third-Party Modules___'''
 import snappy
-from numpy import count_nonzero
+from numpy import ma, ndarray
 
 '''___NPL Modules___'''
 sys.path.append(pjoin(dirname(dirname(dirname(__file__))), "snappy_shared"))
 from SnappySubsetFactory import SnappySubsetFactory
 
+productIO_directory = pjoin(dirname(dirname(dirname(dirname(dirname(__file__))))), "productIO")
+sys.path.append(productIO_directory)
+from FlagCoding import FlagCoding
+
 
 '''___Authorship___'''
 __author__ = "Sam Hunt"
@@ -41,6 +45,10 @@ class OLCIL1SubsetFactory(SnappySubsetFactory):
             Returns updated ``attributes`` dictionary attribute of subsetted Sentinel *eopy.dataIO.Product.Product* data
             product
 
+        .. py:method:: readRegionFlagValues(...):
+
+            Returns raw values of flag variable for pixels within the region of interest of subsetted product
+
         :inherited from *eopy.dataProcessing.subset.snappy_shared.SnappySubsetFactory.SnappySubsetFactory*:
 
             .. py:method:: processProduct(...):
@@ -111,16 +119,17 @@ class OLCIL1SubsetFactory(SnappySubsetFactory):
 
         new_attrs = deepcopy(product_subset.attributes)
 
-        # Compute new pixel flag percentages
+        # Compute new pixel flag percentages, from one read of the quality_flags bitfield
         flags = ["invalid", "cosmetic", "duplicated", "dubious", "fresh_inland_water", "bright", "tidal_region"]
 
+        quality_flags, flag_attributes = self.readRegionFlagValues(product_subset, "quality_flags")
+        percentages = FlagCoding.fromAttributes(flag_attributes).percentages(quality_flags, flags + ["land"])
+
         for flag in flags:
-            data = product_subset.getData("quality_flags_"+flag).values
-            new_attrs[flag+"_pixels_percentage"] = (float(count_nonzero(data))/float(data.size))*100.0
+            new_attrs[flag+"_pixels_percentage"] = percentages[flag]
 
         # deal with saline water separately (1 -land)
-        data = product_subset.getData("quality_flags_land").values
-        new_attrs["saline_water_pixels_percentage"] = 100.0 - ((float(count_nonzero(data)) / float(data.size)) * 100.0)
+        new_attrs["saline_water_pixels_percentage"] = 100.0 - percentages["land"]
 
         # todo - write update saturated pixels percentage entry
         new_attrs['saturated_pixels_percentage'] = None
@@ -130,6 +139,45 @@ class OLCIL1SubsetFactory(SnappySubsetFactory):
 
         return new_attrs
 
+    def readRegionFlagValues(self, product_subset, variable):
+        """
+        Returns raw values of flag variable for pixels within the region of interest of subsetted product, with its flag
+        attributes
+
+        The flag word is read unmasked, as masked reads through *getData* are returned as floats with masked pixels set
+        to NaN, and the region of interest mask of WKT subsets (the data factory ``data_mask``) applied by selecting
+        pixels within the region
+
+        :type product_subset: eopy.dataIO.Product.Product
+        :param product_subset: subsetted data product
+
+        :type variable: str
+        :param variable: Name of flag variable
+
+        :return:
+            :flag_values: *numpy.ndarray*
+
+            Raw flag values of pixels within region of interest, as *uint32*
+
+            :flag_attributes: *dict*
+
+            ``flag_masks`` and ``flag_meanings`` attributes of flag variable
+        """
+
+        dataFactory = product_subset.dataReader.dataFactory
+
+        product = dataFactory.determine_getData_product(product_subset.product, [variable])
+        flag_values = ma.getdata(dataFactory.getPixelValues(product, product_subset.variables,
+                                                            product_subset.attributes, variable))
+        flag_attributes = dataFactory.getFlagAttributes(product, variable)
+
+        # Region of interest mask set for WKT subsets only, true within region
+        region_mask = dataFactory.determine_getData_mask(product_subset.product, [variable])
+        if isinstance(region_mask, ndarray):
+            flag_values = flag_values[region_mask.astype(bool)]
+
+        return flag_values, flag_attributes
+
 
 if __name__ == "__main__":
     pass
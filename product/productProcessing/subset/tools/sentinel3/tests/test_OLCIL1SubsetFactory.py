@@ -0,0 +1,124 @@
+"""
+OLCIL1SubsetFactory class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname, abspath
+from os.path import join as pjoin
+
+'''___Third-Party Modules___'''
+from numpy import array, ones, ma, uint32, bool_
+import xarray as xr
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(dirname(dirname(dirname(abspath(__file__)))))))
+sys.path.append(dirname(dirname(abspath(__file__))))
+from OLCIL1SubsetFactory import OLCIL1SubsetFactory
+sys.path.append(pjoin(dirname(dirname(dirname(dirname(dirname(dirname(abspath(__file__))))))), "productIO"))
+from Product import Product
+from AbstractDataReader import AbstractDataReader
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+FLAG_MEANINGS = ["land", "coastline", "fresh_inland_water", "tidal_region", "bright", "invalid", "cosmetic",
+                 "duplicated", "dubious"]
+FLAG_MASKS = array([2**31, 2**30, 2**29, 2**28, 2**27, 2**25, 2**24, 2**23, 2**21], uint32)
+
+# quality_flags of 4 x 3 subset window, WKT region of interest is the first two columns
+LAND = 2**31
+BRIGHT = 2**27
+INVALID = 2**25
+quality_flags_array = array([[LAND, LAND | BRIGHT, INVALID],
+                             [LAND, 0, INVALID],
+                             [0, 0, INVALID]], uint32)
+region_mask = array([[True, True, False],
+                     [True, True, False],
+                     [True, True, False]])
+
+
+class FlagDataFactory(object):
+    """
+    Data factory of one subsetted product with quality_flags band, reading data as snappy data factories do -
+    masked reads returned by *getData* as floats with masked pixels set to NaN
+    """
+
+    def __init__(self):
+        self.data_mask = None
+
+    def determine_getData_product(self, products, selected_variables):
+        return products[0]["product"]
+
+    def determine_getData_mask(self, products, selected_variables):
+        return self.data_mask
+
+    def getPixelValues(self, product, variables, attributes, variable, mask=None, window=None,
+                       tie_point_resolution="image", scaling="physical"):
+        valid_mask = ones(quality_flags_array.shape, bool_)
+        if mask is not None:
+            return ma.masked_array(quality_flags_array, mask=mask ^ valid_mask)
+        return ma.masked_array(quality_flags_array, mask=~valid_mask)
+
+    def getFlagAttributes(self, product, variable):
+        return {"flag_masks": FLAG_MASKS, "flag_meanings": " ".join(FLAG_MEANINGS)}
+
+    def getData(self, products, variables, attributes, variable, *args, **kwargs):
+        product = self.determine_getData_product(products, [variable])
+        mask = self.determine_getData_mask(products, [variable])
+        return xr.DataArray(self.getPixelValues(product, variables, attributes, variable, mask=mask),
+                            attrs=self.getFlagAttributes(product, variable))
+
+
+def setup(data_mask=None):
+    product_subset = Product()
+    product_subset.dataReader = AbstractDataReader()
+    product_subset.dataReader.dataFactory = FlagDataFactory()
+    product_subset.dataReader.dataFactory.data_mask = data_mask
+    product_subset.product = [{"product_name": "main", "product": None, "variables": ["quality_flags"]}]
+    product_subset.variables = []
+    product_subset.attributes = {"product_string": "OL_1_EFR"}
+
+    return OLCIL1SubsetFactory(), product_subset
+
+
+class TestOLCIL1SubsetFactory(unittest.TestCase):
+    def test_updateSpecificAttributes_pos(self):
+        factory, product_subset = setup()
+
+        new_attrs = factory.updateSpecificAttributes(product_subset, None)
+
+        self.assertAlmostEqual(100.0 / 3.0, new_attrs["invalid_pixels_percentage"])
+        self.assertAlmostEqual(100.0 / 9.0, new_attrs["bright_pixels_percentage"])
+        self.assertAlmostEqual(100.0 - 100.0 / 3.0, new_attrs["saline_water_pixels_percentage"])
+        self.assertEqual(0.0, new_attrs["dubious_pixels_percentage"])
+
+    def test_updateSpecificAttributes_wkt(self):
+        factory, product_subset = setup(data_mask=region_mask)
+
+        new_attrs = factory.updateSpecificAttributes(product_subset, None)
+
+        self.assertEqual(0.0, new_attrs["invalid_pixels_percentage"])
+        self.assertAlmostEqual(100.0 / 6.0, new_attrs["bright_pixels_percentage"])
+        self.assertAlmostEqual(50.0, new_attrs["saline_water_pixels_percentage"])
+
+    def test_readRegionFlagValues_wkt(self):
+        factory, product_subset = setup(data_mask=region_mask)
+
+        flag_values, flag_attributes = factory.readRegionFlagValues(product_subset, "quality_flags")
+
+        self.assertEqual(uint32, flag_values.dtype)
+        self.assertEqual(sorted(quality_flags_array[region_mask].tolist()), sorted(flag_values.tolist()))
+        self.assertEqual(" ".join(FLAG_MEANINGS), flag_attributes["flag_meanings"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,278 @@
+"""
+Snappy products with radiance bands converted to reflectance in memory, per band and window as read
+"""
+
+'''___Built-In Modules___'''
+from threading import Lock
+from collections import OrderedDict
+
+'''___Third-Party Modules___'''
+from numpy import pi, cos, deg2rad, zeros, float32
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+ASTRONOMICAL_UNIT = 149597870700.0  # (m)
+GEOMETRY_CACHE_SIZE = 4             # Windows of geometry held per product, shared by reflectance bands read in turn
+
+
+def return_earth_sun_distance(date):
+    """
+    Return approximate Earth-Sun distance on given date, to within about 0.0002 AU
+
+    :type date: datetime.datetime
+    :param date: date
+
+    :return:
+        :earth_sun_distance: *float*
+
+        Earth-Sun distance (AU)
+    """
+
+    day_of_year = date.timetuple().tm_yday
+    return 1.0 - 0.01672 * cos(deg2rad(0.9856 * (day_of_year - 4)))
+
+
+def radiance2reflectance(radiance, solar_flux, solar_zenith, earth_sun_distance=None):
+    """
+    Return reflectance, :math:`\\rho = \\pi L d^2 / (F_0 \\cos\\theta_s)`. Vectorised, so suitable for *numpy.ndarray*
+    or *dask.array.Array* arguments.
+
+    :type radiance: numpy.ndarray
+    :param radiance: radiance, *L*
+
+    :type solar_flux: numpy.ndarray
+    :param solar_flux: solar flux, *F_0*, in units of radiance times steradians
+
+    :type solar_zenith: numpy.ndarray
+    :param solar_zenith: solar zenith angle, *theta_s* (degrees)
+
+    :type earth_sun_distance: float
+    :param earth_sun_distance: (optional) Earth-Sun distance, *d* (AU). If None (default) no correction applied, as
+    for solar flux already corrected to the Earth-Sun distance of acquisition.
+
+    :return:
+        :reflectance: *numpy.ndarray*
+
+        reflectance
+    """
+
+    reflectance = pi * radiance / (solar_flux * cos(deg2rad(solar_zenith)))
+
+    if earth_sun_distance is not None:
+        reflectance = reflectance * earth_sun_distance ** 2
+
+    return reflectance
+
+
+class SnappyReflectanceProduct(object):
+    """
+    SnappyReflectanceProduct is an in-memory representation of a *snappy.Product* with radiance bands converted to
+    reflectance. Each reflectance band is computed from its radiance, solar flux and solar zenith angle only when its
+    pixels are read, and only within the window read - so reading one reflectance band of a small region (or one dask
+    chunk) costs the same as reading its radiance, rather than converting all bands of the full scene with the snap
+    *Rad2Refl* operator. Solar geometry (e.g. tie point grids interpolated to the window) is read once per window and
+    shared by the reflectance bands read in it.
+
+    Reflectance bands replace their radiance bands, other bands are kept, as for the snap *Rad2Refl* operator with
+    non-spectral bands copied. The converted *snappy.Product* is only created, with the snap *Rad2Refl* operator, the
+    first time it is required (e.g. to pass to another snap operator). Other *snappy.Product* methods are delegated to
+    the source product.
+
+    :Attributes:
+        .. py:attribute:: product
+
+            *snappy.Product*
+
+            Source product
+
+        .. py:attribute:: reflectance_bands
+
+            *collections.OrderedDict*
+
+            Definitions of reflectance bands by name, each a tuple of *(radiance, solar_flux, solar_zenith)* - names of
+            radiance band, solar flux band (or value) and solar zenith angle band or tie point grid of source product
+
+        .. py:attribute:: earth_sun_distance
+
+            *float*
+
+            Earth-Sun distance (AU) to correct reflectance for, None if no correction applied
+
+    :Methods:
+        .. py:method:: getReflectanceProduct(...):
+
+            Return converted product, converting with snap on first call
+
+        .. py:method:: readGeometry(...):
+
+            Return pixel values of band or tie point grid of source product within window, shared between reflectance
+            bands
+    """
+
+    def __init__(self, product, reflectance_bands, convert, earth_sun_distance=None):
+        """
+        Initialise reflectance product
+
+        :type product: *snappy.Product*
+        :param product: Source product
+
+        :type reflectance_bands: collections.OrderedDict
+        :param reflectance_bands: Definitions of reflectance bands by name, each a tuple of
+        *(radiance, solar_flux, solar_zenith)*
+
+        :type convert: function
+        :param convert: Function to convert source product with snap, with argument *(product)*
+
+        :type earth_sun_distance: float
+        :param earth_sun_distance: (optional) Earth-Sun distance (AU) to correct reflectance for
+        """
+
+        self.product = product
+        self.reflectance_bands = reflectance_bands
+        self.convert = convert
+        self.earth_sun_distance = earth_sun_distance
+        self.reflectance_product = None
+        self.lock = Lock()
+        self.geometry = OrderedDict()
+        self.geometry_lock = Lock()
+
+        self.radiance_band_names = set(radiance for radiance, _, _ in reflectance_bands.values())
+
+    def getReflectanceProduct(self):
+        """
+        Return converted product, converting with snap on first call
+
+        :return:
+            :reflectance_product: *snappy.Product*
+
+            Converted product
+        """
+
+        with self.lock:
+            if self.reflectance_product is None:
+                self.reflectance_product = self.convert(self.product)
+        return self.reflectance_product
+
+    def readGeometry(self, name, x, y, w, h):
+        """
+        Return pixel values of band or tie point grid of source product within window, shared between reflectance
+        bands. Values for the most recently read windows are cached.
+
+        :type name: str
+        :param name: band or tie point grid name
+
+        :type x: int
+        :param x: window x
+
+        :type y: int
+        :param y: window y
+
+        :type w: int
+        :param w: window width
+
+        :type h: int
+        :param h: window height
+
+        :return:
+            :values: *numpy.ndarray*
+
+            Pixel values, flattened, read-only
+        """
+
+        key = (name, x, y, w, h)
+
+        with self.geometry_lock:
+            if key in self.geometry:
+                self.geometry[key] = self.geometry.pop(key)
+                return self.geometry[key]
+
+        node = self.product.getBand(name)
+        if node is None:
+            node = self.product.getTiePointGrid(name)
+        values = zeros(w * h, float32)
+        node.readPixels(x, y, w, h, values)
+        values.flags.writeable = False
+
+        with self.geometry_lock:
+            self.geometry[key] = values
+            while len(self.geometry) > GEOMETRY_CACHE_SIZE:
+                self.geometry.popitem(last=False)
+
+        return values
+
+    def getBandNames(self):
+        band_names = [name for name in self.product.getBandNames() if name not in self.radiance_band_names]
+        return list(self.reflectance_bands.keys()) + band_names
+
+    def getBand(self, name):
+        if name in self.reflectance_bands:
+            return SnappyReflectanceNode(name, self)
+        if name in self.radiance_band_names:
+            return None
+        return self.product.getBand(name)
+
+    def __getattr__(self, name):
+        return getattr(self.product, name)
+
+
+class SnappyReflectanceNode(object):
+    """
+    SnappyReflectanceNode is a reflectance band of a *SnappyReflectanceProduct*, computing reflectance within the
+    window read from the radiance, solar flux and solar zenith angle of the source product in the same window. Valid
+    masks are those of the radiance band. Other band methods are delegated to the source product radiance band.
+    """
+
+    def __init__(self, name, reflectance_product):
+        self.name = name
+        self.reflectance_product = reflectance_product
+
+        product = reflectance_product.product
+        self.radiance_name, self.solar_flux, self.solar_zenith_name = reflectance_product.reflectance_bands[name]
+        self.node = product.getBand(self.radiance_name)
+
+    def getName(self):
+        return self.name
+
+    def getUnit(self):
+        return "dl"
+
+    def isFlagBand(self):
+        return False
+
+    def readPixels(self, x, y, w, h, pixel_values):
+        radiance = zeros(w * h, float32)
+        self.node.readPixels(x, y, w, h, radiance)
+        solar_zenith = self.reflectance_product.readGeometry(self.solar_zenith_name, x, y, w, h)
+        solar_flux = self.solar_flux
+        if isinstance(solar_flux, str):
+            solar_flux = self._readNode(solar_flux, x, y, w, h)
+
+        pixel_values[:] = radiance2reflectance(radiance, solar_flux, solar_zenith,
+                                               self.reflectance_product.earth_sun_distance)
+        return pixel_values
+
+    def readValidMask(self, x, y, w, h, valid_mask):
+        return self.node.readValidMask(x, y, w, h, valid_mask)
+
+    def _readNode(self, name, x, y, w, h):
+        values = zeros(w * h, float32)
+        self.reflectance_product.product.getBand(name).readPixels(x, y, w, h, values)
+        return values
+
+    def __getattr__(self, name):
+        return getattr(self.node, name)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,106 @@
+"""
+SnappyReflectanceProduct class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+from collections import OrderedDict
+from datetime import datetime
+
+'''___Third-Party Modules___'''
+from numpy import arange, zeros, full, float32, pi, cos, deg2rad
+from numpy.testing import assert_allclose
+import snappy
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from SnappyReflectanceProduct import SnappyReflectanceProduct, radiance2reflectance, return_earth_sun_distance
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+w = 15
+h = 10
+radiance_array = arange(w*h, dtype=float32).reshape((h, w))
+solar_flux_array = full((h, w), 1500.0, float32)
+sza_array = (arange(w*h, dtype=float32).reshape((h, w)) / 5.0).astype(float32)
+
+
+def setup():
+    product = snappy.Product("product", "type", w, h)
+    for name, values in [("Oa01_radiance", radiance_array), ("solar_flux_band_1", solar_flux_array),
+                         ("SZA", sza_array), ("quality_flags", zeros((h, w), float32))]:
+        band = product.addBand(name, "float32")
+        band.ensureRasterData()
+        band.setPixels(0, 0, w, h, values.flatten())
+
+    converted = []
+
+    def convert(p):
+        converted.append(p)
+        return p
+
+    reflectance_bands = OrderedDict([("Oa01_reflectance", ("Oa01_radiance", "solar_flux_band_1", "SZA")),
+                                     ("Oa02_reflectance", ("Oa01_radiance", 1500.0, "SZA"))])
+    return product, SnappyReflectanceProduct(product, reflectance_bands, convert), converted
+
+
+class TestSnappyReflectanceProduct(unittest.TestCase):
+    def test_radiance2reflectance(self):
+        self.assertAlmostEqual(pi * 100.0 / (1500.0 * cos(deg2rad(60.0))), radiance2reflectance(100.0, 1500.0, 60.0))
+        self.assertAlmostEqual(radiance2reflectance(100.0, 1500.0, 60.0) * 0.98 ** 2,
+                               radiance2reflectance(100.0, 1500.0, 60.0, earth_sun_distance=0.98))
+
+    def test_return_earth_sun_distance(self):
+        self.assertAlmostEqual(0.9833, return_earth_sun_distance(datetime(2018, 1, 3)), places=3)
+        self.assertAlmostEqual(1.0167, return_earth_sun_distance(datetime(2018, 7, 4)), places=3)
+
+    def test_getBandNames(self):
+        product, reflectance_product, converted = setup()
+        self.assertEqual(["Oa01_reflectance", "Oa02_reflectance", "SZA", "quality_flags", "solar_flux_band_1"],
+                         reflectance_product.getBandNames()[:2] + sorted(reflectance_product.getBandNames()[2:]))
+        self.assertIsNone(reflectance_product.getBand("Oa01_radiance"))
+
+    def test_readPixels(self):
+        product, reflectance_product, converted = setup()
+
+        pixel_values = zeros(3 * 2, float32)
+        band = reflectance_product.getBand("Oa01_reflectance")
+        band.readPixels(4, 5, 3, 2, pixel_values)
+
+        expected = radiance2reflectance(radiance_array, solar_flux_array, sza_array)[5:7, 4:7]
+        assert_allclose(expected.flatten(), pixel_values, rtol=1e-6)
+        self.assertEqual("Oa01_reflectance", band.getName())
+        self.assertEqual([], converted)
+
+    def test_readPixels_solar_flux_value(self):
+        product, reflectance_product, converted = setup()
+
+        pixel_values = [zeros(3 * 2, float32), zeros(3 * 2, float32)]
+        reflectance_product.getBand("Oa01_reflectance").readPixels(4, 5, 3, 2, pixel_values[0])
+        reflectance_product.getBand("Oa02_reflectance").readPixels(4, 5, 3, 2, pixel_values[1])
+
+        assert_allclose(pixel_values[0], pixel_values[1], rtol=1e-6)
+
+        # Geometry read once for both bands
+        self.assertEqual(1, len(reflectance_product.geometry))
+
+    def test_getReflectanceProduct(self):
+        product, reflectance_product, converted = setup()
+
+        self.assertIs(product, reflectance_product.getReflectanceProduct())
+        reflectance_product.getReflectanceProduct()
+        self.assertEqual(1, len(converted))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ import sys
 from os.path import dirname
 from os.path import join as pjoin
 from copy import deepcopy
+from collections import OrderedDict
 import re
 
 '''___Third-Party Modules___'''
@@ -21,6 +22,11 @@ from AbstractProcessingFactory import AbstractProcessingFactory
 productIO_directory = pjoin(dirname(productProcessing_directory), "productIO")
 sys.path.append(productIO_directory)
 from Product import Product
+sys.path.append(pjoin(productIO_directory, "snappy_shared"))
+from SnappyLazyProduct import return_snap_product
+
+sys.path.append(pjoin(dirname(dirname(dirname(__file__))), "snappy_shared"))
+from SnappyReflectanceProduct import SnappyReflectanceProduct, ASTRONOMICAL_UNIT
 
 
 '''___Authorship___'''
@@ -33,6 +39,10 @@ __email__ = "sam.hunt@npl.co.uk"
 __status__ = "Development"
 
 
+# Constants
+OLCI_BANDS = 21
+
+
 class OLCIL1Radiance2ReflectanceFactory(AbstractProcessingFactory):
     """
     OLCIL1Radiance2ReflectanceFactory is a sub-class of *AbstractProcessingFactory* for converting Sentinel-3 OLCI L1
@@ -47,10 +57,19 @@ class OLCIL1Radiance2ReflectanceFactory(AbstractProcessingFactory):
 
             Return product_name entry of processed *eopy.product.productIO.Product.Product* product dictionary attribute
 
+        .. py:method:: returnEarthSunDistance(...):
+
+            Return Earth-Sun distance at acquisition of product
+
         .. py:method:: convertProduct(...):
 
             Return OLCI *snappy.Product* data product object with units converted to reflectance
 
+        .. py:method:: snapConvertProduct(...):
+
+            Return OLCI *snappy.Product* data product object with units converted to reflectance by snap *Rad2Refl*
+            operator
+
         .. py:method:: updateProductVariablesAttributes(...):
 
             Return updates variables attribute of processed *eopy.product.productIO.Product.Product* product attribute.
@@ -85,6 +104,9 @@ class OLCIL1Radiance2ReflectanceFactory(AbstractProcessingFactory):
                 Initialises the class
     """
 
+    # Pattern of names of radiance variables converted to reflectance
+    RADIANCE_VARIABLE_PATTERN = re.compile(r"Oa.*_radiance")
+
     def processProduct(self, product, **kwargs):
         """
         Returns input *eopy.product.productIO.Product.Product* OLCI L1 data object in units of reflectance
@@ -92,12 +114,20 @@ class OLCIL1Radiance2ReflectanceFactory(AbstractProcessingFactory):
         :type product: eopy.product.productIO.Product.Product
         :param product: Data product to process
 
+        :type earth_sun_distance_correction: bool
+        :param earth_sun_distance_correction: (default False) if True, correct reflectance for the Earth-Sun distance
+        of acquisition. Not required for OLCI L1 products, as their solar flux is already corrected for it.
+
         :return:
             :product_processed: *eopy.product.productIO.Product.Product*
 
             Processed data product
         """
 
+        earth_sun_distance = None
+        if ("earth_sun_distance_correction" in kwargs.keys()) and kwargs["earth_sun_distance_correction"]:
+            earth_sun_distance = self.returnEarthSunDistance(product)
+
         # Initialise subset empty subset product
         product_processed = Product()
         product_processed.dataReader = product.dataReader
@@ -113,7 +143,8 @@ class OLCIL1Radiance2ReflectanceFactory(AbstractProcessingFactory):
 
             # Convert units to reflectance
             product_processed.product[i]["product_name"] = self.updateProductName(p["product_name"])
-            product_processed.product[i]["product"] = self.convertProduct(p["product"])
+            product_processed.product[i]["product"] = self.convertProduct(p["product"],
+                                                                          earth_sun_distance=earth_sun_distance)
             product_processed.product[i]["variables"] = self.updateProductVariablesAttributes(p["variables"])
 
         ################################################################################################################
@@ -126,7 +157,9 @@ class OLCIL1Radiance2ReflectanceFactory(AbstractProcessingFactory):
         product_processed.attributes = self.updateCommonAttributes(product_processed, product)
 
         # Update processing log
-        product_processed.attributes = self.updateAttributesProcessingLog(product_processed, "rad2refl", {})
+        product_processed.attributes = self.updateAttributesProcessingLog(product_processed, "rad2refl",
+                                                                          {"earth_sun_distance_correction":
+                                                                           earth_sun_distance is not None})
 
         # Update product specific attributes - should be updated in product specific sub-classes
         product_processed.attributes = self.updateSpecificAttributes(product_processed, product)
@@ -150,10 +183,56 @@ class OLCIL1Radiance2ReflectanceFactory(AbstractProcessingFactory):
 
         return original_product_name
 
-    def convertProduct(self, product, sensor="OLCI"):
+    def returnEarthSunDistance(self, product):
+        """
+        Return Earth-Sun distance at acquisition of product
+
+        :type product: eopy.product.productIO.Product.Product
+        :param product: Data product
+
+        :return:
+            :earth_sun_distance: *float*
+
+            Earth-Sun distance (AU)
+        """
+
+        return product.attributes["earth_sun_distance"] / ASTRONOMICAL_UNIT
+
+    def convertProduct(self, product, earth_sun_distance=None):
         """
         Return OLCI *snappy.Product* data product object with units converted to reflectance
 
+        Reflectance, :math:`\\rho = \\pi L / (F_0 \\cos\\theta_s)`, is computed in memory from each band's
+        radiance, *solar_flux_band_n* and *SZA* only when read, and only within the window read (see
+        *SnappyReflectanceProduct*).
+
+        :type product: *snappy.Product*
+        :param product: In-memory OLCI L1 data product
+
+        :type earth_sun_distance: float
+        :param earth_sun_distance: (optional) Earth-Sun distance (AU) to correct reflectance for, default no correction
+
+        :return:
+            :product_processed: *snappy.Product*
+
+            In-memory OLCI L1 data product with units converted to reflectance
+        """
+
+        band_names = set(product.getBandNames())
+
+        reflectance_bands = OrderedDict()
+        for i in range(1, OLCI_BANDS + 1):
+            if "Oa%02d_radiance" % i in band_names:
+                reflectance_bands["Oa%02d_reflectance" % i] = ("Oa%02d_radiance" % i, "solar_flux_band_%d" % i, "SZA")
+
+        return SnappyReflectanceProduct(product, reflectance_bands, self.snapConvertProduct,
+                                        earth_sun_distance=earth_sun_distance)
+
+    def snapConvertProduct(self, product, sensor="OLCI"):
+        """
+        Return OLCI *snappy.Product* data product object with units converted to reflectance by snap *Rad2Refl*
+        operator
+
         :type product: *snappy.Product*
         :param product: In-memory OLCI L1 data product
 
@@ -166,6 +245,9 @@ class OLCIL1Radiance2ReflectanceFactory(AbstractProcessingFactory):
             In-memory OLCI L1 data product with units converted to reflectance
         """
 
+        # Lazily processed products (e.g. region and collocated products) only processed with snap when required
+        product = return_snap_product(product)
+
         HashMap = jpy.get_type('java.util.HashMap')
         params = HashMap()
         params.put("sensor", sensor)
@@ -194,9 +276,8 @@ class OLCIL1Radiance2ReflectanceFactory(AbstractProcessingFactory):
         new_product_variables_attrs = deepcopy(original_product_variables_attrs)
 
         # Replace radiance variable names to reflectance
-        rad_var_name = re.compile(r"Oa.*_radiance.*")
         for i in range(len(new_product_variables_attrs)):
-            if rad_var_name.match(new_product_variables_attrs[i]):
+            if self.RADIANCE_VARIABLE_PATTERN.match(new_product_variables_attrs[i]):
                 new_product_variables_attrs[i] = new_product_variables_attrs[i].replace("radiance", "reflectance")
 
         return new_product_variables_attrs
@@ -300,9 +381,8 @@ class OLCIL1Radiance2ReflectanceFactory(AbstractProcessingFactory):
         new_variables = deepcopy(product.variables)
 
         # Replace radiance variable names to reflectance
-        rad_var_name = re.compile(r"Oa.*_radiance")
         for i in range(len(new_variables)):
-            if rad_var_name.match(new_variables[i].name):
+            if self.RADIANCE_VARIABLE_PATTERN.match(new_variables[i].name):
 
                 # Copy radiance variables attributes
                 new_variables[i].name = new_variables[i].name.replace("radiance", "reflectance")
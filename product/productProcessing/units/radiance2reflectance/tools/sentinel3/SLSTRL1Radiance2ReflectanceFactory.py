@@ -0,0 +1,176 @@
+"""
+Processing factory for converting Sentinel-3 SLSTR L1 eopy.product.productIO.Product.Product objects to reflectance
+units
+"""
+
+'''___Built-In Modules___'''
+import sys
+from os.path import dirname
+from os.path import join as pjoin
+from collections import OrderedDict
+import re
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(__file__))
+from OLCIL1Radiance2ReflectanceFactory import OLCIL1Radiance2ReflectanceFactory
+
+sys.path.append(pjoin(dirname(dirname(dirname(__file__))), "snappy_shared"))
+from SnappyReflectanceProduct import SnappyReflectanceProduct, return_earth_sun_distance
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+# Pattern of SLSTR visible/SWIR radiance band names - channel, stripe (a, b or c) and view (nadir or oblique)
+SLSTR_RADIANCE_BAND_PATTERN = re.compile(r"^(S[1-6])_radiance_([abc])([no])$")
+
+# Nominal in-band solar irradiance of SLSTR visible/SWIR channels at 1 AU (mW.m-2.nm-1), as used by snap Rad2Refl
+SLSTR_SOLAR_IRRADIANCES = {"S1": 1837.39, "S2": 1525.94, "S3": 956.17, "S4": 365.90, "S5": 248.33, "S6": 78.33}
+
+
+class SLSTRL1Radiance2ReflectanceFactory(OLCIL1Radiance2ReflectanceFactory):
+    """
+    SLSTRL1Radiance2ReflectanceFactory is a sub-class of *OLCIL1Radiance2ReflectanceFactory* for converting the
+    visible/SWIR channels (S1-S6) of Sentinel-3 SLSTR L1 *eopy.product.productIO.Product.Product* objects to units of
+    reflectance.
+
+    Radiance bands of all stripes (a, b, c) and views (nadir, oblique) are converted, with the solar zenith angle of
+    their view (*solar_zenith_tn* or *solar_zenith_to* tie point grid). The 1 km product, of thermal channels, is
+    unchanged.
+
+    :Methods:
+        .. py:method:: returnEarthSunDistance(...):
+
+            Return Earth-Sun distance at acquisition of product
+
+        .. py:method:: convertProduct(...):
+
+            Return SLSTR *snappy.Product* data product object with units converted to reflectance
+
+        :inherited from OLCIL1Radiance2ReflectanceFactory.OLCIL1Radiance2ReflectanceFactory:
+
+            .. py:method:: processProduct(...):
+
+                Returns input *eopy.product.productIO.Product.Product* data object in units of reflectance
+
+            .. py:method:: updateProductName(...):
+
+                Return product_name entry of processed *eopy.product.productIO.Product.Product* product dictionary
+                attribute
+
+            .. py:method:: snapConvertProduct(...):
+
+                Return *snappy.Product* data product object with units converted to reflectance by snap *Rad2Refl*
+                operator
+
+            .. py:method:: updateProductVariablesAttributes(...):
+
+                Return updates variables attribute of processed *eopy.product.productIO.Product.Product* product
+                attribute.
+
+            .. py:method:: updateCommonAttributes(...):
+
+                Returns updated ``attributes`` attribute for common snappy product attributes
+
+            .. py:method:: updateSpecificAttributes(...):
+
+                Returns updated ``attributes`` attribute for specific product attributes
+
+            .. py:method:: updateAttributesProcessingLog(...):
+
+                Returns ``attributes`` attribute of processed *eopy.product.productIO.Product.Product* product with
+                updated "product_processing" log entry
+
+            .. py:method:: updateVariables(...):
+
+                Return update variables list attribute of processed *eopy.product.productIO.Product.Product* data
+                product.
+    """
+
+    # Pattern of names of radiance variables converted to reflectance
+    RADIANCE_VARIABLE_PATTERN = re.compile(r"S[1-6]_radiance_")
+
+    def returnEarthSunDistance(self, product):
+        """
+        Return Earth-Sun distance at acquisition of product, from product start time
+
+        :type product: eopy.product.productIO.Product.Product
+        :param product: Data product
+
+        :return:
+            :earth_sun_distance: *float*
+
+            Earth-Sun distance (AU)
+        """
+
+        return return_earth_sun_distance(product.attributes["start_time"])
+
+    def convertProduct(self, product, earth_sun_distance=None):
+        """
+        Return SLSTR *snappy.Product* data product object with units converted to reflectance
+
+        Reflectance, :math:`\\rho = \\pi L / (F_0 \\cos\\theta_s)`, is computed in memory from each band's
+        radiance, channel nominal solar irradiance and view solar zenith angle only when read, and only within the
+        window read (see *SnappyReflectanceProduct*). The tie point solar zenith angle is interpolated to the 500 m grid
+        only within the window read, once for all bands of a view.
+
+        :type product: *snappy.Product*
+        :param product: In-memory SLSTR L1 data product
+
+        :type earth_sun_distance: float
+        :param earth_sun_distance: (optional) Earth-Sun distance (AU) to correct reflectance for, default no correction
+
+        :return:
+            :product_processed: *snappy.Product*
+
+            In-memory SLSTR L1 data product with units converted to reflectance, unchanged if product has no
+            visible/SWIR radiance bands
+        """
+
+        reflectance_bands = OrderedDict()
+        for name in product.getBandNames():
+            match = SLSTR_RADIANCE_BAND_PATTERN.match(name)
+            if match is None:
+                continue
+
+            channel, stripe, view = match.groups()
+            reflectance_bands[name.replace("radiance", "reflectance")] = (name, SLSTR_SOLAR_IRRADIANCES[channel],
+                                                                          "solar_zenith_t" + view)
+
+        if len(reflectance_bands) == 0:
+            return product
+
+        return SnappyReflectanceProduct(product, reflectance_bands, self.snapConvertProduct,
+                                        earth_sun_distance=earth_sun_distance)
+
+    def snapConvertProduct(self, product, sensor="SLSTR_500m"):
+        """
+        Return SLSTR *snappy.Product* data product object with units converted to reflectance by snap *Rad2Refl*
+        operator
+
+        :type product: *snappy.Product*
+        :param product: In-memory SLSTR L1 data product
+
+        :param type: str
+        :param sensor: name of product sensor (default "SLSTR_500m")
+
+        :return:
+            :product_processed: *snappy.Product*
+
+            In-memory SLSTR L1 data product with units converted to reflectance
+        """
+
+        return OLCIL1Radiance2ReflectanceFactory.snapConvertProduct(self, product, sensor=sensor)
+
+
+if __name__ == "__main__":
+    pass
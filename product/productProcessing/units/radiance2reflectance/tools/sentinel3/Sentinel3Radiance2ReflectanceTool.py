@@ -16,6 +16,7 @@ from AbstractProcessingTool import AbstractProcessingTool
 
 sys.path.append(dirname(__file__))
 from OLCIL1Radiance2ReflectanceFactory import OLCIL1Radiance2ReflectanceFactory
+from SLSTRL1Radiance2ReflectanceFactory import SLSTRL1Radiance2ReflectanceFactory
 
 '''___Authorship___'''
 __author__ = "Sam Hunt"
@@ -82,8 +83,7 @@ class Sentinel3Radiance2ReflectanceTool(AbstractProcessingTool):
             return OLCIL1Radiance2ReflectanceFactory
         # SLSTR L1 Radiance & Brightness Temperatures
         if product_string == "SL_1_RBT":
-            # todo - write subset factory for SL_1_RBT type products
-            return None
+            return SLSTRL1Radiance2ReflectanceFactory
         # Synergy - SLSTR and OLCI L1b ungridded bands
         if product_string == "SY_1_SYN":
             # todo - write subset factory for SY_1_SYN type products
@@ -0,0 +1,84 @@
+"""
+SLSTRL1Radiance2ReflectanceFactory class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+from datetime import datetime
+
+'''___Third-Party Modules___'''
+import snappy
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from SLSTRL1Radiance2ReflectanceFactory import SLSTRL1Radiance2ReflectanceFactory
+from OLCIL1Radiance2ReflectanceFactory import OLCIL1Radiance2ReflectanceFactory
+from Sentinel3Radiance2ReflectanceTool import Sentinel3Radiance2ReflectanceTool
+from SnappyReflectanceProduct import SnappyReflectanceProduct, return_earth_sun_distance
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+class ProductStub(object):
+    def __init__(self, attributes):
+        self.attributes = attributes
+
+
+def setup(band_names):
+    product = snappy.Product("product", "SL_1_RBT", 4, 3)
+    for name in band_names:
+        product.addBand(name, "float32")
+    return product
+
+
+class TestSLSTRL1Radiance2ReflectanceFactory(unittest.TestCase):
+    def test_convertProduct(self):
+        product = setup(["S1_radiance_an", "S5_radiance_bo", "S6_radiance_cn", "S7_BT_in", "S1_radiance_an_extra",
+                         "solar_zenith_tn", "solar_zenith_to"])
+
+        factory = SLSTRL1Radiance2ReflectanceFactory()
+        reflectance_product = factory.convertProduct(product, earth_sun_distance=0.98)
+
+        self.assertEqual(type(reflectance_product), SnappyReflectanceProduct)
+        self.assertIs(reflectance_product.product, product)
+        self.assertEqual(reflectance_product.earth_sun_distance, 0.98)
+        self.assertEqual(dict(reflectance_product.reflectance_bands),
+                         {"S1_reflectance_an": ("S1_radiance_an", 1837.39, "solar_zenith_tn"),
+                          "S5_reflectance_bo": ("S5_radiance_bo", 248.33, "solar_zenith_to"),
+                          "S6_reflectance_cn": ("S6_radiance_cn", 78.33, "solar_zenith_tn")})
+
+    def test_convertProduct_1km(self):
+        product = setup(["S7_BT_in", "S8_BT_io", "F1_BT_fn", "solar_zenith_tn"])
+
+        factory = SLSTRL1Radiance2ReflectanceFactory()
+        self.assertIs(factory.convertProduct(product), product)
+
+    def test_returnEarthSunDistance(self):
+        start_time = datetime(2018, 1, 3)
+        product = ProductStub({"start_time": start_time})
+
+        factory = SLSTRL1Radiance2ReflectanceFactory()
+        earth_sun_distance = factory.returnEarthSunDistance(product)
+
+        self.assertEqual(earth_sun_distance, return_earth_sun_distance(start_time))
+        self.assertAlmostEqual(earth_sun_distance, 0.9833, places=3)
+
+    def test_setProcessingFactory(self):
+        tool = Sentinel3Radiance2ReflectanceTool()
+
+        self.assertIs(tool.setProcessingFactory("SL_1_RBT"), SLSTRL1Radiance2ReflectanceFactory)
+        self.assertIs(tool.setProcessingFactory("OL_1_EFR"), OLCIL1Radiance2ReflectanceFactory)
+        self.assertIsNone(tool.setProcessingFactory("SY_2_SYN"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,313 @@
+"""
+Lookup of slave image pixels for each pixel of a master image grid, for collocation by resampling
+"""
+
+'''___Built-In Modules___'''
+
+'''___Third-Party Modules___'''
+from numpy import asarray, floor, clip, isnan, int32, float32, where, full, nan, zeros
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+RESAMPLING_METHODS = ["nearest_neighbour", "bilinear_interpolation"]
+RESAMPLING_ATTRIBUTES = {"nearest_neighbour": ["rows", "columns"],
+                         "bilinear_interpolation": ["rows", "columns", "rows_0", "columns_0", "row_weights",
+                                                    "column_weights"]}
+
+
+class CollocationIndex(object):
+    """
+    CollocationIndex instances hold the lookup of slave image pixels for each pixel of a master image grid, built once
+    from the geolocation of both images, to collocate any number of slave image variables onto the master grid by
+    indexing.
+
+    Sample Code:
+
+    .. code-block:: python
+
+        index = CollocationIndex(GeolocationIndex(slave_lat, slave_lon), master_lat, master_lon)
+        band_collocated = index.apply(band)
+
+    :Attributes:
+        .. py:attribute:: shape
+
+            *tuple*
+
+            Master grid shape, *(rows, columns)*
+
+        .. py:attribute:: slave_shape
+
+            *tuple*
+
+            Slave image shape, *(rows, columns)*
+
+        .. py:attribute:: rows
+
+            *numpy.ndarray*
+
+            Row of nearest slave pixel to each master pixel, -1 if master pixel outside slave image
+
+        .. py:attribute:: columns
+
+            *numpy.ndarray*
+
+            Column of nearest slave pixel to each master pixel, -1 if master pixel outside slave image
+
+        .. py:attribute:: rows_0
+
+            *numpy.ndarray*
+
+            Upper row of slave pixels for bilinear interpolation at each master pixel
+
+        .. py:attribute:: columns_0
+
+            *numpy.ndarray*
+
+            Left column of slave pixels for bilinear interpolation at each master pixel
+
+        .. py:attribute:: row_weights
+
+            *numpy.ndarray*
+
+            Weight of lower row for bilinear interpolation at each master pixel
+
+        .. py:attribute:: column_weights
+
+            *numpy.ndarray*
+
+            Weight of right column for bilinear interpolation at each master pixel
+
+    :Methods:
+        .. py:method:: fromArrays(...):
+
+            Return collocation index from its lookup arrays, e.g. as persisted by *CollocationIndexCache*
+
+        .. py:method:: returnArrays(...):
+
+            Return lookup arrays of collocation index required for resampling method
+
+        .. py:method:: apply(...):
+
+            Return slave image values collocated onto master grid
+
+        .. py:method:: returnSlaveWindow(...):
+
+            Return window of slave image required to collocate a window of master grid
+    """
+
+    def __init__(self, slave_index, master_latitude, master_longitude):
+        """
+        Initialise collocation index
+
+        :type slave_index: GeolocationIndex
+        :param slave_index: Geolocation index of slave image
+
+        :type master_latitude: numpy.ndarray
+        :param master_latitude: Master grid pixel latitudes, dimensions *(rows, columns)*
+
+        :type master_longitude: numpy.ndarray
+        :param master_longitude: Master grid pixel longitudes, dimensions *(rows, columns)*
+        """
+
+        self.shape = asarray(master_latitude).shape
+        self.slave_shape = slave_index.latitude.shape
+        slave_rows, slave_columns = self.slave_shape
+
+        # Continuous slave pixel coordinates of master pixels
+        x, y = slave_index.latlon2fracpix(master_latitude, master_longitude)
+        outside = isnan(x)
+        x = where(outside, 0.5, x)
+        y = where(outside, 0.5, y)
+
+        # Nearest neighbour
+        self.rows = where(outside, -1, clip(floor(y), 0, slave_rows - 1)).astype(int32)
+        self.columns = where(outside, -1, clip(floor(x), 0, slave_columns - 1)).astype(int32)
+
+        # Bilinear interpolation, between the four slave pixel centres around each master pixel (clamped at edges)
+        x_0 = clip(floor(x - 0.5), 0, max(slave_columns - 2, 0))
+        y_0 = clip(floor(y - 0.5), 0, max(slave_rows - 2, 0))
+        self.columns_0 = x_0.astype(int32)
+        self.rows_0 = y_0.astype(int32)
+        self.column_weights = clip(x - 0.5 - x_0, 0.0, 1.0).astype(float32) if slave_columns > 1 \
+            else zeros(self.shape, float32)
+        self.row_weights = clip(y - 0.5 - y_0, 0.0, 1.0).astype(float32) if slave_rows > 1 \
+            else zeros(self.shape, float32)
+
+    @classmethod
+    def fromArrays(cls, slave_shape, arrays):
+        """
+        Return collocation index from its lookup arrays, e.g. as persisted by *CollocationIndexCache*
+
+        :type slave_shape: tuple
+        :param slave_shape: Slave image shape, *(rows, columns)*
+
+        :type arrays: dict
+        :param arrays: Lookup arrays by attribute name, for one or both resampling methods
+
+        :return:
+            :index: *CollocationIndex*
+
+            Collocation index, only supporting the resampling methods for which arrays given
+        """
+
+        index = cls.__new__(cls)
+        index.slave_shape = tuple(int(v) for v in slave_shape)
+        index.shape = arrays["rows"].shape
+        for name in RESAMPLING_ATTRIBUTES["bilinear_interpolation"]:
+            setattr(index, name, arrays.get(name, None))
+        return index
+
+    def returnArrays(self, resampling):
+        """
+        Return lookup arrays of collocation index required for resampling method
+
+        :type resampling: str
+        :param resampling: resampling method, *"nearest_neighbour"* or *"bilinear_interpolation"*
+
+        :return:
+            :arrays: *dict*
+
+            Lookup arrays by attribute name
+        """
+
+        if resampling not in RESAMPLING_METHODS:
+            raise ValueError("Unsupported resampling method: " + str(resampling))
+
+        return dict((name, getattr(self, name)) for name in RESAMPLING_ATTRIBUTES[resampling])
+
+    def returnSlaveWindow(self, window=None):
+        """
+        Return window of slave image required to collocate a window of master grid
+
+        :type window: tuple
+        :param window: (optional) Window of master grid, defined as *(x, y, x_width, y_width)*, default full grid
+
+        :return:
+            :slave_window: *tuple*
+
+            Window of slave image, defined as *(x, y, x_width, y_width)*, None if master window outside slave image
+        """
+
+        rows, columns = self._crop(window, self.rows, self.columns)
+
+        inside = rows >= 0
+        if not inside.any():
+            return None
+
+        slave_rows, slave_columns = self.slave_shape
+        x_min, x_max = columns[inside].min(), columns[inside].max()
+        y_min, y_max = rows[inside].min(), rows[inside].max()
+
+        if self.rows_0 is not None:
+            rows_0, columns_0 = self._crop(window, self.rows_0, self.columns_0)
+            x_min = min(x_min, columns_0[inside].min())
+            y_min = min(y_min, rows_0[inside].min())
+            x_max = min(max(x_max, columns_0[inside].max() + 1), slave_columns - 1)
+            y_max = min(max(y_max, rows_0[inside].max() + 1), slave_rows - 1)
+
+        return int(x_min), int(y_min), int(x_max - x_min + 1), int(y_max - y_min + 1)
+
+    def apply(self, values, resampling="nearest_neighbour", window=None, slave_window=None, fill_value=None):
+        """
+        Return slave image values collocated onto master grid
+
+        :type values: numpy.ndarray
+        :param values: Slave image values, for full image or for slave_window
+
+        :type resampling: str
+        :param resampling: (optional) resampling method, *"nearest_neighbour"* (default) or
+        *"bilinear_interpolation"*. Non-float values are always resampled by nearest neighbour.
+
+        :type window: tuple
+        :param window: (optional) Window of master grid to return, defined as *(x, y, x_width, y_width)*, default full
+        grid
+
+        :type slave_window: tuple
+        :param slave_window: (optional) Window of slave image values given for, defined as
+        *(x, y, x_width, y_width)*, default full image
+
+        :type fill_value: -
+        :param fill_value: (optional) Value of master pixels outside slave image, default nan for float values, else 0
+
+        :return:
+            :collocated_values: *numpy.ndarray*
+
+            Values on master grid (window)
+        """
+
+        if resampling not in RESAMPLING_METHODS:
+            raise ValueError("Unsupported resampling method: " + str(resampling))
+        if (resampling == "bilinear_interpolation") and (self.rows_0 is None):
+            raise ValueError("Collocation index has no bilinear interpolation arrays")
+
+        values = asarray(values)
+        if fill_value is None:
+            fill_value = nan if values.dtype.kind == "f" else 0
+
+        x_offset, y_offset = (0, 0) if slave_window is None else (slave_window[0], slave_window[1])
+        rows, columns = self._crop(window, self.rows, self.columns)
+        outside = rows < 0
+
+        # Nearest neighbour
+        if (resampling == "nearest_neighbour") or (values.dtype.kind != "f"):
+            collocated_values = values[where(outside, 0, rows - y_offset), where(outside, 0, columns - x_offset)]
+
+        # Bilinear interpolation
+        else:
+            rows_0, columns_0, row_weights, column_weights = \
+                self._crop(window, self.rows_0, self.columns_0, self.row_weights, self.column_weights)
+            r = rows_0 - y_offset
+            c = columns_0 - x_offset
+            r_1 = clip(r + 1, 0, values.shape[0] - 1)
+            c_1 = clip(c + 1, 0, values.shape[1] - 1)
+            r = where(outside, 0, r)
+            c = where(outside, 0, c)
+            r_1 = where(outside, 0, r_1)
+            c_1 = where(outside, 0, c_1)
+
+            top = values[r, c] * (1 - column_weights) + values[r, c_1] * column_weights
+            bottom = values[r_1, c] * (1 - column_weights) + values[r_1, c_1] * column_weights
+            collocated_values = (top * (1 - row_weights) + bottom * row_weights).astype(values.dtype)
+
+        if outside.any():
+            collocated_values = where(outside, full(collocated_values.shape, fill_value, collocated_values.dtype),
+                                      collocated_values)
+
+        return collocated_values
+
+    def _crop(self, window, *arrays):
+        """
+        Return lookup arrays cropped to window of master grid
+
+        :type window: tuple
+        :param window: Window of master grid, defined as *(x, y, x_width, y_width)*, if None arrays returned uncropped
+
+        :type arrays: numpy.ndarray
+        :param arrays: Lookup arrays
+
+        :return:
+            :arrays: *list*
+
+            Cropped lookup arrays
+        """
+
+        if window is None:
+            return list(arrays)
+
+        x, y, w, h = [int(v) for v in window]
+        return [a[y:y+h, x:x+w] for a in arrays]
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,328 @@
+"""
+On-disk cache of collocation indices, keyed by the geolocation of the master and slave images and resampling method
+"""
+
+'''___Built-In Modules___'''
+import json
+import hashlib
+from os import getenv, listdir, rename, utime, makedirs
+from os.path import join as pjoin
+from os.path import exists, getsize, getmtime, isdir
+from shutil import rmtree
+from tempfile import mkdtemp
+from threading import Lock
+
+'''___Third-Party Modules___'''
+from numpy import ascontiguousarray, float32, save, load
+
+'''___NPL Modules___'''
+from CollocationIndex import CollocationIndex
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+# Environment variables giving directory and maximum size (bytes) of collocation index cache
+CACHE_DIRECTORY_ENV = "EOPY_COLLOCATION_CACHE"
+CACHE_SIZE_ENV = "EOPY_COLLOCATION_CACHE_SIZE"
+
+# Constants
+DEFAULT_CACHE_SIZE = 2**30   # Default maximum cache size (bytes)
+ENTRY_VERSION = "1"          # Version of cache entry format, entries of other versions are never hit
+INFO_FILENAME = "index.json"
+
+
+class CollocationIndexCache:
+    """
+    CollocationIndexCache is an on-disk cache of collocation indices (see *CollocationIndex*), so collocating images
+    onto grids they have been collocated onto before (e.g. in reprocessing campaigns) skips the geolocation search.
+
+    Entries are keyed by a hash of the master and slave image geolocation and the resampling method. Each entry is a
+    directory of the lookup arrays required for the resampling method, as *.npy* files which are memory-mapped when
+    read. The least recently used entries are removed when the total cache size exceeds its maximum.
+
+    Sample Code:
+
+    .. code-block:: python
+
+        cache = CollocationIndexCache.getCache("/path/to/cache")
+        key = cache.returnKey(master_lat, master_lon, slave_lat, slave_lon, "nearest_neighbour")
+        index = cache.read(key)
+        if index is None:
+            index = CollocationIndex(GeolocationIndex(slave_lat, slave_lon), master_lat, master_lon)
+            cache.write(key, index, "nearest_neighbour")
+
+    :Attributes:
+        .. py:attribute:: directory
+
+            *str*
+
+            Cache directory
+
+        .. py:attribute:: max_size
+
+            *int*
+
+            Maximum total size of cache entries (bytes)
+
+        .. py:attribute:: hits
+
+            *int*
+
+            Number of reads of cache returning an entry
+
+        .. py:attribute:: misses
+
+            *int*
+
+            Number of reads of cache not returning an entry
+
+    :Methods:
+        .. py:method:: getCache(...):
+
+            Return process-wide cache of given directory, initialised on first call
+
+        .. py:method:: returnKey(...):
+
+            Return cache key of collocation of slave image onto master image grid
+
+        .. py:method:: read(...):
+
+            Return cached collocation index for key, None if not cached
+
+        .. py:method:: write(...):
+
+            Write collocation index to cache for key, removing least recently used entries if cache size exceeded
+
+        .. py:method:: evict(...):
+
+            Remove least recently used entries until total cache size within maximum
+
+        .. py:method:: returnEntries(...):
+
+            Return cache entries
+
+        .. py:method:: returnStatistics(...):
+
+            Return cache hit and miss counts, number of entries and size
+    """
+
+    # Process-wide caches, by directory
+    caches = {}
+
+    def __init__(self, directory, max_size=DEFAULT_CACHE_SIZE):
+        """
+        Initialise cache
+
+        :type directory: str
+        :param directory: Cache directory, created if it does not exist
+
+        :type max_size: int
+        :param max_size: (optional) Maximum total size of cache entries (bytes)
+        """
+
+        self.directory = directory
+        self.max_size = int(max_size)
+        self.hits = 0
+        self.misses = 0
+        self.lock = Lock()
+
+        if not isdir(self.directory):
+            makedirs(self.directory)
+
+    @classmethod
+    def getCache(cls, directory=None, max_size=None):
+        """
+        Return process-wide cache of given directory, initialised on first call
+
+        :type directory: str
+        :param directory: (optional) Cache directory, default from *EOPY_COLLOCATION_CACHE* environment variable
+
+        :type max_size: int
+        :param max_size: (optional) Maximum total size of cache entries (bytes), default from
+        *EOPY_COLLOCATION_CACHE_SIZE* environment variable or 1 GiB
+
+        :return:
+            :cache: *CollocationIndexCache*
+
+            Collocation index cache, None if no cache directory defined
+        """
+
+        if directory is None:
+            directory = getenv(CACHE_DIRECTORY_ENV)
+            if directory is None:
+                return None
+
+        if max_size is None:
+            max_size = int(getenv(CACHE_SIZE_ENV, DEFAULT_CACHE_SIZE))
+
+        if directory not in cls.caches:
+            cls.caches[directory] = cls(directory, max_size)
+        cls.caches[directory].max_size = int(max_size)
+
+        return cls.caches[directory]
+
+    def returnKey(self, master_latitude, master_longitude, slave_latitude, slave_longitude, resampling):
+        """
+        Return cache key of collocation of slave image onto master image grid
+
+        :type master_latitude: numpy.ndarray
+        :param master_latitude: Master grid pixel latitudes
+
+        :type master_longitude: numpy.ndarray
+        :param master_longitude: Master grid pixel longitudes
+
+        :type slave_latitude: numpy.ndarray
+        :param slave_latitude: Slave image pixel latitudes
+
+        :type slave_longitude: numpy.ndarray
+        :param slave_longitude: Slave image pixel longitudes
+
+        :type resampling: str
+        :param resampling: resampling method
+
+        :return:
+            :key: *str*
+
+            Cache key
+        """
+
+        key = hashlib.sha1((ENTRY_VERSION + resampling).encode("utf-8"))
+        for values in [master_latitude, master_longitude, slave_latitude, slave_longitude]:
+            values = ascontiguousarray(values, dtype=float32)
+            key.update(str(values.shape).encode("utf-8"))
+            key.update(values.tobytes())
+
+        return key.hexdigest()
+
+    def read(self, key):
+        """
+        Return cached collocation index for key, None if not cached
+
+        :type key: str
+        :param key: Cache key
+
+        :return:
+            :index: *CollocationIndex*
+
+            Collocation index, with memory-mapped lookup arrays
+        """
+
+        entry_directory = pjoin(self.directory, key)
+        info_path = pjoin(entry_directory, INFO_FILENAME)
+
+        index = None
+        if exists(info_path):
+            try:
+                with open(info_path, "r") as f:
+                    info = json.load(f)
+                arrays = dict((name, load(pjoin(entry_directory, name + ".npy"), mmap_mode="r"))
+                              for name in info["arrays"])
+                index = CollocationIndex.fromArrays(info["slave_shape"], arrays)
+
+                # Mark entry as recently used
+                utime(entry_directory, None)
+            except (IOError, OSError, ValueError, KeyError):
+                index = None
+
+        with self.lock:
+            if index is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return index
+
+    def write(self, key, index, resampling):
+        """
+        Write collocation index to cache for key, removing least recently used entries if cache size exceeded
+
+        :type key: str
+        :param key: Cache key
+
+        :type index: CollocationIndex
+        :param index: Collocation index
+
+        :type resampling: str
+        :param resampling: resampling method, only lookup arrays required for resampling method written
+        """
+
+        entry_directory = pjoin(self.directory, key)
+        if exists(entry_directory):
+            return
+
+        # Write entry to temporary directory, then move into place, so partially written entries never read
+        arrays = index.returnArrays(resampling)
+        temp_directory = mkdtemp(prefix=".tmp", dir=self.directory)
+        for name, values in arrays.items():
+            save(pjoin(temp_directory, name + ".npy"), values)
+        with open(pjoin(temp_directory, INFO_FILENAME), "w") as f:
+            json.dump({"version": ENTRY_VERSION, "slave_shape": list(index.slave_shape), "arrays": sorted(arrays)}, f)
+
+        try:
+            rename(temp_directory, entry_directory)
+        except OSError:
+            # Entry written by another process
+            rmtree(temp_directory, ignore_errors=True)
+
+        self.evict()
+
+    def evict(self):
+        """
+        Remove least recently used entries until total cache size within maximum
+        """
+
+        entries = self.returnEntries()
+        size = sum(entry_size for _, _, entry_size in entries)
+
+        for entry_directory, _, entry_size in sorted(entries, key=lambda entry: entry[1]):
+            if size <= self.max_size:
+                break
+            rmtree(entry_directory, ignore_errors=True)
+            size -= entry_size
+
+    def returnEntries(self):
+        """
+        Return cache entries
+
+        :return:
+            :entries: *list*
+
+            Entries, as tuples of *(directory, last use time, size)*
+        """
+
+        entries = []
+        for name in listdir(self.directory):
+            entry_directory = pjoin(self.directory, name)
+            if name.startswith(".") or not isdir(entry_directory):
+                continue
+            try:
+                entry_size = sum(getsize(pjoin(entry_directory, f)) for f in listdir(entry_directory))
+                entries.append((entry_directory, getmtime(entry_directory), entry_size))
+            except OSError:
+                continue
+
+        return entries
+
+    def returnStatistics(self):
+        """
+        Return cache hit and miss counts, number of entries and size
+
+        :return:
+            :statistics: *dict*
+
+            Cache statistics, with entries *"hits"*, *"misses"*, *"entries"* and *"size"* (bytes)
+        """
+
+        entries = self.returnEntries()
+        return {"hits": self.hits, "misses": self.misses, "entries": len(entries),
+                "size": sum(entry_size for _, _, entry_size in entries)}
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,362 @@
+"""
+Spatio-temporal index of product footprints, for fast point and time range to product lookups
+"""
+
+'''___Built-In Modules___'''
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+from numpy import array, float64, int64, arange, argsort, ceil, sqrt, repeat, cumsum, concatenate, zeros, \
+    datetime64, unique, minimum, maximum, count_nonzero
+
+'''___NPL Modules___'''
+sys.path.append(dirname(__file__))
+from PolygonRasteriser import return_polygons_bounds, return_edges
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+NODE_CAPACITY = 16   # Maximum number of children per index tree node
+
+
+def unwrap_footprint(polygons):
+    """
+    Return footprint polygons with longitudes continuous across the antimeridian, i.e. footprints spanning the
+    antimeridian have negative longitudes shifted by 360 degrees, to the range 0 to 360
+
+    :type polygons: list
+    :param polygons: Footprint polygons, each a list of rings of *(lon, lat)* vertices
+
+    :return:
+        :polygons: *list*
+
+        Unwrapped footprint polygons
+    """
+
+    lon_min, _, lon_max, _ = return_polygons_bounds(polygons)
+    if lon_max - lon_min <= 180.0:
+        return polygons
+
+    unwrapped = []
+    for polygon in polygons:
+        rings = []
+        for ring in polygon:
+            ring = array(ring, dtype=float64)
+            ring[ring[:, 0] < 0.0, 0] += 360.0
+            rings.append(ring)
+        unwrapped.append(rings)
+    return unwrapped
+
+
+def pack_str(bounds, node_capacity=NODE_CAPACITY):
+    """
+    Return order of boxes and their grouping into parent nodes, by Sort-Tile-Recursive packing - boxes are sorted into
+    vertical slices by x centre, and within slices into nodes by y centre
+
+    :type bounds: numpy.ndarray
+    :param bounds: Box bounds, dimensions *(n, 4)* - each *(x_min, y_min, x_max, y_max)*
+
+    :type node_capacity: int
+    :param node_capacity: (optional) Maximum number of boxes per node
+
+    :return:
+        :order: *numpy.ndarray*
+
+        Order of boxes, boxes of each node consecutive
+
+        :node_starts: *numpy.ndarray*
+
+        Index in order of first box of each node
+    """
+
+    n = len(bounds)
+    n_nodes = int(ceil(float(n) / node_capacity))
+    n_slices = int(ceil(sqrt(n_nodes)))
+    slice_size = n_slices * node_capacity
+
+    x_order = argsort((bounds[:, 0] + bounds[:, 2]), kind="mergesort")
+    y_centres = bounds[:, 1] + bounds[:, 3]
+
+    order = []
+    node_starts = []
+    for slice_start in range(0, n, slice_size):
+        slice_boxes = x_order[slice_start:slice_start+slice_size]
+        slice_boxes = slice_boxes[argsort(y_centres[slice_boxes], kind="mergesort")]
+        node_starts.extend(range(slice_start, slice_start + len(slice_boxes), node_capacity))
+        order.append(slice_boxes)
+
+    return concatenate(order), array(node_starts, dtype=int64)
+
+
+def append_end(starts, n):
+    """
+    Return ends of consecutive ranges with given starts
+
+    :type starts: numpy.ndarray
+    :param starts: Range starts, ascending
+
+    :type n: int
+    :param n: End of last range
+
+    :return:
+        :ends: *numpy.ndarray*
+
+        Range ends
+    """
+
+    return concatenate([starts[1:], array([n], dtype=int64)])
+
+
+def return_ranges(starts, ends):
+    """
+    Return concatenated integer ranges, vectorised
+
+    :type starts: numpy.ndarray
+    :param starts: Range starts
+
+    :type ends: numpy.ndarray
+    :param ends: Range ends (exclusive)
+
+    :return:
+        :indices: *numpy.ndarray*
+
+        Concatenation of *arange(start, end)* of each range
+    """
+
+    lengths = ends - starts
+    if lengths.sum() == 0:
+        return zeros(0, dtype=int64)
+    return repeat(starts - cumsum(lengths) + lengths, lengths) + arange(lengths.sum())
+
+
+def point_in_edges(x, y, edges):
+    """
+    Return True if point inside polygon edges, by even-odd crossing number test (as
+    *PolygonRasteriser.points_in_polygons*, for one point against many edges)
+
+    :type x: float
+    :param x: Point x coordinate (e.g. longitude)
+
+    :type y: float
+    :param y: Point y coordinate (e.g. latitude)
+
+    :type edges: numpy.ndarray
+    :param edges: Edges of all rings of disjoint polygons, dimensions *(n_edges, 4)* - each edge *(x_0, y_0, x_1, y_1)*
+
+    :return:
+        :inside: *bool*
+
+        True if point inside polygons
+    """
+
+    x_0, y_0, x_1, y_1 = edges.T
+    crossed = (minimum(y_0, y_1) <= y) & (y < maximum(y_0, y_1))
+    x_cross = x_0[crossed] + (y - y_0[crossed]) * (x_1[crossed] - x_0[crossed]) / (y_1[crossed] - y_0[crossed])
+    return bool(count_nonzero(x >= x_cross) % 2)
+
+
+class FootprintIndex:
+    """
+    FootprintIndex is a spatio-temporal index of product footprints and acquisition times, to find products with
+    footprints containing a point, within a time range, without opening them.
+
+    Footprint bounding boxes are indexed in a Sort-Tile-Recursive packed R-tree, searched level by level with NumPy,
+    so only candidate products whose bounding boxes contain the point are tested against their footprint polygons.
+
+    Sample Code:
+
+    .. code-block:: python
+
+        index = FootprintIndex(footprints, start_times, end_times)
+        products = index.query(lon, lat, start=time - timedelta(hours=2), end=time + timedelta(hours=2))
+
+    :Attributes:
+        .. py:attribute:: footprints
+
+            *list*
+
+            Footprint of each product, list of polygons each a list of rings of *(lon, lat)* vertices, unwrapped
+            across the antimeridian
+
+        .. py:attribute:: edges
+
+            *list*
+
+            Edges of footprint of each product, see *PolygonRasteriser.return_edges*
+
+        .. py:attribute:: start_times
+
+            *numpy.ndarray*
+
+            Acquisition start time of each product, *datetime64[us]*
+
+        .. py:attribute:: end_times
+
+            *numpy.ndarray*
+
+            Acquisition end time of each product, *datetime64[us]*
+
+        .. py:attribute:: levels
+
+            *list*
+
+            Index tree levels from root to leaves, each *(bounds, child_starts, child_ends)* of level nodes - children
+            of leaf nodes are indices of *items*
+
+        .. py:attribute:: items
+
+            *numpy.ndarray*
+
+            Product indices, in order of index leaf nodes
+
+        .. py:attribute:: bounds
+
+            *numpy.ndarray*
+
+            Footprint bounding boxes of products, in order of *items*
+
+    :Methods:
+        .. py:method:: queryBounds(...):
+
+            Return indices of products with footprint bounding boxes intersecting box
+
+        .. py:method:: query(...):
+
+            Return indices of products with footprints containing point, acquired within time range
+    """
+
+    def __init__(self, footprints, start_times=None, end_times=None, node_capacity=NODE_CAPACITY):
+        """
+        Initialise index
+
+        :type footprints: list
+        :param footprints: Footprint of each product, list of polygons each a list of rings of *(lon, lat)* vertices
+        (as returned by *PolygonRasteriser.parse_wkt*)
+
+        :type start_times: list
+        :param start_times: (optional) Acquisition start time of each product, *datetime.datetime*
+
+        :type end_times: list
+        :param end_times: (optional) Acquisition end time of each product, *datetime.datetime*, default start time
+
+        :type node_capacity: int
+        :param node_capacity: (optional) Maximum number of children per index tree node
+        """
+
+        self.footprints = [unwrap_footprint(footprint) for footprint in footprints]
+        self.edges = [concatenate([return_edges(polygon) for polygon in footprint]) for footprint in self.footprints]
+
+        n = len(self.footprints)
+        start_times = start_times if start_times is not None else [None] * n
+        end_times = end_times if end_times is not None else start_times
+        self.start_times = array([datetime64(t, "us") if t is not None else datetime64("NaT")
+                                  for t in start_times], dtype="datetime64[us]")
+        self.end_times = array([datetime64(t, "us") if t is not None else datetime64("NaT")
+                                for t in end_times], dtype="datetime64[us]")
+
+        # Build tree bottom up - pack product boxes into leaf nodes, then node boxes into parent nodes, to one root
+        self.items = zeros(0, dtype=int64)
+        self.bounds = zeros((0, 4), dtype=float64)
+        self.levels = []
+        if n == 0:
+            return
+
+        bounds = array([return_polygons_bounds(footprint) for footprint in self.footprints], dtype=float64)
+        order, node_starts = pack_str(bounds, node_capacity)
+        self.items = order
+        self.bounds = bounds = bounds[order]
+
+        while True:
+            node_ends = append_end(node_starts, len(bounds))
+            node_bounds = array([[bounds[s:e, 0].min(), bounds[s:e, 1].min(), bounds[s:e, 2].max(),
+                                  bounds[s:e, 3].max()] for s, e in zip(node_starts, node_ends)],
+                                dtype=float64).reshape(-1, 4)
+
+            if len(node_bounds) <= node_capacity:
+                self.levels.append((node_bounds, node_starts, node_ends))
+                break
+
+            order, parent_starts = pack_str(node_bounds, node_capacity)
+            self.levels.append((node_bounds[order], node_starts[order], node_ends[order]))
+            bounds = node_bounds[order]
+            node_starts = parent_starts
+
+        self.levels.reverse()
+
+    def queryBounds(self, bounds):
+        """
+        Return indices of products with footprint bounding boxes intersecting box
+
+        :type bounds: tuple
+        :param bounds: Box, *(lon_min, lat_min, lon_max, lat_max)*
+
+        :return:
+            :indices: *numpy.ndarray*
+
+            Product indices
+        """
+
+        if len(self.levels) == 0:
+            return zeros(0, dtype=int64)
+
+        x_min, y_min, x_max, y_max = bounds
+
+        nodes = arange(len(self.levels[0][0]))
+        for node_bounds, child_starts, child_ends in self.levels:
+            b = node_bounds[nodes]
+            nodes = nodes[(b[:, 0] <= x_max) & (b[:, 2] >= x_min) & (b[:, 1] <= y_max) & (b[:, 3] >= y_min)]
+            nodes = return_ranges(child_starts[nodes], child_ends[nodes])
+
+        b = self.bounds[nodes]
+        return self.items[nodes[(b[:, 0] <= x_max) & (b[:, 2] >= x_min) & (b[:, 1] <= y_max) & (b[:, 3] >= y_min)]]
+
+    def query(self, lon, lat, start=None, end=None):
+        """
+        Return indices of products with footprints containing point, acquired (in part) within time range
+
+        :type lon: float
+        :param lon: Point longitude
+
+        :type lat: float
+        :param lat: Point latitude
+
+        :type start: datetime.datetime
+        :param start: (optional) Start of time range
+
+        :type end: datetime.datetime
+        :param end: (optional) End of time range
+
+        :return:
+            :indices: *numpy.ndarray*
+
+            Product indices, in ascending order
+        """
+
+        # Points west of the antimeridian also tested 360 degrees east, against unwrapped footprints
+        candidates = [(lon, self.queryBounds((lon, lat, lon, lat)))]
+        if lon < 0.0:
+            candidates.append((lon + 360.0, self.queryBounds((lon + 360.0, lat, lon + 360.0, lat))))
+
+        indices = []
+        for point_lon, point_candidates in candidates:
+            if start is not None:
+                point_candidates = point_candidates[self.end_times[point_candidates] >= datetime64(start, "us")]
+            if end is not None:
+                point_candidates = point_candidates[self.start_times[point_candidates] <= datetime64(end, "us")]
+
+            indices.extend(i for i in point_candidates if point_in_edges(point_lon, lat, self.edges[i]))
+
+        return unique(array(indices, dtype=int64))
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,462 @@
+"""
+Index of satellite image pixel geolocation, for fast lat/lon to pixel lookups
+"""
+
+'''___Built-In Modules___'''
+
+'''___Third-Party Modules___'''
+from numpy import asarray, atleast_1d, float64, int64, arange, append, meshgrid, isfinite, deg2rad, cos, sin, sqrt, \
+    stack, clip, floor, ceil, argmin, where, inf, nan, full, nanmedian, arcsin, broadcast_arrays, isnan
+from scipy.spatial import cKDTree
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+EARTH_RADIUS = 6371008.8        # Mean Earth radius (m)
+MAX_TREE_SIZE = 2**20           # Maximum number of pixels in KD-tree, image subsampled to limit memory use
+QUERY_BLOCK_SIZE = 4096         # Number of points refined at once in GeolocationIndex.latlon2pix
+
+
+def latlon2xyz(lat, lon):
+    """
+    Return 3D unit vectors of points on sphere, given by latitude and longitude
+
+    :type lat: numpy.ndarray
+    :param lat: latitude (degrees)
+
+    :type lon: numpy.ndarray
+    :param lon: longitude (degrees)
+
+    :return:
+        :xyz: *numpy.ndarray*
+
+        Unit vectors, with final dimension of length 3
+    """
+
+    lat = deg2rad(asarray(lat, dtype=float64))
+    lon = deg2rad(asarray(lon, dtype=float64))
+    cos_lat = cos(lat)
+
+    return stack([cos_lat * cos(lon), cos_lat * sin(lon), sin(lat)], axis=-1)
+
+
+def chord2distance(chord):
+    """
+    Return great circle distance on Earth for unit sphere chord length
+
+    :type chord: numpy.ndarray
+    :param chord: chord length between unit vectors
+
+    :return:
+        :distance: *numpy.ndarray*
+
+        great circle distance (m)
+    """
+
+    return 2.0 * arcsin(clip(asarray(chord) / 2.0, 0.0, 1.0)) * EARTH_RADIUS
+
+
+def wrap_longitude(lon):
+    """
+    Return longitude (or longitude difference) wrapped to range [-180, 180)
+
+    :type lon: numpy.ndarray
+    :param lon: longitude (degrees)
+
+    :return:
+        :lon: *numpy.ndarray*
+
+        wrapped longitude (degrees)
+    """
+
+    return (asarray(lon) + 180.0) % 360.0 - 180.0
+
+
+class GeolocationIndex:
+    """
+    GeolocationIndex instances index the geolocation of the pixels of a satellite image, given by per pixel latitude and
+    longitude arrays, to find the pixels containing given points with vectorised queries. Suitable for curvilinear
+    (e.g. swath) image grids.
+
+    Pixels are indexed in a KD-tree of their 3D unit vectors, so there are no discontinuities at the antimeridian or
+    the poles. For large images the KD-tree is built from a subsampled grid of pixels, and the nearest pixel found by
+    searching the full resolution grid around the nearest subsampled pixel.
+
+    Pixel coordinates follow the snappy convention - pixel *(i, j)* (column, row) covers *x* in *[i, i+1)* and *y* in
+    *[j, j+1)*, with its centre at *(i + 0.5, j + 0.5)*.
+
+    Sample Code:
+
+    .. code-block:: python
+
+        index = GeolocationIndex(latitude, longitude)
+        x, y = index.latlon2pix(site_lats, site_lons)
+
+    :Attributes:
+        .. py:attribute:: latitude
+
+            *numpy.ndarray*
+
+            Pixel latitudes, dimensions *(rows, columns)*
+
+        .. py:attribute:: longitude
+
+            *numpy.ndarray*
+
+            Pixel longitudes, dimensions *(rows, columns)*
+
+        .. py:attribute:: step
+
+            *int*
+
+            Subsampling step of pixels in KD-tree
+
+        .. py:attribute:: max_distance
+
+            *float*
+
+            Maximum distance (m) of point from nearest pixel centre for point to be within image
+
+    :Methods:
+        .. py:method:: latlon2pix(...):
+
+            Return pixel coordinates of pixels containing given points
+
+        .. py:method:: latlon2fracpix(...):
+
+            Return continuous pixel coordinates of given points, within the pixels containing them
+
+        .. py:method:: pix2latlon(...):
+
+            Return latitude and longitude of pixels at given pixel coordinates
+
+        .. py:method:: return_pixel_spacing(...):
+
+            Return typical distance between neighbouring pixel centres
+    """
+
+    def __init__(self, latitude, longitude, step=None, max_distance=None):
+        """
+        Initialise index
+
+        :type latitude: numpy.ndarray
+        :param latitude: Pixel latitudes, dimensions *(rows, columns)*, invalid pixels nan
+
+        :type longitude: numpy.ndarray
+        :param longitude: Pixel longitudes, dimensions *(rows, columns)*, invalid pixels nan
+
+        :type step: int
+        :param step: (optional) Subsampling step of pixels in KD-tree, default smallest step for KD-tree of at most
+        *MAX_TREE_SIZE* pixels
+
+        :type max_distance: float
+        :param max_distance: (optional) Maximum distance (m) of point from nearest pixel centre for point to be within
+        image, default twice the pixel spacing
+        """
+
+        self.latitude = asarray(latitude)
+        self.longitude = asarray(longitude)
+
+        if (self.latitude.ndim != 2) or (self.latitude.shape != self.longitude.shape):
+            raise ValueError("latitude and longitude must be 2D arrays of the same shape")
+
+        rows, columns = self.latitude.shape
+
+        if step is None:
+            step = max(1, int(ceil((rows * columns / float(MAX_TREE_SIZE)) ** 0.5)))
+        self.step = step
+
+        # Subsampled grid of pixels, including last row and column
+        tree_rows = arange(0, rows, step)
+        tree_columns = arange(0, columns, step)
+        if tree_rows[-1] != rows - 1:
+            tree_rows = append(tree_rows, rows - 1)
+        if tree_columns[-1] != columns - 1:
+            tree_columns = append(tree_columns, columns - 1)
+        tree_rows, tree_columns = meshgrid(tree_rows, tree_columns, indexing="ij")
+
+        tree_lat = self.latitude[tree_rows, tree_columns]
+        tree_lon = self.longitude[tree_rows, tree_columns]
+        valid = isfinite(tree_lat) & isfinite(tree_lon)
+        if not valid.any():
+            raise ValueError("No valid pixel geolocation to index")
+
+        self.tree_rows = tree_rows[valid]
+        self.tree_columns = tree_columns[valid]
+        self.tree = cKDTree(latlon2xyz(tree_lat[valid], tree_lon[valid]))
+
+        self.max_distance = 2.0 * self.return_pixel_spacing() if max_distance is None else float(max_distance)
+
+    def return_pixel_spacing(self):
+        """
+        Return typical distance between neighbouring pixel centres, the larger of the median along and across rows
+
+        :return:
+            :pixel_spacing: *float*
+
+            Pixel spacing (m)
+        """
+
+        rows, columns = self.latitude.shape
+
+        # Sample neighbours at KD-tree pixels
+        r = clip(self.tree_rows, 0, max(rows - 2, 0))
+        c = clip(self.tree_columns, 0, max(columns - 2, 0))
+        xyz = latlon2xyz(self.latitude[r, c], self.longitude[r, c])
+
+        spacings = []
+        if columns > 1:
+            xyz_x = latlon2xyz(self.latitude[r, c + 1], self.longitude[r, c + 1])
+            spacings.append(nanmedian(sqrt(((xyz_x - xyz) ** 2).sum(axis=-1))))
+        if rows > 1:
+            xyz_y = latlon2xyz(self.latitude[r + 1, c], self.longitude[r + 1, c])
+            spacings.append(nanmedian(sqrt(((xyz_y - xyz) ** 2).sum(axis=-1))))
+
+        if spacings == []:
+            return 0.0
+        return float(chord2distance(max(spacings)))
+
+    def latlon2pix(self, lat, lon, extrapolate=False):
+        """
+        Return pixel coordinates of pixels containing given points, as pixel centres
+
+        :type lat: float/numpy.ndarray
+        :param lat: Latitude of points (degrees)
+
+        :type lon: float/numpy.ndarray
+        :param lon: Longitude of points (degrees)
+
+        :type extrapolate: bool
+        :param extrapolate: (optional) If True, pixel coordinates of points outside image are extrapolated from the
+        geolocation of the nearest image pixel (e.g. for windows of regions extending past the image edge), otherwise
+        nan. Default is False.
+
+        :return:
+            :x: *numpy.ndarray*
+
+            Pixel x coordinate (column) of points, nan for points outside image unless extrapolated and for invalid
+            points
+
+            :y: *numpy.ndarray*
+
+            Pixel y coordinate (row) of points, nan for points outside image unless extrapolated and for invalid
+            points
+        """
+
+        lat = atleast_1d(asarray(lat, dtype=float64))
+        lon = atleast_1d(asarray(lon, dtype=float64))
+        shape = lat.shape
+        lat = lat.ravel()
+        lon = lon.ravel()
+
+        x = full(lat.shape, nan)
+        y = full(lat.shape, nan)
+
+        for start in range(0, lat.size, QUERY_BLOCK_SIZE):
+            block = slice(start, start + QUERY_BLOCK_SIZE)
+            x[block], y[block] = self._latlon2pix(lat[block], lon[block], extrapolate)
+
+        return x.reshape(shape), y.reshape(shape)
+
+    def _latlon2pix(self, lat, lon, extrapolate=False):
+        """
+        Return pixel coordinates of pixels containing given points, for block of points
+
+        :type lat: numpy.ndarray
+        :param lat: Latitude of points (degrees), 1D
+
+        :type lon: numpy.ndarray
+        :param lon: Longitude of points (degrees), 1D
+
+        :type extrapolate: bool
+        :param extrapolate: (optional) If True, pixel coordinates of points outside image are extrapolated, otherwise
+        nan
+
+        :return:
+            :x: *numpy.ndarray*
+
+            Pixel x coordinate (column) of points, nan for points outside image
+
+            :y: *numpy.ndarray*
+
+            Pixel y coordinate (row) of points, nan for points outside image
+        """
+
+        rows, columns = self.latitude.shape
+        valid_points = isfinite(lat) & isfinite(lon)
+        xyz = latlon2xyz(where(valid_points, lat, 0.0), where(valid_points, lon, 0.0))
+
+        # 1. Nearest pixel of subsampled grid
+        _, i = self.tree.query(xyz)
+        rows_0 = self.tree_rows[i]
+        columns_0 = self.tree_columns[i]
+
+        # 2. Nearest pixel of full grid, searched in window around nearest subsampled pixel
+        if self.step > 1:
+            offsets = arange(-self.step, self.step + 1)
+            candidate_rows = clip(rows_0[:, None, None] + offsets[None, :, None], 0, rows - 1)
+            candidate_columns = clip(columns_0[:, None, None] + offsets[None, None, :], 0, columns - 1)
+            candidate_rows, candidate_columns = broadcast_arrays(candidate_rows, candidate_columns)
+            candidate_rows = candidate_rows.reshape(len(xyz), -1)
+            candidate_columns = candidate_columns.reshape(len(xyz), -1)
+
+            candidate_xyz = latlon2xyz(self.latitude[candidate_rows, candidate_columns],
+                                       self.longitude[candidate_rows, candidate_columns])
+            chord2 = ((candidate_xyz - xyz[:, None, :]) ** 2).sum(axis=-1)
+            chord2 = where(isfinite(chord2), chord2, inf)
+
+            nearest = argmin(chord2, axis=1)
+            points = arange(len(xyz))
+            rows_0 = candidate_rows[points, nearest]
+            columns_0 = candidate_columns[points, nearest]
+            chord = sqrt(chord2[points, nearest])
+        else:
+            chord = sqrt(((latlon2xyz(self.latitude[rows_0, columns_0], self.longitude[rows_0, columns_0]) - xyz)
+                          ** 2).sum(axis=-1))
+
+        # 3. Points too far from nearest pixel outside image
+        inside = valid_points & (chord2distance(where(isfinite(chord), chord, 2.0)) <= self.max_distance)
+
+        x = where(inside, columns_0 + 0.5, nan)
+        y = where(inside, rows_0 + 0.5, nan)
+
+        # 4. Points outside image extrapolated from local geolocation of nearest pixel, to centres of pixels beyond edge
+        # - including points nearest edge pixels, as points within max_distance of the image may still be outside it
+        on_edge = (rows_0 == 0) | (rows_0 == rows - 1) | (columns_0 == 0) | (columns_0 == columns - 1)
+        outside = valid_points & (~inside | on_edge)
+        if extrapolate and outside.any():
+            dx, dy = self._return_pixel_offsets(lat[outside], lon[outside], rows_0[outside], columns_0[outside])
+            x[outside] = floor(columns_0[outside] + 0.5 + dx) + 0.5
+            y[outside] = floor(rows_0[outside] + 0.5 + dy) + 0.5
+
+        return x, y
+
+    def latlon2fracpix(self, lat, lon):
+        """
+        Return continuous pixel coordinates of given points, within the pixels containing them. Points are located
+        within their pixel by inverting the local linear mapping of pixel coordinates to latitude and longitude, from
+        the differences of neighbouring pixel geolocation.
+
+        :type lat: float/numpy.ndarray
+        :param lat: Latitude of points (degrees)
+
+        :type lon: float/numpy.ndarray
+        :param lon: Longitude of points (degrees)
+
+        :return:
+            :x: *numpy.ndarray*
+
+            Pixel x coordinate of points, nan for points outside image
+
+            :y: *numpy.ndarray*
+
+            Pixel y coordinate of points, nan for points outside image
+        """
+
+        x, y = self.latlon2pix(lat, lon)
+        lat = atleast_1d(asarray(lat, dtype=float64)).reshape(x.shape)
+        lon = atleast_1d(asarray(lon, dtype=float64)).reshape(x.shape)
+
+        inside = ~isnan(x)
+        r = floor(y[inside]).astype(int64)
+        c = floor(x[inside]).astype(int64)
+
+        # Offsets kept within pixel
+        dx, dy = self._return_pixel_offsets(lat[inside], lon[inside], r, c)
+        x[inside] = c + 0.5 + clip(dx, -0.5, 0.5)
+        y[inside] = r + 0.5 + clip(dy, -0.5, 0.5)
+
+        return x, y
+
+    def _return_pixel_offsets(self, lat, lon, r, c):
+        """
+        Return offsets of points from the centres of given pixels, by inverting the local linear mapping of pixel
+        coordinates to latitude and longitude at the pixels, from the differences of neighbouring pixel geolocation
+
+        :type lat: numpy.ndarray
+        :param lat: Latitude of points (degrees), 1D
+
+        :type lon: numpy.ndarray
+        :param lon: Longitude of points (degrees), 1D
+
+        :type r: numpy.ndarray
+        :param r: Row of pixel of each point
+
+        :type c: numpy.ndarray
+        :param c: Column of pixel of each point
+
+        :return:
+            :dx: *numpy.ndarray*
+
+            Offset of points from pixel centres in x (pixels), 0 where mapping undefined
+
+            :dy: *numpy.ndarray*
+
+            Offset of points from pixel centres in y (pixels), 0 where mapping undefined
+        """
+
+        rows, columns = self.latitude.shape
+
+        # Differences of geolocation to neighbouring pixels, lon scaled to distance along parallel
+        cos_lat = cos(deg2rad(self.latitude[r, c]))
+        c_plus, c_minus = clip(c + 1, 0, columns - 1), clip(c - 1, 0, columns - 1)
+        r_plus, r_minus = clip(r + 1, 0, rows - 1), clip(r - 1, 0, rows - 1)
+        n_c = where(c_plus > c_minus, c_plus - c_minus, 1)
+        n_r = where(r_plus > r_minus, r_plus - r_minus, 1)
+
+        dlat_dx = (self.latitude[r, c_plus] - self.latitude[r, c_minus]) / n_c
+        dlon_dx = wrap_longitude(self.longitude[r, c_plus] - self.longitude[r, c_minus]) * cos_lat / n_c
+        dlat_dy = (self.latitude[r_plus, c] - self.latitude[r_minus, c]) / n_r
+        dlon_dy = wrap_longitude(self.longitude[r_plus, c] - self.longitude[r_minus, c]) * cos_lat / n_r
+
+        dlat = lat - self.latitude[r, c]
+        dlon = wrap_longitude(lon - self.longitude[r, c]) * cos_lat
+
+        # Solve for pixel offset from pixel centre
+        det = dlat_dx * dlon_dy - dlat_dy * dlon_dx
+        valid_det = isfinite(det) & (det != 0)
+        det = where(valid_det, det, 1.0)
+        dx = where(valid_det, (dlat * dlon_dy - dlat_dy * dlon) / det, 0.0)
+        dy = where(valid_det, (dlat_dx * dlon - dlat * dlon_dx) / det, 0.0)
+
+        return where(isfinite(dx), dx, 0.0), where(isfinite(dy), dy, 0.0)
+
+    def pix2latlon(self, x, y):
+        """
+        Return latitude and longitude of pixels at given pixel coordinates
+
+        :type x: float/numpy.ndarray
+        :param x: Pixel x coordinate (column)
+
+        :type y: float/numpy.ndarray
+        :param y: Pixel y coordinate (row)
+
+        :return:
+            :lat: *numpy.ndarray*
+
+            Latitude of pixels (degrees)
+
+            :lon: *numpy.ndarray*
+
+            Longitude of pixels (degrees)
+        """
+
+        rows, columns = self.latitude.shape
+        r = clip(floor(asarray(y, dtype=float64)).astype(int64), 0, rows - 1)
+        c = clip(floor(asarray(x, dtype=float64)).astype(int64), 0, columns - 1)
+
+        return self.latitude[r, c], self.longitude[r, c]
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,314 @@
+"""
+Process-wide registry of eopy plugin classes - e.g. data readers, processing tools and parsing tools
+"""
+
+'''___Built-In Modules___'''
+import sys
+import imp
+import re
+import json
+from os import getenv
+from os.path import basename, splitext, getmtime, exists, abspath
+from collections import OrderedDict
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+# Environment variable giving path of file to persist plugin registries to between processes
+CACHE_PATH_ENV = "EOPY_PLUGIN_CACHE"
+
+
+class PluginRegistry:
+    """
+    PluginRegistry is a process-wide registry of plugin classes, defined in plugin modules at given paths (e.g. all
+    *\*DataReader.py* modules of the *eopy.product.productIO* package).
+
+    Plugin modules are only loaded once per process, when first required. Plugin classes may define a class attribute
+    ``PATTERNS``, a list of regular expressions matching the subjects (e.g. product directory names) the plugin is
+    suitable for. These are combined into one precompiled regular expression, so the suitable plugin for a subject is
+    found with one match, without loading or testing every plugin. Plugins without ``PATTERNS`` are tested in turn.
+
+    Plugin patterns and resolved plugins may be persisted to disk (json), given by the *EOPY_PLUGIN_CACHE*
+    environment variable, so new processes only load the plugin modules they use.
+
+    Sample Code:
+
+    .. code-block:: python
+
+        registry = PluginRegistry.getRegistry("readers", getPluginPaths)
+        plugin = registry.resolve(subject, test)
+
+    :Attributes:
+        .. py:attribute:: name
+
+            *str*
+
+            Name of registry
+
+        .. py:attribute:: plugin_paths
+
+            *list*
+
+            Paths of plugin modules, the plugin class of each module has the same name as the module
+
+        .. py:attribute:: cache_path
+
+            *str*
+
+            Path of file to persist registry to, not persisted if None
+
+    :Methods:
+        .. py:method:: getRegistry(...):
+
+            Return process-wide registry of given name, initialised on first call
+
+        .. py:method:: getPlugin(...):
+
+            Return plugin class defined in plugin module at given path, loading module if not already loaded
+
+        .. py:method:: getPattern(...):
+
+            Return combined precompiled regular expression of patterns of all plugins
+
+        .. py:method:: resolve(...):
+
+            Return suitable plugin class for given subject
+
+        .. py:method:: clear(...):
+
+            Clear all process-wide registries
+    """
+
+    # Process-wide registries, by name
+    registries = {}
+
+    def __init__(self, name, plugin_paths, cache_path=None):
+        """
+        Initialise registry
+
+        :type name: str
+        :param name: Name of registry
+
+        :type plugin_paths: list
+        :param plugin_paths: Paths of plugin modules
+
+        :type cache_path: str
+        :param cache_path: (optional) Path of file to persist registry to
+        """
+
+        self.name = name
+        self.plugin_paths = list(plugin_paths)
+        self.cache_path = cache_path
+
+        self.plugins = {}         # Loaded plugin classes by path
+        self.patterns = None      # Plugin patterns by path
+        self.pattern = None       # Combined precompiled regular expression of plugin patterns
+        self.pattern_paths = {}   # Paths of plugins by combined regular expression group name
+        self.resolved = {}        # Memo of resolved plugin paths by key
+
+        if self.cache_path is not None:
+            self.readCache()
+
+    @classmethod
+    def getRegistry(cls, name, getPluginPaths, cache_path=None):
+        """
+        Return process-wide registry of given name, initialised on first call
+
+        :type name: str
+        :param name: Name of registry
+
+        :type getPluginPaths: function
+        :param getPluginPaths: Function that returns paths of plugin modules, only called on initialisation
+
+        :type cache_path: str
+        :param cache_path: (optional) Path of file to persist registry to, default from *EOPY_PLUGIN_CACHE* environment
+        variable
+
+        :return:
+            :registry: *PluginRegistry*
+
+            Plugin registry
+        """
+
+        if name not in cls.registries:
+            if cache_path is None:
+                cache_path = getenv(CACHE_PATH_ENV)
+            cls.registries[name] = cls(name, getPluginPaths(), cache_path)
+        return cls.registries[name]
+
+    @classmethod
+    def clear(cls):
+        """
+        Clear all process-wide registries
+        """
+
+        cls.registries = {}
+
+    def getPlugin(self, plugin_path):
+        """
+        Return plugin class defined in plugin module at given path, loading module if not already loaded
+
+        :type plugin_path: str
+        :param plugin_path: Path of plugin module
+
+        :return:
+            :plugin: *cls*
+
+            Plugin class
+        """
+
+        if plugin_path not in self.plugins:
+            plugin_name = splitext(basename(plugin_path))[0]
+
+            # Reuse module if already imported from same path, else load
+            module = sys.modules.get(plugin_name, None)
+            if (module is None) or \
+                    (splitext(abspath(getattr(module, "__file__", "")))[0] != splitext(abspath(plugin_path))[0]):
+                module = imp.load_source(plugin_name, plugin_path)
+
+            self.plugins[plugin_path] = getattr(module, plugin_name)
+
+        return self.plugins[plugin_path]
+
+    def getPattern(self):
+        """
+        Return combined precompiled regular expression of patterns of all plugins
+
+        :return:
+            :pattern: *_sre.SRE_Pattern*
+
+            Combined regular expression, with group per plugin. None if no plugins define patterns.
+        """
+
+        if self.patterns is None:
+            self.patterns = OrderedDict()
+            for plugin_path in self.plugin_paths:
+                self.patterns[plugin_path] = list(getattr(self.getPlugin(plugin_path), "PATTERNS", []))
+            self.writeCache()
+
+        if (self.pattern is None) and any(self.patterns.values()):
+            groups = []
+            for i, plugin_path in enumerate(self.plugin_paths):
+                if self.patterns.get(plugin_path, []):
+                    group_name = "plugin%d" % i
+                    self.pattern_paths[group_name] = plugin_path
+                    groups.append("(?P<%s>%s)" % (group_name, "|".join("(?:%s)" % p
+                                                                       for p in self.patterns[plugin_path])))
+            self.pattern = re.compile("|".join(groups))
+
+        return self.pattern
+
+    def resolve(self, subject, test, key=None):
+        """
+        Return suitable plugin class for given subject
+
+        :type subject: str
+        :param subject: Subject to match against plugin patterns, e.g. product directory name
+
+        :type test: function
+        :param test: Function that takes a plugin class and returns True if plugin suitable
+
+        :type key: str
+        :param key: (optional) Key to memoise resolved plugin with, only if plugin suitability depends only on key
+
+        :return:
+            :plugin: *cls*
+
+            Suitable plugin class. None if no suitable plugin found.
+        """
+
+        # 1. Previously resolved
+        if (key is not None) and (key in self.resolved):
+            if self.resolved[key] is None:
+                return None
+            return self.getPlugin(self.resolved[key])
+
+        plugin_path = None
+
+        # 2. Match subject against combined plugin patterns
+        pattern = self.getPattern() if subject is not None else None
+        match = pattern.match(subject) if pattern is not None else None
+        if (match is not None) and test(self.getPlugin(self.pattern_paths[match.lastgroup])):
+            plugin_path = self.pattern_paths[match.lastgroup]
+
+        # 3. Otherwise test plugins without patterns in turn
+        else:
+            for path in self.plugin_paths:
+                if (self.patterns is None) or (self.patterns.get(path, []) == []):
+                    if test(self.getPlugin(path)):
+                        plugin_path = path
+                        break
+
+        if key is not None:
+            self.resolved[key] = plugin_path
+            self.writeCache()
+
+        return self.getPlugin(plugin_path) if plugin_path is not None else None
+
+    def readCache(self):
+        """
+        Read persisted plugin patterns and resolved plugins from *self.cache_path*, if plugin modules unchanged
+        """
+
+        if not exists(self.cache_path):
+            return
+
+        try:
+            with open(self.cache_path, "r") as f:
+                cache = json.load(f)
+        except ValueError:
+            return
+
+        entry = cache.get(self.name, None)
+        if (entry is None) or (entry["mtimes"] != self.mtimes()):
+            return
+
+        self.patterns = OrderedDict((p, entry["patterns"][p]) for p in self.plugin_paths)
+        self.resolved = entry["resolved"]
+
+    def writeCache(self):
+        """
+        Write plugin patterns and resolved plugins to *self.cache_path*, if defined
+        """
+
+        if (self.cache_path is None) or (self.patterns is None):
+            return
+
+        cache = {}
+        if exists(self.cache_path):
+            try:
+                with open(self.cache_path, "r") as f:
+                    cache = json.load(f)
+            except ValueError:
+                cache = {}
+
+        cache[self.name] = {"mtimes": self.mtimes(), "patterns": self.patterns, "resolved": self.resolved}
+
+        with open(self.cache_path, "w") as f:
+            json.dump(cache, f)
+
+    def mtimes(self):
+        """
+        Return modification times of plugin modules
+
+        :return:
+            :mtimes: *dict*
+
+            modification time by plugin module path
+        """
+
+        return dict((p, getmtime(p)) for p in self.plugin_paths)
+
+
+if __name__ == "__main__":
+    pass
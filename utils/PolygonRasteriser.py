@@ -0,0 +1,240 @@
+"""
+Rasterisation of polygons, e.g. regions of interest, to image masks
+
+Polygons are represented as lists of rings, the exterior ring followed by any holes, where each ring is a
+*numpy.ndarray* of vertex coordinates of dimensions *(n_vertices, 2)*. Multipolygons are lists of polygons. Points are
+inside a polygon by the even-odd rule, and inside a multipolygon if inside any of its polygons.
+
+Edges follow a top-left rule - points on left or top edges are inside, points on right or bottom edges are outside - so
+adjacent polygons sharing an edge never both contain a point on the edge.
+"""
+
+'''___Built-In Modules___'''
+import re
+
+'''___Third-Party Modules___'''
+from numpy import asarray, array, zeros, int32, float64, bool_, arange, ceil, clip, concatenate, repeat, argsort, \
+    searchsorted, cumsum, add, logical_or, logical_xor, isfinite, roll
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+def parse_wkt(wkt):
+    """
+    Return polygons of *Well Known Text* POLYGON or MULTIPOLYGON
+
+    :type wkt: str
+    :param wkt: Well Known Text definition of polygon or multipolygon
+
+    :return:
+        :polygons: *list*
+
+        List of polygons, each a list of rings (exterior first, then holes) of *(x, y)* vertices (e.g. (lon, lat))
+    """
+
+    geometry_type = wkt.strip().split("(")[0].strip().upper()
+    if geometry_type not in ["POLYGON", "MULTIPOLYGON"]:
+        raise ValueError("Unsupported WKT geometry type: " + geometry_type)
+
+    body = wkt[wkt.index("("):]
+
+    # Parse nested parentheses, rings are the innermost groups
+    polygons = []
+    depth = 0
+    ring_depth = 2 if geometry_type == "POLYGON" else 3
+    for token in re.findall(r"\(|\)|[^()]+", body):
+        if token == "(":
+            depth += 1
+            if depth == ring_depth - 1:
+                polygons.append([])
+        elif token == ")":
+            depth -= 1
+        elif depth == ring_depth:
+            nums = [float(v) for v in re.findall(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?", token)]
+            polygons[-1].append(array(nums, dtype=float64).reshape(-1, 2))
+
+    return polygons
+
+
+def return_polygons_bounds(polygons):
+    """
+    Return bounds of polygons
+
+    :type polygons: list
+    :param polygons: List of polygons, each a list of rings of *(x, y)* vertices
+
+    :return:
+        :bounds: *tuple*
+
+        Bounds as *(x_min, y_min, x_max, y_max)*
+    """
+
+    vertices = concatenate([ring for polygon in polygons for ring in polygon])
+    return vertices[:, 0].min(), vertices[:, 1].min(), vertices[:, 0].max(), vertices[:, 1].max()
+
+
+def return_edges(polygon):
+    """
+    Return edges of all rings of polygon
+
+    :type polygon: list
+    :param polygon: Polygon as list of rings of *(x, y)* vertices
+
+    :return:
+        :edges: *numpy.ndarray*
+
+        Edges, dimensions *(n_edges, 4)* - each edge *(x_0, y_0, x_1, y_1)*. Horizontal edges excluded.
+    """
+
+    edges = []
+    for ring in polygon:
+        ring = asarray(ring, dtype=float64)
+        edges.append(concatenate([ring, roll(ring, -1, axis=0)], axis=1))
+    edges = concatenate(edges)
+
+    return edges[edges[:, 1] != edges[:, 3]]
+
+
+def rasterise_polygons(polygons, width, height):
+    """
+    Return mask of image pixels with centres inside polygons, by scanline even-odd filling
+
+    Polygon vertices are in pixel coordinates, where pixel *(i, j)* (column, row) covers *x* in *[i, i+1)* and *y* in
+    *[j, j+1)*.
+
+    :type polygons: list
+    :param polygons: List of polygons, each a list of rings of *(x, y)* vertices in pixel coordinates
+
+    :type width: int
+    :param width: Image width (columns)
+
+    :type height: int
+    :param height: Image height (rows)
+
+    :return:
+        :mask: *numpy.ndarray*
+
+        Mask of pixels inside polygons, dimensions *(height, width)*
+    """
+
+    mask = zeros((height, width), dtype=bool_)
+
+    for polygon in polygons:
+        edges = return_edges(polygon)
+        if len(edges) == 0:
+            continue
+
+        # 1. Find rows with centres crossed by each edge, half-open in y so shared vertices counted once
+        y_min = edges[:, [1, 3]].min(axis=1)
+        y_max = edges[:, [1, 3]].max(axis=1)
+        row_first = clip(ceil(y_min - 0.5), 0, height).astype(int32)
+        row_last = clip(ceil(y_max - 0.5), 0, height).astype(int32)
+        n_rows = clip(row_last - row_first, 0, None)
+
+        edge_index = repeat(arange(len(edges)), n_rows)
+        rows = repeat(row_first, n_rows) + arange(n_rows.sum()) - repeat(cumsum(n_rows) - n_rows, n_rows)
+
+        # 2. x of edge crossing at row centres
+        x_0, y_0, x_1, y_1 = edges[edge_index].T
+        x_cross = x_0 + (rows + 0.5 - y_0) * (x_1 - x_0) / (y_1 - y_0)
+
+        # 3. Toggle pixels with centres right of or on crossing, then fill by parity of cumulative toggles
+        column_first = clip(ceil(x_cross - 0.5), 0, width).astype(int32)
+        toggles = zeros((height, width + 1), dtype=int32)
+        add.at(toggles, (rows, column_first), 1)
+
+        mask = logical_or(mask, (cumsum(toggles[:, :width], axis=1) % 2).astype(bool_))
+
+    return mask
+
+
+def points_in_polygons(x, y, polygons):
+    """
+    Return mask of points inside polygons, by even-odd crossing number test. Suitable for arbitrary points, e.g. the
+    per pixel latitude and longitude of a curvilinear image grid.
+
+    Each edge is only tested against points within its y extent, found from the points sorted by y.
+
+    :type x: numpy.ndarray
+    :param x: Point x coordinates (e.g. longitude)
+
+    :type y: numpy.ndarray
+    :param y: Point y coordinates (e.g. latitude)
+
+    :type polygons: list
+    :param polygons: List of polygons, each a list of rings of *(x, y)* vertices
+
+    :return:
+        :mask: *numpy.ndarray*
+
+        Mask of points inside polygons, same shape as x
+    """
+
+    x = asarray(x, dtype=float64)
+    y = asarray(y, dtype=float64)
+    shape = x.shape
+    x = x.ravel()
+    y = y.ravel()
+
+    order = argsort(y, kind="mergesort")
+    y_sorted = y[order]
+    x_sorted = x[order]
+
+    inside = zeros(x.size, dtype=bool_)
+
+    for polygon in polygons:
+        polygon_inside = zeros(x.size, dtype=bool_)
+
+        for x_0, y_0, x_1, y_1 in return_edges(polygon):
+
+            # Points in half-open y extent of edge
+            start = searchsorted(y_sorted, min(y_0, y_1), side="left")
+            end = searchsorted(y_sorted, max(y_0, y_1), side="left")
+            if end <= start:
+                continue
+
+            x_cross = x_0 + (y_sorted[start:end] - y_0) * (x_1 - x_0) / (y_1 - y_0)
+            polygon_inside[start:end] = logical_xor(polygon_inside[start:end], x_sorted[start:end] >= x_cross)
+
+        inside = logical_or(inside, polygon_inside)
+
+    mask = zeros(x.size, dtype=bool_)
+    mask[order] = inside & isfinite(x_sorted) & isfinite(y_sorted)
+
+    return mask.reshape(shape)
+
+
+def unwrap_longitudes(lon, polygons):
+    """
+    Return longitudes wrapped to within 180 degrees of the centre of polygons, so points across the antimeridian from
+    polygons are compared continuously
+
+    :type lon: numpy.ndarray
+    :param lon: longitudes (degrees)
+
+    :type polygons: list
+    :param polygons: List of polygons, each a list of rings of *(lon, lat)* vertices
+
+    :return:
+        :lon: *numpy.ndarray*
+
+        Wrapped longitudes (degrees)
+    """
+
+    lon_min, _, lon_max, _ = return_polygons_bounds(polygons)
+    lon_centre = (lon_min + lon_max) / 2.0
+
+    return (asarray(lon, dtype=float64) - lon_centre + 180.0) % 360.0 - 180.0 + lon_centre
+
+
+if __name__ == "__main__":
+    pass
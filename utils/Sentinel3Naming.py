@@ -0,0 +1,59 @@
+"""
+Sentinel-3 product naming convention - classification of Sentinel-3 product directory names by product type
+"""
+
+'''___Built-In Modules___'''
+import re
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+# Product type of Sentinel-3 product data type identifiers, characters 4 to 12 of product directory names (e.g.
+# "OL_1_EFR" of "S3A_OL_1_EFR____20161023T100950_...SEN3")
+SENTINEL3_PRODUCT_TYPES = {"OL_1_EFR": "OLCIL1", "OL_1_ERR": "OLCIL1",
+                           "OL_2_LFR": "OLCIL2L", "OL_2_LRR": "OLCIL2L",
+                           "OL_2_WFR": "OLCIL2W", "OL_2_WRR": "OLCIL2W",
+                           "SL_1_RBT": "SLSTRL1",
+                           "SL_2_LST": "SLSTRL2LST",
+                           "SL_2_WST": "SLSTRL2WST",
+                           "SL_2_WCT": "SLSTRL2WCT",
+                           "SY_1_SYN": "SYNL1",
+                           "SY_2_SYN": "SYNL2",
+                           "SY_2_VGP": "SYNVGT", "SY_2_VG1": "SYNVGT", "SY_2_V10": "SYNVGT"}
+
+# Regular expression matching names of all Sentinel-3 product types, one anchored alternation of data type identifiers
+SENTINEL3_PATTERN = re.compile(r"S3._(?:%s)" % "|".join(sorted(SENTINEL3_PRODUCT_TYPES.keys())))
+
+
+def return_product_type(product_directory):
+    """
+    Return product type of Sentinel-3 product directory name, from one lookup of its data type identifier
+
+    :type product_directory: str
+    :param product_directory: Product directory name, e.g. "S3A_OL_1_EFR____20161023T100950_...SEN3"
+
+    :return:
+        :product_type: *str*
+
+        Product type, e.g. "OLCIL1" (see *SENTINEL3_PRODUCT_TYPES*), None if not a Sentinel-3 product name
+    """
+
+    if product_directory[:2] != "S3" or product_directory[3:4] != "_":
+        return None
+    return SENTINEL3_PRODUCT_TYPES.get(product_directory[4:12], None)
+
+
+if __name__ == "__main__":
+    pass
@@ -0,0 +1,230 @@
+"""
+Vectorised bilinear interpolation of tie point grids to image grid pixels, with interpolation weights cached per grid
+geometry and window
+"""
+
+'''___Built-In Modules___'''
+from collections import OrderedDict
+from threading import Lock
+
+'''___Third-Party Modules___'''
+from numpy import arange, floor, clip, minimum, float64, sin, cos, deg2rad, rad2deg, arctan2
+
+'''___NPL Modules___'''
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = ["Andrew Banks", "Javier Gorrono", "Niall Origo", "Tracy Scanlon"]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Constants
+WEIGHTS_CACHE_SIZE = 64   # Number of sets of interpolation weights held, by grid geometry and window
+
+
+class TiePointInterpolator(object):
+    """
+    TiePointInterpolator bilinearly interpolates tie point grid values to the image grid pixels of a window. Tie point
+    grids are defined, as for *snappy.TiePointGrid*, by their shape, subsampling factors and the image pixel
+    coordinates of the first tie point.
+
+    Interpolation weights depend only on the grid geometry and window, so are computed once and shared between all
+    the tie point grids of a product (e.g. OLCI geometry and meteorological grids) and all reads of the same window.
+    Only the tie points surrounding the window need be read (see *returnTieWindow*).
+
+    Sample Code:
+
+    .. code-block:: python
+
+        interpolator = TiePointInterpolator(tie_values.shape, 64, 64)
+        pixel_values = interpolator.interpolate(tie_values, (x, y, x_width, y_width))
+
+    :Attributes:
+        .. py:attribute:: shape
+
+            *tuple*
+
+            Tie point grid shape, *(rows, columns)*
+
+        .. py:attribute:: sub_sampling_x
+
+            *float*
+
+            Tie point grid subsampling factor in the x (column) dimension
+
+        .. py:attribute:: sub_sampling_y
+
+            *float*
+
+            Tie point grid subsampling factor in the y (row) dimension
+
+        .. py:attribute:: offset_x
+
+            *float*
+
+            Image x coordinate of the first tie point, 0.5 for the centre of the first pixel
+
+        .. py:attribute:: offset_y
+
+            *float*
+
+            Image y coordinate of the first tie point, 0.5 for the centre of the first pixel
+
+    :Methods:
+        .. py:method:: returnWeights(...):
+
+            Return tie point indices and interpolation weights of image grid pixels in window
+
+        .. py:method:: returnTieWindow(...):
+
+            Return window of tie points surrounding image grid window
+
+        .. py:method:: interpolate(...):
+
+            Return tie point grid values bilinearly interpolated to image grid pixels in window
+    """
+
+    # Process-wide cache of interpolation weights, by grid geometry and window
+    weights = OrderedDict()
+    weights_lock = Lock()
+
+    def __init__(self, shape, sub_sampling_x, sub_sampling_y, offset_x=0.5, offset_y=0.5):
+        """
+        Initialise interpolator
+
+        :type shape: tuple
+        :param shape: Tie point grid shape, *(rows, columns)*
+
+        :type sub_sampling_x: float
+        :param sub_sampling_x: Tie point grid subsampling factor in the x (column) dimension
+
+        :type sub_sampling_y: float
+        :param sub_sampling_y: Tie point grid subsampling factor in the y (row) dimension
+
+        :type offset_x: float
+        :param offset_x: (optional) Image x coordinate of the first tie point, default centre of first pixel
+
+        :type offset_y: float
+        :param offset_y: (optional) Image y coordinate of the first tie point, default centre of first pixel
+        """
+
+        self.shape = tuple(int(n) for n in shape)
+        self.sub_sampling_x = float(sub_sampling_x)
+        self.sub_sampling_y = float(sub_sampling_y)
+        self.offset_x = float(offset_x)
+        self.offset_y = float(offset_y)
+
+    def returnWeights(self, window):
+        """
+        Return tie point indices and interpolation weights of image grid pixels in window. Pixels beyond the outer
+        tie points are linearly extrapolated.
+
+        :type window: tuple
+        :param window: Image grid pixel window, defined as *(x, y, x_width, y_width)*
+
+        :return:
+            :weights: *tuple*
+
+            *(i0, i1, j0, j1, di, dj)* - tie point row indices above and below each window row, tie point column
+            indices either side of each window column, and row and column interpolation weights
+        """
+
+        key = (self.shape, self.sub_sampling_x, self.sub_sampling_y, self.offset_x, self.offset_y,
+               tuple(int(v) for v in window))
+
+        with self.weights_lock:
+            if key in self.weights:
+                self.weights[key] = self.weights.pop(key)
+                return self.weights[key]
+
+        x, y, w, h = key[-1]
+        n_rows, n_columns = self.shape
+
+        # Fractional tie point grid coordinates of image pixel centres
+        fi = (arange(y, y+h) + 0.5 - self.offset_y) / self.sub_sampling_y
+        fj = (arange(x, x+w) + 0.5 - self.offset_x) / self.sub_sampling_x
+        i0 = clip(floor(fi).astype(int), 0, max(n_rows-2, 0))
+        j0 = clip(floor(fj).astype(int), 0, max(n_columns-2, 0))
+        i1 = minimum(i0+1, n_rows-1)
+        j1 = minimum(j0+1, n_columns-1)
+        di = (fi - i0)[:, None]
+        dj = (fj - j0)[None, :]
+
+        weights = (i0, i1, j0, j1, di, dj)
+        for array in weights:
+            array.flags.writeable = False
+
+        with self.weights_lock:
+            self.weights[key] = weights
+            while len(self.weights) > WEIGHTS_CACHE_SIZE:
+                self.weights.popitem(last=False)
+
+        return weights
+
+    def returnTieWindow(self, window):
+        """
+        Return window of tie points surrounding image grid window, i.e. the tie points required to interpolate to it
+
+        :type window: tuple
+        :param window: Image grid pixel window, defined as *(x, y, x_width, y_width)*
+
+        :return:
+            :tie_window: *tuple*
+
+            Tie point window, defined as *(tie_x, tie_y, tie_x_width, tie_y_width)*
+        """
+
+        i0, i1, j0, j1, _, _ = self.returnWeights(window)
+        return int(j0[0]), int(i0[0]), int(j1[-1] - j0[0] + 1), int(i1[-1] - i0[0] + 1)
+
+    def interpolate(self, tie_values, window, discontinuity=False, tie_window=None):
+        """
+        Return tie point grid values bilinearly interpolated to image grid pixels in window
+
+        :type tie_values: numpy.ndarray
+        :param tie_values: Tie point values, of full tie point grid or of tie window
+
+        :type window: tuple
+        :param window: Image grid pixel window to interpolate to, defined as *(x, y, x_width, y_width)*
+
+        :type discontinuity: bool/int
+        :param discontinuity: (optional) If True (or 180) values are treated as angles in degrees with a discontinuity
+        at 180, interpolated as their sine and cosine. If 360 values are treated as angles with a discontinuity at 360,
+        returned in the range 0 to 360.
+
+        :type tie_window: tuple
+        :param tie_window: (optional) Tie point window of tie values, as returned by *returnTieWindow*. Default is
+        the full tie point grid.
+
+        :return:
+            :pixel_values: *numpy.ndarray*
+
+            Interpolated values, *float64*
+        """
+
+        if discontinuity:
+            sin_values = self.interpolate(sin(deg2rad(tie_values)), window, tie_window=tie_window)
+            cos_values = self.interpolate(cos(deg2rad(tie_values)), window, tie_window=tie_window)
+            pixel_values = rad2deg(arctan2(sin_values, cos_values))
+            return pixel_values % 360.0 if discontinuity == 360 else pixel_values
+
+        i0, i1, j0, j1, di, dj = self.returnWeights(window)
+
+        # Tie point indices relative to tie window
+        if tie_window is not None:
+            i0, i1 = i0 - tie_window[1], i1 - tie_window[1]
+            j0, j1 = j0 - tie_window[0], j1 - tie_window[0]
+
+        tie_values = tie_values.astype(float64)
+        upper = tie_values[i0]
+        lower = tie_values[i1]
+
+        return (upper[:, j0] * (1-dj) + upper[:, j1] * dj) * (1-di) + (lower[:, j0] * (1-dj) + lower[:, j1] * dj) * di
+
+
+if __name__ == "__main__":
+    pass
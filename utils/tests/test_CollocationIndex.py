@@ -0,0 +1,137 @@
+"""
+CollocationIndex class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+from numpy import arange, meshgrid, isnan, int16, float32, bool_, zeros
+from numpy.testing import assert_array_equal, assert_allclose
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from GeolocationIndex import GeolocationIndex
+from CollocationIndex import CollocationIndex
+sys.path.append(dirname(__file__))
+from test_GeolocationIndex import makeGeolocation
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+def makeCollocationIndex():
+    """
+    Return collocation index of slave grid onto master grid at half slave resolution, with master grid extending
+    beyond the slave image
+    """
+
+    slave_lat, slave_lon = makeGeolocation(40, 30)
+
+    # Master pixel (i, j) centre at slave pixel coordinates (3.25 + 2i, 2.25 + 2j)
+    c, r = meshgrid(3.25 + 2.0 * arange(20), 2.25 + 2.0 * arange(25))
+    master_lon = 10.0 + 0.01 * (c + 0.2 * r)
+    master_lat = 45.0 - 0.01 * (r - 0.2 * c)
+
+    return CollocationIndex(GeolocationIndex(slave_lat, slave_lon), master_lat, master_lon)
+
+
+class TestCollocationIndex(unittest.TestCase):
+    def test_nearest_neighbour(self):
+        index = makeCollocationIndex()
+        values = arange(40 * 30, dtype=int16).reshape(40, 30)
+
+        collocated_values = index.apply(values)
+
+        self.assertEqual(int16, collocated_values.dtype)
+        self.assertEqual((25, 20), collocated_values.shape)
+        rows, columns = meshgrid(2 + 2 * arange(19), 3 + 2 * arange(14), indexing="ij")
+        assert_array_equal(values[rows, columns], collocated_values[:19, :14])
+
+        # Master pixels beyond slave image filled
+        self.assertTrue((index.rows[:, 15:] == -1).all())
+        self.assertTrue((collocated_values[:, 15:] == 0).all())
+
+    def test_bilinear_interpolation(self):
+        index = makeCollocationIndex()
+        c, r = meshgrid(arange(30) + 0.5, arange(40) + 0.5)
+        values = (2.0 * c + 3.0 * r).astype(float32)
+
+        collocated_values = index.apply(values, resampling="bilinear_interpolation")
+
+        # Bilinear interpolation exact for linear field within slave image
+        c_m, r_m = meshgrid(3.25 + 2.0 * arange(14), 2.25 + 2.0 * arange(19))
+        assert_allclose(2.0 * c_m + 3.0 * r_m, collocated_values[:19, :14], atol=1e-3)
+        self.assertTrue(isnan(collocated_values[:, 15:]).all())
+
+    def test_bilinear_interpolation_integer(self):
+        index = makeCollocationIndex()
+        values = arange(40 * 30, dtype=int16).reshape(40, 30)
+
+        assert_array_equal(index.apply(values), index.apply(values, resampling="bilinear_interpolation"))
+
+    def test_apply_windows(self):
+        index = makeCollocationIndex()
+        values = arange(40 * 30, dtype=float32).reshape(40, 30)
+        window = (2, 5, 6, 4)
+
+        slave_window = index.returnSlaveWindow(window)
+        x, y, w, h = slave_window
+        collocated_values = index.apply(values[y:y+h, x:x+w], resampling="bilinear_interpolation", window=window,
+                                        slave_window=slave_window)
+
+        expected = index.apply(values, resampling="bilinear_interpolation")[5:9, 2:8]
+        assert_array_equal(expected, collocated_values)
+
+    def test_returnSlaveWindow_outside(self):
+        index = makeCollocationIndex()
+
+        self.assertIsNone(index.returnSlaveWindow((15, 0, 5, 5)))
+
+    def test_apply_mask_fill(self):
+        index = makeCollocationIndex()
+
+        collocated_values = index.apply(zeros((40, 30), bool_) | True, fill_value=False)
+
+        self.assertEqual(bool_, collocated_values.dtype)
+        self.assertTrue(collocated_values[:19, :14].all())
+        self.assertFalse(collocated_values[:, 15:].any())
+
+    def test_apply_unsupported(self):
+        index = makeCollocationIndex()
+
+        self.assertRaises(ValueError, index.apply, zeros((40, 30)), "cubic_convolution")
+
+    def test_fromArrays(self):
+        index = makeCollocationIndex()
+        values = arange(40 * 30, dtype=float32).reshape(40, 30)
+
+        arrays = index.returnArrays("nearest_neighbour")
+        self.assertEqual(["columns", "rows"], sorted(arrays.keys()))
+
+        index_arrays = CollocationIndex.fromArrays(index.slave_shape, arrays)
+        self.assertEqual((40, 30), index_arrays.slave_shape)
+        self.assertEqual((25, 20), index_arrays.shape)
+        assert_array_equal(index.apply(values), index_arrays.apply(values))
+
+        index_arrays = CollocationIndex.fromArrays(index.slave_shape,
+                                                   index.returnArrays("bilinear_interpolation"))
+        assert_allclose(index.apply(values, resampling="bilinear_interpolation"),
+                        index_arrays.apply(values, resampling="bilinear_interpolation"))
+
+    def test_returnArrays_unsupported(self):
+        index = makeCollocationIndex()
+
+        self.assertRaises(ValueError, index.returnArrays, "cubic_convolution")
+
+
+if __name__ == "__main__":
+    unittest.main()
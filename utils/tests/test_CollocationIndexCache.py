@@ -0,0 +1,101 @@
+"""
+CollocationIndexCache class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+from os import listdir
+from tempfile import mkdtemp
+from shutil import rmtree
+
+'''___Third-Party Modules___'''
+from numpy import arange, float32, memmap
+from numpy.testing import assert_array_equal
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from CollocationIndexCache import CollocationIndexCache
+sys.path.append(dirname(__file__))
+from test_CollocationIndex import makeCollocationIndex
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+class TestCollocationIndexCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = mkdtemp()
+
+    def tearDown(self):
+        rmtree(self.directory)
+
+    def test_returnKey(self):
+        cache = CollocationIndexCache(self.directory)
+        a = arange(12, dtype=float32).reshape(3, 4)
+
+        key = cache.returnKey(a, a, a, a, "nearest_neighbour")
+
+        self.assertEqual(key, cache.returnKey(a.copy(), a, a, a, "nearest_neighbour"))
+        self.assertNotEqual(key, cache.returnKey(a, a, a, a, "bilinear_interpolation"))
+        self.assertNotEqual(key, cache.returnKey(a + 1, a, a, a, "nearest_neighbour"))
+        self.assertNotEqual(key, cache.returnKey(a.reshape(4, 3), a, a, a, "nearest_neighbour"))
+
+    def test_read_write(self):
+        cache = CollocationIndexCache(self.directory)
+        index = makeCollocationIndex()
+        values = arange(40 * 30, dtype=float32).reshape(40, 30)
+
+        self.assertIsNone(cache.read("key"))
+        cache.write("key", index, "bilinear_interpolation")
+        index_cached = cache.read("key")
+
+        self.assertIsInstance(index_cached.rows, memmap)
+        assert_array_equal(index.apply(values, resampling="bilinear_interpolation"),
+                           index_cached.apply(values, resampling="bilinear_interpolation"))
+        self.assertEqual(index.returnSlaveWindow((2, 5, 6, 4)), index_cached.returnSlaveWindow((2, 5, 6, 4)))
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+
+    def test_read_nearest_neighbour(self):
+        cache = CollocationIndexCache(self.directory)
+        index = makeCollocationIndex()
+        values = arange(40 * 30, dtype=float32).reshape(40, 30)
+
+        cache.write("key", index, "nearest_neighbour")
+        index_cached = cache.read("key")
+
+        assert_array_equal(index.apply(values), index_cached.apply(values))
+        self.assertRaises(ValueError, index_cached.apply, values, "bilinear_interpolation")
+
+    def test_evict(self):
+        cache = CollocationIndexCache(self.directory)
+        index = makeCollocationIndex()
+        cache.write("key_0", index, "nearest_neighbour")
+        entry_size = cache.returnStatistics()["size"]
+
+        cache.max_size = 2 * entry_size
+        cache.write("key_1", index, "nearest_neighbour")
+        cache.read("key_0")
+        cache.write("key_2", index, "nearest_neighbour")
+
+        # Least recently used entry removed
+        self.assertEqual(["key_0", "key_2"], sorted(listdir(self.directory)))
+        self.assertEqual(2, cache.returnStatistics()["entries"])
+
+    def test_getCache(self):
+        cache = CollocationIndexCache.getCache(self.directory, 100)
+
+        self.assertIs(cache, CollocationIndexCache.getCache(self.directory, 100))
+        self.assertEqual(100, cache.max_size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+FootprintIndex class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+from datetime import datetime as dt
+from datetime import timedelta
+
+'''___Third-Party Modules___'''
+from numpy import array
+from numpy.random import RandomState
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from FootprintIndex import FootprintIndex, pack_str, return_ranges
+from PolygonRasteriser import points_in_polygons
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+def box(x, y, w, h):
+    return [[array([[x, y], [x+w, y], [x+w, y+h], [x, y+h]], dtype=float)]]
+
+
+# Random footprints, one acquired every hour
+random_state = RandomState(0)
+footprints = [box(random_state.uniform(-180, 175), random_state.uniform(-80, 75), *random_state.uniform(0.5, 5, 2))
+              for i in range(500)]
+start_times = [dt(2018, 1, 1) + timedelta(hours=i) for i in range(500)]
+
+
+class TestFootprintIndex(unittest.TestCase):
+    def test_pack_str(self):
+        bounds = array([[x, y, x+1, y+1] for x in range(4) for y in range(4)], dtype=float)
+
+        order, node_starts = pack_str(bounds, node_capacity=4)
+
+        self.assertEqual(list(range(16)), sorted(order))
+        self.assertEqual([0, 4, 8, 12], node_starts.tolist())
+
+        # Boxes sorted into 2 slices of 2 columns, nodes are 2 x 2 blocks of boxes
+        self.assertEqual([0, 1, 4, 5], sorted(order[:4]))
+
+    def test_return_ranges(self):
+        self.assertEqual([2, 3, 4, 7, 10, 11], return_ranges(array([2, 7, 10]), array([5, 8, 12])).tolist())
+        self.assertEqual([], return_ranges(array([2]), array([2])).tolist())
+
+    def test_query(self):
+        index = FootprintIndex(footprints, start_times, node_capacity=4)
+        self.assertTrue(len(index.levels) > 2)
+
+        for lon, lat in zip(random_state.uniform(-180, 180, 50), random_state.uniform(-80, 80, 50)):
+            expected = [i for i, footprint in enumerate(footprints)
+                        if points_in_polygons(array([lon]), array([lat]), footprint)[0]]
+            self.assertEqual(expected, index.query(lon, lat).tolist())
+
+    def test_query_time(self):
+        index = FootprintIndex(footprints, start_times)
+        lon, lat = footprints[100][0][0][0] + 0.1
+
+        self.assertIn(100, index.query(lon, lat).tolist())
+        self.assertIn(100, index.query(lon, lat, start=start_times[100] - timedelta(hours=2),
+                                       end=start_times[100] + timedelta(hours=2)).tolist())
+        self.assertNotIn(100, index.query(lon, lat, start=start_times[100] + timedelta(minutes=1)).tolist())
+        self.assertNotIn(100, index.query(lon, lat, end=start_times[100] - timedelta(minutes=1)).tolist())
+
+    def test_query_antimeridian(self):
+        index = FootprintIndex([[[array([[178.0, 0.0], [-178.0, 0.0], [-178.0, 2.0], [178.0, 2.0]])]]])
+
+        self.assertEqual([0], index.query(179.5, 1.0).tolist())
+        self.assertEqual([0], index.query(-179.5, 1.0).tolist())
+        self.assertEqual([], index.query(0.0, 1.0).tolist())
+
+    def test_query_empty(self):
+        self.assertEqual([], FootprintIndex([]).query(0.0, 0.0).tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+"""
+GeolocationIndex class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+from numpy import linspace, meshgrid, array, nan, isnan, arange
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from GeolocationIndex import GeolocationIndex, latlon2xyz
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+def makeGeolocation(rows, columns, lon_0=10.0, lat_0=45.0, spacing=0.01):
+    """
+    Return lat/lon arrays of rotated regular grid, a simple curvilinear grid
+    """
+
+    c, r = meshgrid(arange(columns) + 0.5, arange(rows) + 0.5)
+    lon = lon_0 + spacing * (c + 0.2 * r)
+    lat = lat_0 - spacing * (r - 0.2 * c)
+    return lat, lon
+
+
+class TestGeolocationIndex(unittest.TestCase):
+    def test_latlon2xyz(self):
+        xyz = latlon2xyz(array([0.0, 90.0]), array([90.0, 0.0]))
+        self.assertEqual((2, 3), xyz.shape)
+        self.assertAlmostEqual(1.0, xyz[0, 1])
+        self.assertAlmostEqual(1.0, xyz[1, 2])
+
+    def test_latlon2pix_pixel_centres(self):
+        lat, lon = makeGeolocation(50, 40)
+        index = GeolocationIndex(lat, lon)
+
+        x, y = index.latlon2pix(lat[[3, 20, 49], [7, 0, 39]], lon[[3, 20, 49], [7, 0, 39]])
+
+        self.assertEqual([7.5, 0.5, 39.5], list(x))
+        self.assertEqual([3.5, 20.5, 49.5], list(y))
+
+    def test_latlon2pix_subsampled(self):
+        lat, lon = makeGeolocation(103, 97)
+        index = GeolocationIndex(lat, lon, step=6)
+
+        rows, columns = meshgrid(arange(0, 103, 5), arange(0, 97, 5), indexing="ij")
+        x, y = index.latlon2pix(lat[rows, columns], lon[rows, columns])
+
+        self.assertEqual(6, index.step)
+        self.assertTrue((x == columns + 0.5).all())
+        self.assertTrue((y == rows + 0.5).all())
+
+    def test_latlon2pix_outside(self):
+        lat, lon = makeGeolocation(20, 20)
+        index = GeolocationIndex(lat, lon)
+
+        x, y = index.latlon2pix([lat[5, 5], 0.0, nan], [lon[5, 5], 0.0, 10.0])
+
+        self.assertEqual(5.5, x[0])
+        self.assertTrue(isnan(x[1:]).all())
+        self.assertTrue(isnan(y[1:]).all())
+
+    def test_latlon2pix_extrapolate(self):
+        lat, lon = makeGeolocation(20, 20)
+        index = GeolocationIndex(lat, lon)
+
+        # Points of pixel centres (-3, 5), (24, 22) and (-1, 3), beyond image edges, of the same grid
+        c = array([-2.5, 24.5, -0.5])
+        r = array([5.5, 22.5, 3.5])
+        x, y = index.latlon2pix(45.0 - 0.01 * (r - 0.2 * c), 10.0 + 0.01 * (c + 0.2 * r), extrapolate=True)
+
+        self.assertEqual(c.tolist(), x.tolist())
+        self.assertEqual(r.tolist(), y.tolist())
+
+    def test_latlon2pix_extrapolate_invalid(self):
+        lat, lon = makeGeolocation(20, 20)
+        index = GeolocationIndex(lat, lon)
+
+        x, y = index.latlon2pix([lat[5, 5], nan], [lon[5, 5], 10.0], extrapolate=True)
+
+        self.assertEqual(5.5, x[0])
+        self.assertTrue(isnan(x[1]))
+        self.assertTrue(isnan(y[1]))
+
+    def test_latlon2pix_antimeridian(self):
+        lat, lon = makeGeolocation(20, 20, lon_0=179.95)
+        lon[lon > 180.0] -= 360.0
+        index = GeolocationIndex(lat, lon)
+
+        x, y = index.latlon2pix(lat[10, 15], lon[10, 15])
+
+        self.assertTrue(lon[10, 15] < 0.0)
+        self.assertEqual((15.5, 10.5), (x[0], y[0]))
+
+    def test_latlon2pix_invalid_pixels(self):
+        lat, lon = makeGeolocation(20, 20)
+        lat[0, :] = nan
+        index = GeolocationIndex(lat, lon)
+
+        x, y = index.latlon2pix(lat[1, 4], lon[1, 4])
+
+        self.assertEqual((4.5, 1.5), (x[0], y[0]))
+
+    def test_latlon2fracpix(self):
+        lat, lon = makeGeolocation(30, 40)
+        index = GeolocationIndex(lat, lon)
+
+        x_true = array([3.2, 17.9, 0.1, 39.5, 50.0])
+        y_true = array([4.7, 11.05, 29.9, 0.3, 5.0])
+        x, y = index.latlon2fracpix(45.0 - 0.01 * (y_true - 0.2 * x_true), 10.0 + 0.01 * (x_true + 0.2 * y_true))
+
+        for i in range(4):
+            self.assertAlmostEqual(x_true[i], x[i], places=6)
+            self.assertAlmostEqual(y_true[i], y[i], places=6)
+        self.assertTrue(isnan(x[4]) and isnan(y[4]))
+
+    def test_pix2latlon(self):
+        lat, lon = makeGeolocation(20, 30)
+        index = GeolocationIndex(lat, lon)
+
+        lats, lons = index.pix2latlon(array([2.5, 29.9, 40.0]), array([3.5, 0.0, 19.5]))
+
+        self.assertEqual([lat[3, 2], lat[0, 29], lat[19, 29]], list(lats))
+        self.assertEqual([lon[3, 2], lon[0, 29], lon[19, 29]], list(lons))
+
+    def test_return_pixel_spacing(self):
+        lat, lon = makeGeolocation(20, 30, lat_0=0.0, spacing=0.01)
+        index = GeolocationIndex(lat, lon)
+
+        self.assertAlmostEqual(1134.0, index.return_pixel_spacing(), delta=5.0)
+        self.assertAlmostEqual(2.0 * index.return_pixel_spacing(), index.max_distance)
+
+    def test___init___shape_mismatch(self):
+        self.assertRaises(ValueError, GeolocationIndex, linspace(0, 1, 10).reshape(2, 5), linspace(0, 1, 10))
+
+
+if __name__ == "__main__":
+    unittest.main()
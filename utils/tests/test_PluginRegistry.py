@@ -0,0 +1,147 @@
+"""
+PluginRegistry class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname, exists
+from os.path import join as pjoin
+from os import makedirs
+from tempfile import mkdtemp
+from shutil import rmtree
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from PluginRegistry import PluginRegistry
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+PLUGIN_TEMPLATE = """
+class {name}:
+    {patterns}
+
+    def setFactory(self, subject):
+        if subject.startswith("{prefix}"):
+            return "{name}Factory"
+        return None
+"""
+
+
+def writePlugin(directory, name, prefix, patterns=None):
+    plugin_directory = pjoin(directory, name.lower())
+    makedirs(plugin_directory)
+    plugin_path = pjoin(plugin_directory, name + ".py")
+    with open(plugin_path, "w") as f:
+        f.write(PLUGIN_TEMPLATE.format(name=name, prefix=prefix,
+                                       patterns="PATTERNS = %r" % patterns if patterns is not None else "pass"))
+    return plugin_path
+
+
+class TestPluginRegistry(unittest.TestCase):
+    def setUp(self):
+        PluginRegistry.clear()
+        self.directory = mkdtemp()
+        self.plugin_paths = [writePlugin(self.directory, "RegistryTestAPlugin", "AAA", [r"AAA.*"]),
+                             writePlugin(self.directory, "RegistryTestBPlugin", "BBB", [r"BBB.*", r"bbb.*"]),
+                             writePlugin(self.directory, "RegistryTestCPlugin", "CCC")]
+        self.tested = []
+
+    def tearDown(self):
+        PluginRegistry.clear()
+        rmtree(self.directory)
+
+    def getPluginPaths(self):
+        self.getPluginPaths_calls = getattr(self, "getPluginPaths_calls", 0) + 1
+        return self.plugin_paths
+
+    def suitable(self, subject):
+        def test(plugin):
+            self.tested.append(plugin.__name__)
+            return plugin().setFactory(subject) is not None
+        return test
+
+    def test_getRegistry(self):
+        registry1 = PluginRegistry.getRegistry("test", self.getPluginPaths)
+        registry2 = PluginRegistry.getRegistry("test", self.getPluginPaths)
+
+        self.assertIs(registry1, registry2)
+        self.assertEqual(1, self.getPluginPaths_calls)
+        self.assertEqual(self.plugin_paths, registry1.plugin_paths)
+
+    def test_getPlugin(self):
+        registry = PluginRegistry.getRegistry("test", self.getPluginPaths)
+
+        plugin = registry.getPlugin(self.plugin_paths[0])
+
+        self.assertEqual("RegistryTestAPlugin", plugin.__name__)
+        self.assertIs(plugin, registry.getPlugin(self.plugin_paths[0]))
+
+    def test_getPattern(self):
+        registry = PluginRegistry.getRegistry("test", self.getPluginPaths)
+
+        pattern = registry.getPattern()
+
+        self.assertEqual(self.plugin_paths[1], registry.pattern_paths[pattern.match("bbb_product").lastgroup])
+        self.assertEqual(None, pattern.match("CCC_product"))
+
+    def test_resolve_pattern(self):
+        registry = PluginRegistry.getRegistry("test", self.getPluginPaths)
+
+        plugin = registry.resolve("BBB_product", self.suitable("BBB_product"))
+
+        self.assertEqual("RegistryTestBPlugin", plugin.__name__)
+        self.assertEqual(["RegistryTestBPlugin"], self.tested)
+
+    def test_resolve_probe(self):
+        registry = PluginRegistry.getRegistry("test", self.getPluginPaths)
+
+        plugin = registry.resolve("CCC_product", self.suitable("CCC_product"))
+
+        self.assertEqual("RegistryTestCPlugin", plugin.__name__)
+        self.assertEqual(["RegistryTestCPlugin"], self.tested)
+
+    def test_resolve_none(self):
+        registry = PluginRegistry.getRegistry("test", self.getPluginPaths)
+
+        self.assertEqual(None, registry.resolve("DDD_product", self.suitable("DDD_product")))
+
+    def test_resolve_key(self):
+        registry = PluginRegistry.getRegistry("test", self.getPluginPaths)
+
+        plugin1 = registry.resolve("CCC_product", self.suitable("CCC_product"), key="CCC_product")
+        plugin2 = registry.resolve("CCC_product", self.suitable("CCC_product"), key="CCC_product")
+
+        self.assertIs(plugin1, plugin2)
+        self.assertEqual(["RegistryTestCPlugin"], self.tested)
+
+    def test_resolve_cache(self):
+        cache_path = pjoin(self.directory, "plugins.json")
+        registry = PluginRegistry.getRegistry("test", self.getPluginPaths, cache_path)
+        registry.getPattern()
+        registry.resolve("CCC_product", self.suitable("CCC_product"), key="CCC_product")
+
+        self.assertTrue(exists(cache_path))
+
+        # New process-wide registry, initialised from cache, only loads required plugins
+        PluginRegistry.clear()
+        registry = PluginRegistry.getRegistry("test", self.getPluginPaths, cache_path)
+
+        self.assertEqual("RegistryTestAPlugin", registry.resolve("AAA_product", self.suitable("AAA_product")).__name__)
+        self.assertEqual("RegistryTestCPlugin", registry.resolve("CCC_product", self.suitable("CCC_product"),
+                                                                 key="CCC_product").__name__)
+        self.assertItemsEqual([self.plugin_paths[0], self.plugin_paths[2]], registry.plugins.keys())
+
+
+if __name__ == "__main__":
+    unittest.main()
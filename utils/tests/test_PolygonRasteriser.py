@@ -0,0 +1,105 @@
+"""
+PolygonRasteriser functions test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+from numpy import array, meshgrid, arange, zeros, bool_
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from PolygonRasteriser import parse_wkt, rasterise_polygons, points_in_polygons, unwrap_longitudes
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+SQUARE_WITH_HOLE = [[array([[1.0, 1.0], [9.0, 1.0], [9.0, 9.0], [1.0, 9.0], [1.0, 1.0]]),
+                     array([[4.0, 4.0], [6.0, 4.0], [6.0, 6.0], [4.0, 6.0], [4.0, 4.0]])]]
+
+
+class TestPolygonRasteriser(unittest.TestCase):
+    def test_parse_wkt_polygon(self):
+        polygons = parse_wkt("POLYGON ((10 40, 11.5 40, 11.5 41, 10 40))")
+
+        self.assertEqual(1, len(polygons))
+        self.assertEqual(1, len(polygons[0]))
+        self.assertEqual([[10.0, 40.0], [11.5, 40.0], [11.5, 41.0], [10.0, 40.0]], polygons[0][0].tolist())
+
+    def test_parse_wkt_multipolygon_holes(self):
+        polygons = parse_wkt("MULTIPOLYGON (((0 0, 10 0, 10 10, 0 10, 0 0), (4 4, 6 4, 6 6, 4 4)), "
+                             "((-20.5 -1e1, -15 -10, -15 -5, -20.5 -10)))")
+
+        self.assertEqual([2, 1], [len(p) for p in polygons])
+        self.assertEqual([-20.5, -10.0], polygons[1][0][0].tolist())
+
+    def test_parse_wkt_unsupported(self):
+        self.assertRaises(ValueError, parse_wkt, "POINT (1 2)")
+
+    def test_rasterise_polygons_hole(self):
+        mask = rasterise_polygons(SQUARE_WITH_HOLE, 10, 10)
+
+        expected = zeros((10, 10), dtype=bool_)
+        expected[1:9, 1:9] = True
+        expected[4:6, 4:6] = False
+        self.assertTrue((expected == mask).all())
+
+    def test_rasterise_polygons_multipolygon(self):
+        polygons = [[array([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0], [0.0, 2.0]])],
+                    [array([[5.0, 3.0], [7.0, 3.0], [7.0, 4.0], [5.0, 4.0]])]]
+
+        mask = rasterise_polygons(polygons, 8, 5)
+
+        self.assertEqual(4 + 2, mask.sum())
+        self.assertTrue(mask[3, 5] and mask[3, 6])
+
+    def test_rasterise_polygons_pixel_centres(self):
+        # Triangle covering pixel centres below diagonal, edge through centres follows top-left rule
+        polygons = [[array([[0.0, 0.0], [4.0, 4.0], [0.0, 4.0]])]]
+
+        mask = rasterise_polygons(polygons, 4, 4)
+
+        self.assertEqual([[False] * 4,
+                          [True, False, False, False],
+                          [True, True, False, False],
+                          [True, True, True, False]], mask.tolist())
+
+    def test_rasterise_polygons_outside(self):
+        polygons = [[array([[-5.0, -5.0], [20.0, -5.0], [20.0, 1.0], [-5.0, 1.0]])]]
+
+        mask = rasterise_polygons(polygons, 4, 3)
+
+        self.assertEqual([True] * 4, mask[0].tolist())
+        self.assertEqual(4, mask.sum())
+
+    def test_points_in_polygons(self):
+        x, y = meshgrid(arange(10) + 0.5, arange(10) + 0.5)
+
+        self.assertTrue((rasterise_polygons(SQUARE_WITH_HOLE, 10, 10) == points_in_polygons(x, y, SQUARE_WITH_HOLE))
+                        .all())
+
+    def test_points_in_polygons_edges(self):
+        square = [[array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]])]]
+
+        mask = points_in_polygons(array([0.0, 1.0, 0.5, 0.5, 0.5]), array([0.5, 0.5, 0.0, 1.0, 0.5]), square)
+
+        self.assertEqual([True, False, True, False, True], mask.tolist())
+
+    def test_unwrap_longitudes(self):
+        polygons = [[array([[179.0, 0.0], [181.0, 0.0], [181.0, 1.0], [179.0, 1.0]])]]
+
+        self.assertEqual([180.5, 179.5], unwrap_longitudes(array([-179.5, 179.5]), polygons).tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,50 @@
+"""
+Sentinel-3 product naming convention test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from Sentinel3Naming import SENTINEL3_PRODUCT_TYPES, SENTINEL3_PATTERN, return_product_type
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+name_suffix = "____20161023T100950_20161023T101250_20161023T120602_0179_010_122_1979_SVL_O_NR_002.SEN3"
+
+
+class TestSentinel3Naming(unittest.TestCase):
+    def test_return_product_type(self):
+        for product_string, product_type in SENTINEL3_PRODUCT_TYPES.items():
+            self.assertEqual(product_type, return_product_type("S3A_" + product_string + name_suffix))
+            self.assertEqual(product_type, return_product_type("S3B_" + product_string + name_suffix))
+
+    def test_return_product_type_none(self):
+        self.assertIsNone(return_product_type("S3A_OL_1_XXX" + name_suffix))
+        self.assertIsNone(return_product_type("S2A_OL_1_EFR" + name_suffix))
+        self.assertIsNone(return_product_type("S3AXOL_1_EFR" + name_suffix))
+        self.assertIsNone(return_product_type("S2A_MSIL1C_20170105T013442_N0204_R031_T53NMJ_20170105T013443.SAFE"))
+        self.assertIsNone(return_product_type(""))
+
+    def test_SENTINEL3_PATTERN(self):
+        for product_string in SENTINEL3_PRODUCT_TYPES.keys():
+            self.assertIsNotNone(SENTINEL3_PATTERN.match("S3A_" + product_string + name_suffix))
+        self.assertIsNone(SENTINEL3_PATTERN.match("S3A_OL_1_XXX" + name_suffix))
+        self.assertIsNone(SENTINEL3_PATTERN.match("xS3A_OL_1_EFR" + name_suffix))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+"""
+TiePointInterpolator class test
+"""
+
+'''___Built-In Modules___'''
+import unittest
+import sys
+from os.path import dirname
+
+'''___Third-Party Modules___'''
+from numpy import arange, array, float32
+from numpy.testing import assert_allclose
+
+'''___NPL Modules___'''
+sys.path.append(dirname(dirname(__file__)))
+from TiePointInterpolator import TiePointInterpolator
+
+'''___Authorship___'''
+__author__ = "Sam Hunt"
+__created__ = "18/10/2026"
+__credits__ = [""]
+__version__ = "0.0"
+__maintainer__ = "Sam Hunt"
+__email__ = "sam.hunt@npl.co.uk"
+__status__ = "Development"
+
+
+# Tie points every 4 columns and 2 rows, linear in image coordinates
+tie_values = (arange(6)[:, None] * 20.0 + arange(5)[None, :] * 4.0).astype(float32)
+
+
+def expected(window):
+    x, y, w, h = window
+    return arange(y, y+h)[:, None] * 10.0 + arange(x, x+w)[None, :]
+
+
+class TestTiePointInterpolator(unittest.TestCase):
+    def test_interpolate(self):
+        interpolator = TiePointInterpolator(tie_values.shape, 4, 2)
+
+        assert_allclose(expected((0, 0, 17, 11)), interpolator.interpolate(tie_values, (0, 0, 17, 11)))
+
+    def test_interpolate_extrapolate(self):
+        interpolator = TiePointInterpolator(tie_values.shape, 4, 2)
+
+        # Pixels beyond the last tie points linearly extrapolated
+        assert_allclose(expected((15, 9, 4, 3)), interpolator.interpolate(tie_values, (15, 9, 4, 3)))
+
+    def test_interpolate_tie_window(self):
+        interpolator = TiePointInterpolator(tie_values.shape, 4, 2)
+        window = (5, 3, 6, 4)
+
+        tie_window = interpolator.returnTieWindow(window)
+        tie_x, tie_y, tie_w, tie_h = tie_window
+
+        self.assertEqual((1, 1, 3, 4), tie_window)
+        assert_allclose(expected(window), interpolator.interpolate(tie_values[tie_y:tie_y+tie_h, tie_x:tie_x+tie_w],
+                                                                   window, tie_window=tie_window))
+
+    def test_interpolate_offset(self):
+        interpolator = TiePointInterpolator(tie_values.shape, 4, 2, offset_x=2.5, offset_y=1.5)
+
+        assert_allclose(expected((2, 1, 8, 6)) - expected((2, 1, 1, 1)),
+                        interpolator.interpolate(tie_values, (2, 1, 8, 6)))
+
+    def test_interpolate_discontinuity(self):
+        interpolator = TiePointInterpolator((2, 2), 2, 2)
+        angles = array([[170.0, -170.0], [170.0, -170.0]])
+
+        # Interpolated across discontinuity at 180, not through 0
+        self.assertAlmostEqual(180.0, abs(interpolator.interpolate(angles, (1, 0, 1, 1), discontinuity=True)[0, 0]))
+
+        # Interpolated across discontinuity at 360, returned in range 0 to 360
+        angles = array([[340.0, 350.0], [340.0, 350.0]])
+        self.assertAlmostEqual(345.0, interpolator.interpolate(angles, (1, 0, 1, 1), discontinuity=360)[0, 0])
+
+    def test_returnWeights_cached(self):
+        interpolator = TiePointInterpolator(tie_values.shape, 4, 2)
+
+        weights = interpolator.returnWeights((0, 0, 8, 8))
+
+        self.assertIs(weights, TiePointInterpolator(tie_values.shape, 4, 2).returnWeights((0, 0, 8, 8)))
+        self.assertIsNot(weights, TiePointInterpolator(tie_values.shape, 8, 2).returnWeights((0, 0, 8, 8)))
+        self.assertFalse(weights[0].flags.writeable)
+
+
+if __name__ == "__main__":
+    unittest.main()